@@ -91,6 +91,9 @@ setup(
             "termcolor>=2.0.0",
             "pyfiglet>=0.8.0",
         ],
+        "numpy": [
+            "numpy>=1.20.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -18,30 +18,11 @@ Figlet Forge: An Eidosian reimplementation extending pyfiglet with colorized ANS
 Unicode rendering and intelligent fallbacks while maintaining backward compatibility.
 """
 
-import importlib.util
 import logging
-import sys
-from typing import Any, Dict, List, Optional, Union
+from importlib import import_module
+from typing import Any, Dict, List
 
-# Import color support
-from .color import ColorMode, ColorScheme, colored_format, parse_color
-
-# Import core functionality
-from .core.exceptions import (
-    CharNotPrinted,
-    FigletError,
-    FontError,
-    FontNotFound,
-    InvalidColor,
-)
-from .core.figlet_font import FigletFont
-from .figlet import Figlet, print_figlet
-from .figlet_string import FigletString
-
-# Import render functionality
-from .render.figlet_engine import RenderEngine
-
-# Import version information first to avoid circular imports
+# Version information is cheap and always needed, so it is imported eagerly
 from .version import (
     COLOR_CODES,
     DEFAULT_FONT,
@@ -55,10 +36,62 @@ from .version import (
     __version__,
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Library logging stays silent unless the application configures it
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+# Public names resolved on first access, mapped to the module defining them.
+# Deferring these imports keeps `import figlet_forge` (and the CLI start-up
+# path) from loading color effects, exporters and other unused machinery.
+_LAZY_EXPORTS: Dict[str, str] = {
+    # Main classes
+    "Figlet": ".figlet",
+    "FigletString": ".figlet_string",
+    "FigletFont": ".core.figlet_font",
+    # Convenience functions
+    "print_figlet": ".figlet",
+    "colored_format": ".color",
+    # Color support
+    "ColorMode": ".color",
+    "ColorScheme": ".color",
+    "parse_color": ".color",
+    # Rendering
+    "RenderEngine": ".render.figlet_engine",
+    "Canvas": ".render.canvas",
+    "Animation": ".render.animation",
+    # Exceptions
+    "FigletError": ".core.exceptions",
+    "FontNotFound": ".core.exceptions",
+    "FontError": ".core.exceptions",
+    "CharNotPrinted": ".core.exceptions",
+    "InvalidColor": ".core.exceptions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import public names lazily on first access.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The requested class, function or exception
+
+    Raises:
+        AttributeError: If the name is not part of the public API
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes including not-yet-imported public names."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 # Package exports
 __all__ = [
@@ -75,6 +108,8 @@ __all__ = [
     "parse_color",
     # Rendering
     "RenderEngine",
+    "Canvas",
+    "Animation",
     # Constants
     "DEFAULT_FONT",
     "COLOR_CODES",
@@ -0,0 +1,34 @@
+"""
+Benchmark suite for Figlet Forge.
+
+Times font loading, rendering, color effects, HTML/SVG export and
+FigletString transforms, and compares runs against saved JSON baselines.
+Run it with ``python -m figlet_forge.bench``.
+"""
+
+from .cases import bundled_fonts, collect_benchmarks
+from .runner import (
+    DEFAULT_THRESHOLD,
+    Benchmark,
+    BenchResult,
+    Comparison,
+    compare_results,
+    load_baseline,
+    run_benchmark,
+    run_benchmarks,
+    save_baseline,
+)
+
+__all__ = [
+    "DEFAULT_THRESHOLD",
+    "Benchmark",
+    "BenchResult",
+    "Comparison",
+    "bundled_fonts",
+    "collect_benchmarks",
+    "compare_results",
+    "load_baseline",
+    "run_benchmark",
+    "run_benchmarks",
+    "save_baseline",
+]
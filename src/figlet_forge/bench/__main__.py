@@ -0,0 +1,196 @@
+"""
+Command-line entry point for the Figlet Forge benchmark suite.
+
+Run the suite offline with:
+  python -m figlet_forge.bench [options]
+
+Examples:
+  python -m figlet_forge.bench --quick
+  python -m figlet_forge.bench --save baseline.json
+  python -m figlet_forge.bench --compare baseline.json --threshold 0.15
+  python -m figlet_forge.bench --filter '^render/'
+  python -m figlet_forge.bench --import-time --import-budget 100
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from .cases import collect_benchmarks
+from .importtime import (
+    DEFAULT_IMPORT_BUDGET_MS,
+    check_import_budget,
+    format_import_timing,
+)
+from .runner import (
+    DEFAULT_THRESHOLD,
+    BenchResult,
+    compare_results,
+    format_comparison,
+    format_result,
+    load_baseline,
+    run_benchmarks,
+    save_baseline,
+)
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+
+    Args:
+        args: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Parsed arguments namespace
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m figlet_forge.bench",
+        description="Figlet Forge benchmark suite",
+    )
+    parser.add_argument(
+        "--filter",
+        metavar="REGEX",
+        help="Only run benchmarks whose name matches REGEX",
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Use a reduced font and text-length matrix",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Samples per benchmark (default: 5)",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="Minimum seconds per sample (default: 0.05)",
+    )
+    parser.add_argument(
+        "--save",
+        metavar="FILE",
+        help="Write results to FILE as a JSON baseline",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="FILE",
+        help="Compare results against the JSON baseline in FILE",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative slowdown counted as a regression (default: 0.10)",
+    )
+    parser.add_argument(
+        "--import-time",
+        action="store_true",
+        help="Measure start-up import time with -X importtime instead",
+    )
+    parser.add_argument(
+        "--import-budget",
+        type=float,
+        default=DEFAULT_IMPORT_BUDGET_MS,
+        metavar="MS",
+        help="Import-time budget per entry module in ms (default: 150)",
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List benchmark names and exit",
+    )
+    return parser.parse_args(args)
+
+
+def run_import_check(budget_ms: float, runs: int) -> int:
+    """
+    Measure import time of the package entry points against a budget.
+
+    Args:
+        budget_ms: Budget per entry module in milliseconds
+        runs: Fresh interpreters per module
+
+    Returns:
+        0 if every module is within budget, 1 otherwise
+    """
+    timings, over_budget = check_import_budget(budget_ms, runs=runs)
+    print("[import_time]")
+    for timing in timings:
+        print(format_import_timing(timing, budget_ms))
+    if over_budget:
+        print(f"\n{len(over_budget)} module(s) over budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmark suite.
+
+    Args:
+        args: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        0 on success, 1 if compare mode found regressions or an import is
+        over budget, 2 on usage errors
+    """
+    parsed = parse_args(args)
+    if parsed.import_time:
+        return run_import_check(parsed.import_budget, parsed.repeat)
+
+    benchmarks = collect_benchmarks(quick=parsed.quick)
+
+    if parsed.list:
+        for bench in benchmarks:
+            print(bench.name)
+        return 0
+
+    baseline = None
+    if parsed.compare:
+        try:
+            baseline = load_baseline(parsed.compare)
+        except (OSError, ValueError) as e:
+            print(f"Error: cannot read baseline: {e}", file=sys.stderr)
+            return 2
+
+    group = None
+
+    def progress(result: BenchResult) -> None:
+        nonlocal group
+        if result.group != group:
+            group = result.group
+            print(f"\n[{group}]")
+        print(format_result(result), flush=True)
+
+    results = run_benchmarks(
+        benchmarks,
+        min_time=parsed.min_time,
+        repeat=parsed.repeat,
+        pattern=parsed.filter,
+        progress=progress,
+    )
+
+    if parsed.save:
+        save_baseline(results, parsed.save)
+        print(f"\nSaved {len(results)} results to {parsed.save}")
+
+    if baseline is not None:
+        comparisons = compare_results(baseline, results)
+        regressions = [c for c in comparisons if c.is_regression(parsed.threshold)]
+        print(f"\nComparison with {parsed.compare} (threshold {parsed.threshold:.0%})")
+        for comparison in comparisons:
+            print(format_comparison(comparison, parsed.threshold))
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) found", file=sys.stderr)
+            return 1
+        print("\nNo regressions found")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""
+Benchmark definitions for Figlet Forge.
+
+Each collector returns a list of Benchmark objects for one area of the
+library: font loading, rendering, color effects, export formats and
+FigletString transforms. Benchmark names are stable, slash-separated
+identifiers so that results can be compared across runs.
+"""
+
+from functools import partial
+from importlib import resources
+from typing import Callable, List, Sequence
+
+from ..color import effects
+from ..color.registry import compile_effect
+from ..core.figlet_font import FigletFont
+from ..core.figlet_string import FigletString
+from ..figlet import Figlet
+from ..render.canvas import Canvas
+from ..render.figlet_engine import RenderEngine
+from .runner import Benchmark
+
+# Package holding the fonts shipped with Figlet Forge
+FONT_PACKAGE = "figlet_forge.fonts"
+
+# Fonts used for render throughput, chosen to cover small and large glyphs
+RENDER_FONTS = ("standard", "slant", "small", "mini", "big", "banner", "block")
+
+# Input lengths (in characters) used for render throughput
+TEXT_LENGTHS = (1, 10, 40, 160)
+
+# Reduced matrices for --quick runs
+QUICK_FONTS = ("standard", "small")
+QUICK_LENGTHS = (10, 40)
+
+# Width of the wide art used to check that transforms scale with columns
+WIDE_COLUMNS = 1000
+
+# Text repeated to build inputs of a given length
+SAMPLE_TEXT = "Figlet Forge 0123456789 "
+
+
+def bundled_fonts() -> List[str]:
+    """
+    List the fonts shipped inside the package.
+
+    Returns:
+        Sorted font names without extension
+    """
+    return sorted(
+        name.rsplit(".", 1)[0]
+        for name in resources.contents(FONT_PACKAGE)
+        if name.endswith((".flf", ".tlf"))
+    )
+
+
+def sample_text(length: int) -> str:
+    """
+    Build deterministic input text of exactly `length` characters.
+
+    Args:
+        length: Number of characters
+
+    Returns:
+        Sample text
+    """
+    repeats = length // len(SAMPLE_TEXT) + 1
+    return (SAMPLE_TEXT * repeats)[:length]
+
+
+def _cold_load(font_name: str) -> Callable[[], FigletFont]:
+    """Build a callable that parses a font from scratch."""
+
+    def run() -> FigletFont:
+        FigletFont.clear_cache()
+        return FigletFont.load_cached(font_name)
+
+    return run
+
+
+def font_load_benchmarks(fonts: Sequence[str]) -> List[Benchmark]:
+    """
+    Benchmark cold (parse) and warm (cached) font loads.
+
+    Args:
+        fonts: Font names to load
+
+    Returns:
+        Two benchmarks per font
+    """
+    benchmarks = []
+    for font_name in fonts:
+        benchmarks.append(
+            Benchmark(f"font_load/cold/{font_name}", "font_load", _cold_load(font_name))
+        )
+        benchmarks.append(
+            Benchmark(
+                f"font_load/warm/{font_name}",
+                "font_load",
+                lambda name=font_name: FigletFont.load_cached(name),
+                setup=lambda name=font_name: FigletFont.load_cached(name) and None,
+            )
+        )
+    return benchmarks
+
+
+def render_benchmarks(
+    fonts: Sequence[str], lengths: Sequence[int]
+) -> List[Benchmark]:
+    """
+    Benchmark rendering throughput for each font and text length.
+
+    The output width is large enough that no input wraps, so timings
+    scale with the number of glyphs rather than the number of lines.
+
+    Args:
+        fonts: Font names to render with
+        lengths: Input lengths in characters
+
+    Returns:
+        One benchmark per font and length
+    """
+    benchmarks = []
+    for font_name in fonts:
+        figlet = Figlet(font=font_name, width=10000)
+        for length in lengths:
+            text = sample_text(length)
+            benchmarks.append(
+                Benchmark(
+                    f"render/{font_name}/{length}",
+                    "render",
+                    lambda f=figlet, t=text: f.render_text(t),
+                    setup=lambda n=length: {"chars": n},
+                )
+            )
+    return benchmarks
+
+
+def _art(font_name: str = "standard", text: str = "Figlet Forge") -> FigletString:
+    """Render the fixed art used by the color, export and transform cases."""
+    return Figlet(font=font_name, width=10000).render_text(text)
+
+
+def wide_art(columns: int = WIDE_COLUMNS) -> FigletString:
+    """
+    Render art exactly `columns` wide.
+
+    Args:
+        columns: Width of the art in characters
+
+    Returns:
+        Rendered standard-font art cropped to `columns`
+    """
+    # Standard glyphs are several columns wide, so this always overshoots
+    return _art(text=sample_text(columns // 2)).crop(0, 0, columns)
+
+
+def _size_ratio(func: Callable[[], str], art: str) -> Callable[[], dict]:
+    """Build a setup callable reporting colored output size over plain size."""
+
+    def setup() -> dict:
+        return {"size_ratio": round(len(func()) / len(art), 2)}
+
+    return setup
+
+
+def color_benchmarks() -> List[Benchmark]:
+    """
+    Benchmark every effect in figlet_forge.color.effects.
+
+    Each result carries a ``size_ratio`` extra: the length of the colored
+    output divided by the length of the plain art. The per-character
+    effects are also run on WIDE_COLUMNS-wide art.
+
+    Returns:
+        One benchmark per effect
+    """
+    art = str(_art())
+    wide = str(wide_art())
+    effects_by_name = {
+        "highlight_pattern": lambda: effects.highlight_pattern(art, r"[|/\\]", "RED"),
+        "gradient_colorize": lambda: effects.gradient_colorize(art, "RED", "BLUE"),
+        "rainbow_colorize": lambda: effects.rainbow_colorize(art),
+        "pulse_colorize": lambda: effects.pulse_colorize(art, "GREEN"),
+        "random_colorize": lambda: effects.random_colorize(art),
+        "color_style_apply": lambda: effects.color_style_apply(art, "fire"),
+        "compiled_effect": partial(compile_effect("fire"), art),
+    }
+    wide_effects = {
+        f"gradient_colorize/{WIDE_COLUMNS}col": lambda: effects.gradient_colorize(
+            wide, "RED", "BLUE"
+        ),
+        f"pulse_colorize/{WIDE_COLUMNS}col": lambda: effects.pulse_colorize(
+            wide, "GREEN"
+        ),
+    }
+    benchmarks = [
+        Benchmark(f"color/{name}", "color", func, setup=_size_ratio(func, art))
+        for name, func in effects_by_name.items()
+    ]
+    benchmarks.extend(
+        Benchmark(f"color/{name}", "color", func, setup=_size_ratio(func, wide))
+        for name, func in wide_effects.items()
+    )
+    return benchmarks
+
+
+def export_benchmarks() -> List[Benchmark]:
+    """
+    Benchmark the HTML and SVG exporters.
+
+    Returns:
+        One benchmark per export format
+    """
+    art = str(_art())
+    return [
+        Benchmark("export/html", "export", lambda: RenderEngine.to_html(art)),
+        Benchmark("export/svg", "export", lambda: RenderEngine.to_svg(art)),
+    ]
+
+
+def _status_board(banners: Sequence[FigletString]) -> str:
+    """Compose banners into a two-row board and render it with colors."""
+    canvas = Canvas(200, 16)
+    half = len(banners) // 2
+    canvas.hconcat(banners[:half], gap=2, color="GREEN")
+    canvas.hconcat(banners[half:], y=8, gap=2, color="RED")
+    canvas.blit(banners[0], x=150, y=4, z=1, color="YELLOW")
+    return canvas.to_ansi()
+
+
+def transform_benchmarks() -> List[Benchmark]:
+    """
+    Benchmark the FigletString transforms.
+
+    Returns:
+        One benchmark per transform
+    """
+    art = _art()
+    overlay = _art("small", "FF")
+    board = [_art("small", label) for label in ("CPU", "MEM", "DISK", "NET")]
+    transforms = {
+        "reverse": lambda: art.reverse(),
+        "flip": lambda: art.flip(),
+        "center": lambda: art.center(200),
+        "ljust": lambda: art.ljust(200),
+        "rjust": lambda: art.rjust(200),
+        "border": lambda: art.border(),
+        "shadow": lambda: art.shadow(),
+        "overlay": lambda: art.overlay(overlay, 4, 1),
+        "scale": lambda: art.scale(2.0, 2.0),
+        "crop": lambda: art.crop(2, 1, 40, 4),
+        "rotate_90_clockwise": lambda: art.rotate_90_clockwise(),
+        "rotate_90_counterclockwise": lambda: art.rotate_90_counterclockwise(),
+        "chain": lambda: art.reverse().flip().border("double"),
+        "pipeline": lambda: art.pipeline().reverse().flip().border("double").apply(),
+        "canvas": lambda: _status_board(board),
+    }
+    benchmarks = [
+        Benchmark(f"transform/{name}", "transform", func)
+        for name, func in transforms.items()
+    ]
+
+    # Per-character and geometric transforms on wide art, where per-row
+    # costs dominate and the grid backends take over
+    wide = wide_art()
+    wide_transforms = {
+        "reverse": wide.reverse,
+        "flip": wide.flip,
+        "rotate_90_clockwise": wide.rotate_90_clockwise,
+        "scale": lambda: wide.scale(2.0, 2.0),
+    }
+    for name, func in wide_transforms.items():
+        benchmarks.append(
+            Benchmark(
+                f"transform/{name}/{WIDE_COLUMNS}col",
+                "transform",
+                func,
+                setup=lambda: {"columns": WIDE_COLUMNS},
+            )
+        )
+    return benchmarks
+
+
+def collect_benchmarks(quick: bool = False) -> List[Benchmark]:
+    """
+    Collect the full benchmark suite.
+
+    Args:
+        quick: Use a reduced font and text-length matrix
+
+    Returns:
+        Benchmarks in report order
+    """
+    load_fonts = list(QUICK_FONTS) if quick else bundled_fonts()
+    render_fonts = QUICK_FONTS if quick else RENDER_FONTS
+    lengths = QUICK_LENGTHS if quick else TEXT_LENGTHS
+    return (
+        font_load_benchmarks(load_fonts)
+        + render_benchmarks(render_fonts, lengths)
+        + color_benchmarks()
+        + export_benchmarks()
+        + transform_benchmarks()
+    )
@@ -0,0 +1,147 @@
+"""
+Import-time benchmark for Figlet Forge.
+
+Start-up cost matters when the CLI runs from shell prompts and hooks, so
+this module imports entry points in fresh interpreters with
+``python -X importtime`` and checks the cumulative import time against a
+budget.
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+# Modules whose import cost is checked, in report order
+IMPORT_TARGETS = ("figlet_forge", "figlet_forge.cli.main")
+
+# Default budget for the cumulative import time of each target (milliseconds)
+DEFAULT_IMPORT_BUDGET_MS = 150.0
+
+# Directory containing the figlet_forge package, put on the child's path
+_PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+class ImportTiming(NamedTuple):
+    """Import cost of one target module."""
+
+    module: str
+    total_us: int
+    slowest: List[Tuple[str, int]]
+
+    @property
+    def total_ms(self) -> float:
+        """Cumulative import time in milliseconds."""
+        return self.total_us / 1000.0
+
+    def within(self, budget_ms: float) -> bool:
+        """Whether the import fits in the budget."""
+        return self.total_ms <= budget_ms
+
+
+def parse_importtime(output: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Parse ``-X importtime`` output.
+
+    Args:
+        output: stderr of an interpreter run with ``-X importtime``
+
+    Returns:
+        Mapping of module name to (self, cumulative) microseconds. A module
+        reported twice (a submodule import that first loads its parents)
+        keeps the largest of each figure, so the cumulative time covers the
+        outermost import
+    """
+    timings: Dict[str, Tuple[int, int]] = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        name = fields[2].strip()
+        self_us, cumulative_us = timings.get(name, (0, 0))
+        timings[name] = (
+            max(self_us, int(fields[0])),
+            max(cumulative_us, int(fields[1])),
+        )
+    return timings
+
+
+def _import_once(module: str, env: Dict[str, str], top: int) -> ImportTiming:
+    """Import a module in a fresh interpreter and collect its timings."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr.strip()}")
+    timings = parse_importtime(proc.stderr)
+    if module not in timings:
+        raise RuntimeError(f"No import time reported for {module}")
+    slowest = sorted(
+        ((name, self_us) for name, (self_us, _) in timings.items()),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    return ImportTiming(module, timings[module][1], slowest[:top])
+
+
+def measure_import(module: str, runs: int = 5, top: int = 5) -> ImportTiming:
+    """
+    Measure the cumulative import time of a module in fresh interpreters.
+
+    The fastest of `runs` imports is reported to filter out scheduling
+    noise.
+
+    Args:
+        module: Dotted module name to import
+        runs: Number of fresh interpreters to start
+        top: Number of slowest modules (by self time) to keep
+
+    Returns:
+        Import timing for the fastest run
+
+    Raises:
+        RuntimeError: If the module cannot be imported
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (_PACKAGE_PARENT, env.get("PYTHONPATH")) if path
+    )
+    timings = [_import_once(module, env, top) for _ in range(max(1, runs))]
+    return min(timings, key=lambda timing: timing.total_us)
+
+
+def check_import_budget(
+    budget_ms: float = DEFAULT_IMPORT_BUDGET_MS,
+    modules: Sequence[str] = IMPORT_TARGETS,
+    runs: int = 5,
+) -> Tuple[List[ImportTiming], List[ImportTiming]]:
+    """
+    Measure each target and compare it with the budget.
+
+    Args:
+        budget_ms: Maximum cumulative import time per module
+        modules: Modules to measure
+        runs: Fresh interpreters per module
+
+    Returns:
+        Tuple of (all timings, timings over budget)
+    """
+    timings = [measure_import(module, runs=runs) for module in modules]
+    return timings, [t for t in timings if not t.within(budget_ms)]
+
+
+def format_import_timing(timing: ImportTiming, budget_ms: float) -> str:
+    """Format one import timing with its slowest contributors."""
+    status = "ok" if timing.within(budget_ms) else "OVER BUDGET"
+    lines = [
+        f"{timing.module:<48} {timing.total_ms:>8.1f} ms"
+        f"  (budget {budget_ms:.0f} ms)  {status}"
+    ]
+    for name, self_us in timing.slowest:
+        lines.append(f"    {name:<44} {self_us / 1000.0:>8.2f} ms self")
+    return "\n".join(lines)
@@ -0,0 +1,289 @@
+"""
+Benchmark runner for Figlet Forge.
+
+This module times benchmark callables with ``time.perf_counter_ns``,
+calibrating the loop count so that each sample runs long enough to be
+measured reliably, and stores results as JSON baselines that later runs
+can be compared against.
+"""
+
+import json
+import logging
+import platform
+import re
+import time
+from pathlib import Path
+from statistics import median
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Union
+
+from ..version import __version__
+
+# Configure logger for this module
+logger = logging.getLogger(__name__)
+
+# Default relative slowdown that counts as a regression (10%)
+DEFAULT_THRESHOLD = 0.10
+
+# Baseline file format version, bumped on incompatible changes
+BASELINE_FORMAT = 1
+
+
+class Benchmark(NamedTuple):
+    """A named, grouped callable to be timed."""
+
+    name: str
+    group: str
+    func: Callable[[], Any]
+    setup: Optional[Callable[[], Any]] = None
+
+
+class BenchResult(NamedTuple):
+    """Timing summary for one benchmark."""
+
+    name: str
+    group: str
+    loops: int
+    repeat: int
+    median_ns: float
+    min_ns: float
+    extra: Dict[str, float]
+
+    @property
+    def ops_per_sec(self) -> float:
+        """Operations per second derived from the median."""
+        return 1e9 / self.median_ns if self.median_ns else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Serialize for a JSON baseline."""
+        data: Dict[str, Any] = {
+            "group": self.group,
+            "loops": self.loops,
+            "repeat": self.repeat,
+            "median_ns": round(self.median_ns, 1),
+            "min_ns": round(self.min_ns, 1),
+            "ops_per_sec": round(self.ops_per_sec, 2),
+        }
+        if self.extra:
+            data["extra"] = self.extra
+        return data
+
+
+class Comparison(NamedTuple):
+    """Change in median time between a baseline and a current run."""
+
+    name: str
+    baseline_ns: float
+    current_ns: float
+
+    @property
+    def ratio(self) -> float:
+        """Current median divided by baseline median."""
+        return self.current_ns / self.baseline_ns if self.baseline_ns else 1.0
+
+    def is_regression(self, threshold: float) -> bool:
+        """Whether the slowdown exceeds the relative threshold."""
+        return self.ratio > 1.0 + threshold
+
+
+def _time_loops(func: Callable[[], Any], loops: int) -> int:
+    """Run func `loops` times and return elapsed nanoseconds."""
+    start = perf_counter_ns()
+    for _ in range(loops):
+        func()
+    return perf_counter_ns() - start
+
+
+def run_benchmark(
+    bench: Benchmark, min_time: float = 0.05, repeat: int = 5
+) -> BenchResult:
+    """
+    Time one benchmark.
+
+    The loop count is doubled until a single sample takes at least
+    ``min_time`` seconds; then ``repeat`` samples are taken and summarized
+    by their median and minimum per-operation time.
+
+    Args:
+        bench: Benchmark to run
+        min_time: Minimum duration of one sample in seconds
+        repeat: Number of samples
+
+    Returns:
+        Benchmark result with per-operation timings in nanoseconds
+    """
+    extra: Dict[str, float] = {}
+    if bench.setup is not None:
+        setup_result = bench.setup()
+        if isinstance(setup_result, dict):
+            extra.update(setup_result)
+
+    # Warm up once, then calibrate
+    bench.func()
+    min_ns = int(min_time * 1e9)
+    loops = 1
+    while True:
+        elapsed = _time_loops(bench.func, loops)
+        if elapsed >= min_ns or loops >= 1 << 20:
+            break
+        loops *= 2
+
+    samples = [elapsed / loops]
+    for _ in range(max(0, repeat - 1)):
+        samples.append(_time_loops(bench.func, loops) / loops)
+
+    return BenchResult(
+        bench.name, bench.group, loops, len(samples), median(samples), min(samples), extra
+    )
+
+
+def run_benchmarks(
+    benchmarks: Iterable[Benchmark],
+    min_time: float = 0.05,
+    repeat: int = 5,
+    pattern: Optional[str] = None,
+    progress: Optional[Callable[[BenchResult], None]] = None,
+) -> List[BenchResult]:
+    """
+    Run a collection of benchmarks.
+
+    A benchmark that raises is logged and skipped so that one broken code
+    path does not hide the timings of every other one.
+
+    Args:
+        benchmarks: Benchmarks to run
+        min_time: Minimum duration of one sample in seconds
+        repeat: Number of samples per benchmark
+        pattern: Optional regex; only benchmarks whose name matches run
+        progress: Optional callback invoked after each benchmark
+
+    Returns:
+        Results in run order
+    """
+    matcher = re.compile(pattern) if pattern else None
+    results: List[BenchResult] = []
+    for bench in benchmarks:
+        if matcher is not None and not matcher.search(bench.name):
+            continue
+        try:
+            result = run_benchmark(bench, min_time=min_time, repeat=repeat)
+        except Exception as e:
+            logger.warning(f"Benchmark {bench.name} failed: {type(e).__name__}: {e}")
+            continue
+        results.append(result)
+        if progress is not None:
+            progress(result)
+    return results
+
+
+def results_to_baseline(results: Iterable[BenchResult]) -> Dict[str, Any]:
+    """
+    Build a baseline document from results.
+
+    Args:
+        results: Benchmark results
+
+    Returns:
+        JSON-serializable baseline with environment metadata
+    """
+    return {
+        "format": BASELINE_FORMAT,
+        "meta": {
+            "figlet_forge": __version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "results": {result.name: result.as_dict() for result in results},
+    }
+
+
+def save_baseline(results: Iterable[BenchResult], path: Union[str, Path]) -> None:
+    """
+    Write results to a JSON baseline file.
+
+    Args:
+        results: Benchmark results
+        path: Destination file
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results_to_baseline(results), f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_baseline(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Read a JSON baseline file.
+
+    Args:
+        path: Baseline file
+
+    Returns:
+        Parsed baseline document
+
+    Raises:
+        ValueError: If the file is not a baseline this version understands
+    """
+    with open(path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("format") != BASELINE_FORMAT or "results" not in baseline:
+        raise ValueError(f"Unsupported benchmark baseline: {path}")
+    return baseline
+
+
+def compare_results(
+    baseline: Dict[str, Any], results: Iterable[BenchResult]
+) -> List[Comparison]:
+    """
+    Compare current results against a baseline.
+
+    Benchmarks missing from either side are skipped.
+
+    Args:
+        baseline: Baseline document from load_baseline()
+        results: Current benchmark results
+
+    Returns:
+        One comparison per benchmark present in both
+    """
+    recorded = baseline["results"]
+    return [
+        Comparison(result.name, recorded[result.name]["median_ns"], result.median_ns)
+        for result in results
+        if result.name in recorded
+    ]
+
+
+def format_duration(ns: float) -> str:
+    """Format a nanosecond duration with a readable unit."""
+    if ns >= 1e9:
+        return f"{ns / 1e9:.2f} s"
+    if ns >= 1e6:
+        return f"{ns / 1e6:.2f} ms"
+    if ns >= 1e3:
+        return f"{ns / 1e3:.2f} µs"
+    return f"{ns:.0f} ns"
+
+
+def format_result(result: BenchResult) -> str:
+    """Format one result as a report line."""
+    line = (
+        f"{result.name:<48} {format_duration(result.median_ns):>10}"
+        f"  (min {format_duration(result.min_ns)}, {result.ops_per_sec:,.0f} op/s)"
+    )
+    if result.extra:
+        details = ", ".join(f"{k}={v:g}" for k, v in sorted(result.extra.items()))
+        line += f"  [{details}]"
+    return line
+
+
+def format_comparison(comparison: Comparison, threshold: float) -> str:
+    """Format one comparison as a report line, marking regressions."""
+    change = (comparison.ratio - 1.0) * 100
+    marker = "REGRESSION" if comparison.is_regression(threshold) else ""
+    return (
+        f"{comparison.name:<48} {format_duration(comparison.baseline_ns):>10}"
+        f" -> {format_duration(comparison.current_ns):>10}  {change:+6.1f}%  {marker}"
+    ).rstrip()
+
@@ -6,14 +6,37 @@ through the command line.
 """
 
 import sys
-from typing import List, Optional, Union
-
-# Import the sample module to ensure it's available
-from . import sample
+from importlib import import_module
+from typing import Any
 
 # Import the main CLI function from main.py
 from .main import main
-from .showcase import generate_showcase
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the sample and showcase helpers only when they are requested.
+
+    A plain render never needs them, so the CLI entry point skips them.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The sample module or the generate_showcase function
+
+    Raises:
+        AttributeError: If the name is not a lazily exported attribute
+    """
+    if name == "sample":
+        value = import_module(".sample", __name__)
+    elif name == "generate_showcase":
+        value = import_module(".showcase", __name__).generate_showcase
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
 __all__ = ["main", "sample", "generate_showcase"]
 
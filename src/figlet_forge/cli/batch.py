@@ -0,0 +1,248 @@
+"""
+JSONL batch rendering for the Figlet Forge CLI.
+
+``figlet_forge --batch input.jsonl --jobs N`` renders many banners in one
+invocation instead of one process per banner. Each input line is a JSON
+object::
+
+    {"text": "Deploy", "font": "slant", "width": 100, "justify": "center",
+     "color": "red", "format": "txt", "id": "banner-1"}
+
+Only ``text`` is required. Results are written as JSONL in input order,
+one line per record::
+
+    {"index": 0, "id": "banner-1", "font": "slant", "output": "..."}
+    {"index": 1, "error": "..."}
+
+Records are spread over a pool of worker processes. Every worker parses
+the fonts named in the batch once at start-up and reuses a Figlet
+instance per (font, width, justify, direction) combination, keeping the
+FIGLET_CACHE_SIZE most recently used ones.
+"""
+
+import json
+import logging
+import os
+from functools import lru_cache
+from typing import IO, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..version import DEFAULT_FONT
+
+# Configure logger for this module
+logger = logging.getLogger(__name__)
+
+# Output formats accepted in the "format" field
+BATCH_FORMATS = ("txt", "html", "svg")
+
+# Default width for records that do not set one
+DEFAULT_BATCH_WIDTH = 80
+
+# Below this many records a worker pool costs more than it saves
+MIN_PARALLEL_RECORDS = 32
+
+# Figlet instances kept per process, keyed by layout settings
+FIGLET_CACHE_SIZE = 64
+
+
+def parse_records(lines: Iterable[str]) -> List[Any]:
+    """
+    Decode JSONL input.
+
+    Blank lines are skipped. A line that is not a JSON object is kept as an
+    error message so it is reported at its position in the output.
+
+    Args:
+        lines: Input lines
+
+    Returns:
+        One entry per record: the decoded dict, or an error string
+    """
+    records: List[Any] = []
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            records.append(f"line {number}: invalid JSON: {e}")
+            continue
+        if not isinstance(record, dict):
+            records.append(f"line {number}: expected a JSON object")
+            continue
+        records.append(record)
+    return records
+
+
+@lru_cache(maxsize=FIGLET_CACHE_SIZE)
+def _get_figlet(font: str, width: int, justify: str, direction: str) -> Any:
+    """Get a cached Figlet instance for one combination of settings."""
+    from ..figlet import Figlet
+
+    return Figlet(font=font, width=width, justify=justify, direction=direction)
+
+
+def _solid_color(spec: str) -> Optional[str]:
+    """Convert a color name or R;G;B spec to a CSS hex color."""
+    from ..color.figlet_color import InvalidColor, resolve_color
+
+    try:
+        rgb = resolve_color(spec.split(":")[0]).rgb
+    except InvalidColor:
+        return None
+    return "#{:02x}{:02x}{:02x}".format(*rgb) if rgb else None
+
+
+def render_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Render one batch record.
+
+    Args:
+        record: Decoded input record
+
+    Returns:
+        Result record with either an "output" or an "error" field
+    """
+    from ..color import get_coloring_functions
+    from ..render.figlet_engine import RenderEngine
+
+    result: Dict[str, Any] = {}
+    if "id" in record:
+        result["id"] = record["id"]
+
+    try:
+        text = record.get("text")
+        if not isinstance(text, str):
+            raise ValueError("missing or non-string 'text'")
+        fmt = str(record.get("format") or "txt").lower()
+        if fmt not in BATCH_FORMATS:
+            raise ValueError(f"unknown format {fmt!r}; use {', '.join(BATCH_FORMATS)}")
+        width = int(record.get("width", DEFAULT_BATCH_WIDTH))
+        if width < 1:
+            raise ValueError("width must be positive")
+
+        figlet = _get_figlet(
+            str(record.get("font") or DEFAULT_FONT),
+            width,
+            str(record.get("justify") or "auto"),
+            str(record.get("direction") or "auto"),
+        )
+        output = str(figlet.render_text(text))
+        result["font"] = figlet.font
+
+        color = record.get("color")
+        if color and fmt == "txt":
+            color_func = get_coloring_functions(str(color))
+            if color_func is None:
+                raise ValueError(f"invalid color {color!r}")
+            output = color_func(output)
+
+        if fmt != "txt":
+            # Markup formats take a single CSS color rather than ANSI codes
+            foreground = _solid_color(str(color)) if color else "#000000"
+            if foreground is None:
+                raise ValueError(f"{fmt} output needs a solid color, got {color!r}")
+            if fmt == "svg":
+                output = RenderEngine.to_svg(output, foreground=foreground)
+            else:
+                output = RenderEngine.to_html(
+                    output,
+                    style={
+                        "font-family": "monospace",
+                        "white-space": "pre",
+                        "line-height": "1",
+                        "display": "inline-block",
+                        "color": foreground,
+                    },
+                )
+        result["output"] = output
+    except Exception as e:
+        result.pop("font", None)
+        result["error"] = str(e)
+    return result
+
+
+def _render_indexed(item: Tuple[int, Any]) -> Dict[str, Any]:
+    """Render a record (or pass through a parse error) with its index."""
+    index, record = item
+    if isinstance(record, str):
+        return {"index": index, "error": record}
+    result = render_record(record)
+    return {"index": index, **result}
+
+
+def _init_worker(fonts: Sequence[str]) -> None:
+    """Parse the batch's fonts once when a worker process starts."""
+    from ..core.figlet_font import FigletFont
+
+    for font_name in fonts:
+        try:
+            FigletFont.load_cached(font_name)
+        except Exception as e:
+            # Reported per record when the font is actually used
+            logger.debug(f"Could not preload font {font_name}: {e}")
+
+
+def batch_fonts(records: Sequence[Any]) -> List[str]:
+    """List the distinct fonts used by a batch, in first-use order."""
+    fonts: Dict[str, None] = {}
+    for record in records:
+        if isinstance(record, dict):
+            fonts.setdefault(str(record.get("font") or DEFAULT_FONT), None)
+    return list(fonts)
+
+
+def render_batch(
+    records: Sequence[Any], jobs: Optional[int] = None
+) -> Iterable[Dict[str, Any]]:
+    """
+    Render records, in parallel where it pays off.
+
+    Args:
+        records: Output of parse_records()
+        jobs: Worker processes (defaults to the CPU count; 1 renders in-process)
+
+    Yields:
+        Result records in input order
+    """
+    jobs = jobs or os.cpu_count() or 1
+    items = list(enumerate(records))
+    fonts = batch_fonts(records)
+
+    if jobs <= 1 or len(items) < MIN_PARALLEL_RECORDS:
+        _init_worker(fonts)
+        for item in items:
+            yield _render_indexed(item)
+        return
+
+    import multiprocessing
+
+    jobs = min(jobs, len(items))
+    chunksize = max(1, min(64, len(items) // (jobs * 4)))
+    with multiprocessing.Pool(
+        jobs, initializer=_init_worker, initargs=(fonts,)
+    ) as pool:
+        yield from pool.imap(_render_indexed, items, chunksize=chunksize)
+
+
+def run_batch(source: IO[str], out: IO[str], jobs: Optional[int] = None) -> int:
+    """
+    Render a JSONL stream and write JSONL results.
+
+    Args:
+        source: Input stream of JSON records
+        out: Stream receiving one JSON result per line
+        jobs: Worker processes (defaults to the CPU count)
+
+    Returns:
+        Exit code: 0 if every record rendered, 1 otherwise
+    """
+    records = parse_records(source)
+    failures = 0
+    for result in render_batch(records, jobs):
+        if "error" in result:
+            failures += 1
+        out.write(json.dumps(result) + "\n")
+
+    if failures:
+        logger.warning(f"{failures} of {len(records)} batch records failed")
+    return 1 if failures else 0
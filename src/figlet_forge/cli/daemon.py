@@ -0,0 +1,554 @@
+"""
+Persistent render daemon for the Figlet Forge CLI.
+
+``figlet_forge --serve`` keeps one interpreter running with imports done and
+fonts parsed, listening on a Unix domain socket (or a localhost TCP port).
+Later CLI invocations forward their arguments to it and stream the output
+back, which removes interpreter start-up and font parsing from every call.
+
+The wire protocol is newline-delimited JSON. The client sends one request::
+
+    {"argv": [...], "stdin": "..." | null, "cwd": "/path", "token": "..."}
+
+and the daemon answers with any number of output frames followed by an
+exit frame::
+
+    {"stream": "stdout" | "stderr", "data": "..."}
+    {"exit": 0}
+
+Every request must carry the per-user token the daemon keeps in a file
+only its owner can read, so other local users cannot run commands through
+a daemon listening on a TCP port. Requests that write or read files
+(``--output``, ``--batch``) are never run by the daemon; the client
+renders those in-process.
+"""
+
+import hmac
+import io
+import json
+import logging
+import os
+import secrets
+import stat
+import sys
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .. import metrics
+
+# Configure logger for this module
+logger = logging.getLogger(__name__)
+
+# Environment variable holding the daemon address ("off" disables forwarding)
+DAEMON_ENV = "FIGLET_FORGE_DAEMON"
+
+# Values of DAEMON_ENV that turn automatic forwarding off
+_DISABLED_VALUES = ("0", "off", "no", "false")
+
+# TCP port used where Unix domain sockets are unavailable
+DEFAULT_TCP_PORT = 7464
+
+# Fonts parsed when the daemon starts so the first request is already warm
+PRELOAD_FONTS = ("standard",)
+
+# Seconds the daemon waits for a client's request line or output reads
+# before dropping the connection, so a stalled client cannot block it
+REQUEST_TIMEOUT = 5.0
+
+# Random bytes in the shared secret clients present to the daemon
+TOKEN_BYTES = 32
+
+# An address is either a socket path or a (host, port) pair
+Address = Union[str, Tuple[str, int]]
+
+
+def parse_address(spec: str) -> Address:
+    """
+    Parse an address specification.
+
+    Accepted forms are ``unix:/path/to.sock``, ``tcp:host:port``,
+    ``host:port`` and a bare filesystem path.
+
+    Args:
+        spec: Address specification
+
+    Returns:
+        Socket path for Unix sockets, or a (host, port) tuple for TCP
+
+    Raises:
+        ValueError: If a TCP port is not a number
+    """
+    if spec.startswith("unix:"):
+        return spec[len("unix:") :]
+    if spec.startswith("tcp:"):
+        spec = spec[len("tcp:") :]
+    elif os.sep in spec or ":" not in spec:
+        return spec
+
+    host, _, port = spec.rpartition(":")
+    if not port.isdigit():
+        raise ValueError(f"Invalid daemon port in address: {spec!r}")
+    return (host or "127.0.0.1", int(port))
+
+
+def _runtime_path(suffix: str) -> str:
+    """
+    Path of a per-user file in the runtime directory.
+
+    Args:
+        suffix: File name extension (".sock", ".token")
+
+    Returns:
+        Path under $XDG_RUNTIME_DIR, or the temporary directory
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    user = os.getuid() if hasattr(os, "getuid") else os.getpid()
+    return os.path.join(runtime_dir, f"figlet_forge-{user}{suffix}")
+
+
+def default_address() -> Address:
+    """
+    Get the address used when none is given.
+
+    Returns:
+        A per-user socket in the runtime directory, or a localhost TCP
+        address on platforms without Unix domain sockets
+    """
+    if sys.platform == "win32":
+        return ("127.0.0.1", DEFAULT_TCP_PORT)
+    return _runtime_path(".sock")
+
+
+def token_path() -> str:
+    """
+    Get the file holding the daemon token.
+
+    Returns:
+        A per-user path in the runtime directory
+    """
+    return _runtime_path(".token")
+
+
+def read_token(path: Optional[str] = None) -> Optional[str]:
+    """
+    Read the daemon token, if it is private to the current user.
+
+    On POSIX systems the file must be a regular file owned by the current
+    user and closed to everyone else; a token others could read or plant
+    is ignored.
+
+    Args:
+        path: Token file (defaults to token_path())
+
+    Returns:
+        The token, or None if there is no usable token file
+    """
+    path = path or token_path()
+    try:
+        info = os.lstat(path)
+        if hasattr(os, "getuid") and (
+            not stat.S_ISREG(info.st_mode)
+            or info.st_uid != os.getuid()
+            or info.st_mode & 0o077
+        ):
+            logger.warning(f"Ignoring daemon token {path}: not private to this user")
+            return None
+        with open(path, encoding="ascii") as f:
+            token = f.read().strip()
+    except (OSError, ValueError):
+        return None
+    return token or None
+
+
+def ensure_token(path: Optional[str] = None) -> str:
+    """
+    Get the daemon token, creating the token file if needed.
+
+    An existing private token is reused, so several daemons of one user
+    share it. Otherwise a new random token is written to a file created
+    with mode 0600.
+
+    Args:
+        path: Token file (defaults to token_path())
+
+    Returns:
+        The token
+
+    Raises:
+        OSError: If the token file cannot be created
+    """
+    path = path or token_path()
+    token = read_token(path)
+    if token:
+        return token
+
+    if os.path.lexists(path):
+        os.unlink(path)  # fails for a file planted by another user
+    token = secrets.token_hex(TOKEN_BYTES)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w", encoding="ascii") as f:
+        f.write(token)
+    return token
+
+
+def resolve_address(
+    spec: Optional[str] = None, force: bool = False
+) -> Optional[Address]:
+    """
+    Decide which daemon, if any, the CLI should forward to.
+
+    An explicit specification wins, then the environment variable. Without
+    either, the default Unix socket is used only if it exists, so a plain
+    invocation costs a single ``stat`` when no daemon is running.
+
+    Args:
+        spec: Explicit address specification (from ``--daemon-address``)
+        force: Try the default address even if no socket file is present
+
+    Returns:
+        Address to connect to, or None to render in-process
+    """
+    if spec:
+        return parse_address(spec)
+
+    env_spec = os.environ.get(DAEMON_ENV, "").strip()
+    if env_spec.lower() in _DISABLED_VALUES:
+        return None
+    if env_spec:
+        return parse_address(env_spec)
+
+    address = default_address()
+    if force or not isinstance(address, str) or os.path.exists(address):
+        return address
+    return None
+
+
+def format_address(address: Address) -> str:
+    """Format an address for messages."""
+    if isinstance(address, str):
+        return f"unix:{address}"
+    return f"tcp:{address[0]}:{address[1]}"
+
+
+def _connect(address: Address, timeout: Optional[float] = None) -> Any:
+    """Open a client socket to the daemon."""
+    import socket
+
+    if isinstance(address, str):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(address)
+    except OSError:
+        sock.close()
+        raise
+    sock.settimeout(None)
+    return sock
+
+
+def forward(
+    argv: List[str],
+    address: Address,
+    stdin: Optional[str] = None,
+    stdout: Optional[IO[str]] = None,
+    stderr: Optional[IO[str]] = None,
+    token: Optional[str] = None,
+) -> Optional[int]:
+    """
+    Run a CLI invocation on the daemon and stream its output.
+
+    Args:
+        argv: CLI arguments to execute
+        address: Daemon address
+        stdin: Text to present to the daemon as standard input
+        stdout: Where to write standard output (defaults to sys.stdout)
+        stderr: Where to write standard error (defaults to sys.stderr)
+        token: Daemon token (defaults to read_token())
+
+    Returns:
+        The exit code reported by the daemon, or None if no daemon could be
+        reached or there is no token (the caller should then render
+        in-process)
+    """
+    token = token or read_token()
+    if token is None:
+        logger.debug("No render daemon token; rendering in-process")
+        return None
+
+    try:
+        sock = _connect(address, timeout=1.0)
+    except OSError as e:
+        logger.debug(f"No render daemon at {format_address(address)}: {e}")
+        return None
+
+    out = stdout or sys.stdout
+    err = stderr or sys.stderr
+    request = {
+        "argv": list(argv),
+        "stdin": stdin,
+        "cwd": os.getcwd(),
+        "token": token,
+    }
+
+    with sock, sock.makefile("rwb") as stream:
+        stream.write(json.dumps(request).encode("utf-8") + b"\n")
+        stream.flush()
+        for line in stream:
+            frame = json.loads(line)
+            if "exit" in frame:
+                return int(frame["exit"])
+            target = err if frame.get("stream") == "stderr" else out
+            target.write(frame.get("data", ""))
+            target.flush()
+
+    print("Error: render daemon closed the connection", file=err)
+    return 1
+
+
+class _FrameWriter(io.TextIOBase):
+    """Text stream that forwards every write to the client as a frame."""
+
+    def __init__(self, stream: Any, name: str) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            stream: Binary socket file of the client connection
+            name: Stream name reported in frames ("stdout" or "stderr")
+        """
+        super().__init__()
+        self._stream = stream
+        self._name = name
+
+    def writable(self) -> bool:
+        """Report that the stream accepts writes."""
+        return True
+
+    def write(self, data: str) -> int:
+        """Send data to the client immediately."""
+        if data:
+            frame = {"stream": self._name, "data": data}
+            self._stream.write(json.dumps(frame).encode("utf-8") + b"\n")
+            self._stream.flush()
+        return len(data)
+
+
+def _writes_files(argv: List[str]) -> Optional[int]:
+    """
+    Check whether an invocation would read or write files by name.
+
+    The arguments are parsed with the CLI's own parser, so abbreviated and
+    combined options are recognised as they would be when running.
+
+    Args:
+        argv: CLI arguments
+
+    Returns:
+        None if the invocation may run; otherwise the exit code to report
+        (2 for --output or --batch, argparse's code for usage errors and
+        --help, whose output has already been written)
+    """
+    from .main import parse_args
+
+    try:
+        args = parse_args(argv)
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else int(e.code is not None)
+    if args.output or args.batch:
+        print("Error: --output and --batch cannot be forwarded", file=sys.stderr)
+        return 2
+    return None
+
+
+def handle_request(
+    request: Dict[str, Any],
+    stream: Any,
+    run: Callable[[List[str]], int],
+    token: Optional[str] = None,
+) -> int:
+    """
+    Execute one forwarded CLI invocation.
+
+    Standard streams and the working directory are swapped for the
+    duration of the call, so requests are handled one at a time.
+
+    Args:
+        request: Decoded request
+        stream: Binary socket file of the client connection
+        run: Callable executing CLI arguments in-process
+        token: Token the request must carry; None accepts any request
+
+    Returns:
+        The exit code of the invocation
+    """
+    if token is not None and not hmac.compare_digest(
+        str(request.get("token") or ""), token
+    ):
+        _FrameWriter(stream, "stderr").write("Error: invalid render daemon token\n")
+        return 1
+
+    argv = [str(arg) for arg in request.get("argv", [])]
+    if "--serve" in argv:
+        _FrameWriter(stream, "stderr").write("Error: --serve cannot be forwarded\n")
+        return 2
+
+    metrics.REGISTRY.inc("daemon_requests")
+    previous_cwd = os.getcwd()
+    previous_stdin = sys.stdin
+    out = _FrameWriter(stream, "stdout")
+    err = _FrameWriter(stream, "stderr")
+    try:
+        cwd = request.get("cwd")
+        if cwd and os.path.isdir(cwd):
+            os.chdir(cwd)
+        sys.stdin = io.StringIO(request.get("stdin") or "")
+        with redirect_stdout(out), redirect_stderr(err):  # type: ignore[type-var]
+            refused = _writes_files(argv)
+            if refused is not None:
+                return refused
+            try:
+                return run(argv)
+            except SystemExit as e:
+                # argparse exits on --help and on usage errors
+                return e.code if isinstance(e.code, int) else int(e.code is not None)
+    finally:
+        sys.stdin = previous_stdin
+        os.chdir(previous_cwd)
+
+
+def create_server(
+    address: Address, run: Callable[[List[str]], int], token: Optional[str] = None
+) -> Any:
+    """
+    Create (but do not start) a daemon server.
+
+    A stale Unix socket left behind by a crashed daemon is removed; a live
+    one is reported as an error. The socket is created closed to other
+    users, and every request must carry the daemon token.
+
+    Args:
+        address: Address to listen on
+        run: Callable executing CLI arguments in-process
+        token: Token requests must carry (defaults to ensure_token())
+
+    Returns:
+        A socketserver instance; call ``serve_forever()`` to run it
+
+    Raises:
+        OSError: If the address is in use by a running daemon, or the
+            token file cannot be created
+    """
+    import socketserver
+
+    token = token or ensure_token()
+
+    class Handler(socketserver.StreamRequestHandler):
+        """Serve one connection (one CLI invocation)."""
+
+        # Applied to the connection, so a silent client times out
+        timeout = REQUEST_TIMEOUT
+
+        def handle(self) -> None:
+            """Read the request, run it and send the exit frame."""
+            try:
+                line = self.rfile.readline()
+            except OSError as e:
+                logger.debug(f"Dropping render daemon client: {e}")
+                return
+            if not line:
+                return
+            try:
+                request = json.loads(line)
+                code = handle_request(request, self.wfile, run, token)
+            except Exception as e:  # never let one request kill the daemon
+                logger.exception("Render daemon request failed")
+                _FrameWriter(self.wfile, "stderr").write(f"Daemon error: {e}\n")
+                code = 1
+            self.wfile.write(json.dumps({"exit": code}).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+    metrics.REGISTRY.describe(
+        "daemon_requests", "counter", "CLI invocations served by the render daemon"
+    )
+
+    if not isinstance(address, str):
+        socketserver.TCPServer.allow_reuse_address = True
+        return socketserver.TCPServer(address, Handler)
+
+    if os.path.exists(address):
+        try:
+            _connect(address, timeout=0.5).close()
+        except OSError:
+            os.unlink(address)  # stale socket from a previous daemon
+        else:
+            raise OSError(f"A render daemon is already listening on {address}")
+
+    # Create the socket closed to other users from the start
+    previous_umask = os.umask(0o077)
+    try:
+        return socketserver.UnixStreamServer(address, Handler)
+    finally:
+        os.umask(previous_umask)
+
+
+def _stop_on_sigterm() -> None:
+    """Make SIGTERM stop the daemon the same way Ctrl-C does."""
+    import signal
+    import threading
+
+    def stop(signum: int, frame: Any) -> None:
+        raise KeyboardInterrupt
+
+    main_thread = threading.current_thread() is threading.main_thread()
+    if hasattr(signal, "SIGTERM") and main_thread:
+        signal.signal(signal.SIGTERM, stop)
+
+
+def serve(
+    address: Optional[Address],
+    run: Callable[[List[str]], int],
+    preload: Tuple[str, ...] = PRELOAD_FONTS,
+) -> int:
+    """
+    Run the daemon in the foreground until interrupted.
+
+    Args:
+        address: Address to listen on (defaults to default_address())
+        run: Callable executing CLI arguments in-process
+        preload: Fonts to parse before accepting connections
+
+    Returns:
+        Exit code for the ``--serve`` invocation
+    """
+    from ..core.figlet_font import FigletFont
+
+    address = address or default_address()
+    for font_name in preload:
+        try:
+            FigletFont.load_cached(font_name)
+        except Exception as e:
+            logger.warning(f"Could not preload font {font_name}: {e}")
+
+    try:
+        server = create_server(address, run)
+    except OSError as e:
+        print(f"Error: cannot start render daemon: {e}", file=sys.stderr)
+        return 1
+
+    _stop_on_sigterm()
+    print(
+        f"Figlet Forge daemon listening on {format_address(address)}",
+        file=sys.stderr,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if isinstance(address, str) and os.path.exists(address):
+            os.unlink(address)
+    return 0
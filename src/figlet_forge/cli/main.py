@@ -6,16 +6,34 @@ This module provides the CLI entry point and command processing
 functionality for the Figlet Forge package.
 """
 import argparse
+import logging
 import sys
 import textwrap
-from typing import List, Optional
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List, Optional
 
-from ..color import get_coloring_functions
 from ..core.exceptions import FigletError, FontNotFound
 from ..core.utils import get_terminal_size
-from ..figlet import Figlet
+from ..render import instrumentation
 from ..version import __version__
-from .showcase import ColorShowcase, display_color_showcase, generate_showcase
+
+if TYPE_CHECKING:
+    from ..color import get_coloring_functions
+    from ..core.figlet_string import FigletString
+    from ..figlet import Figlet
+    from .showcase import ColorShowcase, display_color_showcase, generate_showcase
+
+# Rendering and showcase machinery is imported on demand: forwarding to a
+# render daemon needs neither, and only --showcase/--color-list need the
+# showcase helpers
+_LAZY_IMPORTS = {
+    "Figlet": "..figlet",
+    "FigletString": "..core.figlet_string",
+    "get_coloring_functions": "..color",
+    "ColorShowcase": ".showcase",
+    "display_color_showcase": ".showcase",
+    "generate_showcase": ".showcase",
+}
 
 # Default values
 DEFAULT_WIDTH = 80
@@ -103,6 +121,12 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         const="RAINBOW",
         help="Color specification (NAME, NAME:BG, rgb;g;b, or rainbow/gradient)",
     )
+    color_options.add_argument(
+        "--color-depth",
+        choices=["auto", "truecolor", "256", "16", "none"],
+        default="auto",
+        help="Colors the output may use (default: auto, detected from the terminal)",
+    )
     color_options.add_argument(
         "--color-list",
         action="store_true",
@@ -118,6 +142,11 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     )
     output_options.add_argument("--html", action="store_true", help="Output as HTML")
     output_options.add_argument("--svg", action="store_true", help="Output as SVG")
+    output_options.add_argument(
+        "--metrics",
+        choices=["prometheus", "json"],
+        help="Print process metrics to STDERR after rendering",
+    )
 
     showcase_options = parser.add_argument_group("Showcase Options")
     showcase_options.add_argument(
@@ -145,6 +174,37 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         help="Comma-separated list of fonts to include in showcase or 'ALL' for all fonts",
     )
 
+    batch_options = parser.add_argument_group("Batch Options")
+    batch_options.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Render JSONL records from FILE ('-' for STDIN) and write JSONL results",
+    )
+    batch_options.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Worker processes for --batch (default: CPU count)",
+    )
+
+    daemon_options = parser.add_argument_group("Daemon Options")
+    daemon_options.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run a render daemon that keeps fonts and imports warm",
+    )
+    daemon_options.add_argument(
+        "--client",
+        action="store_true",
+        help="Forward to a render daemon, rendering in-process if none is running",
+    )
+    daemon_options.add_argument(
+        "--daemon-address",
+        metavar="ADDRESS",
+        help="Daemon address: unix:PATH or tcp:HOST:PORT "
+        "(default: $FIGLET_FORGE_DAEMON or a per-user socket)",
+    )
+
     # Add version option
     parser.add_argument(
         "--version", "-v", action="store_true", help="Show version information"
@@ -154,6 +214,34 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     return parsed_args
 
 
+def __getattr__(name: str) -> Any:
+    """
+    Resolve rendering and showcase helpers lazily.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The requested helper
+
+    Raises:
+        AttributeError: If the name is not a lazily imported helper
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __package__), name)
+    globals()[name] = value
+    return value
+
+
+def _load_lazy(*names: str) -> None:
+    """Import helpers into this module unless already present (or patched)."""
+    for name in names:
+        if name not in globals():
+            __getattr__(name)
+
+
 def read_input() -> str:
     """Read input text from stdin if available, with proper error handling."""
     if sys.stdin.isatty():
@@ -171,6 +259,7 @@ def read_input() -> str:
 
 def list_colors() -> None:
     """Display a list of available colors."""
+    _load_lazy("ColorShowcase")
     categories = ColorShowcase.get_color_categories()
 
     print("Available colors:")
@@ -197,19 +286,145 @@ def list_colors() -> None:
     print("  gradient_name   - e.g., red_to_blue, yellow_to_green")
 
 
-def main(argv: Optional[List[str]] = None) -> int:
+def dump_metrics(fmt: str) -> None:
+    """
+    Print the process-wide metrics registry to stderr.
+
+    Args:
+        fmt: Export format, either "prometheus" or "json"
+    """
+    from ..metrics import REGISTRY
+
+    if fmt == "json":
+        print(REGISTRY.to_json(indent=2), file=sys.stderr)
+    else:
+        print(REGISTRY.to_prometheus(), end="", file=sys.stderr)
+
+
+def run_batch_cli(args: argparse.Namespace) -> int:
+    """
+    Run --batch mode.
+
+    Args:
+        args: Parsed arguments
+
+    Returns:
+        Exit code (1 if any record failed)
+    """
+    from .batch import run_batch
+
+    if args.jobs is not None and args.jobs < 1:
+        print("Error: --jobs must be at least 1", file=sys.stderr)
+        return 2
+
+    source = sys.stdin if args.batch == "-" else open(args.batch, encoding="utf-8")
+    try:
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as out:
+                return run_batch(source, out, args.jobs)
+        return run_batch(source, sys.stdout, args.jobs)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+def _needs_stdin(args: argparse.Namespace) -> bool:
+    """Check whether an invocation will read its text from stdin."""
+    if args.batch:
+        return args.batch == "-"
+    return not (
+        args.text
+        or args.version
+        or args.list_fonts
+        or args.color_list
+        or args.showcase
+        or args.sample_color
+    )
+
+
+def forward_to_daemon(argv: List[str], args: argparse.Namespace) -> Optional[int]:
+    """
+    Run an invocation on a render daemon if one is available.
+
+    The client's terminal width, color depth and standard input are
+    resolved locally, since the daemon has none of them. Invocations that
+    write or read files by name (--output, --batch) always run in-process.
+
+    Args:
+        argv: Raw command line arguments
+        args: Parsed arguments
+
+    Returns:
+        The daemon's exit code, or None to render in-process
+    """
+    from . import daemon
+
+    if args.output or args.batch:
+        return None
+    address = daemon.resolve_address(args.daemon_address, force=args.client)
+    if address is None:
+        return None
+
+    forwarded = [arg for arg in argv if arg != "--client"]
+    if not args.width:
+        term_width, _ = get_terminal_size()
+        forwarded += ["--width", str(term_width or DEFAULT_WIDTH)]
+    if args.color and args.color_depth == "auto":
+        from ..color.depth import depth_name, detect_color_depth
+
+        forwarded += ["--color-depth", depth_name(detect_color_depth())]
+
+    stdin_text = read_input() if _needs_stdin(args) else None
+    code = daemon.forward(forwarded, address, stdin=stdin_text)
+    if code is None and stdin_text is not None:
+        # stdin is consumed; hand the text to the in-process fallback
+        args.text = [stdin_text] if stdin_text else []
+    return code
+
+
+def main(argv: Optional[List[str]] = None, use_daemon: bool = True) -> int:
     """
     Main entry point for the Figlet Forge CLI.
 
     Args:
         argv: Command line arguments (defaults to sys.argv[1:])
+        use_daemon: Forward to a running render daemon when one is found
 
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
+    logging.basicConfig(
+        level=logging.WARNING, format="%(name)s - %(levelname)s - %(message)s"
+    )
+
     try:
+        if argv is None:
+            argv = sys.argv[1:]
         args = parse_args(argv)
 
+        # Run as a render daemon if requested
+        if args.serve:
+            from . import daemon
+
+            address = (
+                daemon.parse_address(args.daemon_address)
+                if args.daemon_address
+                else None
+            )
+            return daemon.serve(address, lambda a: main(a, use_daemon=False))
+
+        # Hand the work to a warm daemon when one is running
+        if use_daemon:
+            code = forward_to_daemon(argv, args)
+            if code is not None:
+                return code
+
+        # Render a JSONL batch
+        if args.batch:
+            return run_batch_cli(args)
+
+        _load_lazy("Figlet", "FigletString", "get_coloring_functions")
+
         # Show version if requested
         if args.version:
             print(f"Figlet Forge v{__version__}")
@@ -237,6 +452,9 @@ def main(argv: Optional[List[str]] = None) -> int:
             term_width, _ = get_terminal_size()
             width = term_width if term_width else DEFAULT_WIDTH
 
+        if args.showcase or (args.sample_color and args.sample_color.upper() == "ALL"):
+            _load_lazy("display_color_showcase", "generate_showcase")
+
         # Show color showcase
         if args.sample_color and args.sample_color.upper() == "ALL":
             display_color_showcase(
@@ -316,6 +534,8 @@ def main(argv: Optional[List[str]] = None) -> int:
                 "  --color=RED:BLACK            # Foreground:Background color",
                 "  --color=rainbow              # Rainbow effect",
                 "  --color=red_to_blue          # Gradient effect",
+                "  --color=diagonal_red_to_blue # Gradient across the whole banner",
+                "  --color=plasma               # Plasma noise",
                 "  --color=green_on_black       # Preset color style",
                 "  --color-list                 # Show available colors",
                 "",
@@ -379,24 +599,33 @@ def main(argv: Optional[List[str]] = None) -> int:
             font=args.font, width=width, justify=args.justify, direction=args.direction
         )
 
-        # Render text
-        result = figlet.renderText(text)
-
-        # Apply transformations in sequence
-        if args.reverse:
-            result = result.reverse()
-        if args.flip:
-            result = result.flip()
-        if args.shade:
-            result = result.shadow()
-        elif args.border:
-            result = result.border(style=args.border)
-
-        # Apply color if specified
-        if args.color:
-            color_func = get_coloring_functions(args.color)
-            if color_func:
-                result = color_func(result)
+        # Render text and apply transformations, timed as one render
+        with instrumentation.render_scope():
+            result = figlet.renderText(text)
+
+            # Apply transformations and color as one fused pass over the rows
+            if not isinstance(result, FigletString):
+                result = FigletString(result)
+            pipeline = result.pipeline()
+            if args.reverse:
+                pipeline = pipeline.reverse()
+            if args.flip:
+                pipeline = pipeline.flip()
+            if args.shade:
+                pipeline = pipeline.shadow()
+            elif args.border:
+                pipeline = pipeline.border(style=args.border)
+            if args.color:
+                from ..color.depth import parse_depth
+
+                color_func = get_coloring_functions(
+                    args.color, parse_depth(args.color_depth)
+                )
+                if color_func:
+                    pipeline = pipeline.colorize(color_func)
+
+            with instrumentation.timed_phase("transforms"):
+                result = pipeline.apply()
 
         # Handle output formatting
         if args.html:
@@ -415,6 +644,9 @@ def main(argv: Optional[List[str]] = None) -> int:
         else:
             print(result)
 
+        if args.metrics:
+            dump_metrics(args.metrics)
+
         return 0
 
     except FontNotFound as e:
@@ -12,7 +12,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from ..color.effects import gradient_colorize, rainbow_colorize
-from ..color.figlet_color import COLOR_CODES
+from ..color.figlet_color import BG_COLOR_CODES, COLOR_CODES
 from ..core.figlet_font import FigletFont
 from ..figlet import Figlet
 from ..version import __version__
@@ -287,8 +287,8 @@ def generate_color_matrix(
         for fg, bg, name, desc in FG_BG_PAIRS:
             print(f"\033[KGenerating color style: {name} ({desc})...")
             # Create ANSI color codes
-            fg_code = f"\033[{COLOR_CODES[fg]}m" if fg in COLOR_CODES else ""
-            bg_code = f"\033[{int(COLOR_CODES[bg]) + 10}m" if bg in COLOR_CODES else ""
+            fg_code = COLOR_CODES.get(fg, "")
+            bg_code = BG_COLOR_CODES.get(bg, "")
             reset_code = "\033[0m"
 
             # Apply colors
@@ -319,7 +319,7 @@ def generate_color_matrix(
             samples = {
                 "rainbow": rainbow_colorize(plain_text),
                 "red_to_blue": gradient_colorize(plain_text, "RED", "BLUE"),
-                "green_on_black": f"\033[{COLOR_CODES['GREEN']}m\033[{int(COLOR_CODES['BLACK']) + 10}m{plain_text}\033[0m",
+                "green_on_black": f"{COLOR_CODES['GREEN']}{BG_COLOR_CODES['BLACK']}{plain_text}\033[0m",
             }
 
             print(
@@ -15,27 +15,25 @@ color_formats = {
     "yellow_on_blue": "Yellow text on blue background",
     "white_on_red": "White text on red background",
     "cyan_on_black": "Cyan text on black background",
+    "plasma": "Plasma noise across the whole banner",
+    "radial": "Gradient out from the center (e.g. radial_yellow_to_red)",
 }
 
-from typing import Callable, Optional, Union
+from importlib import import_module
+from typing import Any, Callable, Dict, Optional, Union
 
-from .effects import (
-    color_style_apply,
-    gradient_colorize,
-    highlight_pattern,
-    pulse_colorize,
-    rainbow_colorize,
-    random_colorize,
-)
+from .depth import TRUECOLOR, detect_color_depth, parse_depth
 from .figlet_color import (
     COLOR_CODES,
     RESET_COLORS,
     ColorMode,
     ColorScheme,
+    ResolvedColor,
     color_to_ansi,
     colored_format,
     get_coloring_functions,
     parse_color,
+    resolve_color,
 )
 
 
@@ -70,63 +68,27 @@ def colored_format(
     return rendered
 
 
-def get_coloring_functions(color_spec: str) -> Optional[Callable[[str], str]]:
+def get_coloring_functions(
+    color_spec: str, depth: int = TRUECOLOR
+) -> Optional[Callable[[str], str]]:
     """
     Get the appropriate coloring function based on the specification.
 
+    The spec is compiled once by the process-wide effect registry
+    (figlet_forge.color.registry); later calls with the same spec and depth
+    return the same compiled effect.
+
     Args:
         color_spec: Color specification (name, gradient, effect)
+        depth: Color depth the function writes escapes for (see
+            figlet_forge.color.depth)
 
     Returns:
         Function that applies the color to a string, or None if invalid
     """
-    # Predefined styles
-    if color_spec.lower() in [
-        "rainbow",
-        "red_to_blue",
-        "yellow_to_green",
-        "magenta_to_cyan",
-        "white_to_blue",
-        "green_on_black",
-        "red_on_black",
-        "yellow_on_blue",
-        "white_on_red",
-        "black_on_white",
-        "cyan_on_black",
-        "metal",
-        "fire",
-        "ice",
-        "neon",
-        "rgb",
-    ]:
-        return lambda text: color_style_apply(text, color_spec.lower())
-
-    # Rainbow special case
-    if color_spec.upper() == "RAINBOW":
-        return rainbow_colorize
-
-    # Gradient
-    if "_to_" in color_spec.lower():
-        colors = color_spec.lower().split("_to_")
-        if len(colors) == 2:
-            return lambda text: gradient_colorize(text, colors[0], colors[1])
-
-    # Pulse effect
-    if color_spec.lower().startswith("pulse_"):
-        base_color = color_spec[6:]
-        return lambda text: pulse_colorize(text, base_color)
-
-    # Random colors
-    if color_spec.lower() == "random":
-        return random_colorize
-
-    # Basic color (handled by parse_color)
-    try:
-        fg_code, bg_code = parse_color(color_spec)
-        return lambda text: apply_color(text, fg_code, bg_code)
-    except Exception:
-        # Return None for invalid color specs
-        return None
+    from .registry import get_registry
+
+    return get_registry().get(color_spec, depth)
 
 
 def apply_color(text: str, fg_code: str, bg_code: str = "") -> str:
@@ -153,9 +115,58 @@ def apply_color(text: str, fg_code: str, bg_code: str = "") -> str:
     return "\n".join(colored_lines)
 
 
+# Effects are imported on first access so that plain rendering, which only
+# needs figlet_color, does not pay for them
+_LAZY_EFFECTS: Dict[str, str] = {
+    "color_style_apply": ".effects",
+    "gradient_colorize": ".effects",
+    "highlight_pattern": ".effects",
+    "highlight_source": ".effects",
+    "pulse_colorize": ".effects",
+    "rainbow_colorize": ".effects",
+    "random_colorize": ".effects",
+    "style_gradient": ".effects",
+    "style_pulse": ".effects",
+    "style_solid": ".effects",
+    "Effect": ".registry",
+    "EffectRegistry": ".registry",
+    "compile_effect": ".registry",
+    "register_effect": ".registry",
+    "ColorField": ".fields",
+    "color_field": ".fields",
+    "field_colorize": ".fields",
+    "plasma_colorize": ".fields",
+    "style_field": ".fields",
+    "Style": ".styled",
+    "StyledArt": ".styled",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve color effects and the effect registry lazily.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The requested effect function or registry attribute
+
+    Raises:
+        AttributeError: If the name is not a known lazy attribute
+    """
+    if name in _LAZY_EFFECTS:
+        value = getattr(import_module(_LAZY_EFFECTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "color_to_ansi",
     "parse_color",
+    "resolve_color",
+    "ResolvedColor",
     "colored_format",
     "ColorScheme",
     "ColorMode",
@@ -164,8 +175,25 @@ __all__ = [
     "random_colorize",
     "pulse_colorize",
     "highlight_pattern",
+    "highlight_source",
     "color_style_apply",
+    "style_gradient",
+    "style_pulse",
+    "style_solid",
+    "ColorField",
+    "color_field",
+    "field_colorize",
+    "plasma_colorize",
+    "style_field",
+    "Style",
+    "StyledArt",
+    "Effect",
+    "EffectRegistry",
+    "compile_effect",
+    "register_effect",
     "color_formats",
+    "detect_color_depth",
+    "parse_depth",
     "get_coloring_functions",
     "COLOR_CODES",
     "RESET_COLORS",
@@ -0,0 +1,109 @@
+"""
+Run-length ANSI emission for Figlet Forge.
+
+Color effects decide a style (an SGR escape sequence) for every character;
+this module turns those decisions into text that switches style only where
+it changes and resets once at the end of each line, instead of wrapping
+every character in its own escape and reset.
+"""
+
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from ..version import RESET_COLORS
+
+# A style is a complete escape sequence such as "\033[38;2;255;0;0m";
+# None means the terminal's default colors
+StyleT = Optional[str]
+
+
+def emit_runs(runs: Iterable[Tuple[StyleT, str]], keep_on_blanks: bool = True) -> str:
+    """
+    Emit one line from (style, text) runs.
+
+    An escape is written only when the style changes, and a line that ends
+    in a style is reset. Styles replace each other directly, so a style
+    that sets a background should only be followed by styles that set
+    their own.
+
+    Args:
+        runs: Consecutive runs of text and the style to draw them in
+        keep_on_blanks: Let unstyled whitespace keep the current style
+            instead of resetting it; foreground colors do not show on
+            spaces, so this only saves escapes
+
+    Returns:
+        The line with ANSI escapes
+    """
+    parts: List[str] = []
+    current: StyleT = None
+    for style, text in runs:
+        if style != current:
+            if style is None:
+                if keep_on_blanks and text.isspace():
+                    parts.append(text)
+                    continue
+                parts.append(RESET_COLORS)
+            else:
+                parts.append(style)
+            current = style
+        parts.append(text)
+    if current is not None:
+        parts.append(RESET_COLORS)
+    return "".join(parts)
+
+
+def emit_line(line: str, styles: Sequence[StyleT], keep_on_blanks: bool = True) -> str:
+    """
+    Emit one line from a style per character.
+
+    Args:
+        line: Text of the line
+        styles: Style of every character of the line
+        keep_on_blanks: See emit_runs()
+
+    Returns:
+        The line with ANSI escapes
+    """
+
+    # Same rules as emit_runs(), one character at a time: per-character
+    # styles rarely repeat, so grouping them first costs more than it saves
+    parts: List[str] = []
+    current: StyleT = None
+    for char, style in zip(line, styles):
+        if style != current:
+            if style is None:
+                if keep_on_blanks and char.isspace():
+                    parts.append(char)
+                    continue
+                parts.append(RESET_COLORS)
+            else:
+                parts.append(style)
+            current = style
+        parts.append(char)
+    if current is not None:
+        parts.append(RESET_COLORS)
+    return "".join(parts)
+
+
+def emit_text(runs: Iterable[Tuple[StyleT, str]], keep_on_blanks: bool = True) -> str:
+    """
+    Emit multi-line text from (style, text) runs.
+
+    Runs may span line breaks; every line is emitted on its own, so a style
+    is reset before each newline and restored on the next line.
+
+    Args:
+        runs: Consecutive runs of text and the style to draw them in
+        keep_on_blanks: See emit_runs()
+
+    Returns:
+        The text with ANSI escapes
+    """
+    lines: List[List[Tuple[StyleT, str]]] = [[]]
+    for style, text in runs:
+        first, *rest = text.split("\n")
+        if first:
+            lines[-1].append((style, first))
+        for piece in rest:
+            lines.append([(style, piece)] if piece else [])
+    return "\n".join(emit_runs(line, keep_on_blanks) for line in lines)
@@ -0,0 +1,201 @@
+"""
+Terminal color depth for Figlet Forge.
+
+Color effects compute 24-bit colors. This module decides how many colors
+the output may use and turns an RGB value straight into the escape for that
+depth, so effects emit 256- or 16-color output directly instead of writing
+truecolor escapes and rewriting them afterwards::
+
+    from figlet_forge.color.depth import detect_color_depth
+    from figlet_forge.color.effects import gradient_colorize
+
+    art = gradient_colorize(text, "RED", "BLUE", depth=detect_color_depth())
+"""
+
+import os
+from functools import lru_cache
+from typing import Dict, Mapping, Optional
+
+from .quantize import RGB, ansi256_to_16, rgb_to_16, rgb_to_256
+
+# Supported color depths (number of colors)
+TRUECOLOR = 16777216
+ANSI_256 = 256
+ANSI_16 = 16
+NO_COLOR = 0
+
+# Names accepted by parse_depth() and the --color-depth option
+DEPTH_NAMES: Dict[str, int] = {
+    "truecolor": TRUECOLOR,
+    "24bit": TRUECOLOR,
+    "256": ANSI_256,
+    "16": ANSI_16,
+    "none": NO_COLOR,
+}
+
+# Escapes kept per (rgb, depth, background)
+ESCAPE_CACHE_SIZE = 4096
+
+
+def depth_from_env(environ: Mapping[str, str], isatty: bool = True) -> int:
+    """
+    Work out the color depth from environment variables.
+
+    NO_COLOR disables color, FORCE_COLOR (0-3) sets the depth outright, then
+    COLORTERM, TERM and finally whether the output is a terminal decide.
+
+    Args:
+        environ: Environment variables
+        isatty: Whether the output is a terminal
+
+    Returns:
+        Color depth (TRUECOLOR, ANSI_256, ANSI_16 or NO_COLOR)
+    """
+    if "NO_COLOR" in environ:
+        return NO_COLOR
+
+    forced = environ.get("FORCE_COLOR")
+    if forced is not None:
+        levels = {"0": NO_COLOR, "1": ANSI_16, "2": ANSI_256, "3": TRUECOLOR}
+        # FORCE_COLOR with any other value (e.g. "true") just forces color on
+        return levels.get(forced.strip(), ANSI_16)
+
+    if environ.get("COLORTERM", "").lower() in ("truecolor", "24bit"):
+        return TRUECOLOR
+
+    term = environ.get("TERM", "").lower()
+    if term == "dumb":
+        return NO_COLOR
+    if "256color" in term:
+        return ANSI_256
+    if "WT_SESSION" in environ:
+        # Windows Terminal supports truecolor but sets neither variable
+        return TRUECOLOR
+    if term or isatty:
+        return ANSI_16
+    return NO_COLOR
+
+
+@lru_cache(maxsize=1)
+def detect_color_depth() -> int:
+    """
+    Detect the color depth of the current terminal.
+
+    Detection runs once per process; the result is cached.
+
+    Returns:
+        Color depth (TRUECOLOR, ANSI_256, ANSI_16 or NO_COLOR)
+    """
+    try:
+        isatty = os.isatty(1)
+    except OSError:
+        isatty = False
+    return depth_from_env(os.environ, isatty)
+
+
+def parse_depth(value: Optional[str]) -> int:
+    """
+    Parse a color depth name.
+
+    Args:
+        value: A name from DEPTH_NAMES, or "auto" or None to detect the
+            depth of the terminal
+
+    Returns:
+        Color depth
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if value is None or value.lower() == "auto":
+        return detect_color_depth()
+    try:
+        return DEPTH_NAMES[value.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown color depth: {value!r} "
+            f"(expected auto or one of {', '.join(DEPTH_NAMES)})"
+        ) from None
+
+
+def depth_name(depth: int) -> str:
+    """
+    Name of a color depth, as accepted by parse_depth().
+
+    Args:
+        depth: Color depth
+
+    Returns:
+        The first name in DEPTH_NAMES for the depth
+
+    Raises:
+        ValueError: If the depth is not supported
+    """
+    for name, value in DEPTH_NAMES.items():
+        if value == depth:
+            return name
+    raise ValueError(f"Unsupported color depth: {depth}")
+
+
+@lru_cache(maxsize=ESCAPE_CACHE_SIZE)
+def rgb_escape(rgb: RGB, depth: int = TRUECOLOR, background: bool = False) -> str:
+    """
+    Escape sequence drawing an RGB color at a color depth.
+
+    Lower depths use the nearest palette color (see
+    figlet_forge.color.quantize).
+
+    Args:
+        rgb: Color to draw
+        depth: Color depth of the output
+        background: Set the background instead of the foreground
+
+    Returns:
+        The escape sequence, or "" when the depth is NO_COLOR
+    """
+    if depth >= TRUECOLOR:
+        r, g, b = rgb
+        return f"\033[{48 if background else 38};2;{r};{g};{b}m"
+    if depth >= ANSI_256:
+        return f"\033[{48 if background else 38};5;{rgb_to_256(rgb)}m"
+    if depth >= ANSI_16:
+        index = rgb_to_16(rgb)
+        base = 40 if background else 30
+        if index >= 8:
+            base += 60
+            index -= 8
+        return f"\033[{base + index}m"
+    return ""
+
+
+@lru_cache(maxsize=ESCAPE_CACHE_SIZE)
+def palette_escape(
+    index: int, depth: int = TRUECOLOR, background: bool = False
+) -> str:
+    """
+    Escape sequence drawing a color of the 256-color palette at a color depth.
+
+    The first 16 colors keep their basic codes (30-37 and 90-97, or 40-47
+    and 100-107), so the terminal's theme still decides how they look. The
+    other colors use their 256-color code, or the nearest basic color at
+    16 colors.
+
+    Args:
+        index: Palette index (0-255)
+        depth: Color depth of the output
+        background: Set the background instead of the foreground
+
+    Returns:
+        The escape sequence, or "" when the depth is NO_COLOR
+    """
+    if depth < ANSI_16:
+        return ""
+    if index >= 16:
+        if depth >= ANSI_256:
+            return f"\033[{48 if background else 38};5;{index}m"
+        index = ansi256_to_16(index)
+    base = 40 if background else 30
+    if index >= 8:
+        base += 60
+        index -= 8
+    return f"\033[{base + index}m"
@@ -3,15 +3,39 @@ Color effects for Figlet Forge.
 
 This module provides advanced color effects for ASCII art including gradients,
 rainbows, pulse effects and pattern highlighting.
+
+Every effect takes a `depth` (see figlet_forge.color.depth) and writes
+escapes in the form that depth supports: 24-bit colors by default, the
+nearest 256- or 16-color palette entry at lower depths, and the text
+unchanged at NO_COLOR. The style_*() effects write the same colors into a
+StyledArt instead of a string.
 """
 
 import re
 import sys  # Add missing import
-from typing import Optional, Tuple
+from functools import lru_cache, partial
+from itertools import cycle
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
+from ..core.char_grid import numpy_module
 from ..core.exceptions import InvalidColor
 from ..version import COLOR_CODES, RESET_COLORS
-from .figlet_color import color_to_ansi, parse_color
+from .ansi import StyleT, emit_line, emit_runs, emit_text
+from .depth import NO_COLOR, TRUECOLOR, rgb_escape
+from .fields import PLASMA_COLORS, field_colorize
+from .figlet_color import color_rgb, palette_index, parse_color, resolve_color
+from .styled import Style, StyledArt
+
+# Shortest gradient whose palette is interpolated with NumPy when available
+NUMPY_MIN_PALETTE = 256
+
+# Palettes kept for repeated (colors, length) requests
+PALETTE_CACHE_SIZE = 256
+
+# Colors of the rainbow effect, in order
+RAINBOW_COLORS = ("RED", "YELLOW", "GREEN", "CYAN", "BLUE", "MAGENTA")
+
+RGB = Tuple[int, int, int]
 
 
 def highlight_pattern(
@@ -20,6 +44,7 @@ def highlight_pattern(
     color: str,
     case_sensitive: bool = True,
     reset: bool = True,
+    depth: int = TRUECOLOR,
 ) -> str:
     """
     Highlight pattern matches in text using ANSI color codes.
@@ -30,6 +55,7 @@ def highlight_pattern(
         color: Color to use for highlighting
         case_sensitive: Whether to use case-sensitive matching
         reset: Whether to reset color after each match
+        depth: Color depth of the output
 
     Returns:
         Text with highlighted matches
@@ -48,11 +74,13 @@ def highlight_pattern(
 
     # Get ANSI color code for all cases
     try:
-        fg_code, bg_code = parse_color(color)
+        fg_code, bg_code = parse_color(color, depth)
         color_code = fg_code + bg_code
     except InvalidColor as e:
         # This is important - we need to propagate this exception for tests
         raise e
+    if depth == NO_COLOR:
+        return text
 
     # Handle parametrized test cases exactly as expected
     if is_parametrized_test:
@@ -129,19 +157,108 @@ def highlight_pattern(
     if not matches:
         return text
 
-    result = ""
+    runs: List[Tuple[StyleT, str]] = []
     last_end = 0
 
     for match in matches:
-        result += text[last_end : match.start()]
-        result += color_code + match.group(0) + RESET_COLORS
+        runs.append((None, text[last_end : match.start()]))
+        runs.append((color_code, match.group(0)))
         last_end = match.end()
 
-    result += text[last_end:]
-    return result
+    runs.append((None, text[last_end:]))
+    # A background would show on the blanks between matches
+    return emit_text(runs, keep_on_blanks=not bg_code)
 
 
-def gradient_colorize(text: str, start_color: str, end_color: str) -> str:
+def highlight_source(
+    art: str,
+    text_pattern: str,
+    color: str,
+    case_sensitive: bool = True,
+    depth: int = TRUECOLOR,
+) -> str:
+    """
+    Highlight the glyphs of input characters that match a pattern.
+
+    Unlike highlight_pattern(), which matches the characters of the art
+    itself, the pattern is matched against the text the art was rendered
+    from, and every column drawn by a matching character is colored on
+    every row. The art needs a source map (render it with
+    ``Figlet(source_map=True)``).
+
+    Args:
+        art: FigletString carrying a source map
+        text_pattern: Pattern matched against the source text (plain string
+            or regex)
+        color: Color to use for highlighting
+        case_sensitive: Whether to use case-sensitive matching
+        depth: Color depth of the output
+
+    Returns:
+        Art with the matching glyphs highlighted
+
+    Raises:
+        ValueError: If the art has no source map
+        InvalidColor: If the color specification is invalid
+    """
+    spans = getattr(art, "source_spans", None)
+    source = getattr(art, "source_text", None)
+    if spans is None or source is None:
+        raise ValueError(
+            "highlight_source() needs art rendered with Figlet(source_map=True)"
+        )
+
+    fg_code, bg_code = parse_color(color, depth)
+    color_code = fg_code + bg_code
+    if depth == NO_COLOR:
+        return str(art)
+
+    flags = 0 if case_sensitive else re.IGNORECASE
+    try:
+        matches = list(re.finditer(text_pattern, source, flags))
+    except re.error:
+        return str(art)  # Return unmodified art if pattern is invalid
+
+    # Column ranges covered by the matches, merged where they touch
+    ranges: List[List[int]] = []
+    for match in matches:
+        covered = [spans[i] for i in range(match.start(), match.end())]
+        covered = [span for span in covered if span[0] < span[1]]
+        if not covered:
+            continue
+        # Right-to-left text runs backwards, so take the outermost columns
+        ranges.append(
+            [min(span[0] for span in covered), max(span[1] for span in covered)]
+        )
+    if not ranges:
+        return str(art)
+
+    ranges.sort()
+    merged = [ranges[0]]
+    for start, end in ranges[1:]:
+        if start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    result = []
+    for row in art.splitlines():
+        runs: List[Tuple[StyleT, str]] = []
+        last_end = 0
+        for start, end in merged:
+            if start >= len(row):
+                break
+            runs.append((None, row[last_end:start]))
+            runs.append((color_code, row[start:end]))
+            last_end = end
+        runs.append((None, row[last_end:]))
+        result.append(emit_runs(runs, keep_on_blanks=not bg_code))
+    return "\n".join(result)
+
+
+def gradient_colorize(
+    text: str, start_color: str, end_color: str, depth: int = TRUECOLOR
+) -> str:
     """
     Apply gradient coloring from start_color to end_color.
 
@@ -149,6 +266,7 @@ def gradient_colorize(text: str, start_color: str, end_color: str) -> str:
         text: Text to colorize
         start_color: Starting color (name or RGB)
         end_color: Ending color (name or RGB)
+        depth: Color depth of the output
 
     Returns:
         Text with gradient coloring
@@ -165,48 +283,41 @@ def gradient_colorize(text: str, start_color: str, end_color: str) -> str:
 
     if start_rgb is None or end_rgb is None:
         raise InvalidColor(f"Invalid color specification: {start_color} or {end_color}")
+    if depth == NO_COLOR:
+        return text
 
-    # Break into lines for proper gradient
-    lines = text.splitlines()
-    result = []
-
-    for line in lines:
-        if not line.strip():
-            result.append(line)
-            continue
-
-        colored_line = []
-        visible_chars = [i for i, c in enumerate(line) if c.strip()]
-        if not visible_chars:
-            result.append(line)
-            continue
-
-        char_count = len(visible_chars)
+    return apply_gradient(
+        text, partial(gradient_palette, start_rgb, end_rgb, depth=depth)
+    )
 
-        for i, char in enumerate(line):
-            if not char.strip():
-                colored_line.append(char)
-                continue
 
-            # Calculate gradient position
-            visible_idx = visible_chars.index(i)
-            position = visible_idx / (char_count - 1) if char_count > 1 else 0
+def apply_gradient(text: str, palette: Callable[[int], Sequence[str]]) -> str:
+    """
+    Color every line of text with a gradient over its visible characters.
 
-            # Interpolate color
-            r = int(start_rgb[0] + position * (end_rgb[0] - start_rgb[0]))
-            g = int(start_rgb[1] + position * (end_rgb[1] - start_rgb[1]))
-            b = int(start_rgb[2] + position * (end_rgb[2] - start_rgb[2]))
+    Args:
+        text: Text to colorize
+        palette: Returns the escapes for a line with the given number of
+            visible characters
 
-            # Apply color
-            fg_code = f"\033[38;2;{r};{g};{b}m"
-            colored_line.append(f"{fg_code}{char}{RESET_COLORS}")
+    Returns:
+        Text with gradient coloring
+    """
+    result = []
+    for line in text.splitlines():
+        if not line.strip():
+            result.append(line)
+            continue
 
-        result.append("".join(colored_line))
+        # The gradient runs over the visible characters of the line
+        colors = iter(palette(len(line) - sum(map(str.isspace, line))))
+        styles = [None if char.isspace() else next(colors) for char in line]
+        result.append(emit_line(line, styles))
 
     return "\n".join(result)
 
 
-def rainbow_colorize(text: str) -> str:
+def rainbow_colorize(text: str, depth: int = TRUECOLOR) -> str:
     """
     Apply rainbow color effect to text.
 
@@ -215,53 +326,62 @@ def rainbow_colorize(text: str) -> str:
 
     Args:
         text: Text to colorize with rainbow effect
+        depth: Color depth of the output
 
     Returns:
         Text with rainbow color effect applied
     """
-    from ..version import RESET_COLORS
-    from .figlet_color import parse_color
-
-    # Define rainbow colors for the sequence
-    rainbow_colors = ["RED", "YELLOW", "GREEN", "CYAN", "BLUE", "MAGENTA"]
+    if depth == NO_COLOR:
+        return text
 
-    # Split into lines for processing
+    rainbow_codes = [resolve_color(color).fg for color in RAINBOW_COLORS]
     lines = text.splitlines()
-    result = []
+    return "\n".join(
+        emit_line(
+            line,
+            [None if index is None else rainbow_codes[index] for index in indices],
+        )
+        for line, indices in zip(lines, _rainbow_indices(lines))
+    )
+
+
+def _rainbow_indices(lines: Sequence[str]) -> List[List[Optional[int]]]:
+    """
+    Rainbow color of every character of the lines.
+
+    Args:
+        lines: Lines of the art
 
+    Returns:
+        Per line, an index into RAINBOW_COLORS for each visible character
+        and None for whitespace
+    """
     # Track color positions for consistency across lines
-    color_positions = {}
+    color_positions: Dict[int, int] = {}
     color_idx = 0
+    result = []
 
     for line_num, line in enumerate(lines):
-        colored_line = []
-        pos = 0
-
-        for char in line:
-            if char.strip():  # Only colorize non-whitespace
-                # Use consistent colors for the same horizontal position across lines
-                if pos in color_positions and line_num > 0:
-                    # Use same color as the position in the line above when possible
-                    current_color_idx = color_positions[pos]
-                else:
-                    # Otherwise use the next color in sequence
-                    current_color_idx = color_idx
-                    color_idx = (color_idx + 1) % len(rainbow_colors)
-                    color_positions[pos] = current_color_idx
-
-                color = rainbow_colors[current_color_idx]
-                fg_code, _ = parse_color(color)
-                colored_line.append(f"{fg_code}{char}{RESET_COLORS}")
+        indices: List[Optional[int]] = []
+        for pos, char in enumerate(line):
+            if not char.strip():  # Only colorize non-whitespace
+                indices.append(None)
+            elif pos in color_positions and line_num > 0:
+                # Use same color as the position in the line above when possible
+                indices.append(color_positions[pos])
             else:
-                colored_line.append(char)
-            pos += 1
+                # Otherwise use the next color in sequence
+                indices.append(color_idx)
+                color_positions[pos] = color_idx
+                color_idx = (color_idx + 1) % len(RAINBOW_COLORS)
+        result.append(indices)
 
-        result.append("".join(colored_line))
-
-    return "\n".join(result)
+    return result
 
 
-def pulse_colorize(text: str, color: str, intensity_levels: int = 5) -> str:
+def pulse_colorize(
+    text: str, color: str, intensity_levels: int = 5, depth: int = TRUECOLOR
+) -> str:
     """
     Apply pulsing effect using varying intensity of a color.
 
@@ -269,6 +389,7 @@ def pulse_colorize(text: str, color: str, intensity_levels: int = 5) -> str:
         text: Text to colorize
         color: Base color
         intensity_levels: Number of intensity levels for the pulse
+        depth: Color depth of the output
 
     Returns:
         Text with pulsing color effect
@@ -280,51 +401,38 @@ def pulse_colorize(text: str, color: str, intensity_levels: int = 5) -> str:
     base_rgb = _parse_color_to_rgb(color)
     if base_rgb is None:
         raise InvalidColor(f"Invalid color specification: {color}")
+    if depth == NO_COLOR:
+        return text
 
-    lines = text.splitlines()
-    result = []
-
-    for line in lines:
-        if not line.strip():
-            result.append(line)
-            continue
-
-        colored_line = []
-        visible_chars = [i for i, c in enumerate(line) if c.strip()]
-        if not visible_chars:
-            result.append(line)
-            continue
-
-        char_count = len(visible_chars)
+    return apply_pulse(text, pulse_palette(base_rgb, intensity_levels, depth))
 
-        for i, char in enumerate(line):
-            if not char.strip():
-                colored_line.append(char)
-                continue
 
-            # Calculate pulse position - create a wave pattern
-            visible_idx = visible_chars.index(i)
-            wave_pos = (
-                abs((visible_idx % (2 * intensity_levels)) - intensity_levels)
-                / intensity_levels
-            )
+def apply_pulse(text: str, palette: Sequence[str]) -> str:
+    """
+    Color every line of text with a repeating wave of escapes.
 
-            # Adjust brightness by scaling RGB values
-            factor = 0.5 + 0.5 * wave_pos  # Between 0.5 and 1.0
-            r = min(255, int(base_rgb[0] * factor))
-            g = min(255, int(base_rgb[1] * factor))
-            b = min(255, int(base_rgb[2] * factor))
+    Args:
+        text: Text to colorize
+        palette: One period of the wave
 
-            # Apply color
-            fg_code = f"\033[38;2;{r};{g};{b}m"
-            colored_line.append(f"{fg_code}{char}{RESET_COLORS}")
+    Returns:
+        Text with pulsing color effect
+    """
+    result = []
+    for line in text.splitlines():
+        if not line.strip():
+            result.append(line)
+            continue
 
-        result.append("".join(colored_line))
+        # The wave restarts on every line and repeats over visible characters
+        wave = cycle(palette)
+        styles = [None if char.isspace() else next(wave) for char in line]
+        result.append(emit_line(line, styles))
 
     return "\n".join(result)
 
 
-def random_colorize(text: str) -> str:
+def random_colorize(text: str, depth: int = TRUECOLOR) -> str:
     """
     Apply random colors to each line of ASCII art text.
 
@@ -333,24 +441,23 @@ def random_colorize(text: str) -> str:
 
     Args:
         text: ASCII art text to colorize
+        depth: Color depth of the output
 
     Returns:
         Text with random ANSI color codes applied
     """
     import random
 
-    from ..version import COLOR_CODES, RESET_COLORS
+    if depth == NO_COLOR:
+        return text
 
     result = []
-    # Use foreground color codes only (starting with '3' or '9')
-    fg_colors = [k for k, v in COLOR_CODES.items() if v.startswith(("3", "9"))]
+    fg_codes = list(COLOR_CODES.values())
 
     # Apply different random colors to each line
     for line in text.splitlines():
         if line.strip():  # Skip empty lines
-            color = random.choice(fg_colors)
-            code = COLOR_CODES[color]
-            result.append(f"\033[{code}m{line}{RESET_COLORS}")
+            result.append(f"{random.choice(fg_codes)}{line}{RESET_COLORS}")
         else:
             result.append(line)
 
@@ -367,59 +474,312 @@ def _parse_color_to_rgb(color_spec: str) -> Optional[Tuple[int, int, int]]:
     Returns:
         Tuple of (r, g, b) values or None if invalid
     """
-    # Check if it's already in RGB format
-    rgb_match = re.match(r"^(\d{1,3});(\d{1,3});(\d{1,3})$", color_spec)
-    if rgb_match:
-        return tuple(map(int, rgb_match.groups()))
-
-    # Handle named colors
-    upper_color = color_spec.upper()
-    if upper_color in COLOR_CODES:
-        # Map named colors to approximate RGB values
-        color_map = {
-            "RED": (255, 0, 0),
-            "GREEN": (0, 255, 0),
-            "BLUE": (0, 0, 255),
-            "YELLOW": (255, 255, 0),
-            "MAGENTA": (255, 0, 255),
-            "CYAN": (0, 255, 255),
-            "WHITE": (255, 255, 255),
-            "BLACK": (0, 0, 0),
-            "LIGHT_RED": (255, 100, 100),
-            "LIGHT_GREEN": (100, 255, 100),
-            "LIGHT_BLUE": (100, 100, 255),
-            "DARK_GRAY": (100, 100, 100),
-            "LIGHT_GRAY": (200, 200, 200),
-        }
-        return color_map.get(upper_color, (255, 255, 255))
-
-    # Try to parse using color_to_ansi to handle edge cases
+    if ":" in color_spec:
+        return None
     try:
-        ansi_code = color_to_ansi(color_spec)
-        # Extract color from ANSI code - this is a simplification
-        if "38;2;" in ansi_code:
-            rgb_part = ansi_code.split("38;2;")[1].split("m")[0]
-            return tuple(map(int, rgb_part.split(";")))
-        # For non-RGB ANSI codes, use approximate values
-        if "31m" in ansi_code:  # RED
-            return (255, 0, 0)
-        elif "32m" in ansi_code:  # GREEN
-            return (0, 255, 0)
-        elif "34m" in ansi_code:  # BLUE
-            return (0, 0, 255)
-    except Exception:
-        pass
-
-    return None
-
-
-def color_style_apply(text: str, style_name: str) -> str:
+        return resolve_color(color_spec).rgb
+    except InvalidColor:
+        return None
+
+
+@lru_cache(maxsize=PALETTE_CACHE_SIZE)
+def _gradient_colors(start_rgb: RGB, end_rgb: RGB, length: int) -> Tuple[RGB, ...]:
+    """
+    Colors of a gradient over `length` visible characters.
+
+    Long gradients are interpolated with NumPy when it is installed; both
+    paths compute ``int(start + position * (end - start))`` in double
+    precision and so give identical colors.
+
+    Args:
+        start_rgb: Color of the first character
+        end_rgb: Color of the last character
+        length: Number of visible characters
+
+    Returns:
+        One color per visible character
+    """
+    np = numpy_module() if length >= NUMPY_MIN_PALETTE else None
+    if np is not None:
+        positions = np.arange(length)[:, None] / (length - 1)
+        start = np.array(start_rgb)
+        channels = start + positions * (np.array(end_rgb) - start)
+        return tuple(map(tuple, channels.astype(int).tolist()))  # type: ignore
+
+    colors = []
+    for index in range(length):
+        position = index / (length - 1) if length > 1 else 0
+        colors.append(
+            tuple(int(s + position * (e - s)) for s, e in zip(start_rgb, end_rgb))
+        )
+    return tuple(colors)  # type: ignore[arg-type]
+
+
+@lru_cache(maxsize=PALETTE_CACHE_SIZE)
+def gradient_palette(
+    start_rgb: RGB, end_rgb: RGB, length: int, depth: int = TRUECOLOR
+) -> Tuple[str, ...]:
+    """
+    Escapes of a gradient over `length` visible characters.
+
+    Args:
+        start_rgb: Color of the first character
+        end_rgb: Color of the last character
+        length: Number of visible characters
+        depth: Color depth of the escapes
+
+    Returns:
+        One escape per visible character
+    """
+    return tuple(
+        rgb_escape(rgb, depth) for rgb in _gradient_colors(start_rgb, end_rgb, length)
+    )
+
+
+@lru_cache(maxsize=PALETTE_CACHE_SIZE)
+def _pulse_colors(base_rgb: RGB, intensity_levels: int) -> Tuple[RGB, ...]:
+    """
+    Colors of one period of the pulse wave.
+
+    Args:
+        base_rgb: Color at full intensity
+        intensity_levels: Number of intensity levels
+
+    Returns:
+        Colors for visible characters 0 .. 2 * intensity_levels - 1
+    """
+    colors = []
+    for index in range(2 * intensity_levels):
+        wave_pos = abs(index - intensity_levels) / intensity_levels
+        # Adjust brightness by scaling RGB values
+        factor = 0.5 + 0.5 * wave_pos  # Between 0.5 and 1.0
+        colors.append(tuple(min(255, int(c * factor)) for c in base_rgb))
+    return tuple(colors)  # type: ignore[arg-type]
+
+
+@lru_cache(maxsize=PALETTE_CACHE_SIZE)
+def pulse_palette(
+    base_rgb: RGB, intensity_levels: int, depth: int = TRUECOLOR
+) -> Tuple[str, ...]:
+    """
+    Escapes of one period of the pulse wave.
+
+    Args:
+        base_rgb: Color at full intensity
+        intensity_levels: Number of intensity levels
+        depth: Color depth of the escapes
+
+    Returns:
+        Escapes for visible characters 0 .. 2 * intensity_levels - 1
+    """
+    return tuple(
+        rgb_escape(rgb, depth) for rgb in _pulse_colors(base_rgb, intensity_levels)
+    )
+
+
+def _styled(art: Union[str, StyledArt]) -> StyledArt:
+    """Wrap art in a StyledArt unless it already is one."""
+    return art if isinstance(art, StyledArt) else StyledArt(art)
+
+
+def style_gradient(
+    art: Union[str, StyledArt], start_color: str, end_color: str
+) -> StyledArt:
+    """
+    Write a gradient over the visible characters of each line into art.
+
+    Uses the same colors as gradient_colorize().
+
+    Args:
+        art: Text to wrap, or StyledArt to paint in place
+        start_color: Starting color (name or RGB)
+        end_color: Ending color (name or RGB)
+
+    Returns:
+        The painted StyledArt
+
+    Raises:
+        InvalidColor: If color specifications are invalid
+    """
+    start_rgb = _parse_color_to_rgb(start_color)
+    end_rgb = _parse_color_to_rgb(end_color)
+    if start_rgb is None or end_rgb is None:
+        raise InvalidColor(f"Invalid color specification: {start_color} or {end_color}")
+
+    styled = _styled(art)
+    for row, line in enumerate(styled.rows):
+        visible = len(line) - sum(map(str.isspace, line))
+        if not visible:
+            continue
+        colors = iter(_gradient_colors(start_rgb, end_rgb, visible))
+        styles = [None if char.isspace() else Style(next(colors)) for char in line]
+        styled.set_styles(row, styles)
+    return styled
+
+
+def style_pulse(
+    art: Union[str, StyledArt],
+    color: str,
+    intensity_levels: int = 5,
+    offset: int = 0,
+) -> StyledArt:
+    """
+    Write a pulse wave of one color into art.
+
+    Uses the same colors as pulse_colorize().
+
+    Args:
+        art: Text to wrap, or StyledArt to paint in place
+        color: Base color
+        intensity_levels: Number of intensity levels for the pulse
+        offset: Visible characters to shift the wave to the right by; the
+            wave repeats every 2 * intensity_levels
+
+    Returns:
+        The painted StyledArt
+
+    Raises:
+        InvalidColor: If the color specification is invalid
+    """
+    base_rgb = _parse_color_to_rgb(color)
+    if base_rgb is None:
+        raise InvalidColor(f"Invalid color specification: {color}")
+
+    wave = [Style(rgb) for rgb in _pulse_colors(base_rgb, intensity_levels)]
+    shift = offset % len(wave)
+    wave = wave[len(wave) - shift :] + wave[: len(wave) - shift]
+    styled = _styled(art)
+    for row, line in enumerate(styled.rows):
+        styles = cycle(wave)
+        styled.set_styles(
+            row, [None if char.isspace() else next(styles) for char in line]
+        )
+    return styled
+
+
+def style_rainbow(art: Union[str, StyledArt], offset: int = 0) -> StyledArt:
+    """
+    Write the rainbow of rainbow_colorize() into art.
+
+    Args:
+        art: Text to wrap, or StyledArt to paint in place
+        offset: Steps to advance every character along the rainbow; the
+            colors repeat every len(RAINBOW_COLORS) steps
+
+    Returns:
+        The painted StyledArt
+    """
+    # Palette indices make the frames use rainbow_colorize()'s codes
+    rainbow = [
+        Style(color_rgb(color), None, palette_index(color)) for color in RAINBOW_COLORS
+    ]
+    styled = _styled(art)
+    for row, indices in enumerate(_rainbow_indices(styled.rows)):
+        styled.set_styles(
+            row,
+            [
+                None if index is None else rainbow[(index + offset) % len(rainbow)]
+                for index in indices
+            ],
+        )
+    return styled
+
+
+def style_shine(
+    art: Union[str, StyledArt],
+    color: str,
+    highlight: str = "WHITE",
+    position: int = 0,
+    width: int = 6,
+) -> StyledArt:
+    """
+    Write one color with a slanted band of highlight into art.
+
+    The band runs along the cells where column + row is constant and
+    fades linearly from its center to its edges; moving `position` sweeps
+    it across the art.
+
+    Args:
+        art: Text to wrap, or StyledArt to paint in place
+        color: Base color
+        highlight: Color at the center of the band
+        position: Column + row of the center of the band
+        width: Width of the band in cells
+
+    Returns:
+        The painted StyledArt
+
+    Raises:
+        InvalidColor: If a color specification is invalid
+    """
+    base_rgb = _parse_color_to_rgb(color)
+    highlight_rgb = _parse_color_to_rgb(highlight)
+    if base_rgb is None or highlight_rgb is None:
+        raise InvalidColor(f"Invalid color specification: {color} or {highlight}")
+
+    half = max(width, 1) / 2
+    base = Style(base_rgb)
+    # Colors across the band, by distance from its center
+    band = [
+        Style(
+            tuple(  # type: ignore[arg-type]
+                int(b + (1 - distance / half) * (h - b))
+                for b, h in zip(base_rgb, highlight_rgb)
+            )
+        )
+        for distance in range(int(half) + 1)
+    ]
+    styled = _styled(art)
+    for row, line in enumerate(styled.rows):
+        styles: List[Optional[Style]] = []
+        for column, char in enumerate(line):
+            distance = abs(column + row - position)
+            if char.isspace():
+                styles.append(None)
+            elif distance < half:
+                styles.append(band[int(distance)])
+            else:
+                styles.append(base)
+        styled.set_styles(row, styles)
+    return styled
+
+
+def style_solid(art: Union[str, StyledArt], color_spec: str) -> StyledArt:
+    """
+    Write one foreground and background color into the visible cells of art.
+
+    Named colors are written with their palette codes, like parse_color()
+    writes them; "R;G;B" colors are written at the output's depth.
+
+    Args:
+        art: Text to wrap, or StyledArt to paint in place
+        color_spec: Color specification (e.g. "RED", "RED:BLACK", "255;0;0")
+
+    Returns:
+        The painted StyledArt
+
+    Raises:
+        InvalidColor: If the specification is invalid or has no RGB value
+    """
+    fg_part, _, bg_part = color_spec.partition(":")
+    resolve_color(color_spec)  # Validates both parts
+    fg = color_rgb(fg_part) if fg_part else None
+    bg = color_rgb(bg_part) if bg_part else None
+    if (fg_part and fg is None) or (bg_part and bg is None):
+        raise InvalidColor(f"Color has no RGB value: {color_spec}", color_spec)
+    # Named colors keep their palette codes, as parse_color() writes them
+    style = Style(fg, bg, palette_index(fg_part), palette_index(bg_part))
+    return _styled(art).fill(style, visible_only=bg is None)
+
+
+def color_style_apply(text: str, style_name: str, depth: int = TRUECOLOR) -> str:
     """
     Apply predefined color styles to text.
 
     Args:
         text: Text to colorize
         style_name: Name of the style to apply
+        depth: Color depth of the output
 
     Returns:
         Styled text
@@ -427,36 +787,16 @@ def color_style_apply(text: str, style_name: str) -> str:
     Raises:
         ValueError: If style name is not recognized
     """
-    # Define a dictionary of color styles
-    styles = {
-        "rainbow": lambda t: rainbow_colorize(t),
-        "red_to_blue": lambda t: gradient_colorize(t, "RED", "BLUE"),
-        "yellow_to_green": lambda t: gradient_colorize(t, "YELLOW", "GREEN"),
-        "magenta_to_cyan": lambda t: gradient_colorize(t, "MAGENTA", "CYAN"),
-        "white_to_blue": lambda t: gradient_colorize(t, "WHITE", "BLUE"),
-        "red_on_black": lambda t: _apply_fg_bg(t, "RED", "BLACK"),
-        "green_on_black": lambda t: _apply_fg_bg(t, "GREEN", "BLACK"),
-        "yellow_on_blue": lambda t: _apply_fg_bg(t, "YELLOW", "BLUE"),
-        "white_on_red": lambda t: _apply_fg_bg(t, "WHITE", "RED"),
-        "black_on_white": lambda t: _apply_fg_bg(t, "BLACK", "WHITE"),
-        "cyan_on_black": lambda t: _apply_fg_bg(t, "CYAN", "BLACK"),
-        # Add standard figlet color combinations
-        "metal": lambda t: gradient_colorize(t, "WHITE", "GRAY"),
-        "fire": lambda t: gradient_colorize(t, "YELLOW", "RED"),
-        "ice": lambda t: gradient_colorize(t, "WHITE", "CYAN"),
-        "neon": lambda t: _apply_fg_bg(t, "GREEN", "BLACK"),
-        "rgb": lambda t: _apply_rgb_cycle(t),
-    }
-
     # Check if style exists
-    if style_name not in styles:
+    if style_name not in COLOR_STYLES:
         raise ValueError(f"Unknown color style: {style_name}")
 
     # Apply the style
-    return styles[style_name](text)
+    kind, *args = COLOR_STYLES[style_name]
+    return _STYLE_KINDS[kind](text, *args, depth=depth)
 
 
-def _apply_fg_bg(text: str, fg: str, bg: str) -> str:
+def _apply_fg_bg(text: str, fg: str, bg: str, depth: int = TRUECOLOR) -> str:
     """
     Apply foreground and background colors to text.
 
@@ -464,6 +804,7 @@ def _apply_fg_bg(text: str, fg: str, bg: str) -> str:
         text: Text to colorize
         fg: Foreground color
         bg: Background color
+        depth: Color depth of the output
 
     Returns:
         Colorized text
@@ -471,8 +812,10 @@ def _apply_fg_bg(text: str, fg: str, bg: str) -> str:
     if not text:
         return ""
 
-    fg_code, _ = parse_color(fg)
-    _, bg_code = parse_color(f":{bg}")
+    fg_code, _ = parse_color(fg, depth)
+    _, bg_code = parse_color(f":{bg}", depth)
+    if depth == NO_COLOR:
+        return text
 
     lines = text.splitlines()
     result = []
@@ -483,37 +826,76 @@ def _apply_fg_bg(text: str, fg: str, bg: str) -> str:
     return "\n".join(result)
 
 
-# Add new RGB cycle function for alternating RGB coloring
-def _apply_rgb_cycle(text: str) -> str:
+def rgb_cycle_colorize(text: str, depth: int = TRUECOLOR) -> str:
     """
     Apply RGB cycle (red, green, blue) to text.
 
     Args:
         text: Text to colorize
+        depth: Color depth of the output
 
     Returns:
         Colorized text with RGB cycle
     """
     if not text:
         return ""
+    if depth == NO_COLOR:
+        return text
 
-    colors = ["RED", "GREEN", "BLUE"]
+    codes = [resolve_color(color).fg for color in ("RED", "GREEN", "BLUE")]
     lines = text.splitlines()
     result = []
 
     for line_num, line in enumerate(lines):
-        colored_line = []
+        styles: List[StyleT] = []
         color_idx = line_num % 3  # Different starting color for each line
 
         for char in line:
             if char.strip():  # Only colorize non-whitespace
-                color = colors[color_idx]
+                styles.append(codes[color_idx])
                 color_idx = (color_idx + 1) % 3
-                fg_code, _ = parse_color(color)
-                colored_line.append(f"{fg_code}{char}{RESET_COLORS}")
             else:
-                colored_line.append(char)
+                styles.append(None)
 
-        result.append("".join(colored_line))
+        result.append(emit_line(line, styles))
 
     return "\n".join(result)
+
+
+# Predefined color styles: name -> (kind, *arguments)
+COLOR_STYLES: Dict[str, Tuple[str, ...]] = {
+    "rainbow": ("rainbow",),
+    "red_to_blue": ("gradient", "RED", "BLUE"),
+    "yellow_to_green": ("gradient", "YELLOW", "GREEN"),
+    "magenta_to_cyan": ("gradient", "MAGENTA", "CYAN"),
+    "white_to_blue": ("gradient", "WHITE", "BLUE"),
+    "red_on_black": ("fg_bg", "RED", "BLACK"),
+    "green_on_black": ("fg_bg", "GREEN", "BLACK"),
+    "yellow_on_blue": ("fg_bg", "YELLOW", "BLUE"),
+    "white_on_red": ("fg_bg", "WHITE", "RED"),
+    "black_on_white": ("fg_bg", "BLACK", "WHITE"),
+    "cyan_on_black": ("fg_bg", "CYAN", "BLACK"),
+    # Add standard figlet color combinations
+    "metal": ("gradient", "WHITE", "GRAY"),
+    "fire": ("gradient", "YELLOW", "RED"),
+    "ice": ("gradient", "WHITE", "CYAN"),
+    "neon": ("fg_bg", "GREEN", "BLACK"),
+    "rgb": ("rgb_cycle",),
+    # Color fields over the whole banner: ("field", field kind, *color stops)
+    "plasma": ("field", "plasma", *PLASMA_COLORS),
+    "sunset": ("field", "vertical", "YELLOW", "RED", "MAGENTA"),
+    "glow": ("field", "radial", "WHITE", "YELLOW", "RED"),
+}
+
+# Effect behind each kind of style, looked up by name when a style is applied
+_STYLE_KINDS: Dict[str, Callable[..., str]] = {
+    "rainbow": lambda text, depth: rainbow_colorize(text, depth=depth),
+    "gradient": lambda text, start, end, depth: gradient_colorize(
+        text, start, end, depth=depth
+    ),
+    "fg_bg": lambda text, fg, bg, depth: _apply_fg_bg(text, fg, bg, depth=depth),
+    "rgb_cycle": lambda text, depth: rgb_cycle_colorize(text, depth=depth),
+    "field": lambda text, kind, *colors, depth: field_colorize(
+        text, kind, colors, depth=depth
+    ),
+}
@@ -0,0 +1,366 @@
+"""
+Color fields over a whole banner.
+
+The line effects in figlet_forge.color.effects color each line on its own.
+A color field instead gives every cell of the grid a color from its
+position in the whole banner: horizontal, vertical, diagonal and radial
+gradients, and plasma-style noise made of overlapping sine waves::
+
+    from figlet_forge.color.fields import field_colorize, plasma_colorize
+
+    print(field_colorize(art, "radial", ("YELLOW", "RED", "BLUE")))
+    print(plasma_colorize(art, phase=0.25))
+
+A field is computed for the whole grid in one pass, as NumPy arrays when
+NumPy is installed and the grid is large, and stored as a palette of
+distinct colors plus a grid of palette indices. The indices are painted
+into a StyledArt, so the run-length emitter writes one escape per change
+of color. Fields are cached per size, kind, colors and phase.
+"""
+
+import math
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence, Tuple, Union
+
+from ..core.char_grid import numpy_module
+from ..core.exceptions import InvalidColor
+from .depth import NO_COLOR, TRUECOLOR
+from .figlet_color import resolve_color
+from .styled import Style, StyledArt
+
+RGB = Tuple[int, int, int]
+
+# Kinds of field, in the order they are documented
+FIELD_KINDS = ("horizontal", "vertical", "diagonal", "radial", "plasma")
+
+# Default colors of the plasma effect
+PLASMA_COLORS = ("BLUE", "MAGENTA", "RED", "YELLOW")
+
+# Height of a terminal cell relative to its width; vertical distances are
+# stretched by it so diagonals run at 45 degrees and circles look round
+CELL_ASPECT = 2.0
+
+# Spatial frequency of the plasma waves, in radians per cell
+PLASMA_SCALE = 0.25
+
+# Smallest grid whose field is computed with NumPy when available
+NUMPY_MIN_FIELD = 1024
+
+# Fields kept for repeated (kind, size, colors, phase) requests
+FIELD_CACHE_SIZE = 64
+
+
+class ColorField(NamedTuple):
+    """
+    Colors of a grid as a palette and a palette index per cell.
+
+    Attributes:
+        palette: Distinct colors of the field
+        indices: One row of palette indices per line of the grid
+    """
+
+    palette: Tuple[RGB, ...]
+    indices: Tuple[Tuple[int, ...], ...]
+
+    def color_at(self, x: int, y: int) -> RGB:
+        """
+        Color of one cell.
+
+        Args:
+            x: Column
+            y: Row
+
+        Returns:
+            The cell's color
+        """
+        return self.palette[self.indices[y][x]]
+
+
+def _position(
+    kind: str,
+    x: Any,
+    y: Any,
+    width: int,
+    height: int,
+    phase: float,
+    sin: Callable[[Any], Any],
+    sqrt: Callable[[Any], Any],
+) -> Any:
+    """
+    Position of cells along the color stops, from 0 to 1.
+
+    Written once for both backends: x and y are either numbers or NumPy
+    coordinate arrays, and sin and sqrt come from math or NumPy. The
+    operations are the same, so both backends give the same positions.
+
+    Args:
+        kind: Kind of field
+        x: Column of each cell
+        y: Row of each cell
+        width: Width of the grid
+        height: Height of the grid
+        phase: Position in the animation cycle (0 to 1)
+        sin: Sine function of the backend
+        sqrt: Square root function of the backend
+
+    Returns:
+        Position of each cell
+    """
+    if kind == "plasma":
+        angle = 2 * math.pi * phase
+        y = y * CELL_ASPECT
+        cx = (width - 1) / 2
+        cy = (height - 1) * CELL_ASPECT / 2
+        radius = sqrt((x - cx) * (x - cx) + (y - cy) * (y - cy))
+        value = (
+            sin(x * PLASMA_SCALE + angle)
+            + sin(y * PLASMA_SCALE - angle)
+            + sin((x + y) * PLASMA_SCALE / 2 + angle)
+            + sin(radius * PLASMA_SCALE + 2 * angle)
+        )
+        return (value + 4) / 8
+
+    if kind == "horizontal":
+        t = x / (width - 1) if width > 1 else x * 0.0
+    elif kind == "vertical":
+        t = y / (height - 1) if height > 1 else y * 0.0
+    elif kind == "diagonal":
+        span = (width - 1) + (height - 1) * CELL_ASPECT
+        t = (x + y * CELL_ASPECT) / span if span else x * 0.0
+    else:
+        cx = (width - 1) / 2
+        cy = (height - 1) * CELL_ASPECT / 2
+        dy = y * CELL_ASPECT - cy
+        reach = sqrt(cx * cx + cy * cy)
+        distance = sqrt((x - cx) * (x - cx) + dy * dy)
+        t = distance / reach if reach else x * 0.0
+    if phase:
+        # Scroll along a there-and-back path, so the cycle has no seam
+        t = 1 - abs(1 - 2 * ((t / 2 + phase) % 1))
+    return t
+
+
+def _field_python(
+    kind: str, width: int, height: int, stops: Tuple[RGB, ...], phase: float
+) -> ColorField:
+    """Compute a field one cell at a time; see _field()."""
+    last = len(stops) - 2
+    palette: List[RGB] = []
+    seen: Dict[RGB, int] = {}
+    indices = []
+    for y in range(height):
+        row = []
+        for x in range(width):
+            position = _position(
+                kind, x, y, width, height, phase, math.sin, math.sqrt
+            ) * (last + 1)
+            stop = min(int(position), last)
+            fraction = position - stop
+            start, end = stops[stop], stops[stop + 1]
+            rgb = tuple(int(s + fraction * (e - s)) for s, e in zip(start, end))
+            index = seen.get(rgb)
+            if index is None:
+                index = seen[rgb] = len(palette)
+                palette.append(rgb)  # type: ignore[arg-type]
+            row.append(index)
+        indices.append(tuple(row))
+    return ColorField(tuple(palette), tuple(indices))
+
+
+def _field_numpy(
+    np: Any,
+    kind: str,
+    width: int,
+    height: int,
+    stops: Tuple[RGB, ...],
+    phase: float,
+) -> ColorField:
+    """Compute a field as NumPy arrays; see _field()."""
+    last = len(stops) - 2
+    y, x = np.mgrid[0:height, 0:width].astype(float)
+    position = _position(kind, x, y, width, height, phase, np.sin, np.sqrt) * (
+        last + 1
+    )
+    stop = np.minimum(position.astype(int), last)
+    fraction = (position - stop)[..., None]
+    colors = np.array(stops)
+    start, end = colors[stop], colors[stop + 1]
+    rgb = (start + fraction * (end - start)).astype(np.int64)
+    codes = (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+    # Number the distinct colors in order of first appearance, as the
+    # per-cell path does, so both give the same palette and indices
+    unique, first, inverse = np.unique(
+        codes.ravel(), return_index=True, return_inverse=True
+    )
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    indices = rank[inverse].reshape(height, width)
+    palette = tuple(
+        (code >> 16, (code >> 8) & 255, code & 255) for code in unique[order].tolist()
+    )
+    return ColorField(palette, tuple(map(tuple, indices.tolist())))
+
+
+@lru_cache(maxsize=FIELD_CACHE_SIZE)
+def _field(
+    kind: str, width: int, height: int, stops: Tuple[RGB, ...], phase: float
+) -> ColorField:
+    """
+    Compute the colors of a grid.
+
+    Each cell's position (0 to 1) is mapped onto the color stops, which
+    are evenly spaced and linearly interpolated.
+
+    Args:
+        kind: Kind of field (see FIELD_KINDS)
+        width: Width of the grid
+        height: Height of the grid
+        stops: RGB colors of the stops, at least two
+        phase: Position in the animation cycle (0 to 1)
+
+    Returns:
+        The field
+    """
+    np = numpy_module() if width * height >= NUMPY_MIN_FIELD else None
+    if np is not None:
+        return _field_numpy(np, kind, width, height, stops, phase)
+    return _field_python(kind, width, height, stops, phase)
+
+
+def _stops(colors: Sequence[str]) -> Tuple[RGB, ...]:
+    """
+    Resolve color stops to RGB.
+
+    Args:
+        colors: Color names or "R;G;B" values
+
+    Returns:
+        RGB color of each stop
+
+    Raises:
+        InvalidColor: If a color is invalid or has no RGB value, or fewer
+            than two are given
+    """
+    if isinstance(colors, str) or len(colors) < 2:
+        raise InvalidColor(f"A color field needs at least two colors: {colors!r}")
+    stops = []
+    for color in colors:
+        rgb = None if ":" in color else resolve_color(color).rgb
+        if rgb is None:
+            raise InvalidColor(f"Color has no RGB value: {color}", color)
+        stops.append(rgb)
+    return tuple(stops)
+
+
+def color_field(
+    kind: str,
+    width: int,
+    height: int,
+    colors: Sequence[str] = PLASMA_COLORS,
+    phase: float = 0.0,
+) -> ColorField:
+    """
+    Compute the colors of a grid.
+
+    Args:
+        kind: "horizontal", "vertical", "diagonal", "radial" or "plasma"
+        width: Width of the grid
+        height: Height of the grid
+        colors: Color stops, from position 0 to position 1
+        phase: Position in the animation cycle, 0 to 1; gradients scroll
+            back and forth and plasma waves move, and phase 1 looks like
+            phase 0
+
+    Returns:
+        The field
+
+    Raises:
+        ValueError: If the kind is unknown
+        InvalidColor: If the colors are invalid
+    """
+    if kind not in FIELD_KINDS:
+        raise ValueError(f"Unknown color field: {kind}")
+    return _field(kind, width, height, _stops(colors), float(phase) % 1)
+
+
+def style_field(
+    art: Union[str, StyledArt],
+    kind: str,
+    colors: Sequence[str] = PLASMA_COLORS,
+    phase: float = 0.0,
+) -> StyledArt:
+    """
+    Write a color field into the visible cells of art.
+
+    Args:
+        art: Text to wrap, or StyledArt to paint in place
+        kind: Kind of field (see color_field())
+        colors: Color stops
+        phase: Position in the animation cycle (see color_field())
+
+    Returns:
+        The painted StyledArt
+
+    Raises:
+        ValueError: If the kind is unknown
+        InvalidColor: If the colors are invalid
+    """
+    styled = art if isinstance(art, StyledArt) else StyledArt(art)
+    width, height = styled.dimensions
+    field = color_field(kind, max(width, 1), max(height, 1), colors, phase)
+    return styled.paint([Style(rgb) for rgb in field.palette], field.indices)
+
+
+def field_colorize(
+    text: str,
+    kind: str,
+    colors: Sequence[str] = PLASMA_COLORS,
+    phase: float = 0.0,
+    depth: int = TRUECOLOR,
+) -> str:
+    """
+    Color text with a field over the whole banner.
+
+    Args:
+        text: Text to colorize
+        kind: "horizontal", "vertical", "diagonal", "radial" or "plasma"
+        colors: Color stops, from position 0 to position 1
+        phase: Position in the animation cycle (see color_field())
+        depth: Color depth of the output
+
+    Returns:
+        Colorized text
+
+    Raises:
+        ValueError: If the kind is unknown
+        InvalidColor: If the colors are invalid
+    """
+    if kind not in FIELD_KINDS:
+        raise ValueError(f"Unknown color field: {kind}")
+    _stops(colors)
+    if not text or depth == NO_COLOR:
+        return text
+    return style_field(text, kind, colors, phase).to_ansi(depth)
+
+
+def plasma_colorize(
+    text: str,
+    phase: float = 0.0,
+    colors: Sequence[str] = PLASMA_COLORS,
+    depth: int = TRUECOLOR,
+) -> str:
+    """
+    Color text with plasma noise.
+
+    Args:
+        text: Text to colorize
+        phase: Position in the animation cycle, 0 to 1
+        colors: Color stops of the plasma
+        depth: Color depth of the output
+
+    Returns:
+        Colorized text
+    """
+    return field_colorize(text, "plasma", colors, phase, depth)
@@ -7,10 +7,54 @@ creating colorized ASCII art output with ANSI escape sequences.
 
 import random
 import re
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
 
+from .. import metrics
 from ..core.exceptions import InvalidColor
-from ..version import COLOR_CODES, RESET_COLORS
+from ..version import BG_COLOR_CODES, COLOR_CODES, RESET_COLORS
+from .depth import NO_COLOR, TRUECOLOR, rgb_escape
+
+RGB = Tuple[int, int, int]
+
+# Approximate RGB values of the named colors, for effects that interpolate
+NAMED_RGB: Dict[str, RGB] = {
+    "BLACK": (0, 0, 0),
+    "RED": (255, 0, 0),
+    "GREEN": (0, 255, 0),
+    "YELLOW": (255, 255, 0),
+    "BLUE": (0, 0, 255),
+    "MAGENTA": (255, 0, 255),
+    "CYAN": (0, 255, 255),
+    "WHITE": (255, 255, 255),
+    "LIGHT_BLACK": (128, 128, 128),
+    "LIGHT_RED": (255, 100, 100),
+    "LIGHT_GREEN": (100, 255, 100),
+    "LIGHT_YELLOW": (255, 255, 100),
+    "LIGHT_BLUE": (100, 100, 255),
+    "LIGHT_MAGENTA": (255, 100, 255),
+    "LIGHT_CYAN": (100, 255, 255),
+    "LIGHT_WHITE": (255, 255, 255),
+}
+
+# Number of distinct color specs whose parse results are kept
+COLOR_CACHE_SIZE = 512
+
+_RGB_SPEC = re.compile(r"^(\d{1,3});(\d{1,3});(\d{1,3})$")
+
+# Palette index of each named color, read from its escape code (30-37, 90-97)
+_NAMED_INDEX: Dict[str, int] = {
+    name: int(code[2:-1]) - (30 if int(code[2:-1]) < 90 else 82)
+    for name, code in COLOR_CODES.items()
+}
+
+
+class ResolvedColor(NamedTuple):
+    """A parsed color specification."""
+
+    fg: str
+    bg: str
+    rgb: Optional[RGB]  # Foreground color, when it has an RGB value
 
 
 class ColorMode:
@@ -109,12 +153,13 @@ class ColorScheme:
         return cls(fg, bg, name=color_spec)
 
 
-def parse_color(color_spec: str) -> Tuple[str, str]:
+def parse_color(color_spec: str, depth: int = TRUECOLOR) -> Tuple[str, str]:
     """
     Parse a color specification string into foreground and background ANSI codes.
 
     Args:
         color_spec: Color specification (e.g., "RED:BLUE", "RED", "255;0;0:0;0;255")
+        depth: Color depth of the output (see figlet_forge.color.depth)
 
     Returns:
         Tuple of (foreground_ansi_code, background_ansi_code)
@@ -122,23 +167,48 @@ def parse_color(color_spec: str) -> Tuple[str, str]:
     Raises:
         InvalidColor: If the color specification is invalid
     """
-    if not color_spec or color_spec == ":":
-        return "", ""
+    # Random colors are drawn on every call, so they bypass the cache
+    if color_spec and color_spec.upper() == "RANDOM":
+        if depth == NO_COLOR:
+            return "", ""
+        return random.choice(list(COLOR_CODES.values())), ""
+
+    fg_code, bg_code, _ = resolve_color(color_spec, depth)
+    return fg_code, bg_code
+
+
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def resolve_color(color_spec: str, depth: int = TRUECOLOR) -> ResolvedColor:
+    """
+    Parse a color specification once.
 
-    # Special case for random colors
-    if color_spec.upper() == "RANDOM":
-        fg_color = random.choice(list(COLOR_CODES.keys()))
-        bg_color = ""
-        return f"\033[{COLOR_CODES[fg_color]}m", ""
+    Results are cached per spec string and depth, so effects and renderers
+    can resolve colors freely without re-parsing them. Unlike parse_color(),
+    "RANDOM" is not drawn here and resolves like any other unknown name.
+
+    Args:
+        color_spec: Color specification (e.g., "RED:BLUE", "RED", "255;0;0")
+        depth: Color depth of the escape codes; RGB colors are converted to
+            the nearest color the depth can show, and NO_COLOR gives empty
+            codes for valid specs
+
+    Returns:
+        Foreground and background escape codes and the foreground RGB value
+
+    Raises:
+        InvalidColor: If the color specification is invalid
+    """
+    if not color_spec or color_spec == ":":
+        return ResolvedColor("", "", None)
 
     # Special case for rainbow (handled differently in effects module)
     if color_spec.upper() == "RAINBOW":
-        return "RAINBOW", ""
+        return ResolvedColor("RAINBOW", "", None)
 
     # Check if we have a gradient specification
     if color_spec.upper().startswith("GRADIENT:"):
         # This will be handled by the effects module
-        return color_spec.upper(), ""
+        return ResolvedColor(color_spec.upper(), "", None)
 
     # Split into foreground and background
     parts = color_spec.split(":", 1)
@@ -148,14 +218,54 @@ def parse_color(color_spec: str) -> Tuple[str, str]:
     # Process foreground color
     fg_code = ""
     if fg_part:
-        fg_code = _process_color_part(fg_part, is_background=False)
+        fg_code = _process_color_part(fg_part, False, depth)
 
     # Process background color
     bg_code = ""
     if bg_part:
-        bg_code = _process_color_part(bg_part, is_background=True)
+        bg_code = _process_color_part(bg_part, True, depth)
 
-    return fg_code, bg_code
+    return ResolvedColor(fg_code, bg_code, color_rgb(fg_part))
+
+
+def color_rgb(color_part: str) -> Optional[RGB]:
+    """
+    RGB value of a valid single color.
+
+    Args:
+        color_part: Color name or "R;G;B" string
+
+    Returns:
+        RGB tuple, or None if the color has no RGB value
+    """
+    rgb_match = _RGB_SPEC.match(color_part)
+    if rgb_match:
+        return tuple(map(int, rgb_match.groups()))  # type: ignore[return-value]
+    return NAMED_RGB.get(_named(color_part))
+
+
+def palette_index(color_part: str) -> Optional[int]:
+    """
+    Index in the 16-color palette of a named color.
+
+    Named colors are drawn with their palette codes ("\\033[31m" for RED),
+    so styles keep this index to write the same codes.
+
+    Args:
+        color_part: Color name or "R;G;B" string
+
+    Returns:
+        Palette index 0-15, or None for "R;G;B" and unknown colors
+    """
+    return _NAMED_INDEX.get(_named(color_part))
+
+
+def _named(color_part: str) -> str:
+    """Key of a color name in NAMED_RGB, with BRIGHT_ spelled LIGHT_."""
+    upper_color = color_part.upper()
+    if upper_color.startswith("BRIGHT_"):
+        upper_color = "LIGHT_" + upper_color[7:]
+    return upper_color
 
 
 def color_to_ansi(color_part: str, is_background: bool = False) -> str:
@@ -176,13 +286,17 @@ def color_to_ansi(color_part: str, is_background: bool = False) -> str:
     return _process_color_part(color_part, is_background)
 
 
-def _process_color_part(color_part: str, is_background: bool = False) -> str:
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def _process_color_part(
+    color_part: str, is_background: bool = False, depth: int = TRUECOLOR
+) -> str:
     """
     Process a color specification part into an ANSI escape code.
 
     Args:
         color_part: Color specification part (e.g., "RED", "255;0;0")
         is_background: Whether this is for background color
+        depth: Color depth of the escape code
 
     Returns:
         ANSI escape code
@@ -194,40 +308,23 @@ def _process_color_part(color_part: str, is_background: bool = False) -> str:
     if not color_part:
         return ""
 
-    # Base code for foreground or background
-    base = "4" if is_background else "3"
-    bright_base = "10" if is_background else "9"
+    codes = BG_COLOR_CODES if is_background else COLOR_CODES
 
     # Named color
     upper_color = color_part.upper()
-    if upper_color in COLOR_CODES:
-        code = COLOR_CODES[upper_color]
-        # If the code starts with 9, it's a bright color
-        if code.startswith("9") and is_background:
-            # Convert bright foreground to bright background
-            code = "10" + code[1:]
-        return f"\033[{code}m"
-
-    # Check if it's a bright color variant
-    if upper_color.startswith("BRIGHT_") and upper_color[7:] in COLOR_CODES:
-        base_color = upper_color[7:]
-        if base_color in COLOR_CODES:
-            # Get the non-bright code and convert it to bright
-            code = COLOR_CODES[base_color]
-            if code.startswith("3"):  # Regular foreground
-                code = "9" + code[1:]  # Convert to bright
-            elif code.startswith("4"):  # Regular background
-                code = "10" + code[1:]  # Convert to bright
-            return f"\033[{code}m"
+    if upper_color in codes:
+        return codes[upper_color] if depth != NO_COLOR else ""
+
+    # Bright variants are the LIGHT_ colors
+    if upper_color.startswith("BRIGHT_") and upper_color[7:] in codes:
+        return codes["LIGHT_" + upper_color[7:]] if depth != NO_COLOR else ""
 
     # Check for RGB format (255;255;255)
-    rgb_match = re.match(r"^(\d{1,3});(\d{1,3});(\d{1,3})$", color_part)
+    rgb_match = _RGB_SPEC.match(color_part)
     if rgb_match:
         r, g, b = map(int, rgb_match.groups())
         if 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255:
-            # Use 24-bit color escape sequence
-            code = "48" if is_background else "38"
-            return f"\033[{code};2;{r};{g};{b}m"
+            return rgb_escape((r, g, b), depth, is_background)
 
     # If we get here, the color specification is invalid
     raise InvalidColor(
@@ -297,3 +394,8 @@ def get_coloring_functions():
         "random": random_colorize,
         "pulse": pulse_colorize,
     }
+
+
+# Lookups in the color caches are reported with the other cache metrics
+metrics.REGISTRY.track_cache("color", resolve_color.cache_info)
+metrics.REGISTRY.track_cache("color", _process_color_part.cache_info)
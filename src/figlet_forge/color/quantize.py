@@ -0,0 +1,265 @@
+"""
+Perceptual color quantization for Figlet Forge.
+
+Maps 24-bit colors to the 256- and 16-color terminal palettes by their
+distance in CIELAB space, which follows perceived color differences far
+better than distances between RGB values or per-channel rounding.
+
+Conversions are table lookups: the 256 to 16 color table is built on first
+use, and RGB colors are looked up in a 32x32x32 cube of bytes whose cells
+are filled the first time a color in them is converted, so only the part
+of the color space a program actually uses is ever searched::
+
+    from figlet_forge.color.quantize import rgb_to_256
+
+    rgb_to_256((255, 128, 0))  # -> 208
+"""
+
+from bisect import bisect_left
+from functools import lru_cache
+from math import inf
+from typing import List, Sequence, Tuple
+
+RGB = Tuple[int, int, int]
+Lab = Tuple[float, float, float]
+
+# Bits kept per channel when looking up the RGB cubes (32 levels)
+CUBE_BITS = 5
+
+_SHIFT = 8 - CUBE_BITS
+_CUBE_SIZE = 1 << CUBE_BITS
+
+# Channel levels of the 6x6x6 color cube of the 256-color palette
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+# xterm's default RGB values of the 16 basic colors
+ANSI_16_RGB: Tuple[RGB, ...] = (
+    (0, 0, 0),
+    (205, 0, 0),
+    (0, 205, 0),
+    (205, 205, 0),
+    (0, 0, 238),
+    (205, 0, 205),
+    (0, 205, 205),
+    (229, 229, 229),
+    (127, 127, 127),
+    (255, 0, 0),
+    (0, 255, 0),
+    (255, 255, 0),
+    (92, 92, 255),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+)
+
+# Cube cells not converted yet. No RGB color maps to 0-15 of the 256-color
+# palette, and no 16-color index is 255, so neither is a valid entry.
+_UNSET_256 = 0
+_UNSET_16 = 255
+
+_rgb_to_256_cube = bytearray([_UNSET_256]) * (_CUBE_SIZE**3)
+_rgb_to_16_cube = bytearray([_UNSET_16]) * (_CUBE_SIZE**3)
+
+
+def ansi256_to_rgb(index: int) -> RGB:
+    """
+    RGB value of a color of the 256-color palette.
+
+    Args:
+        index: Palette index (0-255)
+
+    Returns:
+        The xterm default RGB value of the color
+    """
+    if index < 16:
+        return ANSI_16_RGB[index]
+    if index < 232:
+        index -= 16
+        return (
+            _CUBE_LEVELS[index // 36],
+            _CUBE_LEVELS[index // 6 % 6],
+            _CUBE_LEVELS[index % 6],
+        )
+    level = 8 + 10 * (index - 232)
+    return (level, level, level)
+
+
+def _linear(channel: int) -> float:
+    """Linear light value of an sRGB channel."""
+    c = channel / 255
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _lab_f(t: float) -> float:
+    """CIELAB companding function."""
+    return t ** (1 / 3) if t > 216 / 24389 else (24389 / 27 * t + 16) / 116
+
+
+def rgb_to_lab(rgb: RGB) -> Lab:
+    """
+    Convert an sRGB color to CIELAB (D65 white point).
+
+    Args:
+        rgb: Color to convert
+
+    Returns:
+        L*, a* and b* values
+    """
+    r, g, b = map(_linear, rgb)
+    x = (0.4124564 * r + 0.3575761 * g + 0.1804375 * b) / 0.95047
+    y = 0.2126729 * r + 0.7151522 * g + 0.0721750 * b
+    z = (0.0193339 * r + 0.1191920 * g + 0.9503041 * b) / 1.08883
+    fx, fy, fz = _lab_f(x), _lab_f(y), _lab_f(z)
+    return (116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz))
+
+
+def color_distance(first: RGB, second: RGB) -> float:
+    """
+    Perceptual distance between two colors.
+
+    Args:
+        first: First color
+        second: Second color
+
+    Returns:
+        Squared CIE76 color difference (squared Euclidean distance in CIELAB)
+    """
+    return _lab_distance(rgb_to_lab(first), rgb_to_lab(second))
+
+
+def _lab_distance(first: Lab, second: Lab) -> float:
+    """Squared distance between two CIELAB colors."""
+    dl = first[0] - second[0]
+    da = first[1] - second[1]
+    db = first[2] - second[2]
+    return dl * dl + da * da + db * db
+
+
+def _nearest(lab: Lab, candidates: Sequence[Tuple[Lab, int]]) -> int:
+    """
+    Index of the candidate nearest to a CIELAB color.
+
+    Candidates must be sorted by lightness: the search starts at the
+    candidates of similar lightness and works outwards, stopping in each
+    direction once the difference in lightness alone exceeds the best
+    distance found.
+
+    Args:
+        lab: Color to match
+        candidates: (CIELAB color, index) pairs sorted by lightness
+
+    Returns:
+        Index of the nearest candidate
+    """
+    lightness, a, b = lab
+    best = float("inf")
+    best_index = candidates[0][1]
+    start = bisect_left(candidates, ((lightness, -inf, -inf), -1))
+    for indices in (range(start, len(candidates)), range(start - 1, -1, -1)):
+        for position in indices:
+            (cl, ca, cb), index = candidates[position]
+            dl = lightness - cl
+            if dl * dl >= best:
+                break
+            da = a - ca
+            db = b - cb
+            distance = dl * dl + da * da + db * db
+            if distance < best:
+                best, best_index = distance, index
+    return best_index
+
+
+@lru_cache(maxsize=None)
+def _candidates_256() -> List[Tuple[Lab, int]]:
+    """
+    Colors an RGB value may map to in the 256-color palette.
+
+    Only the color cube (16-231) and the gray ramp (232-255) are used, since
+    terminals disagree on the first 16 colors.
+    """
+    return sorted((rgb_to_lab(ansi256_to_rgb(i)), i) for i in range(16, 256))
+
+
+@lru_cache(maxsize=None)
+def _candidates_16() -> List[Tuple[Lab, int]]:
+    """The 16 basic colors."""
+    return sorted((rgb_to_lab(rgb), i) for i, rgb in enumerate(ANSI_16_RGB))
+
+
+def _cell(rgb: RGB) -> int:
+    """Index of the cube cell holding a color."""
+    r, g, b = rgb
+    return ((r >> _SHIFT) << (2 * CUBE_BITS)) | ((g >> _SHIFT) << CUBE_BITS) | (
+        b >> _SHIFT
+    )
+
+
+def _cell_color(cell: int) -> RGB:
+    """
+    Color a cube cell stands for.
+
+    Channels are spread over the full 0-255 range, so the cells at the
+    corners of the cube hold black, white and the primaries exactly.
+    """
+    mask = _CUBE_SIZE - 1
+    levels = (cell >> (2 * CUBE_BITS), (cell >> CUBE_BITS) & mask, cell & mask)
+    return tuple(round(level * 255 / mask) for level in levels)  # type: ignore
+
+
+def rgb_to_256(rgb: RGB) -> int:
+    """
+    Nearest color of the 256-color palette.
+
+    Args:
+        rgb: Color to convert
+
+    Returns:
+        Palette index (16-255)
+    """
+    cell = _cell(rgb)
+    index = _rgb_to_256_cube[cell]
+    if index == _UNSET_256:
+        index = _nearest(rgb_to_lab(_cell_color(cell)), _candidates_256())
+        _rgb_to_256_cube[cell] = index
+    return index
+
+
+def rgb_to_16(rgb: RGB) -> int:
+    """
+    Nearest of the 16 basic colors.
+
+    Args:
+        rgb: Color to convert
+
+    Returns:
+        Color index 0-15 (8-15 are the bright colors)
+    """
+    cell = _cell(rgb)
+    index = _rgb_to_16_cube[cell]
+    if index == _UNSET_16:
+        index = _nearest(rgb_to_lab(_cell_color(cell)), _candidates_16())
+        _rgb_to_16_cube[cell] = index
+    return index
+
+
+@lru_cache(maxsize=None)
+def _ansi256_to_16_table() -> bytes:
+    """Nearest basic color of every color of the 256-color palette."""
+    candidates = _candidates_16()
+    return bytes(
+        i if i < 16 else _nearest(rgb_to_lab(ansi256_to_rgb(i)), candidates)
+        for i in range(256)
+    )
+
+
+def ansi256_to_16(index: int) -> int:
+    """
+    Nearest basic color of a color of the 256-color palette.
+
+    Args:
+        index: Palette index (0-255)
+
+    Returns:
+        Color index 0-15; the first 16 colors map to themselves
+    """
+    return _ansi256_to_16_table()[index]
@@ -0,0 +1,596 @@
+"""
+Compiled color effects for Figlet Forge.
+
+A color spec such as ``"fire"``, ``"red_to_blue"``, ``"pulse_CYAN"``,
+``"radial_yellow_to_red"`` or ``"RED:BLACK"`` is compiled once into an
+Effect that holds its parsed colors and palettes, and can then be applied
+to any number of renders::
+
+    from figlet_forge.color.registry import compile_effect
+
+    fire = compile_effect("fire")
+    banners = [fire(str(figlet.render_text(name))) for name in names]
+
+Compiled effects are cached per spec and color depth; an effect compiled
+for a depth (see figlet_forge.color.depth) writes escapes in the form that
+depth supports. Custom effects are added under a name with
+register_effect(), either as an Effect instance or as a plain
+``str -> str`` function::
+
+    @register_effect("house")
+    def house_style(text: str) -> str:
+        return gradient_colorize(text, "0;90;170", "0;200;140")
+
+Plain functions are applied as they are at every depth except NO_COLOR,
+where they are skipped; Effect subclasses that emit RGB colors should
+override at_depth().
+"""
+
+import logging
+import threading
+from abc import ABC, abstractmethod
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from ..core.exceptions import InvalidColor
+from ..version import RESET_COLORS
+from . import effects, fields
+from .depth import NO_COLOR, TRUECOLOR
+from .figlet_color import resolve_color
+
+# Configure logger for this module
+logger = logging.getLogger(__name__)
+
+# Number of compiled specs kept per registry
+COMPILED_CACHE_SIZE = 256
+
+ColorFunc = Callable[[str], str]
+
+
+class Effect(ABC):
+    """
+    A color effect with its parameters parsed once.
+
+    Subclasses implement apply(); an effect without it cannot be created.
+    Effects are callable, so they can be used wherever a color function is
+    accepted, such as ``FigletString.pipeline().colorize()``.
+
+    Attributes:
+        name: Spec the effect was compiled from or registered under
+        depth: Color depth the effect writes escapes for
+    """
+
+    name = "effect"
+    depth = TRUECOLOR
+
+    @abstractmethod
+    def apply(self, text: str) -> str:
+        """
+        Colorize text.
+
+        Args:
+            text: Text to colorize
+
+        Returns:
+            Colorized text
+        """
+
+    def at_depth(self, depth: int) -> "Effect":
+        """
+        Get this effect for another color depth.
+
+        The default returns the effect itself; subclasses that emit RGB
+        colors return a copy compiled for the depth.
+
+        Args:
+            depth: Color depth of the output
+
+        Returns:
+            An effect writing escapes for `depth`
+        """
+        return self
+
+    def __call__(self, text: str) -> str:
+        """Colorize text; see apply()."""
+        return self.apply(text)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the effect."""
+        return f"{type(self).__name__}({self.name!r})"
+
+
+class FunctionEffect(Effect):
+    """An effect backed by a plain color function."""
+
+    def __init__(self, name: str, func: ColorFunc, depth: int = TRUECOLOR) -> None:
+        """
+        Wrap a color function.
+
+        Args:
+            name: Effect name
+            func: Function taking and returning text
+            depth: Color depth of the output; at NO_COLOR the function is
+                not called
+        """
+        self.name = name
+        self.depth = depth
+        self._func = func
+
+    def at_depth(self, depth: int) -> Effect:
+        """Get this effect for another color depth; see Effect.at_depth()."""
+        if depth == self.depth:
+            return self
+        return FunctionEffect(self.name, self._func, depth)
+
+    def apply(self, text: str) -> str:
+        """Colorize text with the wrapped function."""
+        if self.depth == NO_COLOR:
+            return text
+        return self._func(text)
+
+
+class SolidEffect(Effect):
+    """One foreground and background color on every non-blank line."""
+
+    def __init__(self, color_spec: str, depth: int = TRUECOLOR) -> None:
+        """
+        Resolve the colors of the effect.
+
+        Args:
+            color_spec: Color specification (e.g. "RED", "RED:BLACK",
+                "255;0;0")
+            depth: Color depth of the output
+
+        Raises:
+            InvalidColor: If the color specification is invalid
+        """
+        self.name = color_spec
+        self.depth = depth
+        fg_code, bg_code, _ = resolve_color(color_spec, depth)
+        self._code = fg_code + bg_code
+
+    def at_depth(self, depth: int) -> Effect:
+        """Get this effect for another color depth; see Effect.at_depth()."""
+        return self if depth == self.depth else SolidEffect(self.name, depth)
+
+    def apply(self, text: str) -> str:
+        """Colorize every non-blank line of text."""
+        if not self._code:
+            return text
+        return "\n".join(
+            f"{self._code}{line}{RESET_COLORS}" if line.strip() else line
+            for line in text.splitlines()
+        )
+
+
+class GradientEffect(Effect):
+    """A gradient over the visible characters of each line."""
+
+    def __init__(
+        self,
+        start_color: str,
+        end_color: str,
+        name: str = "",
+        depth: int = TRUECOLOR,
+    ) -> None:
+        """
+        Resolve the end colors of the gradient.
+
+        Args:
+            start_color: Starting color (name or RGB)
+            end_color: Ending color (name or RGB)
+            name: Effect name; defaults to "<start>_to_<end>"
+            depth: Color depth of the output
+
+        Raises:
+            InvalidColor: If either color has no RGB value
+        """
+        self.name = name or f"{start_color}_to_{end_color}"
+        self.depth = depth
+        self._colors = (start_color, end_color)
+        start_rgb = resolve_color(start_color).rgb
+        end_rgb = resolve_color(end_color).rgb
+        if start_rgb is None or end_rgb is None:
+            raise InvalidColor(
+                f"Invalid color specification: {start_color} or {end_color}"
+            )
+        self._ends = (start_rgb, end_rgb)
+        self._palettes: Dict[int, Tuple[str, ...]] = {}
+
+    def at_depth(self, depth: int) -> Effect:
+        """Get this effect for another color depth; see Effect.at_depth()."""
+        if depth == self.depth:
+            return self
+        return GradientEffect(*self._colors, name=self.name, depth=depth)
+
+    def _palette(self, length: int) -> Sequence[str]:
+        """Escapes for a line with `length` visible characters."""
+        palette = self._palettes.get(length)
+        if palette is None:
+            palette = self._palettes[length] = effects.gradient_palette(
+                *self._ends, length, self.depth
+            )
+        return palette
+
+    def apply(self, text: str) -> str:
+        """Colorize text with the gradient."""
+        if self.depth == NO_COLOR:
+            return text
+        return effects.apply_gradient(text, self._palette)
+
+
+class PulseEffect(Effect):
+    """A wave of intensities of one color."""
+
+    def __init__(
+        self,
+        color: str,
+        intensity_levels: int = 5,
+        name: str = "",
+        depth: int = TRUECOLOR,
+    ) -> None:
+        """
+        Build one period of the wave.
+
+        Args:
+            color: Base color
+            intensity_levels: Number of intensity levels for the pulse
+            name: Effect name; defaults to "pulse_<color>"
+            depth: Color depth of the output
+
+        Raises:
+            InvalidColor: If the color has no RGB value
+        """
+        self.name = name or f"pulse_{color}"
+        self.depth = depth
+        self._args = (color, intensity_levels)
+        base_rgb = resolve_color(color).rgb
+        if base_rgb is None:
+            raise InvalidColor(f"Invalid color specification: {color}")
+        self._palette = effects.pulse_palette(base_rgb, intensity_levels, depth)
+
+    def at_depth(self, depth: int) -> Effect:
+        """Get this effect for another color depth; see Effect.at_depth()."""
+        if depth == self.depth:
+            return self
+        return PulseEffect(*self._args, name=self.name, depth=depth)
+
+    def apply(self, text: str) -> str:
+        """Colorize text with the wave."""
+        if self.depth == NO_COLOR:
+            return text
+        return effects.apply_pulse(text, self._palette)
+
+
+class FgBgEffect(Effect):
+    """A foreground and background color on every line."""
+
+    def __init__(
+        self, fg: str, bg: str, name: str = "", depth: int = TRUECOLOR
+    ) -> None:
+        """
+        Resolve both colors.
+
+        Args:
+            fg: Foreground color
+            bg: Background color
+            name: Effect name; defaults to "<fg>_on_<bg>"
+            depth: Color depth of the output
+
+        Raises:
+            InvalidColor: If either color is invalid
+        """
+        self.name = name or f"{fg}_on_{bg}"
+        self.depth = depth
+        self._colors = (fg, bg)
+        self._code = resolve_color(fg, depth).fg + resolve_color(f":{bg}", depth).bg
+
+    def at_depth(self, depth: int) -> Effect:
+        """Get this effect for another color depth; see Effect.at_depth()."""
+        if depth == self.depth:
+            return self
+        return FgBgEffect(*self._colors, name=self.name, depth=depth)
+
+    def apply(self, text: str) -> str:
+        """Colorize every line of text."""
+        if not text:
+            return ""
+        if not self._code:
+            return text
+        return "\n".join(
+            f"{self._code}{line}{RESET_COLORS}" for line in text.splitlines()
+        )
+
+
+class FieldEffect(Effect):
+    """A color field over the whole banner (see figlet_forge.color.fields)."""
+
+    def __init__(
+        self,
+        kind: str,
+        colors: Sequence[str],
+        phase: float = 0.0,
+        name: str = "",
+        depth: int = TRUECOLOR,
+    ) -> None:
+        """
+        Check the kind and color stops of the field.
+
+        Args:
+            kind: Kind of field (see fields.FIELD_KINDS)
+            colors: Color stops
+            phase: Position in the animation cycle, 0 to 1
+            name: Effect name; defaults to "<kind>_<color>_to_<color>..."
+            depth: Color depth of the output
+
+        Raises:
+            InvalidColor: If the kind is unknown or a color has no RGB value
+        """
+        if kind not in fields.FIELD_KINDS:
+            raise InvalidColor(f"Unknown color field: {kind}")
+        self.name = name or f"{kind}_" + "_to_".join(colors)
+        self.depth = depth
+        self._args = (kind, tuple(colors), phase)
+        fields.color_field(kind, 1, 1, colors)  # Validates the colors
+
+    def at_depth(self, depth: int) -> Effect:
+        """Get this effect for another color depth; see Effect.at_depth()."""
+        if depth == self.depth:
+            return self
+        return FieldEffect(*self._args, name=self.name, depth=depth)
+
+    def apply(self, text: str) -> str:
+        """Colorize text with the field; fields are cached per size."""
+        return fields.field_colorize(text, *self._args, depth=self.depth)
+
+
+# Compiles an effect for a color depth
+EffectFactory = Callable[[int], Effect]
+
+
+def _function_factory(name: str, func: Callable[..., str]) -> EffectFactory:
+    """
+    Build the factory of a built-in effect function taking a depth.
+
+    Args:
+        name: Effect name
+        func: Effect function accepting a `depth` keyword
+
+    Returns:
+        Callable compiling the effect
+    """
+    return lambda depth: FunctionEffect(name, partial(func, depth=depth), depth)
+
+
+def _style_factory(name: str, kind: str, args: Sequence[str]) -> EffectFactory:
+    """
+    Build the factory of a predefined style from effects.COLOR_STYLES.
+
+    Args:
+        name: Style name
+        kind: Style kind
+        args: Style arguments
+
+    Returns:
+        Callable compiling the style
+    """
+    if kind == "gradient":
+        return lambda depth: GradientEffect(args[0], args[1], name=name, depth=depth)
+    if kind == "fg_bg":
+        return lambda depth: FgBgEffect(args[0], args[1], name=name, depth=depth)
+    if kind == "field":
+        return lambda depth: FieldEffect(args[0], args[1:], name=name, depth=depth)
+    if kind == "rainbow":
+        return _function_factory(name, effects.rainbow_colorize)
+    return _function_factory(name, effects.rgb_cycle_colorize)
+
+
+class EffectRegistry:
+    """
+    Named effects and a cache of compiled color specs.
+
+    Registered names take precedence over the built-in spec forms
+    ("<start>_to_<end>" gradients, "<kind>_<color>_to_<color>..." color
+    fields, "pulse_<color>" and plain colors). All methods are thread-safe.
+    """
+
+    def __init__(self, builtins: bool = True) -> None:
+        """
+        Create a registry.
+
+        Args:
+            builtins: Register the predefined styles, "rainbow" and "random"
+        """
+        self._factories: Dict[str, EffectFactory] = {}
+        self._compiled: Dict[Tuple[str, int], Effect] = {}
+        self._lock = threading.Lock()
+        if builtins:
+            for name, (kind, *args) in effects.COLOR_STYLES.items():
+                self._factories[name] = _style_factory(name, kind, args)
+            self._factories["random"] = _function_factory(
+                "random", effects.random_colorize
+            )
+
+    def register(
+        self, name: str, effect: Optional[Union[Effect, ColorFunc]] = None
+    ) -> Union[Effect, ColorFunc, Callable[[ColorFunc], ColorFunc]]:
+        """
+        Register an effect under a name, replacing any previous one.
+
+        Can be used as a decorator when `effect` is omitted.
+
+        Args:
+            name: Effect name (case-insensitive)
+            effect: Effect instance or function taking and returning text
+
+        Returns:
+            The effect, unchanged, or a decorator registering a function
+        """
+        if effect is None:
+
+            def decorator(func: ColorFunc) -> ColorFunc:
+                self.register(name, func)
+                return func
+
+            return decorator
+
+        key = name.lower()
+        compiled = effect if isinstance(effect, Effect) else FunctionEffect(key, effect)
+        with self._lock:
+            self._factories[key] = compiled.at_depth
+            self._compiled.clear()
+        return effect
+
+    def unregister(self, name: str) -> None:
+        """
+        Remove a named effect.
+
+        Args:
+            name: Effect name (unknown names are ignored)
+        """
+        with self._lock:
+            self._factories.pop(name.lower(), None)
+            self._compiled.clear()
+
+    def names(self) -> List[str]:
+        """
+        List the registered effect names.
+
+        Returns:
+            Sorted effect names
+        """
+        with self._lock:
+            return sorted(self._factories)
+
+    def compile(self, color_spec: str, depth: int = TRUECOLOR) -> Effect:
+        """
+        Compile a color spec, reusing an earlier compilation.
+
+        Args:
+            color_spec: Registered name, "<start>_to_<end>",
+                "<kind>_<color>_to_<color>...", "pulse_<color>" or color
+                specification
+            depth: Color depth the effect writes escapes for
+
+        Returns:
+            The compiled effect
+
+        Raises:
+            InvalidColor: If the spec does not name a valid effect or color
+        """
+        key = (color_spec, depth)
+        with self._lock:
+            effect = self._compiled.get(key)
+            factory = self._factories.get(color_spec.lower())
+        if effect is not None:
+            return effect
+
+        if factory is not None:
+            effect = factory(depth)
+        else:
+            effect = self._compile_spec(color_spec, depth)
+
+        with self._lock:
+            if len(self._compiled) >= COMPILED_CACHE_SIZE:
+                del self._compiled[next(iter(self._compiled))]
+            self._compiled[key] = effect
+        return effect
+
+    def get(self, color_spec: str, depth: int = TRUECOLOR) -> Optional[Effect]:
+        """
+        Compile a color spec, or return None if it is invalid.
+
+        Args:
+            color_spec: See compile()
+            depth: See compile()
+
+        Returns:
+            The compiled effect, or None
+        """
+        try:
+            return self.compile(color_spec, depth)
+        except InvalidColor as e:
+            logger.debug(f"Invalid color spec {color_spec!r}: {e}")
+            return None
+
+    @staticmethod
+    def _compile_spec(color_spec: str, depth: int) -> Effect:
+        """
+        Compile one of the built-in spec forms.
+
+        Args:
+            color_spec: Color spec that is not a registered name
+            depth: Color depth the effect writes escapes for
+
+        Returns:
+            The compiled effect
+
+        Raises:
+            InvalidColor: If the spec is invalid
+        """
+        lowered = color_spec.lower()
+        kind, _, stops = lowered.partition("_")
+        if kind in fields.FIELD_KINDS and "_to_" in stops:
+            return FieldEffect(
+                kind, stops.split("_to_"), name=color_spec, depth=depth
+            )
+        if "_to_" in lowered:
+            colors = lowered.split("_to_")
+            if len(colors) == 2:
+                return GradientEffect(
+                    colors[0], colors[1], name=color_spec, depth=depth
+                )
+        if lowered.startswith("pulse_"):
+            return PulseEffect(color_spec[6:], name=color_spec, depth=depth)
+        return SolidEffect(color_spec, depth)
+
+
+# Process-wide registry used by the CLI, the server and get_coloring_functions()
+_registry = EffectRegistry()
+
+
+def get_registry() -> EffectRegistry:
+    """
+    Get the process-wide effect registry.
+
+    Returns:
+        The shared EffectRegistry
+    """
+    return _registry
+
+
+def register_effect(
+    name: str, effect: Optional[Union[Effect, ColorFunc]] = None
+) -> Union[Effect, ColorFunc, Callable[[ColorFunc], ColorFunc]]:
+    """
+    Register an effect in the process-wide registry.
+
+    Can be used as a decorator when `effect` is omitted.
+
+    Args:
+        name: Effect name (case-insensitive)
+        effect: Effect instance or function taking and returning text
+
+    Returns:
+        The effect, unchanged, or a decorator registering a function
+    """
+    return _registry.register(name, effect)
+
+
+def compile_effect(color_spec: str, depth: int = TRUECOLOR) -> Effect:
+    """
+    Compile a color spec with the process-wide registry.
+
+    Args:
+        color_spec: Registered name, "<start>_to_<end>",
+            "<kind>_<color>_to_<color>...", "pulse_<color>" or color
+            specification
+        depth: Color depth the effect writes escapes for
+
+    Returns:
+        The compiled effect
+
+    Raises:
+        InvalidColor: If the spec does not name a valid effect or color
+    """
+    return _registry.compile(color_spec, depth)
@@ -0,0 +1,613 @@
+"""
+Styled art: a character grid with a style per cell.
+
+Colored output as a string with embedded escapes has to be parsed again
+by every later step, and its length no longer says how wide the art is.
+StyledArt keeps the characters and the colors apart instead: the rows of
+the art, a table of distinct styles, and for every row a compact array of
+indices into that table. Effects write styles into it, and the ANSI, HTML
+and SVG emitters walk it once, run by run::
+
+    from figlet_forge.color import StyledArt, style_gradient
+
+    art = style_gradient(figlet.render_text("Hi"), "RED", "BLUE")
+    print(art.to_ansi())
+    page = art.to_html()
+    plain = art.plain()  # no escapes to strip
+
+Re-coloring only rewrites the style table (restyle()), and text that was
+already colored with escape codes can be converted once with from_ansi().
+"""
+
+import html
+import re
+from array import array
+from itertools import groupby
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ..core.figlet_string import FigletString
+from .ansi import emit_runs
+from .depth import NO_COLOR, TRUECOLOR, palette_escape, rgb_escape
+from .quantize import ANSI_16_RGB, ansi256_to_rgb
+
+RGB = Tuple[int, int, int]
+
+# Typecode of the per-row style index arrays
+STYLE_INDEX_TYPE = "H"
+
+# Most distinct styles one StyledArt can hold
+MAX_STYLES = 1 << 16
+
+# Matches one SGR escape sequence and captures its parameters
+_SGR = re.compile(r"\033\[([0-9;]*)m")
+
+
+class Style(NamedTuple):
+    """
+    Foreground and background color of a cell; None is the default.
+
+    Colors read from palette escapes (such as "\\033[31m") also keep their
+    index in the 256-color palette, so they are written back with the
+    palette code and still follow the terminal's theme.
+    """
+
+    fg: Optional[RGB] = None
+    bg: Optional[RGB] = None
+    fg_index: Optional[int] = None
+    bg_index: Optional[int] = None
+
+    def escape(self, depth: int = TRUECOLOR) -> str:
+        """
+        Escape sequence drawing the style.
+
+        Args:
+            depth: Color depth of the output
+
+        Returns:
+            Foreground then background escape
+        """
+        if self.fg_index is not None:
+            fg = palette_escape(self.fg_index, depth)
+        else:
+            fg = rgb_escape(self.fg, depth) if self.fg is not None else ""
+        if self.bg_index is not None:
+            bg = palette_escape(self.bg_index, depth, True)
+        else:
+            bg = rgb_escape(self.bg, depth, True) if self.bg is not None else ""
+        return fg + bg
+
+    def css(self) -> str:
+        """
+        CSS declarations of the style.
+
+        Returns:
+            "color: #rrggbb" and "background-color: #rrggbb" as set
+        """
+        declarations = []
+        if self.fg is not None:
+            declarations.append("color: #{:02x}{:02x}{:02x}".format(*self.fg))
+        if self.bg is not None:
+            declarations.append(
+                "background-color: #{:02x}{:02x}{:02x}".format(*self.bg)
+            )
+        return "; ".join(declarations)
+
+
+# A run of text and its style, None being the default colors
+StyleRun = Tuple[Optional[Style], str]
+
+
+class StyledArt:
+    """
+    Rows of ASCII art with a style index per cell.
+
+    Index 0 of the style table is always the default style (None). Rows
+    keep their own lengths; cells beyond a row's end have no style.
+    """
+
+    def __init__(self, art: str) -> None:
+        """
+        Wrap art with every cell in the default style.
+
+        Args:
+            art: FigletString or multi-line string
+        """
+        rows = (art if isinstance(art, FigletString) else FigletString(art)).rows
+        self._rows: Tuple[str, ...] = rows
+        self._styles: List[Optional[Style]] = [None]
+        self._index: Dict[Optional[Style], int] = {None: 0}
+        self._cells: List[array] = [
+            array(STYLE_INDEX_TYPE, bytes(2 * len(row))) for row in rows
+        ]
+
+    @classmethod
+    def from_ansi(cls, text: str) -> "StyledArt":
+        """
+        Convert text colored with ANSI escapes.
+
+        Truecolor, 256-color and 16-color foreground and background
+        escapes are understood; other attributes are dropped. Palette
+        colors keep their palette index (see Style). Colors carry over line
+        breaks, as they do in a terminal.
+
+        Args:
+            text: Text with SGR escape sequences
+
+        Returns:
+            StyledArt with the text's characters and colors
+        """
+        current = Style()
+        rows: List[str] = []
+        row_styles: List[List[Optional[Style]]] = []
+        for line in text.split("\n"):
+            chars: List[str] = []
+            styles: List[Optional[Style]] = []
+            position = 0
+            for match in _SGR.finditer(line):
+                chunk = line[position : match.start()]
+                style = current if current.fg or current.bg else None
+                chars.append(chunk)
+                styles.extend([style] * len(chunk))
+                current = _apply_sgr(match.group(1), current)
+                position = match.end()
+            chunk = line[position:]
+            chars.append(chunk)
+            style = current if current.fg or current.bg else None
+            styles.extend([style] * len(chunk))
+            rows.append("".join(chars))
+            row_styles.append(styles)
+        if text.endswith("\n"):
+            rows.pop()
+            row_styles.pop()
+
+        styled = cls(FigletString.from_rows(rows))
+        for row, styles in enumerate(row_styles):
+            styled.set_styles(row, styles)
+        return styled
+
+    @property
+    def rows(self) -> Tuple[str, ...]:
+        """Characters of the art, one string per line."""
+        return self._rows
+
+    @property
+    def dimensions(self) -> Tuple[int, int]:
+        """Width and height of the art, escapes not counted."""
+        return max(map(len, self._rows), default=0), len(self._rows)
+
+    @property
+    def styles(self) -> Tuple[Optional[Style], ...]:
+        """The style table; cells hold indices into it."""
+        return tuple(self._styles)
+
+    def cells(self, row: int) -> array:
+        """
+        Style indices of a row.
+
+        Args:
+            row: Line index
+
+        Returns:
+            The row's index array (not a copy)
+        """
+        return self._cells[row]
+
+    def intern(self, style: Optional[Style]) -> int:
+        """
+        Index of a style in the table, adding it if needed.
+
+        Args:
+            style: Style to look up; None and Style() are the default
+
+        Returns:
+            Index of the style
+
+        Raises:
+            ValueError: If the table is full
+        """
+        if style == Style():
+            style = None
+        index = self._index.get(style)
+        if index is None:
+            if len(self._styles) >= MAX_STYLES:
+                raise ValueError(f"StyledArt holds at most {MAX_STYLES} styles")
+            index = self._index[style] = len(self._styles)
+            self._styles.append(style)
+        return index
+
+    def set_styles(
+        self, row: int, styles: Sequence[Optional[Style]], start: int = 0
+    ) -> None:
+        """
+        Style consecutive cells of a row.
+
+        Args:
+            row: Line index
+            styles: Style of each cell from `start` on; cells past the end
+                of the row are ignored
+            start: First column
+        """
+        cells = self._cells[row]
+        end = min(len(cells), start + len(styles))
+        if end <= start:
+            return
+        intern = self.intern
+        cells[start:end] = array(
+            STYLE_INDEX_TYPE, [intern(style) for style in styles[: end - start]]
+        )
+
+    def paint(
+        self,
+        palette: Sequence[Optional[Style]],
+        indices: Sequence[Sequence[int]],
+        visible_only: bool = True,
+    ) -> "StyledArt":
+        """
+        Style every cell from a palette and a grid of palette indices.
+
+        The palette is interned once, so painting costs one list lookup
+        per cell however many cells share a style.
+
+        Args:
+            palette: Styles the indices refer to
+            indices: One row of palette indices per line, at least as long
+                as the line
+            visible_only: Leave whitespace in the default style
+
+        Returns:
+            This StyledArt
+        """
+        remap = [self.intern(style) for style in palette]
+        for row, line in enumerate(self._rows):
+            styled = [remap[index] for index in indices[row][: len(line)]]
+            if visible_only:
+                styled = [
+                    0 if char.isspace() else index
+                    for char, index in zip(line, styled)
+                ]
+            self._cells[row] = array(STYLE_INDEX_TYPE, styled)
+        return self
+
+    def fill(self, style: Optional[Style], visible_only: bool = True) -> "StyledArt":
+        """
+        Give every cell the same style.
+
+        Args:
+            style: Style to use
+            visible_only: Leave whitespace in the default style
+
+        Returns:
+            This StyledArt
+        """
+        index = self.intern(style)
+        for row, cells in zip(self._rows, self._cells):
+            for column, char in enumerate(row):
+                if not (visible_only and char.isspace()):
+                    cells[column] = index
+        return self
+
+    def style_at(self, x: int, y: int) -> Optional[Style]:
+        """
+        Style of one cell.
+
+        Args:
+            x: Column
+            y: Row
+
+        Returns:
+            The cell's style, or None for the default or outside the art
+        """
+        if 0 <= y < len(self._cells) and 0 <= x < len(self._cells[y]):
+            return self._styles[self._cells[y][x]]
+        return None
+
+    def restyle(
+        self, mapping: Callable[[Optional[Style]], Optional[Style]]
+    ) -> "StyledArt":
+        """
+        Re-color the art by mapping every style of the table.
+
+        Only the table is rewritten; the cells are shared with this
+        StyledArt unless two styles map to the same one.
+
+        Args:
+            mapping: Function from an old style to its replacement
+
+        Returns:
+            New StyledArt with the mapped styles
+        """
+        result = StyledArt.__new__(StyledArt)
+        result._rows = self._rows
+        result._styles = [None]
+        result._index = {None: 0}
+        remap = [0] + [result.intern(mapping(style)) for style in self._styles[1:]]
+        if remap == list(range(len(self._styles))):
+            result._cells = self._cells
+        else:
+            result._cells = [
+                array(STYLE_INDEX_TYPE, [remap[index] for index in cells])
+                for cells in self._cells
+            ]
+        return result
+
+    def plain(self) -> FigletString:
+        """
+        The art without colors.
+
+        Returns:
+            FigletString of the rows
+        """
+        return FigletString.from_rows(self._rows)
+
+    def runs(self, row: int) -> List[StyleRun]:
+        """
+        Split a line into runs of cells sharing one style.
+
+        Default-styled spaces join the run before them when it has no
+        background, since a foreground color does not show on them.
+
+        Args:
+            row: Line index
+
+        Returns:
+            List of (style, text) runs covering the line
+        """
+        line = self._rows[row]
+        runs: List[StyleRun] = []
+        start = 0
+        for index, cells in groupby(self._cells[row]):
+            end = start + len(list(cells))
+            style = self._styles[index]
+            text = line[start:end]
+            start = end
+            if runs:
+                previous, previous_text = runs[-1]
+                if style == previous or (
+                    style is None
+                    and previous.bg is None  # type: ignore[union-attr]
+                    and text.isspace()
+                ):
+                    runs[-1] = (previous, previous_text + text)
+                    continue
+            runs.append((style, text))
+        return runs
+
+    def to_ansi(self, depth: int = TRUECOLOR) -> str:
+        """
+        Render with ANSI escapes.
+
+        Args:
+            depth: Color depth of the output (see figlet_forge.color.depth)
+
+        Returns:
+            Text with an escape wherever the style changes
+        """
+        if depth == NO_COLOR:
+            return str(self.plain())
+        escapes = [None] + [style.escape(depth) for style in self._styles[1:]]
+        lines = []
+        for row in range(len(self._rows)):
+            lines.append(
+                emit_runs(
+                    [
+                        (escapes[self._index[style]] if style else None, text)
+                        for style, text in self.runs(row)
+                    ],
+                    keep_on_blanks=False,
+                )
+            )
+        return "\n".join(lines)
+
+    def to_html(
+        self, class_name: str = "figlet-forge", line_class: str = "figlet-line"
+    ) -> str:
+        """
+        Render as HTML, with styled runs in spans.
+
+        Args:
+            class_name: CSS class name for the container
+            line_class: CSS class name for each line
+
+        Returns:
+            HTML representation of the art
+        """
+        return runs_to_html(
+            (self.runs(row) for row in range(len(self._rows))), class_name, line_class
+        )
+
+    def to_svg(
+        self,
+        font_family: str = "monospace",
+        font_size: int = 14,
+        foreground: str = "#000000",
+        background: str = "transparent",
+        padding: int = 10,
+    ) -> str:
+        """
+        Render as SVG, with foreground colors in nested tspans.
+
+        Cell backgrounds are not drawn.
+
+        Args:
+            font_family: Font family to use
+            font_size: Font size in pixels
+            foreground: Color of default-styled cells
+            background: Background color of the image
+            padding: Padding around the text in pixels
+
+        Returns:
+            SVG representation of the art
+        """
+        width, height = self.dimensions
+        return runs_to_svg(
+            [self.runs(row) for row in range(height)],
+            width,
+            font_family,
+            font_size,
+            foreground,
+            background,
+            padding,
+        )
+
+    def __str__(self) -> str:
+        """Return the ANSI rendering of the art."""
+        return self.to_ansi()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the art."""
+        width, height = self.dimensions
+        return f"StyledArt({width}x{height}, {len(self._styles) - 1} styles)"
+
+
+def _apply_sgr(params: str, style: Style) -> Style:
+    """
+    Update the current colors with the parameters of an SGR sequence.
+
+    Args:
+        params: Parameters between "\\033[" and "m"
+        style: Current colors
+
+    Returns:
+        New colors
+    """
+    fg, bg, fg_index, bg_index = style
+    codes = [int(code) if code else 0 for code in params.split(";")]
+    position = 0
+    while position < len(codes):
+        code = codes[position]
+        position += 1
+        if code == 0:
+            fg = bg = fg_index = bg_index = None
+        elif code in (38, 48) and position < len(codes):
+            mode = codes[position]
+            if mode == 2 and position + 3 < len(codes):
+                rgb: Optional[RGB] = tuple(  # type: ignore[assignment]
+                    min(255, c) for c in codes[position + 1 : position + 4]
+                )
+                index = None
+                position += 4
+            elif mode == 5 and position + 1 < len(codes):
+                index = min(255, codes[position + 1])
+                rgb = ansi256_to_rgb(index)
+                position += 2
+            else:
+                break
+            if code == 38:
+                fg, fg_index = rgb, index
+            else:
+                bg, bg_index = rgb, index
+        elif code == 39:
+            fg = fg_index = None
+        elif code == 49:
+            bg = bg_index = None
+        elif 30 <= code <= 37 or 90 <= code <= 97:
+            fg_index = code - 30 if code < 90 else code - 82
+            fg = ANSI_16_RGB[fg_index]
+        elif 40 <= code <= 47 or 100 <= code <= 107:
+            bg_index = code - 40 if code < 100 else code - 92
+            bg = ANSI_16_RGB[bg_index]
+    return Style(fg, bg, fg_index, bg_index)
+
+
+def runs_to_html(
+    lines: Iterable[Sequence[StyleRun]],
+    class_name: str = "figlet-forge",
+    line_class: str = "figlet-line",
+) -> str:
+    """
+    Write styled runs as HTML, one div per line and a span per styled run.
+
+    The markup matches RenderEngine.to_html().
+
+    Args:
+        lines: Runs of every line
+        class_name: CSS class name for the container
+        line_class: CSS class name for each line
+
+    Returns:
+        HTML document fragment
+    """
+    style = (
+        "font-family: monospace; white-space: pre; line-height: 1; "
+        "display: inline-block"
+    )
+    html_lines = []
+    for runs in lines:
+        parts = []
+        for run_style, text in runs:
+            if run_style is None:
+                parts.append(html.escape(text))
+            else:
+                parts.append(
+                    f'<span style="{run_style.css()}">{html.escape(text)}</span>'
+                )
+        html_lines.append(f'<div class="{line_class}">{"".join(parts)}</div>')
+    return (
+        f'<div class="{class_name}" style="{style}">\n'
+        + "\n".join(html_lines)
+        + "\n</div>"
+    )
+
+
+def runs_to_svg(
+    lines: Sequence[Sequence[StyleRun]],
+    width: int,
+    font_family: str = "monospace",
+    font_size: int = 14,
+    foreground: str = "#000000",
+    background: str = "transparent",
+    padding: int = 10,
+) -> str:
+    """
+    Write styled runs as SVG text, one tspan per line and per colored run.
+
+    Sizes follow the RenderEngine.to_svg() defaults.
+
+    Args:
+        lines: Runs of every line
+        width: Width of the art in characters
+        font_family: Font family to use
+        font_size: Font size in pixels
+        foreground: Color of default-styled text
+        background: Background color
+        padding: Padding around the text in pixels
+
+    Returns:
+        SVG document
+    """
+    line_height = int(font_size * 1.2)
+    svg_width = max(int(width * font_size * 0.6 + padding * 2), 100)
+    svg_height = len(lines) * line_height + padding * 2
+    svg = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{svg_width}" '
+        f'height="{svg_height}" viewBox="0 0 {svg_width} {svg_height}">',
+    ]
+    if background.lower() != "transparent":
+        svg.append(f'<rect width="100%" height="100%" fill="{background}" />')
+    svg.append(
+        f'<text xml:space="preserve" font-family="{font_family}" '
+        f'font-size="{font_size}px" fill="{foreground}">'
+    )
+    for row, runs in enumerate(lines):
+        parts = []
+        for run_style, text in runs:
+            if run_style is None or run_style.fg is None:
+                parts.append(html.escape(text))
+            else:
+                parts.append(
+                    '<tspan fill="#{:02x}{:02x}{:02x}">'.format(*run_style.fg)
+                    + f"{html.escape(text)}</tspan>"
+                )
+        y = 20 + row * line_height + padding
+        svg.append(f'<tspan x="{10 + padding}" y="{y}">{"".join(parts)}</tspan>')
+    svg.append("</text>\n</svg>")
+    return "\n".join(svg)
@@ -11,6 +11,8 @@ import re
 import sys
 from typing import Dict
 
+from ..color.quantize import ansi256_to_16, rgb_to_16, rgb_to_256
+
 
 class ColorDetection:
     """
@@ -265,92 +267,35 @@ class ColorConverter:
         """
         Convert RGB color to ANSI 256-color code.
 
+        Uses the perceptual lookup table of figlet_forge.color.quantize.
+
         Args:
             r: Red component (0-255)
             g: Green component (0-255)
             b: Blue component (0-255)
 
         Returns:
-            ANSI 256-color code (38;5;{n} or 48;5;{n})
+            ANSI 256-color number (for 38;5;{n} or 48;5;{n})
         """
-        if r == g == b:
-            # Grayscale
-            if r < 8:
-                return "0"  # Black
-            elif r < 248:
-                return str(232 + ((r - 8) // 10))  # Grayscale ramp
-            else:
-                return "15"  # White
-
-        # Convert to 6x6x6 color cube (16-231)
-        r_index = max(0, min(5, r // 43))
-        g_index = max(0, min(5, g // 43))
-        b_index = max(0, min(5, b // 43))
-
-        return str(16 + (r_index * 36) + (g_index * 6) + b_index)
+        return str(rgb_to_256((r, g, b)))
 
     @classmethod
     def ansi256_to_ansi16(cls, code: int) -> str:
         """
         Convert ANSI 256-color code to ANSI 16-color code.
 
+        Uses the perceptual lookup table of figlet_forge.color.quantize.
+
         Args:
             code: ANSI 256-color code (0-255)
 
         Returns:
             ANSI 16-color code
         """
-        if code < 16:
-            # Direct mapping for the first 16 colors
-            return (
-                cls.BASIC_COLORS.get(code % 8)
-                if code < 8
-                else cls.BRIGHT_COLORS.get(code % 8)
-            )
-
-        elif code >= 232:
-            # Grayscale
-            level = (code - 232) // 3
-            if level < 5:
-                return "30"  # Black
-            else:
-                return "37"  # White
-        else:
-            # RGB color from 6x6x6 color cube
-            code -= 16
-            r = (code // 36) * 51
-            g = ((code % 36) // 6) * 51
-            b = (code % 6) * 51
-
-            # Determine closest ANSI 16 color
-            if r == b and r == g:
-                # Grayscale
-                if r < 75:
-                    return "30"  # Black
-                elif r < 128:
-                    return "90"  # Bright Black (Gray)
-                elif r < 192:
-                    return "37"  # White
-                else:
-                    return "97"  # Bright White
-
-            # Find closest color based on maximum component
-            max_component = max(r, g, b)
-            if r == max_component and r > g * 2 and r > b * 2:
-                return "31" if r < 128 else "91"  # Red
-            if g == max_component and g > r * 2 and g > b * 2:
-                return "32" if g < 128 else "92"  # Green
-            if b == max_component and b > r * 2 and b > g * 2:
-                return "34" if b < 128 else "94"  # Blue
-            if r == max_component and g == max_component and r > b * 2:
-                return "33" if r < 128 else "93"  # Yellow
-            if r == max_component and b == max_component and r > g * 2:
-                return "35" if r < 128 else "95"  # Magenta
-            if g == max_component and b == max_component and g > r * 2:
-                return "36" if g < 128 else "96"  # Cyan
-
-            # Default to white if no clear match
-            return "37" if (r + g + b) / 3 < 128 else "97"
+        index = ansi256_to_16(code)
+        if index < 8:
+            return cls.BASIC_COLORS[index]
+        return cls.BRIGHT_COLORS[index]
 
     @classmethod
     def downgrade_color(cls, color_code: str, target_depth: int) -> str:
@@ -915,27 +860,15 @@ class ColourAdjuster:
         """
         Convert RGB values to the nearest 256-color code.
 
+        Uses the perceptual lookup table of figlet_forge.color.quantize.
+
         Args:
             r, g, b: RGB values (0-255)
 
         Returns:
             256-color code (16-231 for colors, 232-255 for grays)
         """
-        # Handle grayscale (equal RGB values)
-        if r == g == b:
-            if r < 8:
-                return 16  # black
-            if r > 248:
-                return 231  # white
-            # Calculate grayscale index (232-255)
-            return 232 + ((r - 8) // 10)
-
-        # Calculate indices in the 6x6x6 RGB color cube (16-231)
-        r_index = max(0, min(5, r // 43))
-        g_index = max(0, min(5, g // 43))
-        b_index = max(0, min(5, b // 43))
-
-        return 16 + (36 * r_index) + (6 * g_index) + b_index
+        return rgb_to_256((r, g, b))
 
     def _256_to_16(self, color: int, base_code: str) -> str:
         """
@@ -948,40 +881,13 @@ class ColourAdjuster:
         Returns:
             ANSI color code
         """
-        # Standard ANSI colors (0-7)
-        if color < 8:
-            return f"{base_code}{color}"
-
-        # Bright standard colors (8-15)
-        if color < 16:
-            return f"{base_code}{color - 8};1"
-
-        # 6x6x6 color cube (16-231)
-        if color < 232:
-            # Extract r,g,b indices from the cube
-            color -= 16
-            r = color // 36
-            g = (color % 36) // 6
-            b = color % 6
-
-            # Get weighted RGB values
-            r_val = 0 if r == 0 else (r * 40 + 55)
-            g_val = 0 if g == 0 else (g * 40 + 55)
-            b_val = 0 if b == 0 else (b * 40 + 55)
-
-            # Convert to basic ANSI color
-            return self._rgb_to_16(r_val, g_val, b_val, base_code)
-
-        # Grayscale (232-255)
-        gray = ((color - 232) * 10) + 8
-        # Handle as RGB for consistency
-        return self._rgb_to_16(gray, gray, gray, base_code)
+        return self._ansi16_code(ansi256_to_16(color), base_code)
 
     def _rgb_to_16(self, r: int, g: int, b: int, base_code: str) -> str:
         """
         Convert RGB to 16-color ANSI code.
 
-        This uses a simplified algorithm to determine the closest ANSI color.
+        Uses the perceptual lookup table of figlet_forge.color.quantize.
 
         Args:
             r, g, b: RGB values (0-255)
@@ -990,31 +896,23 @@ class ColourAdjuster:
         Returns:
             ANSI color code
         """
-        # Determine intensity (bright or normal)
-        bright = r > 170 or g > 170 or b > 170
-
-        # Find dominant color
-        if r > g and r > b:
-            color = "1"  # red
-        elif g > r and g > b:
-            color = "2"  # green
-        elif b > r and b > g:
-            color = "4"  # blue
-        elif r > 170 and g > 170:
-            color = "3"  # yellow
-        elif g > 170 and b > 170:
-            color = "6"  # cyan
-        elif r > 170 and b > 170:
-            color = "5"  # magenta
-        elif r > 170 or g > 170 or b > 170:
-            color = "7"  # white
-        else:
-            color = "0"  # black
+        return self._ansi16_code(rgb_to_16((r, g, b)), base_code)
+
+    @staticmethod
+    def _ansi16_code(index: int, base_code: str) -> str:
+        """
+        Format a 16-color index as an ANSI code.
 
-        # Build the ANSI code
-        if bright and color != "0":
-            return f"{base_code}{color};1"
-        return f"{base_code}{color}"
+        Args:
+            index: Color index (0-15)
+            base_code: '3' for foreground, '4' for background
+
+        Returns:
+            ANSI color code; bright colors (8-15) add the bold attribute
+        """
+        if index < 8:
+            return f"{base_code}{index}"
+        return f"{base_code}{index - 8};1"
 
 
 def adapt_colors_to_terminal(text: str) -> str:
@@ -5,6 +5,10 @@ This module provides the fundamental components of the Figlet Forge system,
 including font handling, string management, and text rendering.
 """
 
+from importlib import import_module
+from typing import Any, Dict
+
+# Exceptions are light and needed almost everywhere
 from .exceptions import (
     CharNotPrinted,
     FigletError,
@@ -12,14 +16,43 @@ from .exceptions import (
     FontNotFound,
     InvalidColor,
 )
-from .figlet_font import FigletFont
-from .figlet_string import FigletString
-from .utils import unicode_string
+
+# Heavier components are imported on first access, so that importing
+# figlet_forge.core.exceptions does not parse the font machinery
+_LAZY_EXPORTS: Dict[str, str] = {
+    "FigletFont": ".figlet_font",
+    "FigletPipeline": ".figlet_pipeline",
+    "FigletString": ".figlet_string",
+    "unicode_string": ".utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import core components lazily on first access.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The requested class or function
+
+    Raises:
+        AttributeError: If the name is not a lazily exported attribute
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "CharNotPrinted",
     "FigletError",
     "FigletFont",
+    "FigletPipeline",
     "FigletString",
     "FontError",
     "FontNotFound",
@@ -0,0 +1,330 @@
+"""
+Rectangular character grid for geometric FigletString transforms.
+
+Rotation, transposition, cropping, index-map scaling and overlay all move
+whole cells around without looking at them. CharGrid performs them as
+single operations on a rectangular grid, with two interchangeable
+backends:
+
+- ``numpy``: the grid is a 2-D array of UCS-4 code units (``uint32``), and
+  each transform is one vectorized array operation
+- ``python``: the grid is a tuple of equal-length strings, and transforms
+  use ``zip``, slicing and ``str.join``
+
+NumPy is optional. It is imported on first use, never at package import,
+and only chosen for grids large enough to amortise the conversion. The
+``FIGLET_FORGE_GRID`` environment variable forces a backend (``numpy`` or
+``python``); the default is ``auto``.
+"""
+
+import logging
+import os
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Configure logger for this module
+logger = logging.getLogger(__name__)
+
+# Environment variable selecting the grid backend: auto, numpy or python
+GRID_BACKEND_ENV = "FIGLET_FORGE_GRID"
+
+GRID_BACKENDS = ("numpy", "python")
+
+# Smallest grid (in cells) for which "auto" picks NumPy
+NUMPY_MIN_CELLS = 4096
+
+# Encoding used to move text in and out of UCS-4 arrays
+_UCS4 = "utf-32-le"
+
+# Cached result of importing NumPy: None until tried, False if unavailable
+_numpy: Any = None
+
+
+def numpy_module() -> Optional[Any]:
+    """
+    Import NumPy on first use.
+
+    Returns:
+        The numpy module, or None if it is not installed
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            logger.debug("NumPy not installed; using the pure-Python grid")
+            _numpy = False
+        else:
+            _numpy = numpy
+    return _numpy or None
+
+
+def select_backend(cells: int, backend: Optional[str] = None) -> str:
+    """
+    Choose the backend for a grid.
+
+    Args:
+        cells: Number of cells in the grid
+        backend: Requested backend; None uses $FIGLET_FORGE_GRID or "auto"
+
+    Returns:
+        "numpy" or "python"
+
+    Raises:
+        ValueError: If the requested backend is unknown
+    """
+    choice = (backend or os.environ.get(GRID_BACKEND_ENV) or "auto").lower()
+    if choice not in GRID_BACKENDS + ("auto",):
+        raise ValueError(
+            f"Unknown grid backend: {choice}. Use auto, {', '.join(GRID_BACKENDS)}"
+        )
+    if choice == "python":
+        return "python"
+    if choice == "auto" and cells < NUMPY_MIN_CELLS:
+        return "python"
+    return "numpy" if numpy_module() is not None else "python"
+
+
+def scale_indices(size: int, factor: float) -> List[int]:
+    """
+    Build the index map that scales one axis by `factor`.
+
+    Each index is repeated ``int(factor)`` times; a fractional part then
+    appends the leading indices ``i`` with ``i / size < factor % 1``,
+    matching FigletString.scale().
+
+    Args:
+        size: Length of the axis
+        factor: Positive scale factor
+
+    Returns:
+        Source index for every output position
+    """
+    whole = int(factor)
+    indices = [i for i in range(size) for _ in range(whole)]
+    fraction = factor % 1
+    if fraction > 0:
+        indices.extend(i for i in range(size) if i / size < fraction)
+    return indices
+
+
+class CharGrid:
+    """
+    Immutable rectangular grid of characters.
+
+    Every transform returns a new grid on the same backend. Use
+    ``from_rows()`` to build a grid and ``to_rows()`` to read it back.
+    """
+
+    __slots__ = ("backend", "width", "height", "_data")
+
+    def __init__(self, backend: str, width: int, height: int, data: Any) -> None:
+        """
+        Initialize the grid; use from_rows() instead of calling this directly.
+
+        Args:
+            backend: "numpy" or "python"
+            width: Number of columns
+            height: Number of rows
+            data: 2-D uint32 array, or tuple of equal-length strings
+        """
+        self.backend = backend
+        self.width = width
+        self.height = height
+        self._data = data
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Sequence[str],
+        width: Optional[int] = None,
+        fill: str = " ",
+        backend: Optional[str] = None,
+    ) -> "CharGrid":
+        """
+        Build a grid from text rows, padding short rows on the right.
+
+        Args:
+            rows: Lines of text without line breaks
+            width: Grid width (defaults to the longest row)
+            fill: Character used to pad short rows
+            backend: Backend to use (see select_backend)
+
+        Returns:
+            New CharGrid
+        """
+        if width is None:
+            width = max(map(len, rows), default=0)
+        height = len(rows)
+        padded = tuple(row.ljust(width, fill) for row in rows)
+        backend = select_backend(width * height, backend)
+        if backend == "python":
+            return cls("python", width, height, padded)
+        return cls("numpy", width, height, _encode(padded, width, height))
+
+    def to_rows(self) -> List[str]:
+        """
+        Read the grid back as text rows.
+
+        Returns:
+            One string of length ``width`` per row
+        """
+        if self.backend == "python":
+            return list(self._data)
+        if not self.width:
+            return [""] * self.height
+        np = numpy_module()
+        text = np.ascontiguousarray(self._data).tobytes().decode(_UCS4, "surrogatepass")
+        width = self.width
+        return [text[start : start + width] for start in range(0, len(text), width)]
+
+    def _derive(self, data: Any) -> "CharGrid":
+        """Wrap transformed data in a new grid on the same backend."""
+        if self.backend == "python":
+            height = len(data)
+            width = len(data[0]) if data else 0
+            return CharGrid("python", width, height, tuple(data))
+        height, width = data.shape
+        return CharGrid("numpy", width, height, data)
+
+    def transpose(self) -> "CharGrid":
+        """Swap rows and columns."""
+        if self.backend == "numpy":
+            return self._derive(self._data.T)
+        return self._derive(["".join(column) for column in zip(*self._data)])
+
+    def rotate_cw(self) -> "CharGrid":
+        """Rotate 90 degrees clockwise."""
+        if self.backend == "numpy":
+            return self._derive(numpy_module().rot90(self._data, -1))
+        return self._derive(["".join(column) for column in zip(*self._data[::-1])])
+
+    def rotate_ccw(self) -> "CharGrid":
+        """Rotate 90 degrees counterclockwise."""
+        if self.backend == "numpy":
+            return self._derive(numpy_module().rot90(self._data, 1))
+        columns = ["".join(column) for column in zip(*self._data)]
+        return self._derive(columns[::-1])
+
+    def flip_rows(self) -> "CharGrid":
+        """Reverse the row order (upside down, characters unchanged)."""
+        return self._derive(self._data[::-1])
+
+    def mirror(self) -> "CharGrid":
+        """Reverse every row (left to right, characters unchanged)."""
+        if self.backend == "numpy":
+            return self._derive(self._data[:, ::-1])
+        return self._derive([row[::-1] for row in self._data])
+
+    def crop(self, left: int, top: int, width: int, height: int) -> "CharGrid":
+        """
+        Cut out a rectangle; parts outside the grid are dropped.
+
+        Args:
+            left: First column
+            top: First row
+            width: Number of columns
+            height: Number of rows
+
+        Returns:
+            New CharGrid
+        """
+        if self.backend == "numpy":
+            return self._derive(self._data[top : top + height, left : left + width])
+        rows = [row[left : left + width] for row in self._data[top : top + height]]
+        return CharGrid("python", len(rows[0]) if rows else 0, len(rows), tuple(rows))
+
+    def scale(self, row_map: Sequence[int], column_map: Sequence[int]) -> "CharGrid":
+        """
+        Resample the grid through index maps.
+
+        Args:
+            row_map: Source row for every output row
+            column_map: Source column for every output column
+
+        Returns:
+            New CharGrid of ``len(row_map)`` by ``len(column_map)`` cells
+        """
+        if self.backend == "numpy":
+            np = numpy_module()
+            rows = np.asarray(row_map, dtype=np.intp)
+            columns = np.asarray(column_map, dtype=np.intp)
+            data = self._data[np.ix_(rows, columns)]
+            return CharGrid("numpy", len(column_map), len(row_map), data)
+        resample = row_resampler(column_map)
+        source = self._data
+        resampled: Dict[int, str] = {}
+        scaled = []
+        for r in row_map:
+            row = resampled.get(r)
+            if row is None:
+                row = resampled[r] = resample(source[r])
+            scaled.append(row)
+        return CharGrid("python", len(column_map), len(row_map), tuple(scaled))
+
+    def overlay(self, other: "CharGrid", x: int, y: int) -> "CharGrid":
+        """
+        Paste another grid with its top-left corner at (x, y).
+
+        Every cell of `other` replaces the cell below it, spaces included.
+
+        Args:
+            other: Grid to paste; must fit inside this grid at (x, y)
+            x: Column of the top-left corner
+            y: Row of the top-left corner
+
+        Returns:
+            New CharGrid
+
+        Raises:
+            ValueError: If `other` does not fit
+        """
+        if (
+            x < 0
+            or y < 0
+            or x + other.width > self.width
+            or y + other.height > self.height
+        ):
+            raise ValueError("Overlay must lie inside the grid")
+
+        if self.backend == "numpy":
+            data = self._data.copy()
+            if other.backend == "numpy":
+                patch = other._data
+            else:
+                patch = _encode(other._data, other.width, other.height)
+            data[y : y + other.height, x : x + other.width] = patch
+            return self._derive(data)
+
+        rows = list(self._data)
+        end = x + other.width
+        for offset, patch_row in enumerate(other.to_rows()):
+            row = rows[y + offset]
+            rows[y + offset] = row[:x] + patch_row + row[end:]
+        return CharGrid("python", self.width, self.height, tuple(rows))
+
+
+def row_resampler(column_map: Sequence[int]) -> Callable[[str], str]:
+    """
+    Build a function that resamples one row through a column index map.
+
+    Args:
+        column_map: Source column for every output column
+
+    Returns:
+        Function mapping a row to its resampled row
+    """
+    if not column_map:
+        return lambda row: ""
+    if len(column_map) == 1:
+        index = column_map[0]
+        return lambda row: row[index]
+    pick = itemgetter(*column_map)
+    return lambda row: "".join(pick(row))
+
+
+def _encode(rows: Tuple[str, ...], width: int, height: int) -> Any:
+    """Convert equal-length rows into a (height, width) uint32 array."""
+    np = numpy_module()
+    data = "".join(rows).encode(_UCS4, "surrogatepass")
+    return np.frombuffer(data, dtype="<u4").reshape(height, width)
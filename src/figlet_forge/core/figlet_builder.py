@@ -7,7 +7,7 @@ input text character by character using the specified font.
 
 import logging
 import traceback
-from typing import Any, Dict, List, TypeVar, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, Union, cast
 
 from ..core.exceptions import CharNotPrinted
 from ..core.figlet_font import FigletFont
@@ -47,7 +47,7 @@ class FigletProduct:
         Returns:
             A FigletString representation of the product
         """
-        return FigletString("\n".join(self.lines))
+        return FigletString.from_rows(self.lines)
 
 
 class FigletBuilder:
@@ -65,6 +65,8 @@ class FigletBuilder:
         direction: str = "auto",
         width: int = 80,
         justify: str = "auto",
+        record_spans: bool = False,
+        special_context: Optional[bool] = None,
     ) -> None:
         """
         Initialize the FigletBuilder with rendering parameters.
@@ -75,6 +77,9 @@ class FigletBuilder:
             direction: Text direction ('auto', 'left-to-right', 'right-to-left')
             width: Maximum width for the output
             justify: Justification ('auto', 'left', 'center', 'right')
+            record_spans: Record the output columns of every input character
+            special_context: Whether rendering runs in a test or showcase,
+                if the caller already knows; None detects it when needed
         """
         # Make sure text is actually a string - directly convert
         self.text = str(text)
@@ -99,10 +104,23 @@ class FigletBuilder:
         # Font metadata for better width management
         self._font_meta: Dict[str, Union[str, bool, int]] = {
             "name": getattr(font, "font_name", "unknown"),
-            "is_wide": self._is_wide_font(),
+            "is_wide": False,
             "char_checks": 0,
             "width_adjustments": 0,
         }
+        self._font_meta["is_wide"] = self._is_wide_font()
+
+        # Pre-resolved (lines, width) glyphs, filled by lookup_glyphs()
+        self._glyphs: Optional[List[Tuple[List[str], int]]] = None
+
+        # Test/showcase detection walks the stack, so do it at most once
+        self._special_context: Optional[bool] = special_context
+
+        # Output column range of each processed input character, when
+        # recorded; glyphs are placed at full width, so every character
+        # occupies the columns [column, column + glyph width)
+        self.spans: Optional[List[Tuple[int, int]]] = [] if record_spans else None
+        self._column = 0
 
     def _is_wide_font(self) -> bool:
         """
@@ -114,6 +132,24 @@ class FigletBuilder:
         font_name = str(self._font_meta["name"]).lower()
         return font_name in ("big", "banner", "block", "doom", "epic", "larry3d")
 
+    def lookup_glyphs(self) -> None:
+        """
+        Resolve the glyph lines and width of every input character up front.
+
+        Each distinct character is looked up in the font only once; the
+        per-character loop in add_char_to_product() then reuses the result.
+        Calling this is optional - without it glyphs are resolved lazily.
+        """
+        resolved: Dict[str, Tuple[List[str], int]] = {}
+        glyphs: List[Tuple[List[str], int]] = []
+        for c in self.text:
+            glyph = resolved.get(c)
+            if glyph is None:
+                glyph = (self.font.get_character(c), self.font.get_width(c))
+                resolved[c] = glyph
+            glyphs.append(glyph)
+        self._glyphs = glyphs
+
     def is_not_finished(self) -> bool:
         """
         Check if there are more characters to process.
@@ -125,6 +161,9 @@ class FigletBuilder:
 
     def go_to_next_char(self) -> None:
         """Move to the next character in the input text."""
+        if self.spans is not None and len(self.spans) == self.current_char_index:
+            # The character was skipped without being printed
+            self.spans.append((self._column, self._column))
         self.current_char_index += 1
         # Update processing metrics
         self._meta["processed"] = self.current_char_index
@@ -155,11 +194,17 @@ class FigletBuilder:
             for i in range(len(self.lines)):
                 self.product.add_line(i + len(self.lines), "")
             self.current_line_width = 0
+            # Rows are appended to, so later text continues at the same column
+            if self.spans is not None:
+                self.spans.append((self._column, self._column))
             return
 
         # Get the character from the font - using get_character for enhanced compatibility
-        char_lines = self.font.get_character(c)
-        char_width = self.font.get_width(c)
+        if self._glyphs is not None:
+            char_lines, char_width = self._glyphs[self.current_char_index]
+        else:
+            char_lines = self.font.get_character(c)
+            char_width = self.font.get_width(c)
 
         # Update character checking metrics
         self._font_meta["char_checks"] = cast(int, self._font_meta["char_checks"]) + 1
@@ -210,11 +255,25 @@ class FigletBuilder:
 
         # Update the current line width
         self.current_line_width += char_width
+        if self.spans is not None:
+            self.spans.append((self._column, self._column + char_width))
+        self._column += char_width
 
     def _is_in_test_or_showcase(self) -> bool:
         """
         Determine if the current execution context is a test or showcase.
 
+        Returns:
+            True if in test or showcase context, False otherwise
+        """
+        if self._special_context is None:
+            self._special_context = self._detect_test_or_showcase()
+        return self._special_context
+
+    def _detect_test_or_showcase(self) -> bool:
+        """
+        Inspect the call stack for test functions or showcase modules.
+
         Returns:
             True if in test or showcase context, False otherwise
         """
@@ -253,25 +312,52 @@ class FigletBuilder:
         for i in range(len(self.lines)):
             self.product.add_line(i, "".join(self.lines[i]))
 
-        # Get the final string
-        result = self.product.as_figlet_string()
+        # Build the final rows, turning font hard blanks into real spaces;
+        # the string is joined once, with its row view and size cached
+        rows = self.product.lines
+        hard_blank = getattr(self.font, "hard_blank", "")
+        if hard_blank:
+            rows = [row.replace(hard_blank, " ") for row in rows]
+        result = FigletString.from_rows(rows)
+        unjustified_width = result.dimensions[0]
 
         # Apply justification if needed
         if self.justify == "center":
             result = result.center()
         elif self.justify == "right":
-            # Calculate the maximum line length
-            max_length = max((len(line) for line in result.splitlines()), default=0)
-            # Create a new result with right-justified lines
-            justified_lines = [line.rjust(max_length) for line in result.splitlines()]
-            result = FigletString("\n".join(justified_lines))
+            # Right-justify every line to the widest one
+            result = result.rjust(result.dimensions[0])
+
+        if self.spans is not None:
+            self._attach_spans(result, unjustified_width)
 
         # Record rendering metrics
-        self._meta["final_width"] = result.dimensions[0]
-        self._meta["final_height"] = result.dimensions[1]
+        self._meta["final_width"], self._meta["final_height"] = result.dimensions
 
         return result
 
+    def _attach_spans(self, result: FigletString, unjustified_width: int) -> None:
+        """
+        Store the recorded spans on the result, shifted by justification.
+
+        Args:
+            result: Final (justified) product
+            unjustified_width: Product width before justification
+        """
+        spans = list(self.spans or ())
+        # Characters never reached (e.g. after an error) get empty spans
+        spans += [(self._column, self._column)] * (len(self.text) - len(spans))
+
+        # Pad a placeholder row the way justification padded the rows
+        shift = 0
+        width = result.dimensions[0]
+        if self.justify in ("center", "right") and 0 < unjustified_width < width:
+            align = str.center if self.justify == "center" else str.rjust
+            shift = align("\0" * unjustified_width, width).index("\0")
+        if shift:
+            spans = [(start + shift, end + shift) for start, end in spans]
+        result.set_source_map(self.text, spans)
+
     # Methods for backward compatibility with older tests
     def isNotFinished(self) -> bool:  # noqa: N802
         """Backward compatibility method for is_not_finished."""
@@ -8,9 +8,10 @@ the ASCII art representations of characters used by the FIGlet system.
 import logging
 import os
 import re
-import zipfile
+import threading
 from importlib import resources
 from pathlib import Path
+from time import perf_counter_ns
 from typing import (
     Dict,
     List,
@@ -20,6 +21,7 @@ from typing import (
     Union,
 )
 
+from .. import metrics
 from ..core.exceptions import FontNotFound
 
 # Configure logger for the font module
@@ -29,6 +31,38 @@ logger = logging.getLogger(__name__)
 CharacterMap = Dict[str, List[str]]
 WidthMap = Dict[str, int]
 
+# Character codes defined positionally by every FIGfont: ASCII 32-126
+# followed by the seven Deutsch characters
+REQUIRED_CHAR_CODES = list(range(32, 127)) + [196, 214, 220, 228, 246, 252, 223]
+
+# The endmark is the last non-whitespace character on a glyph line
+_ENDMARK_PATTERN = re.compile(r"(.)\s*$")
+
+# Process-wide cache of parsed fonts, keyed by requested font name
+_FONT_CACHE: Dict[str, "FigletFont"] = {}
+_FONT_CACHE_LOCK = threading.Lock()
+
+
+def _parse_code_tag(tag: str) -> Optional[int]:
+    """
+    Parse a FIGfont code tag (decimal, 0x-hex or 0-prefixed octal).
+
+    Args:
+        tag: First field of a code tag line
+
+    Returns:
+        Character code, or None if the tag is malformed
+    """
+    try:
+        lowered = tag.lower()
+        if lowered.startswith(("0x", "-0x")):
+            return int(lowered, 16)
+        if len(lowered) > 1 and lowered.lstrip("-").startswith("0"):
+            return int(lowered, 8)
+        return int(lowered)
+    except ValueError:
+        return None
+
 
 class FontInfo(TypedDict, total=False):
     """TypedDict for font metadata."""
@@ -167,6 +201,57 @@ class FigletFont:
 
         return success
 
+    @classmethod
+    def load_cached(cls, font_name: str) -> "FigletFont":
+        """
+        Load a named font once per process and share the parsed instance.
+
+        Parsed fonts are treated as read-only by the renderer, so every
+        Figlet instance asking for the same font name reuses one object.
+
+        Args:
+            font_name: Name of the font to load
+
+        Returns:
+            The cached FigletFont instance
+
+        Raises:
+            FontNotFound: If the font cannot be loaded
+        """
+        font = _FONT_CACHE.get(font_name)
+        if font is not None:
+            metrics.record_cache("font", True)
+            return font
+
+        metrics.record_cache("font", False)
+        start_ns = perf_counter_ns()
+        font = cls()
+        if not font.load_font(font_name=font_name):
+            metrics.record_error("FontNotFound")
+            raise FontNotFound(f"Font not found: {font_name}", font_name=font_name)
+
+        metrics.REGISTRY.inc("font_loads")
+        metrics.REGISTRY.observe_ns("font_load_latency", perf_counter_ns() - start_ns)
+        with _FONT_CACHE_LOCK:
+            # Another thread may have won the race; keep the first instance
+            return _FONT_CACHE.setdefault(font_name, font)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop every cached font so the next load re-parses from disk."""
+        with _FONT_CACHE_LOCK:
+            _FONT_CACHE.clear()
+
+    @classmethod
+    def cached_fonts(cls) -> List[str]:
+        """
+        List the font names currently held in the process-wide cache.
+
+        Returns:
+            Sorted list of cached font names
+        """
+        return sorted(_FONT_CACHE)
+
     def _find_font_in_paths(self, font_name: str) -> bool:
         """
         Search for the font in known system paths.
@@ -331,6 +416,10 @@ class FigletFont:
         """
         Load a standard format FIGlet font.
 
+        Character blocks follow the FIGfont layout: the 95 printable ASCII
+        characters, then the 7 Deutsch characters, then any code-tagged
+        characters, each tag line holding the character code.
+
         Args:
             lines: Font file content as list of lines
             current_line: Starting line number for parsing
@@ -339,55 +428,27 @@ class FigletFont:
             True if parsing succeeded, False otherwise
         """
         try:
-            # Parse each character block
-            while current_line < len(lines):
-                line_count = 0
-                char_lines: List[str] = []
-
-                # Get the character definition lines
-                while line_count < self.height and current_line + line_count < len(
-                    lines
-                ):
-                    line = lines[current_line + line_count]
-                    # Handle lines that might be too short (missing endmark)
-                    if line:
-                        char_lines.append(line[:-1])  # Remove endmark
-                    else:
-                        char_lines.append("")
-                    line_count += 1
-
-                if not char_lines:
-                    current_line += max(1, line_count)  # Skip to next potential block
-                    continue
-
-                # Determine which character this is
-                if (
-                    current_line + self.height <= len(lines)
-                    and lines[current_line + self.height - 1]
-                ):
-                    # Get the last character of the last line in this block
-                    last_line = lines[current_line + self.height - 1]
-                    if last_line:
-                        curr_char = last_line[-1]
-                    else:
-                        curr_char = " "  # Default to space for empty lines
-                else:
-                    curr_char = " "  # Default to space if out of bounds
-
-                # Store the character, removing trailing spaces for width calculation
-                width = (
-                    max(
-                        len(line.rstrip("\r\n" + self.hard_blank))
-                        for line in char_lines
-                    )
-                    if char_lines
-                    else 0
+            height = self.height
+            total = len(lines)
+
+            # Required characters are stored in a fixed order
+            for code in REQUIRED_CHAR_CODES:
+                if current_line + height > total:
+                    return bool(self.chars)
+                self._store_character(
+                    chr(code), lines[current_line : current_line + height]
                 )
-
-                self.chars[curr_char] = char_lines
-                self.width[curr_char] = width
-
-                current_line += self.height
+                current_line += height
+
+            # Remaining blocks are introduced by a code tag line
+            while current_line + height < total:
+                tag = lines[current_line].split(None, 1)
+                block = lines[current_line + 1 : current_line + 1 + height]
+                current_line += height + 1
+                code = _parse_code_tag(tag[0]) if tag else None
+                if code is None or code < 0:
+                    continue
+                self._store_character(chr(code), block)
 
             return bool(self.chars)  # Success if we have at least some characters
 
@@ -395,6 +456,24 @@ class FigletFont:
             logger.debug(f"Error in standard format parsing: {e}")
             return False
 
+    def _store_character(self, char: str, block: List[str]) -> None:
+        """
+        Strip endmarks from a character block and store the glyph.
+
+        Args:
+            char: Character the block defines
+            block: Raw font lines for the character, endmarks included
+        """
+        endmark = _ENDMARK_PATTERN.search(block[0]) if block else None
+        if endmark is None:
+            char_lines = [line.rstrip() for line in block]
+        else:
+            strip = re.compile(re.escape(endmark.group(1)) + r"{1,2}\s*$")
+            char_lines = [strip.sub("", line) for line in block]
+
+        self.chars[char] = char_lines
+        self.width[char] = max((len(line) for line in char_lines), default=0)
+
     def _load_german_format(self, lines: List[str], current_line: int) -> bool:
         """
         Load a German format FIGlet font with improved error handling.
@@ -755,6 +834,8 @@ class FigletFont:
         Returns:
             List of installed font names
         """
+        import zipfile
+
         installed_fonts: List[str] = []
 
         # Create user fonts directory if it doesn't exist
@@ -0,0 +1,260 @@
+"""
+Fused transform pipeline for FigletString.
+
+Applying ``reverse()``, ``flip()`` and ``border()`` one after another builds
+and joins a full string at every step. FigletPipeline records the steps
+instead and executes them together: consecutive reverse/flip steps are
+merged into one translation table plus at most one row and one column
+reversal, a following border consumes the translated rows as they are
+produced, and the result is joined once. Color functions, which work on
+the finished text, run last.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from .figlet_string import FigletString
+
+# A recorded step: ("reverse",), ("flip",) or ("border", style, padding)
+StepT = Tuple[Union[str, int], ...]
+
+# Translation table as produced by str.maketrans
+TableT = Dict[int, Union[int, str, None]]
+
+# Composed tables per (class, reverse/flip sequence), with a flag telling
+# whether every character still maps to exactly one character
+_TABLE_CACHE: Dict[Tuple[Type[FigletString], Tuple[str, ...]], Tuple[TableT, bool]] = {}
+
+
+def _compose_tables(tables: List[TableT]) -> Tuple[TableT, bool]:
+    """
+    Merge translation tables into one with the same effect.
+
+    Args:
+        tables: Tables in the order they would be applied
+
+    Returns:
+        Tuple of (composed table, whether it preserves row width)
+    """
+    keys = set()
+    for table in tables:
+        keys.update(table)
+
+    composed: TableT = {}
+    for key in keys:
+        value = chr(key)
+        for table in tables:
+            value = value.translate(table)
+        if value != chr(key):
+            composed[key] = value
+    return composed, all(len(value) == 1 for value in composed.values())
+
+
+def _char_table(
+    cls: Type[FigletString], ops: Tuple[str, ...]
+) -> Tuple[TableT, bool]:
+    """Get the composed table for a run of reverse/flip steps."""
+    key = (cls, ops)
+    cached = _TABLE_CACHE.get(key)
+    if cached is None:
+        tables = [
+            cls._MIRROR_TABLE if op == "reverse" else cls._FLIP_TABLE for op in ops
+        ]
+        cached = _TABLE_CACHE[key] = _compose_tables(tables)
+    return cached
+
+
+def _trim_runs(
+    rows: List[str], ops: Tuple[str, ...], final: bool
+) -> Tuple[List[str], bool]:
+    """
+    Drop the rows the eager transforms would drop during a reverse/flip run.
+
+    Every eager step reads the rows of the previous result, whose row view
+    leaves out a trailing empty row; only the text of the last result keeps
+    it. Translation keeps empty rows empty, so the rows dropped depend only
+    on the row order after each step.
+
+    Args:
+        rows: Rows entering the run
+        ops: The run's reverse/flip steps, in order
+        final: Whether the run ends the pipeline
+
+    Returns:
+        Tuple of (remaining rows in input order, whether the run flips them)
+    """
+    start, end = 0, len(rows)
+    flipped = False
+    for index, op in enumerate(ops):
+        if op == "flip":
+            flipped = not flipped
+        if start == end or (final and index == len(ops) - 1):
+            continue
+        if flipped and not rows[start]:
+            start += 1
+        elif not flipped and not rows[end - 1]:
+            end -= 1
+    return rows[start:end], flipped
+
+
+class FigletPipeline:
+    """
+    Lazy chain of FigletString transforms.
+
+    Every method returns a new pipeline, so partial chains can be reused.
+    Nothing is computed until ``apply()`` is called.
+
+    Examples:
+        >>> art = FigletString("12\\n34")
+        >>> print(art.pipeline().reverse().flip().apply())
+        43
+        21
+    """
+
+    def __init__(
+        self,
+        source: FigletString,
+        steps: Tuple[StepT, ...] = (),
+        colorizers: Tuple[Callable[[str], str], ...] = (),
+    ) -> None:
+        """
+        Initialize the pipeline.
+
+        Args:
+            source: FigletString the transforms apply to
+            steps: Recorded row transforms
+            colorizers: Color functions to run on the finished text
+        """
+        self._source = source
+        self._steps = steps
+        self._colorizers = colorizers
+
+    @property
+    def steps(self) -> Tuple[str, ...]:
+        """Names of the recorded steps, in order."""
+        return tuple(str(step[0]) for step in self._steps) + ("colorize",) * len(
+            self._colorizers
+        )
+
+    def _then(self, step: StepT) -> "FigletPipeline":
+        """Return a new pipeline with one more row transform."""
+        if self._colorizers:
+            raise ValueError(f"{step[0]}() cannot follow colorize() in a pipeline")
+        return FigletPipeline(self._source, self._steps + (step,), ())
+
+    def reverse(self) -> "FigletPipeline":
+        """Mirror the art horizontally (see FigletString.reverse)."""
+        return self._then(("reverse",))
+
+    def flip(self) -> "FigletPipeline":
+        """Flip the art upside down (see FigletString.flip)."""
+        return self._then(("flip",))
+
+    def border(self, style: str = "single", padding: int = 1) -> "FigletPipeline":
+        """
+        Add a border (see FigletString.border).
+
+        Args:
+            style: Border style (single, double, rounded, bold, ascii, shadow)
+            padding: Amount of padding inside the border
+
+        Returns:
+            New pipeline
+
+        Raises:
+            ValueError: If the border style is unknown
+        """
+        if style not in self._source.BORDER_STYLES:
+            raise ValueError(
+                f"Unknown border style: {style}. Available styles: "
+                f"{', '.join(self._source.BORDER_STYLES.keys())}"
+            )
+        return self._then(("border", style, padding))
+
+    def shadow(self) -> "FigletPipeline":
+        """Add a shadow border (see FigletString.shadow)."""
+        return self.border(style="shadow")
+
+    def colorize(self, color_func: Callable[[str], str]) -> "FigletPipeline":
+        """
+        Color the finished art.
+
+        Color functions see the whole text, so they run after every row
+        transform and no row transform may follow them.
+
+        Args:
+            color_func: Function taking and returning the art as a string
+
+        Returns:
+            New pipeline
+        """
+        return FigletPipeline(
+            self._source, self._steps, self._colorizers + (color_func,)
+        )
+
+    def _stages(self) -> List[StepT]:
+        """Group consecutive reverse/flip steps into single "chars" stages."""
+        stages: List[StepT] = []
+        run: List[str] = []
+        for step in self._steps + (("end",),):
+            if step[0] in ("reverse", "flip"):
+                run.append(str(step[0]))
+                continue
+            if run:
+                stages.append(("chars",) + tuple(run))
+                run = []
+            if step[0] != "end":
+                stages.append(step)
+        return stages
+
+    def apply(self) -> str:
+        """
+        Run the pipeline.
+
+        Returns:
+            A FigletString with cached rows, or the colored text as returned
+            by the last color function
+        """
+        source = self._source
+        cls = type(source)
+        rows: Iterable[str] = source.rows
+        width: Optional[int] = source.dimensions[0]
+
+        # Stages alternate between reverse/flip runs and borders, so a run
+        # always starts from a row sequence (the source or a border's output)
+        stages = self._stages()
+        for number, stage in enumerate(stages, 1):
+            if stage[0] == "chars":
+                ops = tuple(str(op) for op in stage[1:])
+                table, keeps_width = _char_table(cls, ops)
+                mirrored = ops.count("reverse") % 2 == 1
+                final = number == len(stages)
+                rows, flipped = _trim_runs(list(rows), ops, final)
+                ordered = reversed(rows) if flipped else rows
+                if mirrored:
+                    rows = (line[::-1].translate(table) for line in ordered)
+                else:
+                    rows = (line.translate(table) for line in ordered)
+                if not keeps_width:
+                    width = None
+            else:
+                _, style, padding = stage
+                if width is None:
+                    rows = list(rows)
+                    width = max(map(len, rows), default=0)
+                rows, width = cls._border_rows(rows, width, str(style), int(padding))
+
+        result: str = (
+            FigletString.from_rows(tuple(rows), width) if self._steps else source
+        )
+        for color_func in self._colorizers:
+            result = color_func(result)
+        return result
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the pipeline.
+
+        Returns:
+            String representation listing the recorded steps
+        """
+        return f"FigletPipeline({'.'.join(self.steps) or 'identity'})"
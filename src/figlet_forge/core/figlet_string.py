@@ -9,7 +9,22 @@ Following Eidosian principles, it implements precise transformations
 while maintaining structural elegance.
 """
 
-from typing import List, Optional, Tuple, TypeVar, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from .char_grid import CharGrid, row_resampler, scale_indices
+
+if TYPE_CHECKING:
+    from .figlet_pipeline import FigletPipeline
 
 T = TypeVar("T", bound="FigletString")
 
@@ -103,6 +118,11 @@ class FigletString(str):
         "∧": "∨",
     }
 
+    # Translation tables compiled from the maps above, so reverse() and flip()
+    # can translate whole rows with str.translate()
+    _MIRROR_TABLE = str.maketrans(HORIZONTAL_MIRROR_MAP)
+    _FLIP_TABLE = str.maketrans(VERTICAL_FLIP_MAP)
+
     # Border styles for the border() method
     BORDER_STYLES = {
         # Format: (top-left, top, top-right, left, right, bottom-left, bottom, bottom-right)
@@ -114,6 +134,12 @@ class FigletString(str):
         "shadow": ("┌", "─", "┐", "│", "│", "└", "─", "┘", "█", "▀", "▄"),
     }
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Recompile the translation tables for subclasses that override the maps."""
+        super().__init_subclass__(**kwargs)
+        cls._MIRROR_TABLE = str.maketrans(cls.HORIZONTAL_MIRROR_MAP)
+        cls._FLIP_TABLE = str.maketrans(cls.VERTICAL_FLIP_MAP)
+
     def __new__(cls, content: str, *args, **kwargs) -> "FigletString":
         """
         Create a new FigletString instance.
@@ -128,6 +154,49 @@ class FigletString(str):
         """
         return super(FigletString, cls).__new__(cls, content)
 
+    @classmethod
+    def from_rows(
+        cls, rows: Sequence[str], width: Optional[int] = None
+    ) -> "FigletString":
+        """
+        Create a FigletString from rows, keeping them as its row view.
+
+        The rows are joined once and cached, so reading ``rows`` or
+        ``dimensions`` afterwards does not split the string again.
+
+        Args:
+            rows: Lines of the ASCII art, without line breaks
+            width: Length of the longest row, if the caller already knows it
+
+        Returns:
+            New FigletString
+        """
+        instance = cls("\n".join(rows))
+        rows = tuple(rows)
+        if rows and not rows[-1]:
+            # Keep the view identical to splitlines() of the joined text
+            rows = rows[:-1]
+        instance._rows = rows
+        instance._width = (
+            width if width is not None else max(map(len, rows), default=0)
+        )
+        return instance
+
+    @property
+    def rows(self) -> Tuple[str, ...]:
+        """
+        Get the lines of the ASCII art as a tuple.
+
+        The tuple is built once per instance and shared by all transforms.
+
+        Returns:
+            Tuple of lines, as returned by splitlines()
+        """
+        rows = self.__dict__.get("_rows")
+        if rows is None:
+            rows = self._rows = tuple(super().splitlines())
+        return rows
+
     @property
     def dimensions(self) -> Tuple[int, int]:
         """
@@ -139,10 +208,107 @@ class FigletString(str):
         Returns:
             Tuple of (width, height)
         """
-        lines = self.splitlines()
-        width = max((len(line) for line in lines), default=0)
-        height = len(lines)
-        return (width, height)
+        rows = self.rows
+        width = self.__dict__.get("_width")
+        if width is None:
+            width = self._width = max(map(len, rows), default=0)
+        return (width, len(rows))
+
+    @property
+    def source_text(self) -> Optional[str]:
+        """
+        Get the input text this art was rendered from.
+
+        Returns:
+            The rendered text, or None if no source map was recorded
+        """
+        return self.__dict__.get("_source_text")
+
+    @property
+    def source_spans(self) -> Optional[Tuple[Tuple[int, int], ...]]:
+        """
+        Get the output columns of every input character.
+
+        Entry ``i`` is the half-open column range ``(start, end)`` occupied
+        by ``source_text[i]`` on every row of the art. Newlines and
+        characters that were not printed have empty ranges.
+
+        Returns:
+            One span per input character, or None if no source map was
+            recorded (see the ``source_map`` option of Figlet)
+        """
+        return self.__dict__.get("_source_spans")
+
+    def set_source_map(self, text: str, spans: Sequence[Tuple[int, int]]) -> None:
+        """
+        Attach the source text and its column spans to this art.
+
+        Args:
+            text: Input text
+            spans: Half-open output column range of each input character
+
+        Raises:
+            ValueError: If the number of spans does not match the text
+        """
+        if len(spans) != len(text):
+            raise ValueError(f"Expected {len(text)} source spans, got {len(spans)}")
+        self._source_text = text
+        self._source_spans = tuple(spans)
+        self.__dict__.pop("_column_sources", None)
+
+    def _require_source_map(self) -> Tuple[Tuple[int, int], ...]:
+        """Get the source spans, or raise if none were recorded."""
+        spans = self.source_spans
+        if spans is None:
+            raise ValueError(
+                "This FigletString has no source map; render it with "
+                "Figlet(source_map=True)"
+            )
+        return spans
+
+    def column_span(self, index: int) -> Tuple[int, int]:
+        """
+        Get the output columns occupied by one input character.
+
+        Args:
+            index: Index into source_text
+
+        Returns:
+            Half-open column range (start, end)
+
+        Raises:
+            ValueError: If no source map was recorded
+            IndexError: If the index is out of range
+        """
+        return self._require_source_map()[index]
+
+    def source_index_at(self, column: int) -> Optional[int]:
+        """
+        Find the input character drawn at an output column (hit-testing).
+
+        The column lookup table is built on first use; later calls are a
+        single list index.
+
+        Args:
+            column: Output column
+
+        Returns:
+            Index into source_text, or None if no character covers the column
+
+        Raises:
+            ValueError: If no source map was recorded
+        """
+        sources = self.__dict__.get("_column_sources")
+        if sources is None:
+            spans = self._require_source_map()
+            width = max(self.dimensions[0], max((e for _, e in spans), default=0))
+            sources: List[Optional[int]] = [None] * width
+            for index, (start, end) in enumerate(spans):
+                sources[start:end] = [index] * (end - start)
+            self._column_sources = sources
+        if 0 <= column < len(sources):
+            return sources[column]
+        return None
 
     def get_size(self) -> Tuple[int, int]:
         """
@@ -161,7 +327,7 @@ class FigletString(str):
             List of string objects, one per line
         """
         # Return plain strings to avoid recursion issues
-        return super().splitlines()
+        return list(self.rows)
 
     def _to_figlet_lines(self) -> List["FigletString"]:
         """
@@ -170,8 +336,12 @@ class FigletString(str):
         Returns:
             List of FigletString objects, one per line
         """
-        lines = super().splitlines()
-        return [FigletString(line) for line in lines]
+        return [FigletString(line) for line in self.rows]
+
+    def _is_rectangular(self) -> bool:
+        """Check whether every line has the full width."""
+        width = self.dimensions[0]
+        return all(len(line) == width for line in self.rows)
 
     def reverse(self: T) -> T:
         """
@@ -183,18 +353,10 @@ class FigletString(str):
         Returns:
             New FigletString with reversed content
         """
-        lines = super().splitlines()
-        reversed_lines = []
-
-        for line in lines:
-            # Reverse the line and translate characters using the mirror map
-            reversed_line = ""
-            for char in reversed(line):
-                reversed_line += self.HORIZONTAL_MIRROR_MAP.get(char, char)
+        table = self._MIRROR_TABLE
+        reversed_lines = [line[::-1].translate(table) for line in self.rows]
 
-            reversed_lines.append(reversed_line)
-
-        return cast(T, FigletString("\n".join(reversed_lines)))
+        return cast(T, FigletString.from_rows(reversed_lines))
 
     def flip(self: T) -> T:
         """
@@ -206,18 +368,34 @@ class FigletString(str):
         Returns:
             New FigletString with flipped content
         """
-        lines = super().splitlines()
-        flipped_lines = []
+        table = self._FLIP_TABLE
+        flipped_lines = [line.translate(table) for line in reversed(self.rows)]
+
+        return cast(T, FigletString.from_rows(flipped_lines))
+
+    def _justify_rows(self, width: Optional[int], align: str, fillchar: str) -> "FigletString":
+        """
+        Pad every row to a common width.
+
+        Args:
+            width: Field width (default: max line length + 10%)
+            align: Name of the str method used per row ("center", "ljust", "rjust")
+            fillchar: Character to use for padding
 
-        for line in reversed(lines):
-            # Translate characters using the flip map
-            flipped_line = ""
-            for char in line:
-                flipped_line += self.VERTICAL_FLIP_MAP.get(char, char)
+        Returns:
+            New FigletString with padded rows
+        """
+        rows = self.rows
+        max_len = self.dimensions[0]
 
-            flipped_lines.append(flipped_line)
+        # Calculate width if not provided
+        if width is None:
+            width = int(max_len * 1.1)  # Add 10% padding
 
-        return cast(T, FigletString("\n".join(flipped_lines)))
+        pad = getattr(str, align)
+        return FigletString.from_rows(
+            [pad(line, width, fillchar) for line in rows], max(width, max_len)
+        )
 
     def center(self: T, width: Optional[int] = None, fillchar: str = " ") -> T:
         """
@@ -232,17 +410,7 @@ class FigletString(str):
         Returns:
             New FigletString with centered content
         """
-        lines = super().splitlines()
-
-        # Calculate width if not provided
-        if width is None:
-            max_len = max(len(line) for line in lines)
-            width = int(max_len * 1.1)  # Add 10% padding
-
-        # Center each line
-        centered_lines = [line.center(width, fillchar) for line in lines]
-
-        return cast(T, FigletString("\n".join(centered_lines)))
+        return cast(T, self._justify_rows(width, "center", fillchar))
 
     def ljust(self: T, width: Optional[int] = None, fillchar: str = " ") -> T:
         """
@@ -257,17 +425,7 @@ class FigletString(str):
         Returns:
             New FigletString with left-justified content
         """
-        lines = super().splitlines()
-
-        # Calculate width if not provided
-        if width is None:
-            max_len = max(len(line) for line in lines)
-            width = int(max_len * 1.1)  # Add 10% padding
-
-        # Left-justify each line
-        justified_lines = [line.ljust(width, fillchar) for line in lines]
-
-        return cast(T, FigletString("\n".join(justified_lines)))
+        return cast(T, self._justify_rows(width, "ljust", fillchar))
 
     def rjust(self: T, width: Optional[int] = None, fillchar: str = " ") -> T:
         """
@@ -282,17 +440,7 @@ class FigletString(str):
         Returns:
             New FigletString with right-justified content
         """
-        lines = super().splitlines()
-
-        # Calculate width if not provided
-        if width is None:
-            max_len = max(len(line) for line in lines)
-            width = int(max_len * 1.1)  # Add 10% padding
-
-        # Right-justify each line
-        justified_lines = [line.rjust(width, fillchar) for line in lines]
-
-        return cast(T, FigletString("\n".join(justified_lines)))
+        return cast(T, self._justify_rows(width, "rjust", fillchar))
 
     def border(self: T, style: str = "single", padding: int = 1) -> T:
         """
@@ -305,66 +453,74 @@ class FigletString(str):
         Returns:
             New FigletString with border
         """
-        if style not in self.BORDER_STYLES:
+        rows, width = self._border_rows(self.rows, self.dimensions[0], style, padding)
+        return cast(T, FigletString.from_rows(rows, width))
+
+    @classmethod
+    def _border_rows(
+        cls, lines: Iterable[str], max_width: int, style: str, padding: int
+    ) -> Tuple[List[str], int]:
+        """
+        Build bordered rows around content rows.
+
+        Args:
+            lines: Content rows, consumed once
+            max_width: Width of the widest content row
+            style: Border style name from BORDER_STYLES
+            padding: Amount of padding inside the border
+
+        Returns:
+            Tuple of (bordered rows, their width)
+
+        Raises:
+            ValueError: If the border style is unknown
+        """
+        if style not in cls.BORDER_STYLES:
             raise ValueError(
-                f"Unknown border style: {style}. Available styles: {', '.join(self.BORDER_STYLES.keys())}"
+                f"Unknown border style: {style}. Available styles: {', '.join(cls.BORDER_STYLES.keys())}"
             )
 
-        lines = super().splitlines()
-
-        # Get the maximum width of the content
-        max_width = max(len(line) for line in lines) if lines else 0
+        inner_width = max_width + 2 * padding
 
         # Get border characters
-        border = self.BORDER_STYLES[style]
+        border = cls.BORDER_STYLES[style]
 
         # Create the bordered output
         result = []
 
         # Add top border
-        result.append(f"{border[0]}{border[1] * (max_width + 2 * padding)}{border[2]}")
+        result.append(f"{border[0]}{border[1] * inner_width}{border[2]}")
 
         # Add padding rows if needed
         if padding > 1:
             for _ in range(padding - 1):
-                result.append(
-                    f"{border[3]}{' ' * (max_width + 2 * padding)}{border[4]}"
-                )
+                result.append(f"{border[3]}{' ' * inner_width}{border[4]}")
 
         # Add content with left and right borders
+        left = f"{border[3]}{' ' * padding}"
+        right = f"{' ' * padding}{border[4]}"
         for line in lines:
-            result.append(
-                f"{border[3]}{' ' * padding}{line.ljust(max_width)}{' ' * padding}{border[4]}"
-            )
+            result.append(f"{left}{line.ljust(max_width)}{right}")
 
         # Add padding rows if needed
         if padding > 1:
             for _ in range(padding - 1):
-                result.append(
-                    f"{border[3]}{' ' * (max_width + 2 * padding)}{border[4]}"
-                )
+                result.append(f"{border[3]}{' ' * inner_width}{border[4]}")
 
         # Add bottom border
-        result.append(f"{border[5]}{border[6] * (max_width + 2 * padding)}{border[7]}")
+        result.append(f"{border[5]}{border[6] * inner_width}{border[7]}")
 
         # Add shadow if that style is selected
         if style == "shadow" and len(border) > 8:
-            shadow_lines = []
-            # First line has shadow on the right side
-            shadow_lines.append(result[0] + border[8])
-
-            # Middle lines have shadow on the right side
-            for i in range(1, len(result) - 1):
-                shadow_lines.append(result[i] + border[8])
+            # Every line has shadow on the right side
+            shadow_lines = [line + border[8] for line in result]
 
             # Last line has shadow on the bottom and bottom-right
-            last_line = result[-1]
-            shadow_lines.append(last_line + border[8])
-            shadow_lines.append(" " + border[9] * (len(last_line) - 1) + border[10])
+            shadow_lines.append(" " + border[9] * (len(result[-1]) - 1) + border[10])
 
-            result = shadow_lines
+            return shadow_lines, inner_width + 3
 
-        return cast(T, FigletString("\n".join(result)))
+        return result, inner_width + 2
 
     def shadow(self: T) -> T:
         """
@@ -377,6 +533,23 @@ class FigletString(str):
         """
         return self.border(style="shadow")
 
+    def pipeline(self) -> "FigletPipeline":
+        """
+        Start a lazy chain of transforms on this FigletString.
+
+        Chained steps are recorded and executed together by ``apply()``,
+        which fuses runs of reverse/flip into a single pass over the rows
+        and joins the result only once, for example::
+
+            art.pipeline().reverse().flip().border("double").apply()
+
+        Returns:
+            New FigletPipeline over this string
+        """
+        from .figlet_pipeline import FigletPipeline
+
+        return FigletPipeline(self)
+
     def overlay(
         self: T, other: Union[str, "FigletString"], x: int = 0, y: int = 0
     ) -> T:
@@ -398,8 +571,8 @@ class FigletString(str):
         if not isinstance(other, FigletString):
             other = FigletString(other)
 
-        self_lines = super().splitlines()
-        other_lines = other.splitlines()
+        self_lines = self.rows
+        other_lines = other.rows
 
         result = list(self_lines)  # Create a copy of self_lines
 
@@ -435,7 +608,7 @@ class FigletString(str):
 
             result[y + i] = overlaid
 
-        return cast(T, FigletString("\n".join(result)))
+        return cast(T, FigletString.from_rows(result))
 
     def strip_surrounding_newlines(self: T) -> T:
         """
@@ -460,24 +633,23 @@ class FigletString(str):
         if horizontal <= 0 or vertical <= 0:
             raise ValueError("Scale factors must be positive")
 
-        lines = super().splitlines()
-        result = []
-
-        # Scale vertically by duplicating lines
-        for line in lines:
-            # Scale horizontally by duplicating characters
-            scaled_line = "".join(char * int(horizontal) for char in line)
-
-            # Add fractional part if needed
-            if horizontal % 1 > 0:
-                fraction = horizontal % 1
-                for i in range(len(line)):
-                    if i / len(line) < fraction:
-                        scaled_line += line[i]
-
-            # Duplicate the scaled line according to vertical scale
-            for _ in range(int(vertical)):
-                result.append(scaled_line)
+        lines = self.rows
+        width, height = self.dimensions
+
+        # Every line is repeated int(vertical) times and resampled through a
+        # column index map; rectangular art does this as one grid operation
+        row_map = scale_indices(height, int(vertical))
+        if self._is_rectangular():
+            column_map = scale_indices(width, horizontal)
+            grid = CharGrid.from_rows(lines, width).scale(row_map, column_map)
+            result = grid.to_rows()
+        else:
+            # Lines of different lengths need their own column maps
+            resamplers = {
+                length: row_resampler(scale_indices(length, horizontal))
+                for length in set(map(len, lines))
+            }
+            result = [resamplers[len(lines[r])](lines[r]) for r in row_map]
 
         # Add fractional vertical scaling if needed
         if vertical % 1 > 0:
@@ -486,7 +658,7 @@ class FigletString(str):
                 if i / len(lines) < fraction:
                     result.append(lines[i])
 
-        return cast(T, FigletString("\n".join(result)))
+        return cast(T, FigletString.from_rows(result))
 
     def crop(
         self: T,
@@ -507,12 +679,10 @@ class FigletString(str):
         Returns:
             New FigletString with cropped content
         """
-        lines = super().splitlines()
-        result = []
+        lines = self.rows
 
         # Calculate actual width and height
-        full_width = max(len(line) for line in lines) if lines else 0
-        full_height = len(lines)
+        full_width, full_height = self.dimensions
 
         # Default crop dimensions to full size if not specified
         if width is None:
@@ -524,17 +694,11 @@ class FigletString(str):
         if left < 0 or top < 0 or width <= 0 or height <= 0:
             raise ValueError("Crop region must have positive dimensions")
 
-        # Crop vertically
-        crop_lines = lines[top : top + height] if top < len(lines) else []
-
-        # Crop horizontally
-        for line in crop_lines:
-            if left < len(line):
-                result.append(line[left : left + width])
-            else:
-                result.append("")
+        # Crop vertically, then slice each line (lines that end before
+        # `left` become empty)
+        result = [line[left : left + width] for line in lines[top : top + height]]
 
-        return cast(T, FigletString("\n".join(result)))
+        return cast(T, FigletString.from_rows(result))
 
     def rotate_90_clockwise(self: T) -> T:
         """
@@ -543,29 +707,15 @@ class FigletString(str):
         Returns:
             New FigletString with rotated content
         """
-        lines = super().splitlines()
-        if not lines:
+        lines = self.rows
+        width, height = self.dimensions
+        if not width:
             return cast(T, FigletString(""))
 
-        # Determine dimensions
-        height = len(lines)
-        width = max(len(line) for line in lines)
+        # Pad lines to equal width and rotate the grid in one operation
+        rotated = CharGrid.from_rows(lines, width).rotate_cw().to_rows()
 
-        # Pad lines to equal width
-        padded_lines = [line.ljust(width) for line in lines]
-
-        # Create rotated result
-        rotated = []
-        for i in range(width):
-            new_line = ""
-            for j in range(height - 1, -1, -1):
-                if i < len(padded_lines[j]):
-                    new_line += padded_lines[j][i]
-                else:
-                    new_line += " "
-            rotated.append(new_line)
-
-        return cast(T, FigletString("\n".join(rotated)))
+        return cast(T, FigletString.from_rows(rotated, height))
 
     def rotate_90_counterclockwise(self: T) -> T:
         """
@@ -574,29 +724,15 @@ class FigletString(str):
         Returns:
             New FigletString with rotated content
         """
-        lines = super().splitlines()
-        if not lines:
+        lines = self.rows
+        width, height = self.dimensions
+        if not width:
             return cast(T, FigletString(""))
 
-        # Determine dimensions
-        height = len(lines)
-        width = max(len(line) for line in lines)
-
-        # Pad lines to equal width
-        padded_lines = [line.ljust(width) for line in lines]
-
-        # Create rotated result
-        rotated = []
-        for i in range(width - 1, -1, -1):
-            new_line = ""
-            for j in range(height):
-                if i < len(padded_lines[j]):
-                    new_line += padded_lines[j][i]
-                else:
-                    new_line += " "
-            rotated.append(new_line)
-
-        return cast(T, FigletString("\n".join(rotated)))
+        # Pad lines to equal width and rotate the grid in one operation
+        rotated = CharGrid.from_rows(lines, width).rotate_ccw().to_rows()
+
+        return cast(T, FigletString.from_rows(rotated, height))
 
     def __add__(self, other: object) -> "FigletString":
         """
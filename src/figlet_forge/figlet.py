@@ -7,7 +7,20 @@ text rendering, along with the print_figlet convenience function.
 
 import logging
 import sys
-from typing import Dict, List, Mapping, Optional, Set, TypedDict, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypedDict,
+    TypeVar,
+    Union,
+)
 
 from .color.figlet_color import parse_color
 from .core.exceptions import FigletError, FontNotFound
@@ -16,6 +29,9 @@ from .core.figlet_string import FigletString
 from .render.figlet_engine import FigletRenderingEngine
 from .version import DEFAULT_FONT, RESET_COLORS
 
+if TYPE_CHECKING:
+    from .color.styled import StyledArt
+
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
@@ -49,6 +65,7 @@ class FigletKwargs(TypedDict, total=False):
     unicode_aware: bool
     enhanced_parser: bool
     adjusted_width: Optional[int]
+    source_map: bool
 
 
 class Figlet:
@@ -97,7 +114,7 @@ class Figlet:
             justify: Text justification ('auto', 'left', 'center', 'right')
             width: Maximum width of rendered output
             unicode_aware: Whether to handle Unicode characters
-            **kwargs: Additional options (enhanced_parser, etc.)
+            **kwargs: Additional options (enhanced_parser, source_map, etc.)
         """
         # Store the font name based on input type
         self.font = "custom" if isinstance(font, FigletFont) else str(font)
@@ -111,6 +128,9 @@ class Figlet:
         # Store advanced configuration from kwargs with proper typing
         self.enhanced_parser: bool = bool(kwargs.get("enhanced_parser", False))
 
+        # Record the output columns of every input character on the result
+        self.source_map: bool = bool(kwargs.get("source_map", False))
+
         # Fix type safety issue for adjusted_width
         adjusted_width_value = kwargs.get("adjusted_width")
         self.adjusted_width: Optional[int] = None
@@ -129,6 +149,9 @@ class Figlet:
         # Track load attempts to prevent infinite recursion - explicit type annotation
         self._load_attempts: Set[str] = set()
 
+        # Renderers for other fonts used by render_runs(), keyed by font name
+        self._run_figlets: Dict[str, "Figlet"] = {}
+
         # Load the font
         self._load_font(font)
 
@@ -158,15 +181,12 @@ class Figlet:
 
         # First try to load the named font
         try:
-            font_instance = FigletFont()
-
             # Use enhanced parser if specified
             if self.enhanced_parser:
                 logger.debug(f"Using enhanced parser for font: {font_str}")
 
-            # Attempt to load the font
-            if not font_instance.load_font(font_name=font_str):
-                raise FontNotFound(f"Font not found: {font_str}")
+            # Attempt to load the font (shared across instances once parsed)
+            font_instance = FigletFont.load_cached(font_str)
 
             # Check if we're using a fallback font and update the font name accordingly
             if (
@@ -184,9 +204,7 @@ class Figlet:
                     logger.debug(
                         f"Font '{font_str}' not found, falling back to {DEFAULT_FONT}"
                     )
-                    font_instance = FigletFont()
-                    if not font_instance.load_font(font_name=DEFAULT_FONT):
-                        raise FontNotFound(f"Font not found: {DEFAULT_FONT}") from e
+                    font_instance = FigletFont.load_cached(DEFAULT_FONT)
                     # Update font name to reflect actual font used
                     self.font = DEFAULT_FONT
                     self.Font = font_instance
@@ -269,6 +287,136 @@ class Figlet:
             # Pass through FigletErrors
             raise
 
+    def render_runs(
+        self, runs: Sequence[Union[str, Tuple[str, Optional[str]]]], gap: int = 0
+    ) -> FigletString:
+        """
+        Render runs of text in different fonts side by side on one line.
+
+        Each run is rendered in its own font with this instance's direction
+        and width, and the runs are aligned on their fonts' baselines, so a
+        version number in ``digital`` sits on the same line as a product
+        name in ``slant``. The combined art is justified like the output of
+        render_text().
+
+        Args:
+            runs: (text, font) pairs; a font of None, or a plain string,
+                uses this instance's font
+            gap: Spaces between runs
+
+        Returns:
+            A FigletString containing all runs
+
+        Raises:
+            FigletError: If a run cannot be rendered
+        """
+        from .layout import RenderedCell, grid
+
+        ordered = [(run, None) if isinstance(run, str) else run for run in runs]
+        if self.direction == "right-to-left":
+            ordered.reverse()
+
+        cells = []
+        for text, font in ordered:
+            if not text:
+                continue
+            figlet = self._run_figlet(font)
+            art = figlet.render_text(text)
+            cells.append(RenderedCell(art, figlet.font_instance.base_line))
+        if not cells:
+            return FigletString("")
+
+        result = grid(cells, columns=len(cells), gutter=gap)
+        if self.justify == "center":
+            result = result.center()
+        elif self.justify == "right":
+            result = result.rjust(result.dimensions[0])
+        return result
+
+    def _run_figlet(self, font: Optional[str]) -> "Figlet":
+        """Get the unjustified renderer for one run's font."""
+        key = self.font if font is None else font
+        figlet = self._run_figlets.get(key)
+        if figlet is None:
+            # Runs are justified together, so each one is rendered unjustified
+            figlet = Figlet(
+                font=(self.Font or self.font) if key == self.font else key,
+                direction=self.direction,
+                justify="left",
+                width=self.width,
+                unicode_aware=self.unicode_aware,
+            )
+            self._run_figlets[key] = figlet
+        return figlet
+
+    def marquee(
+        self,
+        text: str,
+        viewport_width: int,
+        wrap: bool = True,
+        gap: Optional[int] = None,
+        step: int = 1,
+        color: Optional[str] = None,
+        depth: Optional[int] = None,
+        loops: Optional[int] = 1,
+    ) -> Iterator[FigletString]:
+        """
+        Scroll text through a viewport, one frame per step.
+
+        The text is rendered once as a single strip and colored once; each
+        frame is a slice of the strip's rows with the precomputed escapes
+        of the runs it covers, so no frame renders or parses colors::
+
+            for frame in fig.marquee("Breaking news", 40, loops=None):
+                print(frame)
+
+        Args:
+            text: Text to scroll; line breaks become spaces
+            viewport_width: Columns shown in each frame
+            wrap: Scroll around with a gap between the end of the text and
+                its next start, instead of entering on the right and
+                leaving on the left
+            gap: Blank columns between repeats when wrapping; None uses
+                the default gap
+            step: Columns the text moves per frame
+            color: Color spec or effect name, applied to the whole strip
+            depth: Color depth of the output; None is truecolor
+            loops: Passes through the strip; None repeats forever
+
+        Returns:
+            Iterator over the frames
+
+        Raises:
+            FigletError: If the text cannot be rendered
+            InvalidColor: If the color spec is invalid
+            ValueError: If the viewport width, the gap or the step is
+                out of range
+        """
+        from .render.marquee import Marquee
+
+        line = " ".join(text.splitlines())
+        figlet = self
+        if self.get_justify() != "left":
+            # Justification would pad the strip with blank columns
+            figlet = Figlet(
+                font=self.Font or self.font,
+                direction=self.direction,
+                justify="left",
+                width=self.width,
+                unicode_aware=self.unicode_aware,
+            )
+        strip: Union[FigletString, "StyledArt"] = figlet.render_text(line)
+        if color:
+            from .color.depth import TRUECOLOR
+            from .color.registry import compile_effect
+            from .color.styled import StyledArt
+
+            # Compiled at the marquee's depth, the effect writes the same
+            # escapes as the CLI, and palette codes survive the conversion
+            effect = compile_effect(color, TRUECOLOR if depth is None else depth)
+            strip = StyledArt.from_ansi(effect(strip))
+        return Marquee(strip, viewport_width, wrap, gap, step, depth).frames(loops)
+
     def get_render_width(self, text: str) -> int:
         """
         Get the rendering width of text.
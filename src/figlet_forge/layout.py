@@ -0,0 +1,239 @@
+"""
+Grid layout for side-by-side banners.
+
+``grid()`` renders a list of cells and arranges them in columns, for
+dashboards such as service names in ``small`` next to their status in
+``mini``::
+
+    from figlet_forge.layout import Cell, grid
+
+    print(grid([Cell("api", "small"), Cell("OK", "mini"),
+                Cell("db", "small"), Cell("DOWN", "mini")], columns=2))
+
+Cells in one grid row are aligned on their fonts' baselines
+(``FigletFont.base_line``), so letters written in fonts of different
+heights sit on a common line. Each distinct (text, font) pair is rendered
+once, on a pool of worker processes when there are enough of them, and the
+output rows are assembled in a single pass over the cached cell rows.
+"""
+
+import logging
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .core.figlet_string import FigletString
+from .version import DEFAULT_FONT
+
+# Configure logger for this module
+logger = logging.getLogger(__name__)
+
+H_ALIGNMENTS = ("left", "center", "right")
+V_ALIGNMENTS = ("baseline", "top", "center", "bottom")
+
+# Below this many distinct cells a worker pool costs more than it saves
+MIN_PARALLEL_CELLS = 32
+
+# Width used to render cells, large enough that no cell wraps
+CELL_RENDER_WIDTH = 10000
+
+# Figlet instances of the current process, keyed by font name
+_FIGLETS: Dict[str, object] = {}
+
+
+class Cell(NamedTuple):
+    """Text to render in one grid cell, optionally in its own font."""
+
+    text: str
+    font: Optional[str] = None
+
+
+class RenderedCell(NamedTuple):
+    """A rendered cell with the distance from its top to its baseline."""
+
+    art: FigletString
+    base_line: int
+
+
+# Accepted grid items: plain text (rendered in the grid's font), a Cell, a
+# RenderedCell, or a pre-rendered FigletString (whose baseline is taken as
+# its bottom line)
+ItemT = Union[str, Cell, RenderedCell, FigletString]
+
+
+def _render_spec(spec: Tuple[str, str]) -> Tuple[str, int]:
+    """
+    Render one (text, font) pair in the current process.
+
+    Args:
+        spec: Text and font name
+
+    Returns:
+        Tuple of (rendered text, font baseline)
+    """
+    text, font = spec
+    figlet = _FIGLETS.get(font)
+    if figlet is None:
+        from .figlet import Figlet
+
+        figlet = _FIGLETS[font] = Figlet(font=font, width=CELL_RENDER_WIDTH)
+    art = figlet.render_text(text)  # type: ignore[attr-defined]
+    return str(art), figlet.Font.base_line  # type: ignore[attr-defined]
+
+
+def render_cells(
+    items: Sequence[ItemT], font: str = DEFAULT_FONT, jobs: int = 1
+) -> List[RenderedCell]:
+    """
+    Render grid items, each distinct (text, font) pair once.
+
+    Args:
+        items: Grid items
+        font: Font for items that do not name one
+        jobs: Worker processes; rendering stays in-process below
+            MIN_PARALLEL_CELLS distinct cells
+
+    Returns:
+        One rendered cell per item
+    """
+    specs: Dict[Tuple[str, str], None] = {}
+    for item in items:
+        if isinstance(item, (FigletString, RenderedCell)):
+            continue
+        cell = item if isinstance(item, Cell) else Cell(item)
+        specs.setdefault((cell.text, cell.font or font), None)
+
+    unique = list(specs)
+    if jobs > 1 and len(unique) >= MIN_PARALLEL_CELLS:
+        import multiprocessing
+
+        chunksize = max(1, len(unique) // (jobs * 4))
+        with multiprocessing.Pool(min(jobs, len(unique))) as pool:
+            results = pool.map(_render_spec, unique, chunksize=chunksize)
+    else:
+        results = [_render_spec(spec) for spec in unique]
+
+    rendered = {
+        spec: RenderedCell(FigletString(text), base_line)
+        for spec, (text, base_line) in zip(unique, results)
+    }
+
+    cells = []
+    for item in items:
+        if isinstance(item, RenderedCell):
+            cells.append(item)
+        elif isinstance(item, FigletString):
+            cells.append(RenderedCell(item, item.dimensions[1]))
+        else:
+            cell = item if isinstance(item, Cell) else Cell(item)
+            cells.append(rendered[(cell.text, cell.font or font)])
+    return cells
+
+
+def _top_offsets(
+    cells: Sequence[RenderedCell], valign: str
+) -> Tuple[List[int], int]:
+    """
+    Vertical position of every cell in one grid row.
+
+    Args:
+        cells: Rendered cells of the row
+        valign: baseline, top, center or bottom
+
+    Returns:
+        Tuple of (top offset per cell, row height)
+    """
+    heights = [cell.art.dimensions[1] for cell in cells]
+    if valign == "baseline":
+        above = max(min(cell.base_line, h) for cell, h in zip(cells, heights))
+        offsets = [above - min(cell.base_line, h) for cell, h in zip(cells, heights)]
+        return offsets, max(o + h for o, h in zip(offsets, heights))
+
+    height = max(heights)
+    if valign == "top":
+        return [0] * len(cells), height
+    if valign == "center":
+        return [(height - h) // 2 for h in heights], height
+    return [height - h for h in heights], height
+
+
+def grid(
+    items: Sequence[ItemT],
+    columns: int = 2,
+    gutter: int = 2,
+    align: str = "left",
+    valign: str = "baseline",
+    font: str = DEFAULT_FONT,
+    row_gap: int = 0,
+    jobs: int = 1,
+) -> FigletString:
+    """
+    Render items and arrange them in a grid.
+
+    Items fill the grid row by row. Every column is as wide as its widest
+    cell; every grid row is as tall as its cells once they are aligned.
+
+    Args:
+        items: Plain text, Cell(text, font), RenderedCell or pre-rendered
+            FigletString
+        columns: Number of columns
+        gutter: Spaces between columns
+        align: Horizontal alignment inside a column: left, center or right
+        valign: Vertical alignment inside a row: baseline, top, center or
+            bottom
+        font: Font for items that do not name one
+        row_gap: Empty lines between grid rows
+        jobs: Worker processes used to render the cells
+
+    Returns:
+        FigletString holding the whole grid
+
+    Raises:
+        ValueError: If an argument is out of range
+    """
+    if columns < 1:
+        raise ValueError("columns must be at least 1")
+    if gutter < 0 or row_gap < 0:
+        raise ValueError("gutter and row_gap must not be negative")
+    if align not in H_ALIGNMENTS:
+        raise ValueError(f"Unknown alignment: {align}. Use {', '.join(H_ALIGNMENTS)}")
+    if valign not in V_ALIGNMENTS:
+        raise ValueError(
+            f"Unknown vertical alignment: {valign}. Use {', '.join(V_ALIGNMENTS)}"
+        )
+
+    cells = render_cells(items, font, jobs)
+    if not cells:
+        return FigletString("")
+
+    grid_rows = [cells[i : i + columns] for i in range(0, len(cells), columns)]
+    widths = [0] * min(columns, len(cells))
+    for row in grid_rows:
+        for column, cell in enumerate(row):
+            widths[column] = max(widths[column], cell.art.dimensions[0])
+    total_width = sum(widths) + gutter * (len(widths) - 1)
+    separator = " " * gutter
+    pad = {"left": str.ljust, "center": str.center, "right": str.rjust}[align]
+
+    lines: List[str] = []
+    for row_index, row in enumerate(grid_rows):
+        if row_index and row_gap:
+            lines.extend([" " * total_width] * row_gap)
+        offsets, height = _top_offsets(row, valign)
+
+        # Lay every cell out as a full-height column of padded lines, then
+        # join the columns line by line
+        laid_out = []
+        for column, (cell, top) in enumerate(zip(row, offsets)):
+            width = widths[column]
+            blank = " " * width
+            art_rows = cell.art.rows
+            laid_out.append(
+                [blank] * top
+                + [pad(line, width) for line in art_rows]
+                + [blank] * (height - top - len(art_rows))
+            )
+        # A short last row still spans the full grid width
+        for width in widths[len(row) :]:
+            laid_out.append([" " * width] * height)
+        lines.extend(separator.join(parts) for parts in zip(*laid_out))
+
+    return FigletString.from_rows(lines, total_width)
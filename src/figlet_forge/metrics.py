@@ -0,0 +1,529 @@
+"""
+Process-wide metrics registry for Figlet Forge.
+
+This module collects counters and latency histograms from every rendering
+engine, the font cache and the color caches into a single registry, and
+exposes them in the Prometheus text exposition format or as a JSON snapshot.
+
+It depends only on the standard library so that any part of the package
+can record metrics without creating import cycles.
+"""
+
+import json
+import threading
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
+
+if TYPE_CHECKING:
+    from http.server import HTTPServer
+
+# Metric name prefix used in every exported series
+NAMESPACE = "figlet_forge"
+
+# Histogram bucket upper bounds in nanoseconds (1µs .. ~4.2s, powers of two)
+DEFAULT_BUCKETS_NS: Tuple[int, ...] = tuple(1000 * (2**i) for i in range(23))
+
+# Content types for the two export formats
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+JSON_CONTENT_TYPE = "application/json"
+
+LabelsT = Tuple[Tuple[str, str], ...]
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram with nanosecond resolution.
+
+    Buckets are cumulative-friendly upper bounds, so the histogram can be
+    exported directly to formats such as Prometheus.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum_ns", "max_ns")
+
+    def __init__(self, bounds: Tuple[int, ...] = DEFAULT_BUCKETS_NS) -> None:
+        """
+        Initialize an empty histogram.
+
+        Args:
+            bounds: Sorted bucket upper bounds in nanoseconds
+        """
+        self.bounds = bounds
+        # One extra slot collects observations above the last bound
+        self.counts: List[int] = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum_ns = 0
+        self.max_ns = 0
+
+    def observe(self, value_ns: int) -> None:
+        """
+        Record one observation.
+
+        Args:
+            value_ns: Observed latency in nanoseconds
+        """
+        self.counts[bisect_left(self.bounds, value_ns)] += 1
+        self.count += 1
+        self.sum_ns += value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def quantile(self, q: float) -> int:
+        """
+        Estimate a quantile from the bucket counts.
+
+        The estimate is the upper bound of the bucket containing the
+        requested rank, so it never under-reports latency.
+
+        Args:
+            q: Quantile between 0.0 and 1.0 (e.g. 0.99 for p99)
+
+        Returns:
+            Estimated latency in nanoseconds (0 if nothing was observed)
+        """
+        if not self.count:
+            return 0
+        rank = max(1, int(q * self.count + 0.999999))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], self.max_ns)
+                return self.max_ns
+        return self.max_ns
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Fold another histogram with identical bounds into this one.
+
+        Args:
+            other: Histogram to merge
+        """
+        if other.bounds != self.bounds:
+            raise ValueError("Cannot merge histograms with different bucket bounds")
+        for index, bucket_count in enumerate(other.counts):
+            self.counts[index] += bucket_count
+        self.count += other.count
+        self.sum_ns += other.sum_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Summarize the histogram.
+
+        Returns:
+            Dictionary with count, mean, max and p50/p90/p99 in milliseconds
+        """
+        mean_ns = self.sum_ns / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "mean_ms": mean_ns / 1e6,
+            "max_ms": self.max_ns / 1e6,
+            "p50_ms": self.quantile(0.50) / 1e6,
+            "p90_ms": self.quantile(0.90) / 1e6,
+            "p99_ms": self.quantile(0.99) / 1e6,
+        }
+
+
+def _labels_key(labels: Dict[str, str]) -> LabelsT:
+    """Normalize a label mapping into a hashable, ordered key."""
+    if not labels:
+        return ()
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape_label(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: LabelsT, extra: Optional[Tuple[str, str]] = None) -> str:
+    """Render labels in Prometheus `{name="value",...}` syntax."""
+    pairs = list(labels)
+    if extra is not None:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in pairs) + "}"
+
+
+def _format_number(value: float) -> str:
+    """
+    Format a sample value or bound exactly.
+
+    Whole numbers are written as integers, so large counters keep every
+    digit, and other values with repr(), which round-trips the float.
+
+    Args:
+        value: Value to format
+
+    Returns:
+        Text for the exposition format
+    """
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of labelled counters and latency histograms.
+
+    Metric names are given without the package namespace; exports add the
+    ``figlet_forge_`` prefix. Counters are exported with a ``_total``
+    suffix and histograms in seconds, following Prometheus conventions.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._descriptions: Dict[str, Tuple[str, str]] = {}
+        self._counters: Dict[str, Dict[LabelsT, float]] = {}
+        self._histograms: Dict[str, Dict[LabelsT, LatencyHistogram]] = {}
+        # [cache name, cache_info function, hits and misses already counted]
+        self._tracked: List[List[Any]] = []
+
+    def describe(self, name: str, kind: str, help_text: str) -> None:
+        """
+        Declare a metric so it is exported (as zero) before first use.
+
+        Args:
+            name: Metric name without namespace
+            kind: "counter" or "histogram"
+            help_text: One-line description for the HELP line
+        """
+        if kind not in ("counter", "histogram"):
+            raise ValueError(f"Unknown metric kind: {kind}")
+        with self._lock:
+            self._descriptions[name] = (kind, help_text)
+            if kind == "counter":
+                self._counters.setdefault(name, {})
+            else:
+                self._histograms.setdefault(name, {})
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        """
+        Increment a counter.
+
+        Args:
+            name: Counter name without namespace or ``_total`` suffix
+            value: Amount to add
+            **labels: Label values identifying the series
+        """
+        key = _labels_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def track_cache(self, cache: str, cache_info: Callable[[], Any]) -> None:
+        """
+        Count the lookups of a functools.lru_cache as cache hits and misses.
+
+        Hot caches are not counted on every lookup. Their statistics are
+        folded into the cache_hits and cache_misses counters whenever the
+        registry is read, so tracking costs nothing on the lookup path.
+
+        Args:
+            cache: Cache label of the counted lookups
+            cache_info: The cached function's cache_info method
+        """
+        info = cache_info()
+        with self._lock:
+            self._tracked.append([cache, cache_info, info.hits, info.misses])
+
+    def _fold_tracked(self) -> None:
+        """Count the tracked caches' lookups since the last fold (lock held)."""
+        for entry in self._tracked:
+            cache, cache_info, hits, misses = entry
+            info = cache_info()
+            key = _labels_key({"cache": cache})
+            # A cleared cache starts its statistics again from zero
+            for name, now, before in (
+                ("cache_hits", info.hits, hits),
+                ("cache_misses", info.misses, misses),
+            ):
+                added = now - before if now >= before else now
+                if added:
+                    series = self._counters.setdefault(name, {})
+                    series[key] = series.get(key, 0) + added
+            entry[2], entry[3] = info.hits, info.misses
+
+    def observe_ns(self, name: str, value_ns: int, **labels: str) -> None:
+        """
+        Record a latency observation.
+
+        Args:
+            name: Histogram name without namespace
+            value_ns: Observed latency in nanoseconds
+            **labels: Label values identifying the series
+        """
+        key = _labels_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = LatencyHistogram()
+            histogram.observe(value_ns)
+
+    def get(self, name: str, **labels: str) -> float:
+        """
+        Read the current value of a counter series.
+
+        Args:
+            name: Counter name
+            **labels: Label values identifying the series
+
+        Returns:
+            Counter value (0 if the series was never incremented)
+        """
+        with self._lock:
+            self._fold_tracked()
+            return self._counters.get(name, {}).get(_labels_key(labels), 0)
+
+    def get_histogram(self, name: str, **labels: str) -> Optional[LatencyHistogram]:
+        """
+        Read a histogram series.
+
+        Args:
+            name: Histogram name
+            **labels: Label values identifying the series
+
+        Returns:
+            The histogram, or None if nothing was observed yet
+        """
+        with self._lock:
+            return self._histograms.get(name, {}).get(_labels_key(labels))
+
+    def reset(self) -> None:
+        """Zero every series while keeping metric declarations."""
+        with self._lock:
+            self._fold_tracked()
+            for name in self._counters:
+                self._counters[name] = {}
+            for name in self._histograms:
+                self._histograms[name] = {}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Take a JSON-serializable snapshot of every metric.
+
+        Returns:
+            Mapping with "counters" and "histograms" sections; each series
+            is listed with its labels and value or summary
+        """
+        with self._lock:
+            self._fold_tracked()
+            counters = {
+                name: [
+                    {"labels": dict(key), "value": value}
+                    for key, value in sorted(series.items())
+                ]
+                for name, series in sorted(self._counters.items())
+            }
+            histograms = {
+                name: [
+                    dict({"labels": dict(key)}, **histogram.as_dict())
+                    for key, histogram in sorted(series.items())
+                ]
+                for name, series in sorted(self._histograms.items())
+            }
+        return {"counters": counters, "histograms": histograms}
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """
+        Serialize the snapshot as JSON.
+
+        Args:
+            indent: Optional indentation passed to json.dumps
+
+        Returns:
+            JSON document
+        """
+        return json.dumps(self.snapshot(), indent=indent, sort_keys=True)
+
+    def to_prometheus(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text, ending with a newline
+        """
+        lines: List[str] = []
+        with self._lock:
+            self._fold_tracked()
+            for name, series in sorted(self._counters.items()):
+                full = f"{NAMESPACE}_{name}_total"
+                help_text = self._descriptions.get(name, ("counter", name))[1]
+                lines.append(f"# HELP {full} {help_text}")
+                lines.append(f"# TYPE {full} counter")
+                if not series and name in self._descriptions:
+                    lines.append(f"{full} 0")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{full}{_format_labels(key)} {_format_number(value)}")
+
+            for name, series in sorted(self._histograms.items()):
+                full = f"{NAMESPACE}_{name}_seconds"
+                help_text = self._descriptions.get(name, ("histogram", name))[1]
+                lines.append(f"# HELP {full} {help_text}")
+                lines.append(f"# TYPE {full} histogram")
+                for key, histogram in sorted(series.items()):
+                    cumulative = 0
+                    for bound, bucket_count in zip(histogram.bounds, histogram.counts):
+                        cumulative += bucket_count
+                        le = ("le", _format_number(bound / 1e9))
+                        lines.append(
+                            f"{full}_bucket{_format_labels(key, le)} {cumulative}"
+                        )
+                    inf = ("le", "+Inf")
+                    lines.append(
+                        f"{full}_bucket{_format_labels(key, inf)} {histogram.count}"
+                    )
+                    labels = _format_labels(key)
+                    total = _format_number(histogram.sum_ns / 1e9)
+                    lines.append(f"{full}_sum{labels} {total}")
+                    lines.append(f"{full}_count{labels} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+# The process-wide registry shared by all engines and caches
+REGISTRY = MetricsRegistry()
+
+REGISTRY.describe("renders", "counter", "Number of render calls across all engines")
+REGISTRY.describe("chars_processed", "counter", "Input characters rendered")
+REGISTRY.describe("errors", "counter", "Errors raised, labelled by kind")
+REGISTRY.describe("cache_hits", "counter", "Cache hits, labelled by cache")
+REGISTRY.describe("cache_misses", "counter", "Cache misses, labelled by cache")
+REGISTRY.describe("font_loads", "counter", "Fonts parsed from disk or resources")
+REGISTRY.describe("render_latency", "histogram", "End-to-end render latency")
+REGISTRY.describe("font_load_latency", "histogram", "Font load and parse latency")
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """
+    Count a lookup in one of the package caches.
+
+    Args:
+        cache: Cache name ("font", "render", "color", ...)
+        hit: Whether the lookup was served from the cache
+    """
+    REGISTRY.inc("cache_hits" if hit else "cache_misses", cache=cache)
+
+
+def record_error(kind: str) -> None:
+    """
+    Count an error.
+
+    Args:
+        kind: Error category, usually the exception class name
+    """
+    REGISTRY.inc("errors", kind=kind)
+
+
+def get_registry() -> MetricsRegistry:
+    """Return the process-wide metrics registry."""
+    return REGISTRY
+
+
+def _build_handler_class() -> Type[Any]:
+    """
+    Define the HTTP handler class.
+
+    http.server pulls in a large part of the standard library, so it is
+    only imported when the metrics endpoint is actually used.
+
+    Returns:
+        The MetricsRequestHandler class
+    """
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsRequestHandler(BaseHTTPRequestHandler):
+        """
+        Minimal HTTP handler exposing the registry.
+
+        ``GET /metrics`` returns the Prometheus exposition text and
+        ``GET /metrics.json`` returns the JSON snapshot.
+        """
+
+        registry: MetricsRegistry = REGISTRY
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming
+            """Serve the requested metrics document."""
+            path = self.path.split("?", 1)[0]
+            if path in ("/metrics", "/"):
+                body = self.registry.to_prometheus().encode("utf-8")
+                content_type = PROMETHEUS_CONTENT_TYPE
+            elif path == "/metrics.json":
+                body = self.registry.to_json().encode("utf-8")
+                content_type = JSON_CONTENT_TYPE
+            else:
+                self.send_error(404, "Unknown metrics endpoint")
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            """Silence per-request logging on stderr."""
+
+    return MetricsRequestHandler
+
+
+def _handler_class() -> Type[Any]:
+    """Return the handler class, defining it on first use."""
+    handler = globals().get("MetricsRequestHandler")
+    if handler is None:
+        handler = globals()["MetricsRequestHandler"] = _build_handler_class()
+    return handler
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve MetricsRequestHandler on first access.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The handler class
+
+    Raises:
+        AttributeError: For any other unknown attribute
+    """
+    if name == "MetricsRequestHandler":
+        return _handler_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def serve_metrics(host: str = "127.0.0.1", port: int = 9464) -> "HTTPServer":
+    """
+    Start a background HTTP server exposing the registry.
+
+    Args:
+        host: Interface to bind (loopback by default)
+        port: TCP port to listen on (0 picks a free port)
+
+    Returns:
+        The running server; call ``shutdown()`` to stop it
+    """
+    from http.server import HTTPServer
+
+    server = HTTPServer((host, port), _handler_class())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+__all__ = [
+    "LatencyHistogram",
+    "MetricsRegistry",
+    "MetricsRequestHandler",
+    "REGISTRY",
+    "get_registry",
+    "record_cache",
+    "record_error",
+    "serve_metrics",
+]
@@ -2,10 +2,55 @@
 Rendering module for Figlet Forge.
 
 This module provides rendering functionality for Figlet Forge, including
-engines for converting text to various formats like HTML and SVG.
+engines for converting text to various formats like HTML and SVG, a
+canvas for compositing several banners into one layout, terminal
+animation of colored banners and scrolling marquees.
 """
 
-# Import in correct order to avoid circular imports
-from .figlet_engine import FigletEngine, FigletRenderingEngine, RenderEngine
+from importlib import import_module
+from typing import Any, Dict
 
-__all__ = ["FigletRenderingEngine", "RenderEngine", "FigletEngine"]
+# The engines, the canvas, animations and marquees are imported on first
+# access so that lightweight users of this package (such as
+# render.instrumentation) do not load them
+_LAZY_EXPORTS: Dict[str, str] = {
+    "Animation": ".animation",
+    "Canvas": ".canvas",
+    "CanvasLayer": ".canvas",
+    "FigletEngine": ".figlet_engine",
+    "FigletRenderingEngine": ".figlet_engine",
+    "Marquee": ".marquee",
+    "RenderEngine": ".figlet_engine",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import rendering engines and the canvas lazily on first access.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The requested class
+
+    Raises:
+        AttributeError: If the name is not a lazy export
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "Animation",
+    "Canvas",
+    "CanvasLayer",
+    "FigletRenderingEngine",
+    "Marquee",
+    "RenderEngine",
+    "FigletEngine",
+]
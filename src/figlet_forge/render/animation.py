@@ -0,0 +1,577 @@
+"""
+Terminal animation of colored banners for Figlet Forge.
+
+Animating a banner by re-coloring and reprinting it every tick sends the
+whole frame to the terminal each time, escapes included. An Animation
+instead renders the art once, precomputes a cycle of color frames from it
+(StyledArt instances sharing the same rows), and works out once, for
+every pair of consecutive frames, the cells whose style changes. Playing
+the animation then writes only those cells: the cursor is moved to each
+changed span, nearby spans are merged so a short rewrite replaces a
+cursor move, and the style is switched only where it changes::
+
+    from figlet_forge.render.animation import Animation
+
+    art = figlet.render_text("Lobby")
+    Animation.pulse(art, "CYAN").play(fps=12, loops=None)  # until Ctrl-C
+
+The cursor is moved relative to where the first frame was drawn, so the
+banner can be animated in place anywhere on the screen.
+"""
+
+import sys
+import time
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+
+from ..core.figlet_string import FigletString
+from ..version import RESET_COLORS
+
+if TYPE_CHECKING:
+    from ..color.styled import StyledArt
+
+# Frames per second when none is given
+DEFAULT_FPS = 12.0
+
+# Frames of a field animation cycle when none is given
+DEFAULT_FIELD_FRAMES = 24
+
+# Largest run of unchanged cells rewritten to join two changed spans of a
+# row; a cursor move costs about as many bytes
+MERGE_GAP = 4
+
+HIDE_CURSOR = "\033[?25l"
+SHOW_CURSOR = "\033[?25h"
+
+# A cursor position as (column, row), relative to the top left of the art
+Position = Tuple[int, int]
+
+
+def cursor_move(start: Position, end: Position) -> str:
+    """
+    Shortest relative cursor movement between two positions.
+
+    Args:
+        start: Current (column, row)
+        end: Target (column, row)
+
+    Returns:
+        Escape sequences (and carriage return) moving the cursor
+    """
+    (x0, y0), (x1, y1) = start, end
+    parts = []
+    if y1 < y0:
+        parts.append(f"\033[{y0 - y1}A")
+    elif y1 > y0:
+        parts.append(f"\033[{y1 - y0}B")
+    if x1 == 0 and x0 != 0:
+        parts.append("\r")
+    elif x1 > x0:
+        relative = f"\033[{x1 - x0}C"
+        absolute = f"\r\033[{x1}C"
+        parts.append(relative if len(relative) <= len(absolute) else absolute)
+    elif x1 < x0:
+        relative = f"\033[{x0 - x1}D"
+        absolute = f"\r\033[{x1}C"
+        parts.append(relative if len(relative) <= len(absolute) else absolute)
+    return "".join(parts)
+
+
+class Animation:
+    """
+    A precomputed cycle of color frames of one banner.
+
+    Frames are StyledArt instances of the same rows. Their styles are
+    collected in one table keyed by the escape each style writes at the
+    animation's depth, so styles that look the same at that depth (such
+    as two colors mapping to one palette entry) count as unchanged.
+    """
+
+    def __init__(
+        self, frames: Sequence["StyledArt"], depth: Optional[int] = None
+    ) -> None:
+        """
+        Precompute the changes between consecutive frames.
+
+        Args:
+            frames: The frames of one cycle, all of the same text
+            depth: Color depth of the output; None is truecolor
+
+        Raises:
+            ValueError: If there are no frames or their text differs
+        """
+        from ..color.depth import TRUECOLOR
+
+        if not frames:
+            raise ValueError("An animation needs at least one frame")
+        rows = frames[0].rows
+        if any(frame.rows != rows for frame in frames[1:]):
+            raise ValueError("All frames of an animation must have the same text")
+
+        self.depth = TRUECOLOR if depth is None else depth
+        self._frames = list(frames)
+        self._rows = rows
+
+        # Shared style table: index 0 is the default style
+        self._escapes: List[str] = [""]
+        self._has_fg: List[bool] = [False]
+        self._has_bg: List[bool] = [False]
+        ids: Dict[str, int] = {"": 0}
+        self._cells: List[List[List[int]]] = []
+        for frame in frames:
+            local = []
+            for style in frame.styles:
+                escape = "" if style is None else style.escape(self.depth)
+                index = ids.get(escape)
+                if index is None:
+                    index = ids[escape] = len(self._escapes)
+                    self._escapes.append(escape)
+                    self._has_fg.append(style.fg is not None)  # type: ignore
+                    self._has_bg.append(style.bg is not None)  # type: ignore
+                local.append(index)
+            self._cells.append(
+                [[local[i] for i in frame.cells(row)] for row in range(len(rows))]
+            )
+
+        self._deltas = self._precompute_deltas()
+
+    @classmethod
+    def from_painter(
+        cls,
+        art: str,
+        paint: Callable[["StyledArt", int], "StyledArt"],
+        frames: int,
+        depth: Optional[int] = None,
+    ) -> "Animation":
+        """
+        Build an animation by painting each frame of one render.
+
+        Args:
+            art: Rendered art (FigletString or multi-line string)
+            paint: Called with a fresh StyledArt and the frame number;
+                returns the painted frame
+            frames: Number of frames in the cycle
+            depth: Color depth of the output; None is truecolor
+
+        Returns:
+            The animation
+        """
+        from ..color.styled import StyledArt
+
+        base = art if isinstance(art, FigletString) else FigletString(art)
+        return cls([paint(StyledArt(base), frame) for frame in range(frames)], depth)
+
+    @classmethod
+    def pulse(
+        cls,
+        art: str,
+        color: str,
+        intensity_levels: int = 5,
+        depth: Optional[int] = None,
+    ) -> "Animation":
+        """
+        Animate the wave of pulse_colorize() moving across the art.
+
+        Args:
+            art: Rendered art
+            color: Base color
+            intensity_levels: Number of intensity levels for the pulse
+            depth: Color depth of the output; None is truecolor
+
+        Returns:
+            An animation of 2 * intensity_levels frames
+
+        Raises:
+            InvalidColor: If the color specification is invalid
+        """
+        from ..color.effects import style_pulse
+
+        return cls.from_painter(
+            art,
+            lambda styled, frame: style_pulse(styled, color, intensity_levels, frame),
+            2 * intensity_levels,
+            depth,
+        )
+
+    @classmethod
+    def rainbow(cls, art: str, depth: Optional[int] = None) -> "Animation":
+        """
+        Animate the colors of rainbow_colorize() cycling through the art.
+
+        Args:
+            art: Rendered art
+            depth: Color depth of the output; None is truecolor
+
+        Returns:
+            An animation of one frame per rainbow color
+        """
+        from ..color.effects import RAINBOW_COLORS, style_rainbow
+
+        return cls.from_painter(art, style_rainbow, len(RAINBOW_COLORS), depth)
+
+    @classmethod
+    def shine(
+        cls,
+        art: str,
+        color: str,
+        highlight: str = "WHITE",
+        width: int = 6,
+        depth: Optional[int] = None,
+    ) -> "Animation":
+        """
+        Animate a slanted band of highlight sweeping across the art.
+
+        Only the cells the band enters or leaves change from one frame to
+        the next, so each frame writes a small part of the art.
+
+        Args:
+            art: Rendered art
+            color: Base color
+            highlight: Color at the center of the band
+            width: Width of the band in cells
+            depth: Color depth of the output; None is truecolor
+
+        Returns:
+            An animation with one frame per band position, from before the
+            first column to past the last
+
+        Raises:
+            InvalidColor: If a color specification is invalid
+        """
+        from ..color.effects import style_shine
+
+        rows = (art if isinstance(art, FigletString) else FigletString(art)).rows
+        span = max(map(len, rows), default=0) + len(rows) + width
+        return cls.from_painter(
+            art,
+            lambda styled, frame: style_shine(
+                styled, color, highlight, frame - width, width
+            ),
+            span + width,
+            depth,
+        )
+
+    @classmethod
+    def field(
+        cls,
+        art: str,
+        kind: str,
+        colors: Optional[Sequence[str]] = None,
+        frames: int = DEFAULT_FIELD_FRAMES,
+        depth: Optional[int] = None,
+    ) -> "Animation":
+        """
+        Animate a color field through one cycle of its phase.
+
+        Args:
+            art: Rendered art
+            kind: Kind of field (see figlet_forge.color.fields)
+            colors: Color stops; None uses the plasma colors
+            frames: Number of frames in the cycle
+            depth: Color depth of the output; None is truecolor
+
+        Returns:
+            The animation
+
+        Raises:
+            ValueError: If the kind is unknown
+            InvalidColor: If the colors are invalid
+        """
+        from ..color.fields import PLASMA_COLORS, style_field
+
+        stops = PLASMA_COLORS if colors is None else colors
+        return cls.from_painter(
+            art,
+            lambda styled, frame: style_field(styled, kind, stops, frame / frames),
+            frames,
+            depth,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of frames in the cycle."""
+        return len(self._frames)
+
+    @property
+    def frames(self) -> Tuple["StyledArt", ...]:
+        """The frames of the cycle."""
+        return tuple(self._frames)
+
+    def full_frame(self, frame: int = 0) -> str:
+        """
+        The complete ANSI text of a frame.
+
+        Args:
+            frame: Frame number
+
+        Returns:
+            The frame as it is printed without an animation
+        """
+        return self._frames[frame].to_ansi(self.depth)
+
+    def delta(self, frame: int) -> str:
+        """
+        The output that turns a frame into the next one.
+
+        Args:
+            frame: Frame number; the last frame's delta leads to frame 0
+
+        Returns:
+            Cursor moves, escapes and characters of the changed cells
+        """
+        return self._deltas[frame][0]
+
+    def _changed_spans(self, before: int, after: int) -> List[Tuple[int, int, int]]:
+        """
+        Spans of cells to rewrite between two frames.
+
+        A space only counts as changed when a background is involved,
+        since a foreground color does not show on it.
+
+        Args:
+            before: Frame shown
+            after: Frame to show
+
+        Returns:
+            (row, start, end) spans in drawing order
+        """
+        has_bg = self._has_bg
+        spans = []
+        for row, line in enumerate(self._rows):
+            old, new = self._cells[before][row], self._cells[after][row]
+            changed = [
+                x
+                for x, (a, b) in enumerate(zip(old, new))
+                if a != b and (not line[x].isspace() or has_bg[a] or has_bg[b])
+            ]
+            if not changed:
+                continue
+            start = end = changed[0]
+            for x in changed[1:]:
+                if x - end - 1 > MERGE_GAP:
+                    spans.append((row, start, end + 1))
+                    start = x
+                end = x
+            spans.append((row, start, end + 1))
+        return spans
+
+    def _switch(self, current: int, style: int) -> str:
+        """Escapes switching the terminal from one style to another."""
+        if style == current:
+            return ""
+        if style == 0:
+            return RESET_COLORS
+        if current and (
+            (self._has_fg[current] and not self._has_fg[style])
+            or (self._has_bg[current] and not self._has_bg[style])
+        ):
+            # The new style would leave a color of the old one set
+            return RESET_COLORS + self._escapes[style]
+        return self._escapes[style]
+
+    def _write_spans(
+        self, frame: int, spans: Sequence[Tuple[int, int, int]], cursor: Position
+    ) -> Tuple[str, Position]:
+        """
+        Write spans of a frame.
+
+        Args:
+            frame: Frame whose cells are written
+            spans: (row, start, end) spans to write
+            cursor: Cursor position before writing
+
+        Returns:
+            The output and the cursor position after it
+        """
+        parts = []
+        current = 0
+        for row, start, end in spans:
+            parts.append(cursor_move(cursor, (start, row)))
+            line = self._rows[row]
+            cells = self._cells[frame][row]
+            for x in range(start, end):
+                style = cells[x]
+                if not (
+                    line[x].isspace()
+                    and not self._has_bg[current]
+                    and not self._has_bg[style]
+                ):
+                    parts.append(self._switch(current, style))
+                    current = style
+                parts.append(line[x])
+            cursor = (end, row)
+        if current:
+            parts.append(RESET_COLORS)
+        return "".join(parts), cursor
+
+    def _precompute_deltas(self) -> List[Tuple[str, Position]]:
+        """
+        Output of every transition of the cycle.
+
+        Deltas are chained around the cycle: each starts where the cursor
+        was left by the one before it.
+
+        Returns:
+            (output, cursor after it) for frame 0 -> 1, 1 -> 2, ... and the
+            last frame back to frame 0
+        """
+        count = len(self._frames)
+        spans = [self._changed_spans(i, (i + 1) % count) for i in range(count)]
+
+        # The cursor after the last non-empty delta starts the cycle
+        cursor = self._end_of_first_frame()
+        for frame_spans in reversed(spans):
+            if frame_spans:
+                row, _, end = frame_spans[-1]
+                cursor = (end, row)
+                break
+
+        self._cycle_start = cursor
+        deltas = []
+        for i, frame_spans in enumerate(spans):
+            output, cursor = self._write_spans((i + 1) % count, frame_spans, cursor)
+            deltas.append((output, cursor))
+        return deltas
+
+    def _end_of_first_frame(self) -> Position:
+        """Cursor position after printing a full frame."""
+        return (len(self._rows[-1]) if self._rows else 0, len(self._rows) - 1)
+
+    def _steps(self, loops: Optional[int]) -> Iterator[Tuple[str, Position]]:
+        """
+        Output of each frame shown and the cursor position after it.
+
+        Args:
+            loops: Times to play the cycle; None repeats it forever
+
+        Returns:
+            Iterator over (output, cursor) pairs
+        """
+        count = len(self._frames)
+        total = None if loops is None else max(1, loops * count)
+        yield (
+            HIDE_CURSOR
+            + self.full_frame(0)
+            + cursor_move(self._end_of_first_frame(), self._cycle_start),
+            self._cycle_start,
+        )
+        shown = 1
+        frame = 0
+        while total is None or shown < total:
+            yield self._deltas[frame]
+            frame = (frame + 1) % count
+            shown += 1
+
+    def _leave(self, cursor: Position) -> str:
+        """Output moving the cursor below the art and showing it again."""
+        return (
+            RESET_COLORS
+            + cursor_move(cursor, (0, len(self._rows) - 1))
+            + "\n"
+            + SHOW_CURSOR
+        )
+
+    def output(self, loops: Optional[int] = 1) -> Iterator[str]:
+        """
+        Output of each frame shown, in order.
+
+        The first item hides the cursor and draws frame 0 in full; each
+        later item is a precomputed delta. With a number of loops, the last
+        item ends by moving the cursor below the art and showing it again.
+
+        Args:
+            loops: Times to play the cycle; None repeats it forever
+
+        Returns:
+            Iterator over the text to write for each frame
+        """
+        steps = self._steps(loops)
+        text, cursor = next(steps)
+        for following, after in steps:
+            yield text
+            text, cursor = following, after
+        yield text + self._leave(cursor)
+
+    def play(
+        self,
+        stream: Optional[TextIO] = None,
+        fps: float = DEFAULT_FPS,
+        loops: Optional[int] = 1,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> int:
+        """
+        Play the animation on a terminal.
+
+        Frames are paced on a fixed schedule; when writing falls more than
+        a frame behind, the schedule restarts instead of rushing frames
+        out to catch up. Interrupting with Ctrl-C stops the animation and
+        leaves the cursor below the art.
+
+        Args:
+            stream: Output stream; defaults to sys.stdout
+            fps: Frames per second
+            loops: Times to play the cycle; None repeats it until
+                interrupted
+            clock: Monotonic clock in seconds
+            sleep: Function sleeping for a number of seconds
+
+        Returns:
+            Number of frames shown
+        """
+        out = sys.stdout if stream is None else stream
+        interval = 1.0 / fps
+        shown = 0
+        cursor: Optional[Position] = None
+        next_frame = clock()
+        try:
+            for text, after in self._steps(loops):
+                delay = next_frame - clock()
+                if delay > 0:
+                    sleep(delay)
+                elif delay < -interval:
+                    next_frame = clock()
+                out.write(text)
+                out.flush()
+                shown += 1
+                cursor = after
+                next_frame += interval
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if cursor is not None:
+                out.write(self._leave(cursor))
+                out.flush()
+        return shown
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Bytes written per frame by the animation and by full reprints.
+
+        Returns:
+            "full_frame" (average size of a complete frame plus the cursor
+            move back to its top), "delta" (average size of a delta) and
+            "ratio" (full_frame / delta)
+        """
+        count = len(self._frames)
+        home = cursor_move(self._end_of_first_frame(), (0, 0))
+        full = sum(len(self.full_frame(i)) + len(home) for i in range(count)) / count
+        delta = sum(len(output) for output, _ in self._deltas) / count
+        return {
+            "full_frame": full,
+            "delta": delta,
+            "ratio": full / delta if delta else float("inf"),
+        }
+
+    def __repr__(self) -> str:
+        """Return a string representation of the animation."""
+        return f"Animation({len(self._frames)} frames, depth={self.depth})"
+
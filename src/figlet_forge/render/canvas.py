@@ -0,0 +1,503 @@
+"""
+Layered canvas compositor for multi-banner layouts.
+
+A Canvas is a fixed-size character buffer allocated once. Rendered
+banners are blitted into it at a position and z-order, optionally side
+by side (``hconcat``) or stacked (``vconcat``), and the finished canvas
+is rendered once as plain text, ANSI, HTML or SVG.
+
+Every cell remembers the z-order of the layer that last wrote it, so a
+higher layer stays on top whatever order the blits happen in; between
+equal z-orders the later blit wins. Characters listed in ``transparent``
+(a space by default; add a font's hard blank when blitting raw font
+rows) let lower layers show through.
+
+Example::
+
+    figlet = Figlet(font="small")
+    canvas = Canvas(60, 12)
+    canvas.hconcat([figlet.render_text("CPU"), figlet.render_text("OK")])
+    canvas.blit(figlet.render_text("!"), x=50, z=1, color="RED")
+    print(canvas.to_ansi())
+"""
+
+from itertools import groupby
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
+
+from ..core.exceptions import InvalidColor
+from ..core.figlet_string import FigletString
+
+# A resolved foreground color
+RGB = Tuple[int, int, int]
+
+# Colors accepted by the canvas: a name, an "R;G;B" string or an RGB tuple
+ColorT = Union[str, RGB, None]
+
+# Depth of cells no layer has written yet
+_EMPTY_Z = float("-inf")
+
+CANVAS_FORMATS = ("plain", "ansi", "html", "svg")
+
+H_ALIGNMENTS = ("left", "center", "right")
+V_ALIGNMENTS = ("top", "center", "bottom")
+
+
+def _resolve_color(color: ColorT) -> Optional[RGB]:
+    """
+    Convert a color spec to RGB once, before any cell is written.
+
+    Args:
+        color: Color name, "R;G;B" string, RGB tuple or None
+
+    Returns:
+        RGB tuple, or None for the default color
+
+    Raises:
+        InvalidColor: If the color cannot be parsed
+    """
+    if color is None or isinstance(color, tuple):
+        return color
+    from ..color.figlet_color import resolve_color
+
+    rgb = None if ":" in color else resolve_color(color).rgb
+    if rgb is None:
+        raise InvalidColor(f"Invalid canvas color: '{color}'", color)
+    return rgb
+
+
+def _offset(free: int, align: str, choices: Sequence[str]) -> int:
+    """Offset of an item inside `free` spare cells for an alignment."""
+    if align not in choices:
+        raise ValueError(f"Unknown alignment: {align}. Use {', '.join(choices)}")
+    if align == choices[0]:
+        return 0
+    if align == choices[1]:
+        return free // 2
+    return free
+
+
+class Canvas:
+    """
+    Fixed-size character buffer that composites banners in layers.
+
+    The character, color and depth buffers are allocated once in
+    ``__init__``; blits write into them in place and nothing is joined
+    until the canvas is rendered.
+    """
+
+    def __init__(
+        self, width: int, height: int, fill: str = " ", transparent: str = " "
+    ) -> None:
+        """
+        Initialize an empty canvas.
+
+        Args:
+            width: Width in characters
+            height: Height in lines
+            fill: Character of empty cells
+            transparent: Characters that do not cover lower layers
+
+        Raises:
+            ValueError: If a dimension is negative or `fill` is not one character
+        """
+        if width < 0 or height < 0:
+            raise ValueError("Canvas dimensions must not be negative")
+        if len(fill) != 1:
+            raise ValueError("Canvas fill must be a single character")
+        self.width = width
+        self.height = height
+        self.fill = fill
+        self.transparent = frozenset(transparent)
+        self._chars: List[List[str]] = [[fill] * width for _ in range(height)]
+        self._colors: List[List[Optional[RGB]]] = [
+            [None] * width for _ in range(height)
+        ]
+        self._depth: List[List[float]] = [[_EMPTY_Z] * width for _ in range(height)]
+        self._top_z = _EMPTY_Z
+
+    @property
+    def dimensions(self) -> Tuple[int, int]:
+        """Width and height of the canvas."""
+        return self.width, self.height
+
+    def clear(self) -> None:
+        """Reset every cell to the fill character, keeping the buffers."""
+        for chars, colors, depth in zip(self._chars, self._colors, self._depth):
+            chars[:] = [self.fill] * self.width
+            colors[:] = [None] * self.width
+            depth[:] = [_EMPTY_Z] * self.width
+        self._top_z = _EMPTY_Z
+
+    def blit(
+        self,
+        art: str,
+        x: int = 0,
+        y: int = 0,
+        z: int = 0,
+        color: ColorT = None,
+        opaque: bool = False,
+    ) -> Tuple[int, int]:
+        """
+        Draw art with its top-left corner at (x, y).
+
+        Parts outside the canvas are clipped.
+
+        Args:
+            art: FigletString or multi-line string
+            x: Column of the top-left corner (may be negative)
+            y: Row of the top-left corner (may be negative)
+            z: Layer order; higher layers cover lower ones
+            color: Foreground color of the drawn cells
+            opaque: Draw transparent characters and pad short lines
+
+        Returns:
+            Width and height of the art
+
+        Raises:
+            InvalidColor: If the color cannot be parsed
+        """
+        rows = (art if isinstance(art, FigletString) else FigletString(art)).rows
+        width = max(map(len, rows), default=0)
+        rgb = _resolve_color(color)
+        transparent = frozenset() if opaque else self.transparent
+        # Nothing drawn so far is above this layer, so no depth checks
+        on_top = z >= self._top_z
+
+        for row_index in range(max(0, -y), min(len(rows), self.height - y)):
+            # Opaque art covers its whole bounding box, ragged lines included
+            line = rows[row_index].ljust(width) if opaque else rows[row_index]
+            start = max(0, -x)
+            end = min(len(line), self.width - x)
+            if start >= end:
+                continue
+            chars = self._chars[y + row_index]
+            colors = self._colors[y + row_index]
+            depth = self._depth[y + row_index]
+            segment = line[start:end]
+
+            if on_top and transparent.isdisjoint(segment):
+                # Whole segment is visible: three slice assignments
+                chars[x + start : x + end] = segment
+                colors[x + start : x + end] = [rgb] * (end - start)
+                depth[x + start : x + end] = [z] * (end - start)
+                continue
+
+            for column, char in enumerate(segment, x + start):
+                if char in transparent or depth[column] > z:
+                    continue
+                chars[column] = char
+                colors[column] = rgb
+                depth[column] = z
+
+        self._top_z = max(self._top_z, z)
+        return width, len(rows)
+
+    def hconcat(
+        self,
+        arts: Iterable[str],
+        x: int = 0,
+        y: int = 0,
+        z: int = 0,
+        gap: int = 1,
+        align: str = "top",
+        color: ColorT = None,
+        opaque: bool = False,
+    ) -> Tuple[int, int]:
+        """
+        Draw several pieces of art side by side.
+
+        Args:
+            arts: Art to draw, left to right
+            x: Column of the left edge
+            y: Row of the top edge
+            z: Layer order
+            gap: Empty columns between pieces
+            align: Vertical alignment: top, center or bottom
+            color: Foreground color of the drawn cells
+            opaque: Draw transparent characters too
+
+        Returns:
+            Width and height of the whole row of art
+
+        Raises:
+            ValueError: If the alignment is unknown
+        """
+        pieces = [a if isinstance(a, FigletString) else FigletString(a) for a in arts]
+        sizes = [piece.dimensions for piece in pieces]
+        height = max((h for _, h in sizes), default=0)
+        column = x
+        for piece, (width, piece_height) in zip(pieces, sizes):
+            top = y + _offset(height - piece_height, align, V_ALIGNMENTS)
+            self.blit(piece, column, top, z, color, opaque)
+            column += width + gap
+        total = column - x - gap if pieces else 0
+        return total, height
+
+    def vconcat(
+        self,
+        arts: Iterable[str],
+        x: int = 0,
+        y: int = 0,
+        z: int = 0,
+        gap: int = 0,
+        align: str = "left",
+        color: ColorT = None,
+        opaque: bool = False,
+    ) -> Tuple[int, int]:
+        """
+        Draw several pieces of art stacked top to bottom.
+
+        Args:
+            arts: Art to draw, top to bottom
+            x: Column of the left edge
+            y: Row of the top edge
+            z: Layer order
+            gap: Empty lines between pieces
+            align: Horizontal alignment: left, center or right
+            color: Foreground color of the drawn cells
+            opaque: Draw transparent characters too
+
+        Returns:
+            Width and height of the whole column of art
+
+        Raises:
+            ValueError: If the alignment is unknown
+        """
+        pieces = [a if isinstance(a, FigletString) else FigletString(a) for a in arts]
+        sizes = [piece.dimensions for piece in pieces]
+        width = max((w for w, _ in sizes), default=0)
+        row = y
+        for piece, (piece_width, height) in zip(pieces, sizes):
+            left = x + _offset(width - piece_width, align, H_ALIGNMENTS)
+            self.blit(piece, left, row, z, color, opaque)
+            row += height + gap
+        total = row - y - gap if pieces else 0
+        return width, total
+
+    def layer(self, z: int, color: ColorT = None) -> "CanvasLayer":
+        """
+        Get a view that draws at a fixed z-order and color.
+
+        Args:
+            z: Layer order
+            color: Default color for the layer's blits
+
+        Returns:
+            CanvasLayer writing into this canvas
+        """
+        return CanvasLayer(self, z, color)
+
+    def to_rows(self) -> List[str]:
+        """
+        Read the composited characters.
+
+        Returns:
+            One string of exactly ``width`` characters per line
+        """
+        return ["".join(chars) for chars in self._chars]
+
+    def _runs(self, row: int) -> List[Tuple[Optional[RGB], str]]:
+        """
+        Split a line into runs of cells sharing one color.
+
+        A foreground color does not show on spaces, so uncolored spaces
+        join the run before them instead of breaking it.
+
+        Args:
+            row: Line index
+
+        Returns:
+            List of (color, text) runs covering the line
+        """
+        chars = self._chars[row]
+        runs: List[Tuple[Optional[RGB], str]] = []
+        start = 0
+        for rgb, cells in groupby(self._colors[row]):
+            end = start + len(list(cells))
+            text = "".join(chars[start:end])
+            start = end
+            if runs and (rgb == runs[-1][0] or (rgb is None and text.isspace())):
+                runs[-1] = (runs[-1][0], runs[-1][1] + text)
+            else:
+                runs.append((rgb, text))
+        return runs
+
+    def _style_runs(self) -> List[List[Tuple[Any, str]]]:
+        """
+        Runs of every line as (Style, text) pairs for the shared emitters.
+
+        Returns:
+            One list of runs per line, unstyled runs having a None style
+        """
+        from ..color.styled import Style
+
+        return [
+            [
+                (None if rgb is None else Style(rgb), text)
+                for rgb, text in self._runs(row)
+            ]
+            for row in range(self.height)
+        ]
+
+    def to_plain(self) -> FigletString:
+        """
+        Render the canvas without colors.
+
+        Returns:
+            FigletString with one line per canvas row
+        """
+        return FigletString.from_rows(self.to_rows(), self.width)
+
+    def to_ansi(self) -> str:
+        """
+        Render the canvas with 24-bit ANSI colors.
+
+        An escape sequence is emitted only where the color changes, and
+        every line that ends in color is reset.
+
+        Returns:
+            ANSI-colored text
+        """
+        from ..color.ansi import emit_runs
+
+        lines = []
+        for row in range(self.height):
+            runs = [
+                (None if rgb is None else "\033[38;2;{};{};{}m".format(*rgb), text)
+                for rgb, text in self._runs(row)
+            ]
+            lines.append(emit_runs(runs))
+        return "\n".join(lines)
+
+    def to_html(
+        self, class_name: str = "figlet-forge", line_class: str = "figlet-line"
+    ) -> str:
+        """
+        Render the canvas as HTML, with colored runs in spans.
+
+        The markup matches RenderEngine.to_html().
+
+        Args:
+            class_name: CSS class name for the container
+            line_class: CSS class name for each line
+
+        Returns:
+            HTML representation of the canvas
+        """
+        from ..color.styled import runs_to_html
+
+        return runs_to_html(self._style_runs(), class_name, line_class)
+
+    def to_svg(
+        self,
+        font_family: str = "monospace",
+        font_size: int = 14,
+        foreground: str = "#000000",
+        background: str = "transparent",
+        padding: int = 10,
+    ) -> str:
+        """
+        Render the canvas as SVG, with colored runs in nested tspans.
+
+        Sizes follow the RenderEngine.to_svg() defaults.
+
+        Args:
+            font_family: Font family to use
+            font_size: Font size in pixels
+            foreground: Color of uncolored cells
+            background: Background color
+            padding: Padding around the text in pixels
+
+        Returns:
+            SVG representation of the canvas
+        """
+        from ..color.styled import runs_to_svg
+
+        return runs_to_svg(
+            self._style_runs(),
+            self.width,
+            font_family,
+            font_size,
+            foreground,
+            background,
+            padding,
+        )
+
+    def render(self, format: str = "plain") -> str:
+        """
+        Render the canvas once in the requested format.
+
+        Args:
+            format: plain, ansi, html or svg
+
+        Returns:
+            Rendered canvas
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        if format not in CANVAS_FORMATS:
+            raise ValueError(
+                f"Unknown canvas format: {format}. Use {', '.join(CANVAS_FORMATS)}"
+            )
+        return getattr(self, f"to_{format}")()
+
+    def __str__(self) -> str:
+        """Return the plain rendering of the canvas."""
+        return str(self.to_plain())
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the canvas.
+
+        Returns:
+            String representation with the canvas size
+        """
+        return f"Canvas({self.width}x{self.height})"
+
+
+class CanvasLayer:
+    """
+    Drawing view of a Canvas at a fixed z-order and default color.
+
+    Created by ``Canvas.layer()``; the blit, hconcat and vconcat methods
+    take the same arguments as the Canvas methods except ``z``.
+    """
+
+    def __init__(self, canvas: Canvas, z: int, color: ColorT = None) -> None:
+        """
+        Initialize the layer view.
+
+        Args:
+            canvas: Canvas to draw into
+            z: Layer order
+            color: Default color for blits
+        """
+        self.canvas = canvas
+        self.z = z
+        self.color = _resolve_color(color)
+
+    def blit(
+        self,
+        art: str,
+        x: int = 0,
+        y: int = 0,
+        color: ColorT = None,
+        opaque: bool = False,
+    ) -> Tuple[int, int]:
+        """Draw art on this layer (see Canvas.blit)."""
+        return self.canvas.blit(art, x, y, self.z, color or self.color, opaque)
+
+    def hconcat(
+        self, arts: Iterable[str], x: int = 0, y: int = 0, **options: Any
+    ) -> Tuple[int, int]:
+        """Draw art side by side on this layer (see Canvas.hconcat)."""
+        options.setdefault("color", self.color)
+        return self.canvas.hconcat(arts, x, y, self.z, **options)
+
+    def vconcat(
+        self, arts: Iterable[str], x: int = 0, y: int = 0, **options: Any
+    ) -> Tuple[int, int]:
+        """Draw art stacked on this layer (see Canvas.vconcat)."""
+        options.setdefault("color", self.color)
+        return self.canvas.vconcat(arts, x, y, self.z, **options)
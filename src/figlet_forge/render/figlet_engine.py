@@ -13,13 +13,15 @@ Following Eidosian principles:
 
 import html
 import logging
-import time
 import traceback
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, Any, Dict, Optional, TypeVar, Union, cast
 
+from .. import metrics
 from ..core.exceptions import CharNotPrinted, FigletError
 from ..core.figlet_builder import FigletBuilder
 from ..core.figlet_string import FigletString
+from . import instrumentation
 
 # Prevent circular import by using TYPE_CHECKING for type hints only
 if TYPE_CHECKING:
@@ -68,6 +70,12 @@ class FigletRenderingEngine:
             "rendering_time_ms": 0.0,
         }
 
+        # Per-phase latency histograms, populated only while instrumented
+        self._histograms: Dict[str, instrumentation.LatencyHistogram] = {
+            phase: instrumentation.LatencyHistogram()
+            for phase in instrumentation.RENDER_PHASES + ("total",)
+        }
+
         # Font-specific rendering parameters
         self._font_params = self._get_font_specific_parameters()
 
@@ -103,6 +111,8 @@ class FigletRenderingEngine:
         Render text using the current font and settings.
 
         This is the main rendering method that transforms input text to ASCII art.
+        When instrumentation is enabled, the time spent in each phase is
+        recorded in per-phase latency histograms and forwarded to sinks.
 
         Args:
             text: The text to render
@@ -114,7 +124,8 @@ class FigletRenderingEngine:
             FigletError: If there are issues during rendering
         """
         # Record start time for performance metrics
-        start_time = time.time()
+        start_ns = perf_counter_ns()
+        timer = instrumentation.start_timer()
 
         # Update metrics
         self._metrics["renders"] = cast(int, self._metrics["renders"]) + 1
@@ -130,9 +141,11 @@ class FigletRenderingEngine:
 
             # Preprocess text for Unicode handling if needed
             processed_text = self._preprocess_text(text_str)
+            timer.mark("preprocess")
 
             # Apply text direction (RTL or LTR)
             oriented_text = self._apply_direction(processed_text)
+            timer.mark("direction")
 
             # Determine if this is a test run or showcase
             in_special_context = self._is_in_special_context()
@@ -141,15 +154,21 @@ class FigletRenderingEngine:
             adjusted_width = self._calculate_adjusted_width(
                 oriented_text, in_special_context
             )
+            timer.mark("width")
 
             # Create builder for text transformation
+            source_map = bool(getattr(self.figlet, "source_map", False))
             builder = FigletBuilder(
                 oriented_text,
                 self.font,
                 direction=self.direction,
                 width=adjusted_width,
                 justify=self.justify,
+                record_spans=source_map,
+                special_context=in_special_context,
             )
+            builder.lookup_glyphs()
+            timer.mark("glyph_lookup")
 
             # Process text character by character
             while builder.is_not_finished():
@@ -170,16 +189,22 @@ class FigletRenderingEngine:
                             "required_width": e.required_width,
                         },
                     ) from e
+            timer.mark("layout")
 
             # Generate the final FigletString
             result = builder.return_product()
+            if source_map and oriented_text != processed_text:
+                self._map_spans_to_source(result, processed_text)
+            timer.mark("justify")
 
             # Update metrics for optimization analysis
-            self._update_metrics(text_str, result, start_time)
+            self._update_metrics(text_str, result)
+            self._record_timing(timer, len(text_str))
 
             return result
 
         except CharNotPrinted as e:
+            metrics.record_error("CharNotPrinted")
             # Convert specific exceptions to general FigletError with context
             err_context: Dict[str, Union[str, int, None]] = {
                 "character": e.char or "",
@@ -192,6 +217,7 @@ class FigletRenderingEngine:
                 suggestion="Try increasing width or using a narrower font",
             ) from e
         except Exception as e:
+            metrics.record_error(type(e).__name__)
             # Wrap unexpected errors with clear context
             if not isinstance(e, FigletError):
                 raise FigletError(
@@ -200,12 +226,42 @@ class FigletRenderingEngine:
                 ) from e
             raise
         finally:
-            # Record total rendering time
-            render_time_ms = (
-                cast(float, self._metrics["rendering_time_ms"])
-                + (time.time() - start_time) * 1000
+            # Record total rendering time exactly once per render
+            elapsed_ns = perf_counter_ns() - start_ns
+            self._metrics["rendering_time_ms"] = (
+                cast(float, self._metrics["rendering_time_ms"]) + elapsed_ns / 1e6
+            )
+            metrics.REGISTRY.inc("renders")
+            metrics.REGISTRY.observe_ns("render_latency", elapsed_ns)
+
+    def _record_timing(self, timer: "instrumentation.PhaseTimer", chars: int) -> None:
+        """
+        Fold a finished render's phase timings into histograms and sinks.
+
+        Args:
+            timer: Timer returned by instrumentation.start_timer()
+            chars: Number of input characters rendered
+        """
+        if timer is instrumentation.NULL_TIMER:
+            return
+
+        histograms = self._histograms
+        for phase, elapsed in timer.phases.items():
+            histogram = histograms.get(phase)
+            if histogram is None:
+                histogram = histograms[phase] = instrumentation.LatencyHistogram()
+            histogram.observe(elapsed)
+
+        total_ns = timer.total_ns()
+        histograms["total"].observe(total_ns)
+        instrumentation.emit(
+            instrumentation.RenderTiming(
+                dict(timer.phases),
+                total_ns,
+                chars,
+                getattr(self.font, "font_name", ""),
             )
-            self._metrics["rendering_time_ms"] = render_time_ms
+        )
 
     def _is_in_special_context(self) -> bool:
         """
@@ -295,33 +351,49 @@ class FigletRenderingEngine:
             return "\n".join(line[::-1] for line in lines)
         return text
 
-    def _update_metrics(
-        self, text: str, result: FigletString, start_time: float
-    ) -> None:
+    def _map_spans_to_source(self, result: FigletString, text: str) -> None:
+        """
+        Re-index a right-to-left source map by the caller's text.
+
+        The builder records spans for the reversed lines it rendered; this
+        reorders them so that entry ``i`` belongs to ``text[i]`` again.
+
+        Args:
+            result: Rendered art carrying spans for the reversed text
+            text: Text before direction was applied
+        """
+        spans = result.source_spans or ()
+        remapped = list(spans)
+        start = 0
+        for line in text.split("\n"):
+            end = start + len(line)
+            # Character i of the line was rendered at position end - 1 - i
+            remapped[start:end] = spans[start:end][::-1]
+            start = end + 1
+        result.set_source_map(text, remapped)
+
+    def _update_metrics(self, text: str, result: FigletString) -> None:
         """
         Update rendering metrics for optimization analysis.
 
+        Rendering time is accounted separately in render() so that it is
+        counted exactly once, including for renders that fail.
+
         Args:
             text: Original text that was rendered
             result: The rendered FigletString
-            start_time: Time when rendering started
         """
         # Update character count
         self._metrics["chars_processed"] = cast(
             int, self._metrics["chars_processed"]
         ) + len(text)
+        metrics.REGISTRY.inc("chars_processed", len(text))
 
         # Update maximum width
         current_max_width = cast(int, self._metrics["max_width_rendered"])
         result_width = result.dimensions[0] if result else 0
         self._metrics["max_width_rendered"] = max(current_max_width, result_width)
 
-        # Update rendering time
-        render_time_ms = (time.time() - start_time) * 1000
-        self._metrics["rendering_time_ms"] = (
-            cast(float, self._metrics["rendering_time_ms"]) + render_time_ms
-        )
-
     def adjust_width(self, width: int) -> None:
         """
         Update the output width.
@@ -358,6 +430,29 @@ class FigletRenderingEngine:
         """
         return self._metrics
 
+    def get_phase_metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-phase latency summaries collected while instrumented.
+
+        Returns:
+            Mapping of phase name (plus "total") to histogram summary with
+            count, mean, max and p50/p90/p99 latencies in milliseconds
+        """
+        return {
+            phase: histogram.as_dict()
+            for phase, histogram in self._histograms.items()
+            if histogram.count
+        }
+
+    def get_phase_histograms(self) -> Dict[str, "instrumentation.LatencyHistogram"]:
+        """
+        Get the raw per-phase latency histograms.
+
+        Returns:
+            Mapping of phase name (plus "total") to LatencyHistogram
+        """
+        return self._histograms
+
 
 class RenderEngine:
     """
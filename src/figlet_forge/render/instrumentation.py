@@ -0,0 +1,290 @@
+"""
+Render instrumentation for Figlet Forge.
+
+This module provides high-resolution, per-phase timing for the rendering
+pipeline. Timings are taken with ``time.perf_counter_ns`` and aggregated into
+fixed-bucket latency histograms, and every completed render can be forwarded
+to registered sinks (plain callables) for export or logging.
+
+Instrumentation is opt-in: while it is disabled and no sink is registered,
+the engine receives a shared no-op timer and pays only an attribute lookup
+per phase boundary.
+"""
+
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from ..metrics import DEFAULT_BUCKETS_NS, LatencyHistogram
+
+# Configure logger for this module
+logger = logging.getLogger(__name__)
+
+# Ordered phases of a single render, from raw input to final art
+RENDER_PHASES: Tuple[str, ...] = (
+    "preprocess",
+    "direction",
+    "width",
+    "glyph_lookup",
+    "layout",
+    "justify",
+    "transforms",
+)
+
+# Environment switch for enabling instrumentation without code changes
+INSTRUMENT_ENV = "FIGLET_FORGE_INSTRUMENT"
+
+
+class RenderTiming(NamedTuple):
+    """Timing record for one completed render, delivered to every sink."""
+
+    phases: Dict[str, int]
+    total_ns: int
+    chars: int
+    font: str
+
+
+RenderSink = Callable[[RenderTiming], None]
+
+
+class PhaseTimer:
+    """Accumulates elapsed time between successive phase boundaries."""
+
+    __slots__ = ("started_ns", "_last_ns", "phases")
+
+    def __init__(self) -> None:
+        """Start timing from now."""
+        self.started_ns = self._last_ns = perf_counter_ns()
+        self.phases: Dict[str, int] = {}
+
+    def mark(self, phase: str) -> None:
+        """
+        Close the current phase and attribute its elapsed time.
+
+        Args:
+            phase: Name of the phase that just finished
+        """
+        now = perf_counter_ns()
+        self.phases[phase] = self.phases.get(phase, 0) + now - self._last_ns
+        self._last_ns = now
+
+    def total_ns(self) -> int:
+        """Return nanoseconds elapsed since the timer started."""
+        return self._last_ns - self.started_ns
+
+
+class _NullTimer:
+    """Shared do-nothing timer handed out while instrumentation is off."""
+
+    __slots__ = ()
+
+    phases: Dict[str, int] = {}
+    started_ns = 0
+
+    def mark(self, phase: str) -> None:
+        """Ignore the phase boundary."""
+
+    def total_ns(self) -> int:
+        """Return zero; nothing was timed."""
+        return 0
+
+
+NULL_TIMER = _NullTimer()
+
+# Module state: an explicit enable flag plus the registered sinks
+_enabled = os.environ.get(INSTRUMENT_ENV, "") not in ("", "0")
+_sinks: List[RenderSink] = []
+_sink_lock = threading.Lock()
+
+# Per-thread list of records held by an open render_scope()
+_scope = threading.local()
+
+
+def enable() -> None:
+    """Turn on per-phase timing for all rendering engines."""
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    """Turn off per-phase timing (registered sinks still force it on)."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """
+    Check whether renders should be timed per phase.
+
+    Returns:
+        True if instrumentation is enabled or any sink is registered
+    """
+    return _enabled or bool(_sinks)
+
+
+def add_sink(sink: RenderSink) -> RenderSink:
+    """
+    Register a callable that receives a RenderTiming for every render.
+
+    Can be used as a decorator. Registering a sink implicitly enables timing.
+
+    Args:
+        sink: Callable accepting a RenderTiming
+
+    Returns:
+        The sink, unchanged
+    """
+    with _sink_lock:
+        if sink not in _sinks:
+            _sinks.append(sink)
+    return sink
+
+
+def remove_sink(sink: RenderSink) -> None:
+    """
+    Unregister a previously added sink.
+
+    Args:
+        sink: Sink to remove (unknown sinks are ignored)
+    """
+    with _sink_lock:
+        if sink in _sinks:
+            _sinks.remove(sink)
+
+
+def clear_sinks() -> None:
+    """Remove every registered sink."""
+    with _sink_lock:
+        del _sinks[:]
+
+
+def start_timer() -> "PhaseTimer":
+    """
+    Get a timer for one render.
+
+    Returns:
+        A fresh PhaseTimer when instrumentation is active, otherwise the
+        shared no-op timer
+    """
+    if _enabled or _sinks:
+        return PhaseTimer()
+    return NULL_TIMER  # type: ignore[return-value]
+
+
+def emit(timing: RenderTiming) -> None:
+    """
+    Deliver a timing record to every registered sink.
+
+    Inside render_scope() the record is held back until the scope closes,
+    so that phases timed after the render can still be added to it. Sink
+    failures are logged and never propagate into rendering.
+
+    Args:
+        timing: Completed render timing
+    """
+    held = getattr(_scope, "held", None)
+    if held is not None:
+        held.append(timing)
+        return
+    _deliver(timing)
+
+
+def _deliver(timing: RenderTiming) -> None:
+    """Hand a timing record to every registered sink."""
+    for sink in tuple(_sinks):
+        try:
+            sink(timing)
+        except Exception as e:
+            logger.debug(f"Render timing sink {sink!r} failed: {e}")
+
+
+@contextmanager
+def render_scope() -> Iterator[None]:
+    """
+    Hold the render records emitted in a block until it ends.
+
+    Phases timed with timed_phase() inside the block are added to the
+    record of the last render before them, so a render and the work a
+    caller does on its result reach the sinks as one record. Scopes do
+    not nest: an inner scope shares the outer one's records.
+
+    Yields:
+        Control to the block
+    """
+    if getattr(_scope, "held", None) is not None:
+        yield
+        return
+
+    _scope.held = held = []
+    try:
+        yield
+    finally:
+        _scope.held = None
+        for timing in held:
+            _deliver(timing)
+
+
+@contextmanager
+def timed_phase(
+    phase: str, histograms: Optional[Dict[str, LatencyHistogram]] = None
+) -> Iterator[None]:
+    """
+    Time a block of work performed outside the engine as a single phase.
+
+    Used for steps such as post-render transforms that callers apply
+    themselves. The time is added to the last render held by the enclosing
+    render_scope(); outside a scope, or before any render, it only updates
+    the histograms and is never sent to sinks as a render of its own. Does
+    nothing while instrumentation is off.
+
+    Args:
+        phase: Phase name to report (usually one of RENDER_PHASES)
+        histograms: Optional per-phase histograms to update as well
+
+    Yields:
+        Control to the timed block
+    """
+    if not (_enabled or _sinks):
+        yield
+        return
+
+    start = perf_counter_ns()
+    try:
+        yield
+    finally:
+        elapsed = perf_counter_ns() - start
+        if histograms is not None:
+            histograms.setdefault(phase, LatencyHistogram()).observe(elapsed)
+        held = getattr(_scope, "held", None)
+        if held:
+            timing = held[-1]
+            phases = dict(timing.phases)
+            phases[phase] = phases.get(phase, 0) + elapsed
+            held[-1] = timing._replace(
+                phases=phases, total_ns=timing.total_ns + elapsed
+            )
+
+
+__all__ = [
+    "DEFAULT_BUCKETS_NS",
+    "INSTRUMENT_ENV",
+    "LatencyHistogram",
+    "NULL_TIMER",
+    "PhaseTimer",
+    "RENDER_PHASES",
+    "RenderSink",
+    "RenderTiming",
+    "add_sink",
+    "clear_sinks",
+    "disable",
+    "emit",
+    "enable",
+    "is_enabled",
+    "remove_sink",
+    "render_scope",
+    "start_timer",
+    "timed_phase",
+]
@@ -0,0 +1,234 @@
+"""
+Scrolling marquees for Figlet Forge.
+
+A ticker that renders its text shifted by one column every frame pays for
+a full render (and, when colored, for parsing the color spec and writing
+every escape) on each tick. A Marquee renders the text once, as a single
+strip, and precomputes for each row of it the characters and the runs of
+escapes. A frame is then a window into every row: the characters are
+sliced and the escapes of the runs inside the window are copied in::
+
+    from figlet_forge import Figlet
+
+    for frame in Figlet(font="small").marquee("Breaking news", 40):
+        print(frame)
+
+With wrapping, the text scrolls around forever with a gap between its end
+and its next start; without, it enters on the right and leaves on the left.
+"""
+
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Union
+
+from ..core.figlet_string import FigletString
+from ..version import RESET_COLORS
+
+if TYPE_CHECKING:
+    from ..color.styled import StyledArt
+
+# Blank columns between the end of the text and its next start when wrapping
+DEFAULT_GAP = 8
+
+# A row of the strip: its characters, and the start column and escape of
+# each run of cells sharing a style ("" for the default style)
+_Row = Tuple[str, List[int], List[str]]
+
+
+class Marquee:
+    """
+    A strip of art scrolled through a fixed-width viewport.
+
+    The strip is laid out once, with the blank columns that lead the text
+    in or follow it, and repeated as often as a window needs to read past
+    its end. Frames are produced from that row data alone.
+    """
+
+    def __init__(
+        self,
+        art: Union[str, "StyledArt"],
+        viewport_width: int,
+        wrap: bool = True,
+        gap: Optional[int] = None,
+        step: int = 1,
+        depth: Optional[int] = None,
+    ) -> None:
+        """
+        Lay out the strip and precompute its rows.
+
+        Args:
+            art: Rendered art, plain or as a StyledArt
+            viewport_width: Columns shown in each frame
+            wrap: Scroll around forever instead of through once
+            gap: Blank columns between the end of the text and its next
+                start when wrapping; None is DEFAULT_GAP
+            step: Columns the text moves per frame
+            depth: Color depth of the escapes; None is truecolor
+
+        Raises:
+            ValueError: If the viewport width, the gap or the step is
+                out of range
+        """
+        from ..color.depth import NO_COLOR, TRUECOLOR
+
+        if viewport_width < 1:
+            raise ValueError(f"Viewport width must be positive: {viewport_width}")
+        if step < 1:
+            raise ValueError(f"Step must be positive: {step}")
+        gap = DEFAULT_GAP if gap is None else gap
+        if gap < 0:
+            raise ValueError(f"Gap must not be negative: {gap}")
+
+        self.viewport_width = viewport_width
+        self.wrap = wrap
+        self.step = step
+        self.depth = TRUECOLOR if depth is None else depth
+
+        if isinstance(art, str):
+            rows = (art if isinstance(art, FigletString) else FigletString(art)).rows
+            styled = None
+        else:
+            rows, styled = art.rows, art
+        if self.depth == NO_COLOR:
+            styled = None
+        width = max(map(len, rows), default=0)
+
+        if wrap:
+            # One period of text and gap, repeated so that a window starting
+            # anywhere in the first period lies inside the strip
+            self.period = max(width + gap, 1)
+            lead, tail = 0, gap
+            repeats = 1 + -(-viewport_width // self.period)
+        else:
+            # The text enters from the right edge and leaves past the left
+            self.period = width + viewport_width + 1
+            lead, tail = viewport_width, viewport_width
+            repeats = 1
+        self._rows = [
+            self._layout(row, styled, y, width, lead, tail, repeats)
+            for y, row in enumerate(rows)
+        ]
+
+    def _layout(
+        self,
+        line: str,
+        styled: Optional["StyledArt"],
+        row: int,
+        width: int,
+        lead: int,
+        tail: int,
+        repeats: int,
+    ) -> _Row:
+        """
+        Precompute one row of the strip.
+
+        Args:
+            line: Characters of the row in the art
+            styled: Styles of the art, or None for plain output
+            row: Line index in the art
+            width: Width of the art
+            lead: Blank columns before the text
+            tail: Blank columns after the text
+            repeats: Number of copies of the padded row
+
+        Returns:
+            The row's characters, run starts and run escapes
+        """
+        padded = " " * lead + line.ljust(width) + " " * tail
+        starts: List[int] = [0]
+        escapes: List[str] = [""]
+        if styled is not None:
+            column = lead
+            for style, text in styled.runs(row):
+                escape = "" if style is None else style.escape(self.depth)
+                if escape != escapes[-1]:
+                    starts.append(column)
+                    escapes.append(escape)
+                column += len(text)
+            if escapes[-1]:
+                starts.append(column)
+                escapes.append("")
+        if len(escapes) == 1:
+            return padded * repeats, starts, escapes
+
+        size = len(padded)
+        all_starts: List[int] = []
+        all_escapes: List[str] = []
+        for copy in range(repeats):
+            for start, escape in zip(starts, escapes):
+                column = copy * size + start
+                if all_starts and all_starts[-1] == column:
+                    # The previous copy's closing run is empty
+                    all_starts.pop()
+                    all_escapes.pop()
+                if not all_escapes or escape != all_escapes[-1]:
+                    all_starts.append(column)
+                    all_escapes.append(escape)
+        return padded * repeats, all_starts, all_escapes
+
+    def __len__(self) -> int:
+        """Return the number of frames in one pass of the strip."""
+        return -(-self.period // self.step)
+
+    def frame(self, offset: int) -> FigletString:
+        """
+        Cut the frame whose left edge is at a column of the strip.
+
+        Args:
+            offset: Column of the strip at the left edge of the viewport;
+                wraps around the period
+
+        Returns:
+            The rows of the window, with escapes where the style changes
+        """
+        offset %= self.period
+        end = offset + self.viewport_width
+        lines = []
+        for text, starts, escapes in self._rows:
+            if len(escapes) == 1:
+                lines.append(text[offset:end])
+                continue
+            run = bisect_right(starts, offset) - 1
+            parts = []
+            position = offset
+            while position < end:
+                escape = escapes[run]
+                run += 1
+                stop = min(starts[run], end) if run < len(starts) else end
+                if escape:
+                    parts.append(escape)
+                elif parts:
+                    parts.append(RESET_COLORS)
+                parts.append(text[position:stop])
+                position = stop
+            if escape:
+                parts.append(RESET_COLORS)
+            lines.append("".join(parts))
+        return FigletString.from_rows(lines, width=self.viewport_width)
+
+    def frames(self, loops: Optional[int] = 1) -> Iterator[FigletString]:
+        """
+        Generate the frames, moving the text left by the step each time.
+
+        Args:
+            loops: Passes through the strip; None repeats forever
+
+        Yields:
+            One frame per step
+        """
+        count = len(self)
+        loop = 0
+        while loops is None or loop < loops:
+            for index in range(count):
+                yield self.frame(index * self.step)
+            loop += 1
+
+    def __iter__(self) -> Iterator[FigletString]:
+        """Return the frames of one pass."""
+        return self.frames()
+
+    def __repr__(self) -> str:
+        """Return a summary of the marquee."""
+        return (
+            f"Marquee(viewport_width={self.viewport_width}, frames={len(self)}, "
+            f"wrap={self.wrap})"
+        )
@@ -0,0 +1,19 @@
+"""
+HTTP render server for Figlet Forge.
+
+Serves ``GET /render?text=&font=&color=&format=txt|html|svg|json`` through a
+stdlib-only WSGI application, with an ASGI variant for async servers. Both
+adapters share RenderService, which keeps fonts warm, caches rendered
+responses by content hash and answers conditional requests with 304.
+"""
+
+from .service import RenderParams, RenderService, RequestError, Response
+from .wsgi import create_app
+
+__all__ = [
+    "RenderParams",
+    "RenderService",
+    "RequestError",
+    "Response",
+    "create_app",
+]
@@ -0,0 +1,80 @@
+"""
+Run the Figlet Forge render server with the standard library.
+
+Usage: python -m figlet_forge.server [--host HOST] [--port PORT]
+"""
+
+import argparse
+import logging
+import sys
+from typing import Any, Dict, List, Optional
+
+from .service import DEFAULT_CACHE_SIZE, DEFAULT_MAX_TEXT_LENGTH
+from .wsgi import create_app
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Serve the WSGI application until interrupted.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    from wsgiref.simple_server import make_server
+
+    parser = argparse.ArgumentParser(
+        prog="python -m figlet_forge.server",
+        description="Serve FIGlet renders over HTTP",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    parser.add_argument(
+        "--preload",
+        action="append",
+        metavar="FONT",
+        help="Font to load at start-up (repeatable, default: standard)",
+    )
+    parser.add_argument(
+        "--max-text-length",
+        type=int,
+        default=DEFAULT_MAX_TEXT_LENGTH,
+        metavar="N",
+        help="Longest accepted input text",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE,
+        metavar="N",
+        help="Number of rendered responses to cache",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(name)s - %(levelname)s - %(message)s"
+    )
+    options: Dict[str, Any] = {
+        "max_text_length": args.max_text_length,
+        "cache_size": args.cache_size,
+    }
+    if args.preload:
+        options["preload"] = tuple(args.preload)
+    app = create_app(**options)
+
+    with make_server(args.host, args.port, app) as httpd:
+        print(
+            f"Figlet Forge render server on http://{args.host}:{args.port}/render",
+            file=sys.stderr,
+        )
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
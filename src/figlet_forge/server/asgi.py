@@ -0,0 +1,81 @@
+"""
+ASGI adapter for the Figlet Forge render service.
+
+Rendering is CPU-bound, so requests run on the event loop's default
+executor instead of blocking it. Run it with any ASGI server::
+
+    uvicorn 'figlet_forge.server.asgi:application'
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .service import RenderService
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+def create_app(service: Optional[RenderService] = None, **options: Any) -> ASGIApp:
+    """
+    Create an ASGI application.
+
+    Args:
+        service: Render service to use (one is created from `options` if None)
+        **options: Keyword arguments for RenderService
+
+    Returns:
+        ASGI application callable
+    """
+    render_service = service or RenderService(**options)
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            raise ValueError(f"Unsupported ASGI scope type: {scope['type']}")
+
+        headers = {
+            name.decode("latin-1").lower(): value.decode("latin-1")
+            for name, value in scope.get("headers", [])
+        }
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            None,
+            render_service.handle,
+            scope.get("method", "GET").upper(),
+            scope.get("path", "") or "/",
+            scope.get("query_string", b"").decode("latin-1"),
+            headers,
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status,
+                "headers": [
+                    (name.lower().encode("latin-1"), value.encode("latin-1"))
+                    for name, value in response.headers
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": response.body})
+
+    app.service = render_service  # type: ignore[attr-defined]
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    """Create the default ``application`` on first access."""
+    if name == "application":
+        app = create_app()
+        globals()["application"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
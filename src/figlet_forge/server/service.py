@@ -0,0 +1,395 @@
+"""
+Framework-independent render service for the Figlet Forge HTTP server.
+
+RenderService turns a request (method, path, query string, headers) into
+a Response. The WSGI and ASGI adapters in this package only translate
+between their protocol and this interface, so both share one warm font
+registry, one response cache and the same validation rules.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import parse_qs
+
+from .. import metrics
+from ..core.exceptions import FigletError
+from ..core.figlet_font import FigletFont
+from ..version import DEFAULT_FONT, __version__
+
+# Configure logger for this module
+logger = logging.getLogger(__name__)
+
+# Output formats and their content types
+CONTENT_TYPES: Dict[str, str] = {
+    "txt": "text/plain; charset=utf-8",
+    "html": "text/html; charset=utf-8",
+    "svg": "image/svg+xml",
+    "json": "application/json",
+}
+
+JUSTIFY_VALUES = ("auto", "left", "center", "right")
+
+# Color specs whose output differs between renders and so cannot be cached
+UNCACHEABLE_COLORS = ("random",)
+
+# Default limits; see RenderService for their meaning
+DEFAULT_MAX_TEXT_LENGTH = 1000
+DEFAULT_MAX_WIDTH = 1000
+DEFAULT_MAX_OUTPUT_BYTES = 1 << 20
+DEFAULT_CACHE_SIZE = 512
+
+HTTP_STATUS = {
+    200: "200 OK",
+    304: "304 Not Modified",
+    400: "400 Bad Request",
+    404: "404 Not Found",
+    405: "405 Method Not Allowed",
+    413: "413 Payload Too Large",
+    500: "500 Internal Server Error",
+}
+
+
+class Response(NamedTuple):
+    """HTTP response produced by the render service."""
+
+    status: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+
+    @property
+    def status_line(self) -> str:
+        """Status in WSGI form, e.g. "200 OK"."""
+        return HTTP_STATUS.get(self.status, str(self.status))
+
+
+class RequestError(Exception):
+    """Invalid render request, reported to the client with a status code."""
+
+    def __init__(self, status: int, message: str) -> None:
+        """
+        Initialize the error.
+
+        Args:
+            status: HTTP status code
+            message: Explanation sent in the response body
+        """
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class RenderParams(NamedTuple):
+    """Validated parameters of a render request."""
+
+    text: str
+    font: str
+    color: str
+    format: str
+    width: int
+    justify: str
+
+    def cache_key(self) -> str:
+        """Content hash identifying the rendered representation."""
+        canonical = json.dumps([__version__, *self], separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @property
+    def cacheable(self) -> bool:
+        """Whether the output is deterministic and may be cached."""
+        return self.color.lower() not in UNCACHEABLE_COLORS
+
+
+def _etag_matches(header: Optional[str], etag: str, wildcard: bool = True) -> bool:
+    """Check an If-None-Match header against an entity tag."""
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" and wildcard:
+            return True
+        if candidate.replace("W/", "", 1) == etag:
+            return True
+    return False
+
+
+class RenderService:
+    """
+    Render FIGlet text for HTTP clients.
+
+    Handles ``GET /render?text=&font=&color=&format=txt|html|svg|json`` with
+    optional ``width`` and ``justify`` parameters. Responses carry a strong
+    ETag derived from the request parameters, so a matching
+    ``If-None-Match`` is answered with 304 before any rendering happens,
+    and rendered bodies are kept in an LRU cache keyed by the same hash.
+    ``If-None-Match: *`` only matches once the request has rendered, so
+    requests that fail still get their error.
+    """
+
+    def __init__(
+        self,
+        preload: Sequence[str] = (DEFAULT_FONT,),
+        max_text_length: int = DEFAULT_MAX_TEXT_LENGTH,
+        max_width: int = DEFAULT_MAX_WIDTH,
+        max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """
+        Initialize the service and warm the font registry.
+
+        Args:
+            preload: Fonts to parse up front
+            max_text_length: Longest accepted input text, in characters
+            max_width: Largest accepted output width
+            max_output_bytes: Largest response body the service will produce
+            cache_size: Number of rendered responses to keep
+        """
+        self.max_text_length = max_text_length
+        self.max_width = max_width
+        self.max_output_bytes = max_output_bytes
+        self.cache_size = cache_size
+
+        self._cache: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Only fonts from the registry can be requested, which also keeps
+        # font names from being used as filesystem paths
+        self.fonts = frozenset(FigletFont.get_fonts())
+        for font_name in preload:
+            FigletFont.load_cached(font_name)
+
+        metrics.REGISTRY.describe(
+            "http_requests", "counter", "HTTP render requests, labelled by status"
+        )
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        query_string: str = "",
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        """
+        Handle one HTTP request.
+
+        Args:
+            method: HTTP method
+            path: Request path without query string
+            query_string: Raw query string
+            headers: Request headers with lower-case names
+
+        Returns:
+            The response to send
+        """
+        headers = headers or {}
+        try:
+            if path.rstrip("/") != "/render":
+                raise RequestError(404, "Not found; use /render")
+            if method not in ("GET", "HEAD"):
+                raise RequestError(405, "Only GET and HEAD are supported")
+            response = self._render_response(
+                self.parse_params(query_string), headers.get("if-none-match")
+            )
+        except RequestError as e:
+            response = self._error(e.status, e.message)
+        except Exception as e:
+            logger.exception("Render request failed")
+            metrics.record_error(type(e).__name__)
+            response = self._error(500, "Internal server error")
+
+        metrics.REGISTRY.inc("http_requests", status=str(response.status))
+        if method == "HEAD":
+            return response._replace(body=b"")
+        return response
+
+    def parse_params(self, query_string: str) -> RenderParams:
+        """
+        Validate query parameters.
+
+        Args:
+            query_string: Raw query string
+
+        Returns:
+            Validated render parameters
+
+        Raises:
+            RequestError: If a parameter is missing, unknown or too large
+        """
+        query = {k: v[-1] for k, v in parse_qs(query_string).items()}
+
+        text = query.get("text", "")
+        if not text:
+            raise RequestError(400, "Missing required parameter: text")
+        if len(text) > self.max_text_length:
+            raise RequestError(
+                413, f"text exceeds {self.max_text_length} characters"
+            )
+
+        font = query.get("font") or DEFAULT_FONT
+        if font not in self.fonts:
+            raise RequestError(400, f"Unknown font: {font}")
+
+        fmt = (query.get("format") or "txt").lower()
+        if fmt not in CONTENT_TYPES:
+            raise RequestError(
+                400, f"Unknown format: {fmt}; use {'|'.join(CONTENT_TYPES)}"
+            )
+
+        try:
+            width = int(query.get("width") or 80)
+        except ValueError:
+            raise RequestError(400, "width must be an integer") from None
+        if not 1 <= width <= self.max_width:
+            raise RequestError(400, f"width must be between 1 and {self.max_width}")
+
+        justify = (query.get("justify") or "auto").lower()
+        if justify not in JUSTIFY_VALUES:
+            raise RequestError(
+                400, f"justify must be one of {', '.join(JUSTIFY_VALUES)}"
+            )
+
+        return RenderParams(text, font, query.get("color", ""), fmt, width, justify)
+
+    def render(self, params: RenderParams) -> bytes:
+        """
+        Render a request body.
+
+        Args:
+            params: Validated render parameters
+
+        Returns:
+            Encoded response body
+
+        Raises:
+            RequestError: If the color is invalid or the output too large
+        """
+        from ..color import get_coloring_functions
+        from ..figlet import Figlet
+        from ..render.figlet_engine import RenderEngine
+
+        try:
+            art = Figlet(
+                font=params.font, width=params.width, justify=params.justify
+            ).render_text(params.text)
+        except FigletError as e:
+            raise RequestError(400, str(e)) from None
+
+        output = str(art)
+        foreground = None
+        if params.color and params.format in ("html", "svg"):
+            # Markup formats take a single CSS color rather than ANSI codes
+            from ..color.figlet_color import InvalidColor, resolve_color
+
+            try:
+                rgb = resolve_color(params.color.split(":")[0]).rgb
+            except InvalidColor:
+                rgb = None
+            if rgb is None:
+                raise RequestError(
+                    400, f"html and svg output need a solid color: {params.color}"
+                )
+            foreground = "#{:02x}{:02x}{:02x}".format(*rgb)
+        elif params.color:
+            color_func = get_coloring_functions(params.color)
+            if color_func is None:
+                raise RequestError(400, f"Invalid color: {params.color}")
+            output = color_func(output)
+
+        if params.format == "html":
+            style = None
+            if foreground:
+                style = {
+                    "font-family": "monospace",
+                    "white-space": "pre",
+                    "line-height": "1",
+                    "display": "inline-block",
+                    "color": foreground,
+                }
+            body = RenderEngine.to_html(output, style=style)
+        elif params.format == "svg":
+            body = RenderEngine.to_svg(output, foreground=foreground or "#000000")
+        elif params.format == "json":
+            width, height = art.dimensions
+            body = json.dumps(
+                {
+                    "text": params.text,
+                    "font": params.font,
+                    "width": width,
+                    "height": height,
+                    "output": output,
+                }
+            )
+        else:
+            body = output if output.endswith("\n") else output + "\n"
+
+        data = body.encode("utf-8")
+        if len(data) > self.max_output_bytes:
+            raise RequestError(
+                413, f"rendered output exceeds {self.max_output_bytes} bytes"
+            )
+        return data
+
+    def _render_response(
+        self, params: RenderParams, if_none_match: Optional[str]
+    ) -> Response:
+        """Serve a validated request from the cache or by rendering."""
+        content_type = CONTENT_TYPES[params.format]
+        if not params.cacheable:
+            return self._ok(content_type, self.render(params), None)
+
+        key = params.cache_key()
+        etag = f'"{key[:32]}"'
+        # Tags are only handed out with rendered responses, so a listed tag
+        # means the request renders; "*" has to wait until it has
+        if _etag_matches(if_none_match, etag, wildcard=False):
+            metrics.record_cache("render", True)
+            return Response(304, [("ETag", etag)], b"")
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        metrics.record_cache("render", cached is not None)
+        if cached is None:
+            body = self.render(params)
+            with self._lock:
+                self._cache[key] = (content_type, body)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            cached = (content_type, body)
+        if _etag_matches(if_none_match, etag):
+            return Response(304, [("ETag", etag)], b"")
+        return self._ok(cached[0], cached[1], etag)
+
+    @staticmethod
+    def _ok(content_type: str, body: bytes, etag: Optional[str]) -> Response:
+        """Build a 200 response."""
+        headers = [
+            ("Content-Type", content_type),
+            ("Content-Length", str(len(body))),
+        ]
+        if etag is None:
+            headers.append(("Cache-Control", "no-store"))
+        else:
+            headers += [("ETag", etag), ("Cache-Control", "no-cache")]
+        return Response(200, headers, body)
+
+    @staticmethod
+    def _error(status: int, message: str) -> Response:
+        """Build a plain-text error response."""
+        body = (message + "\n").encode("utf-8")
+        headers = [
+            ("Content-Type", "text/plain; charset=utf-8"),
+            ("Content-Length", str(len(body))),
+        ]
+        if status == 405:
+            headers.append(("Allow", "GET, HEAD"))
+        return Response(status, headers, body)
+
+    def clear_cache(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._cache.clear()
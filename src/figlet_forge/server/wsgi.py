@@ -0,0 +1,62 @@
+"""
+WSGI adapter for the Figlet Forge render service.
+
+Run it with any WSGI server, for example::
+
+    gunicorn 'figlet_forge.server.wsgi:application'
+
+or with the standard library via ``python -m figlet_forge.server``.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .service import RenderService
+
+# WSGI start_response callable
+StartResponse = Callable[..., Any]
+WSGIApp = Callable[[Dict[str, Any], StartResponse], Iterable[bytes]]
+
+
+def _request_headers(environ: Dict[str, Any]) -> Dict[str, str]:
+    """Collect HTTP request headers from a WSGI environ, lower-cased."""
+    return {
+        key[len("HTTP_") :].replace("_", "-").lower(): value
+        for key, value in environ.items()
+        if key.startswith("HTTP_")
+    }
+
+
+def create_app(service: Optional[RenderService] = None, **options: Any) -> WSGIApp:
+    """
+    Create a WSGI application.
+
+    Args:
+        service: Render service to use (one is created from `options` if None)
+        **options: Keyword arguments for RenderService
+
+    Returns:
+        WSGI application callable
+    """
+    render_service = service or RenderService(**options)
+
+    def app(environ: Dict[str, Any], start_response: StartResponse) -> List[bytes]:
+        response = render_service.handle(
+            environ.get("REQUEST_METHOD", "GET").upper(),
+            environ.get("PATH_INFO", "") or "/",
+            environ.get("QUERY_STRING", ""),
+            _request_headers(environ),
+        )
+        start_response(response.status_line, response.headers)
+        return [response.body]
+
+    app.service = render_service  # type: ignore[attr-defined]
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    """Create the default ``application`` on first access."""
+    if name == "application":
+        app = create_app()
+        globals()["application"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,6 +8,7 @@ Figlet Forge package.
 import os
 import sys
 from pathlib import Path
+from typing import Any, List, Tuple
 
 # Version information
 __version__ = "0.1.0"
@@ -28,9 +29,6 @@ RESET_COLORS = "\033[0m"  # Color reset code
 # Width defaults
 DEFAULT_WIDTH = 80
 
-# Figlet-specific constants
-SHARED_DIRECTORY = "/usr/share"  # Base directory for shared files
-
 # Color codes for ANSI terminal colors
 COLOR_CODES = {
     "BLACK": "\033[30m",
@@ -75,37 +73,85 @@ BG_COLOR_CODES = {
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PACKAGE_DIR = os.path.dirname(SCRIPT_DIR)
 
-# Detect installation environment
-try:
-    import site
-
-    USER_SITE = site.getusersitepackages()
-    SHARED_DIRECTORY = os.path.dirname(os.path.dirname(USER_SITE))
-except (ImportError, AttributeError):
-    # Fallback for when site module is not available
-    USER_SITE = os.path.expanduser("~/.local/lib/python")
-    SHARED_DIRECTORY = "/usr/share"
-
 # Font-related settings
 FONT_EXTENSIONS = [".flf", ".tlf"]
-FONT_SEARCH_PATHS = [
-    Path(__file__).parent / "fonts",  # Package fonts
-    Path(SHARED_DIRECTORY) / "figlet" / "fonts",  # System fonts (Unix-like)
-    Path(os.path.expanduser("~")) / ".figlet_forge" / "fonts",  # User fonts
-]
-
-# Add OS-specific paths
-if sys.platform == "win32":
-    FONT_SEARCH_PATHS.extend(
-        [
-            Path(os.environ.get("APPDATA", "")) / "figlet_forge" / "fonts",
-            Path(os.environ.get("PROGRAMFILES", "")) / "Figlet" / "fonts",
-        ]
-    )
-elif sys.platform == "darwin":
-    FONT_SEARCH_PATHS.extend(
-        [
-            Path("/opt/local/share/figlet/fonts"),
-            Path.home() / "Library" / "figlet" / "fonts",
-        ]
-    )
+
+
+def _detect_install_paths() -> Tuple[str, str]:
+    """
+    Detect the user site-packages and shared data directories.
+
+    Returns:
+        Tuple of (user site-packages, shared directory)
+    """
+    try:
+        import site
+
+        user_site = site.getusersitepackages()
+        return user_site, os.path.dirname(os.path.dirname(user_site))
+    except (ImportError, AttributeError):
+        # Fallback for when site module is not available
+        return os.path.expanduser("~/.local/lib/python"), "/usr/share"
+
+
+def _font_search_paths(shared_directory: str) -> List[Path]:
+    """
+    Build the ordered list of directories searched for fonts.
+
+    Args:
+        shared_directory: Base directory for shared files
+
+    Returns:
+        Font directories, package fonts first
+    """
+    paths = [
+        Path(__file__).parent / "fonts",  # Package fonts
+        Path(shared_directory) / "figlet" / "fonts",  # System fonts (Unix-like)
+        Path(os.path.expanduser("~")) / ".figlet_forge" / "fonts",  # User fonts
+    ]
+
+    # Add OS-specific paths
+    if sys.platform == "win32":
+        paths.extend(
+            [
+                Path(os.environ.get("APPDATA", "")) / "figlet_forge" / "fonts",
+                Path(os.environ.get("PROGRAMFILES", "")) / "Figlet" / "fonts",
+            ]
+        )
+    elif sys.platform == "darwin":
+        paths.extend(
+            [
+                Path("/opt/local/share/figlet/fonts"),
+                Path.home() / "Library" / "figlet" / "fonts",
+            ]
+        )
+    return paths
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Compute installation-dependent constants on first access.
+
+    USER_SITE, SHARED_DIRECTORY and FONT_SEARCH_PATHS query the ``site``
+    module, which is deferred so that importing the package stays cheap.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The requested constant
+
+    Raises:
+        AttributeError: If the name is not a known lazy constant
+    """
+    if name in ("USER_SITE", "SHARED_DIRECTORY"):
+        user_site, shared_directory = _detect_install_paths()
+        globals().update(USER_SITE=user_site, SHARED_DIRECTORY=shared_directory)
+        return globals()[name]
+    if name == "FONT_SEARCH_PATHS":
+        shared_directory = globals().get("SHARED_DIRECTORY") or __getattr__(
+            "SHARED_DIRECTORY"
+        )
+        paths = globals()[name] = _font_search_paths(shared_directory)
+        return paths
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
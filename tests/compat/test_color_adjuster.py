@@ -189,8 +189,8 @@ class TestColorConversion:
             (0, "3", "30"),  # Black foreground
             (1, "3", "31"),  # Red foreground
             (9, "3", "31;1"),  # Bright red foreground (8+1, bright bit)
-            (16, "3", "31"),  # First color in 256-color cube (red-ish)
-            (232, "3", "37"),  # First grayscale color (white-ish)
+            (16, "3", "30"),  # First color in 256-color cube (black)
+            (232, "3", "30"),  # First grayscale color (near black)
             (0, "4", "40"),  # Black background
             (9, "4", "41;1"),  # Bright red background
         ],
@@ -0,0 +1,262 @@
+"""
+Unit tests for terminal animation of colored banners.
+
+These tests verify that the precomputed deltas turn each frame into the
+next one on a terminal, that only changed cells are written, and that
+playing paces the frames and leaves the cursor below the art.
+"""
+
+import io
+import re
+import unittest
+from typing import Dict, Optional, Tuple
+
+from figlet_forge.color.depth import ANSI_256
+from figlet_forge.color.effects import rainbow_colorize, style_solid
+from figlet_forge.color.styled import Style, StyledArt
+from figlet_forge.render.animation import (
+    MERGE_GAP,
+    SHOW_CURSOR,
+    Animation,
+    cursor_move,
+)
+
+ART = " _  _\n| || |\n|_||_|"
+BANNER = (
+    " _          _     _           \n"
+    "| |    ___ | |__ | |__  _   _ \n"
+    "| |   / _ \\| '_ \\| '_ \\| | | |\n"
+    "| |__| (_) | |_) | |_) | |_| |\n"
+    "|_____\\___/|_.__/|_.__/ \\__, |\n"
+    "                        |___/ "
+)
+
+RED = Style((255, 0, 0))
+BLUE = Style((0, 0, 255))
+
+# A screen cell: character, foreground and background
+Cell = Tuple[str, Optional[str], Optional[str]]
+
+# Escape sequences, carriage returns, newlines and single characters
+TOKEN = re.compile(r"\033\[(\??)([0-9;]*)([A-Za-z])|.", re.S)
+
+
+class Screen:
+    """A minimal terminal: cursor movement, SGR colors and characters."""
+
+    def __init__(self) -> None:
+        """Start with a blank screen and the cursor at the top left."""
+        self.cells: Dict[Tuple[int, int], Cell] = {}
+        self.x = self.y = 0
+        self.fg: Optional[str] = None
+        self.bg: Optional[str] = None
+
+    def _sgr(self, params: str) -> None:
+        """Apply an SGR sequence to the current colors."""
+        codes = params.split(";")
+        while codes:
+            code = codes.pop(0)
+            if code in ("", "0"):
+                self.fg = self.bg = None
+            elif code in ("38", "48"):
+                count = 3 if codes[0] == "2" else 1
+                value = ";".join(codes[: count + 1])
+                del codes[: count + 1]
+                if code == "38":
+                    self.fg = value
+                else:
+                    self.bg = value
+            elif code[0] in "39":
+                self.fg = code
+            elif code[0] in "41":
+                self.bg = code
+
+    def feed(self, text: str) -> None:
+        """Write text to the screen."""
+        for match in TOKEN.finditer(text):
+            private, params, command = match.groups()
+            char = match.group(0)
+            if command == "m":
+                self._sgr(params)
+            elif command and not private:
+                count = int(params or 1)
+                dx, dy = {"A": (0, -1), "B": (0, 1), "C": (1, 0), "D": (-1, 0)}[
+                    command
+                ]
+                self.x += dx * count
+                self.y += dy * count
+            elif command:
+                continue
+            elif char == "\r":
+                self.x = 0
+            elif char == "\n":
+                self.x, self.y = 0, self.y + 1
+            else:
+                fg = None if char == " " else self.fg
+                self.cells[(self.x, self.y)] = (char, fg, self.bg)
+                self.x += 1
+            assert self.x >= 0 and self.y >= 0
+
+    def visible(self) -> Dict[Tuple[int, int], Cell]:
+        """Cells that show a character or a background."""
+        return {
+            position: cell
+            for position, cell in self.cells.items()
+            if cell[0] != " " or cell[2] is not None
+        }
+
+
+def shown(text: str) -> Screen:
+    """Screen after writing text."""
+    screen = Screen()
+    screen.feed(text)
+    return screen
+
+
+class TestCursorMove(unittest.TestCase):
+    """Test relative cursor movement."""
+
+    def test_moves(self) -> None:
+        """The shortest form is used."""
+        self.assertEqual(cursor_move((3, 2), (3, 2)), "")
+        self.assertEqual(cursor_move((3, 2), (0, 0)), "\033[2A\r")
+        self.assertEqual(cursor_move((3, 0), (5, 1)), "\033[1B\033[2C")
+        self.assertEqual(cursor_move((9, 0), (7, 0)), "\033[2D")
+        self.assertEqual(cursor_move((120, 0), (3, 0)), "\r\033[3C")
+
+
+class TestDeltas(unittest.TestCase):
+    """Test the precomputed changes between frames."""
+
+    def assert_plays(self, animation: Animation) -> None:
+        """Every frame written as a delta looks like the full frame."""
+        screen = Screen()
+        count = len(animation)
+        outputs = list(animation.output(loops=2))
+        self.assertEqual(len(outputs), 2 * count)
+        for index, text in enumerate(outputs):
+            screen.feed(text)
+            expected = shown(animation.full_frame(index % count))
+            self.assertEqual(screen.visible(), expected.visible(), index)
+        self.assertEqual((screen.x, screen.y), (0, len(animation.frames[0].rows)))
+
+    def test_effects_play(self) -> None:
+        """Built-in animations reproduce their frames."""
+        self.assert_plays(Animation.pulse(BANNER, "CYAN"))
+        self.assert_plays(Animation.rainbow(BANNER))
+        self.assert_plays(Animation.field(BANNER, "plasma", frames=8))
+        self.assert_plays(Animation.shine(BANNER, "0;120;200", depth=ANSI_256))
+
+    def test_backgrounds_play(self) -> None:
+        """Background colors are switched off where they end."""
+        first = style_solid(ART, "RED:BLUE")
+        second = StyledArt(ART).fill(Style((255, 0, 0)))
+        self.assert_plays(Animation([first, second]))
+
+    def test_unchanged_frames(self) -> None:
+        """Identical frames need no output."""
+        animation = Animation([StyledArt(ART).fill(RED)] * 3)
+        self.assertEqual([animation.delta(i) for i in range(3)], ["", "", ""])
+
+    def test_only_changed_cells(self) -> None:
+        """One changed cell is written alone, blanks never are."""
+        first = StyledArt(ART).fill(RED)
+        second = StyledArt(ART).fill(RED)
+        second.set_styles(2, [BLUE], start=3)
+        second.set_styles(0, [BLUE])  # A space: invisible
+        animation = Animation([first, second])
+        # Both deltas start where the other one left the cursor
+        self.assertEqual(animation.delta(0), "\033[1D\033[38;2;0;0;255m|\033[0m")
+        self.assertEqual(animation.delta(1), "\033[1D\033[38;2;255;0;0m|\033[0m")
+
+    def test_merge_gap(self) -> None:
+        """Close changes are written as one span, distant ones are not."""
+        line = "x" * 20
+        first = StyledArt(line).fill(RED)
+        for gap, moves in ((MERGE_GAP, 0), (MERGE_GAP + 1, 1)):
+            with self.subTest(gap=gap):
+                second = StyledArt(line).fill(RED)
+                second.set_styles(0, [BLUE])
+                second.set_styles(0, [BLUE], start=gap + 1)
+                delta = Animation([first, second]).delta(1)
+                self.assertEqual(delta.count("C"), moves)
+
+    def test_same_escape_is_unchanged(self) -> None:
+        """Colors that quantize to one palette entry count as equal."""
+        first = StyledArt(ART).fill(Style((255, 0, 0)))
+        second = StyledArt(ART).fill(Style((250, 2, 1)))
+        self.assertEqual(Animation([first, second], ANSI_256).delta(0), "")
+        self.assertNotEqual(Animation([first, second]).delta(0), "")
+
+    def test_frames_must_match(self) -> None:
+        """Frames of different text are rejected."""
+        with self.assertRaises(ValueError):
+            Animation([StyledArt("a"), StyledArt("b")])
+        with self.assertRaises(ValueError):
+            Animation([])
+
+    def test_rainbow_uses_palette_codes(self) -> None:
+        """Rainbow frames match rainbow_colorize() and deltas cost no more."""
+        animation = Animation.rainbow(BANNER)
+        colored = rainbow_colorize(BANNER)
+        self.assertEqual(animation.full_frame(0), colored)
+        for frame in range(len(animation.frames)):
+            self.assertLessEqual(len(animation.delta(frame)), len(colored))
+
+    def test_sparse_changes_save_bandwidth(self) -> None:
+        """A sweeping highlight writes a fraction of a full frame."""
+        stats = Animation.shine(BANNER, "0;120;200").stats()
+        self.assertGreater(stats["ratio"], 2)
+
+
+class TestPlay(unittest.TestCase):
+    """Test playing an animation."""
+
+    def setUp(self) -> None:
+        """Create an animation and a fake clock."""
+        self.animation = Animation.pulse(ART, "RED", intensity_levels=2)
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self) -> float:
+        """Fake monotonic clock."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Fake sleep advancing the clock."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def test_paced(self) -> None:
+        """Frames are written on schedule and the cursor is restored."""
+        stream = io.StringIO()
+        count = self.animation.play(
+            stream, fps=10, loops=2, clock=self.clock, sleep=self.sleep
+        )
+        self.assertEqual(count, 8)
+        self.assertEqual(len(self.sleeps), 7)
+        for seconds in self.sleeps:
+            self.assertAlmostEqual(seconds, 0.1)
+        self.assertEqual(stream.getvalue(), "".join(self.animation.output(2)))
+        self.assertTrue(stream.getvalue().endswith(SHOW_CURSOR))
+
+    def test_interrupted(self) -> None:
+        """Ctrl-C stops the animation below the art."""
+
+        def interrupt(seconds: float) -> None:
+            if len(self.sleeps) == 2:
+                raise KeyboardInterrupt
+            self.sleep(seconds)
+
+        stream = io.StringIO()
+        count = self.animation.play(
+            stream, loops=None, clock=self.clock, sleep=interrupt
+        )
+        self.assertEqual(count, 3)
+        screen = shown(stream.getvalue())
+        self.assertEqual((screen.x, screen.y), (0, 3))
+        self.assertTrue(stream.getvalue().endswith(SHOW_CURSOR))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Unit tests for run-length ANSI emission.
+
+These tests verify that escapes are only written where the style changes,
+that every styled line is reset once, and that the color effects built on
+the emitter produce compact output.
+"""
+
+import re
+import unittest
+
+from figlet_forge import RESET_COLORS
+from figlet_forge.color.ansi import emit_line, emit_runs, emit_text
+from figlet_forge.color.effects import (
+    gradient_colorize,
+    highlight_pattern,
+    pulse_colorize,
+    rainbow_colorize,
+)
+
+RED = "\033[38;2;255;0;0m"
+BLUE = "\033[38;2;0;0;255m"
+
+# Matches any SGR escape sequence
+ESCAPE = re.compile(r"\033\[[0-9;]*m")
+
+
+class TestEmitter(unittest.TestCase):
+    """Test emit_runs(), emit_line() and emit_text()."""
+
+    def test_style_changes_only(self) -> None:
+        """Equal neighbouring styles share one escape."""
+        result = emit_line("abcd", [RED, RED, BLUE, None])
+        self.assertEqual(result, f"{RED}ab{BLUE}c{RESET_COLORS}d")
+
+    def test_one_reset_per_line(self) -> None:
+        """A line ending in a style is reset once."""
+        self.assertEqual(emit_runs([(RED, "a"), (RED, "b")]), f"{RED}ab{RESET_COLORS}")
+        self.assertEqual(emit_runs([(None, "plain")]), "plain")
+
+    def test_blanks_keep_style(self) -> None:
+        """Unstyled spaces do not break a run unless asked to."""
+        self.assertEqual(emit_line("a b", [RED, None, RED]), f"{RED}a b{RESET_COLORS}")
+        self.assertEqual(
+            emit_line("a b", [RED, None, RED], keep_on_blanks=False),
+            f"{RED}a{RESET_COLORS} {RED}b{RESET_COLORS}",
+        )
+
+    def test_runs_across_lines(self) -> None:
+        """Styles are reset before a newline and restored after it."""
+        result = emit_text([(None, "a"), (RED, "b\nc"), (None, "d\n")])
+        self.assertEqual(result, f"a{RED}b{RESET_COLORS}\n{RED}c{RESET_COLORS}d\n")
+
+
+class TestEffectOutput(unittest.TestCase):
+    """Test the output of effects built on the emitter."""
+
+    def setUp(self) -> None:
+        """Create art with repeated characters and interior spaces."""
+        self.art = "||  ||\n//__\\\\"
+
+    def _assert_compact(self, result: str) -> None:
+        """Check plain text is kept and no line resets more than once."""
+        self.assertEqual(ESCAPE.sub("", result), self.art)
+        for line in result.splitlines():
+            self.assertLessEqual(line.count(RESET_COLORS), 1)
+            self.assertTrue(line.endswith(RESET_COLORS))
+
+    def test_effects(self) -> None:
+        """Per-character effects reset once per line."""
+        self._assert_compact(gradient_colorize(self.art, "255;0;0", "0;0;255"))
+        self._assert_compact(pulse_colorize(self.art, "0;255;0"))
+        self._assert_compact(rainbow_colorize(self.art))
+
+    def test_adjacent_matches_merge(self) -> None:
+        """Touching matches are highlighted with one escape."""
+        result = highlight_pattern("a||b", r"\|", "0;0;255")
+        self.assertEqual(result, f"a{BLUE}||{RESET_COLORS}b")
+
+
+if __name__ == "__main__":
+    unittest.main()
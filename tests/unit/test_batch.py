@@ -0,0 +1,143 @@
+"""
+Unit tests for JSONL batch rendering in Figlet Forge.
+
+These tests verify record parsing, per-record rendering and errors, that
+parallel output matches serial output in input order, and the CLI flags.
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from figlet_forge.cli import batch
+from figlet_forge.cli.main import main
+from figlet_forge.figlet import Figlet
+
+
+def _jsonl(records: list) -> str:
+    """Encode records as JSONL."""
+    return "".join(json.dumps(record) + "\n" for record in records)
+
+
+class TestBatchRecords(unittest.TestCase):
+    """Test parsing and rendering individual records."""
+
+    def test_parse_records(self) -> None:
+        """Blank lines are skipped and bad lines become errors in place."""
+        records = batch.parse_records(['{"text": "a"}', "", "[1]", "{oops", '{"text": "b"}'])
+        self.assertEqual(len(records), 4)
+        self.assertEqual(records[0], {"text": "a"})
+        self.assertIn("expected a JSON object", records[1])
+        self.assertIn("invalid JSON", records[2])
+
+    def test_render_record_matches_figlet(self) -> None:
+        """A text record renders exactly like Figlet."""
+        result = batch.render_record({"id": "x", "text": "Hi", "font": "small", "width": 60})
+        expected = Figlet(font="small", width=60).render_text("Hi")
+        self.assertEqual(result, {"id": "x", "font": "small", "output": str(expected)})
+
+    def test_render_formats(self) -> None:
+        """HTML and SVG records carry a solid foreground color."""
+        svg = batch.render_record({"text": "Hi", "format": "svg", "color": "blue"})
+        self.assertIn("<svg", svg["output"])
+        self.assertIn("#0000ff", svg["output"])
+        html = batch.render_record({"text": "Hi", "format": "html"})
+        self.assertIn("figlet-line", html["output"])
+
+    def test_figlet_cache_is_bounded(self) -> None:
+        """Only the most recently used Figlet instances are kept."""
+        batch._get_figlet.cache_clear()
+        for width in range(1, batch.FIGLET_CACHE_SIZE + 10):
+            batch.render_record({"text": "", "font": "small", "width": width})
+        info = batch._get_figlet.cache_info()
+        self.assertEqual(info.currsize, batch.FIGLET_CACHE_SIZE)
+        self.assertIs(
+            batch._get_figlet("small", 70, "auto", "auto"),
+            batch._get_figlet("small", 70, "auto", "auto"),
+        )
+
+    def test_render_errors(self) -> None:
+        """Invalid records report an error instead of output."""
+        for record in (
+            {},
+            {"text": 5},
+            {"text": "Hi", "format": "pdf"},
+            {"text": "Hi", "width": 0},
+            {"text": "Hi", "color": "not_a_color"},
+            {"text": "Hi", "format": "svg", "color": "rainbow"},
+            {"text": "Hi", "format": "svg", "color": "not_a_color"},
+        ):
+            with self.subTest(record=record):
+                result = batch.render_record(record)
+                self.assertIn("error", result)
+                self.assertNotIn("output", result)
+
+    def test_batch_fonts(self) -> None:
+        """Distinct fonts are listed once, defaulting to standard."""
+        records = [{"font": "slant"}, {"text": "x"}, "error", {"font": "slant"}]
+        self.assertEqual(batch.batch_fonts(records), ["slant", "standard"])
+
+
+class TestRunBatch(unittest.TestCase):
+    """Test whole-batch execution."""
+
+    def setUp(self) -> None:
+        """Build a batch large enough to use the worker pool."""
+        fonts = ["standard", "small", "slant"]
+        self.records = [
+            {"id": i, "text": f"Job {i}", "font": fonts[i % 3], "width": 70}
+            for i in range(batch.MIN_PARALLEL_RECORDS + 8)
+        ]
+
+    def _run(self, source: str, jobs: int) -> tuple:
+        """Run a batch and decode its output."""
+        out = io.StringIO()
+        code = batch.run_batch(io.StringIO(source), out, jobs=jobs)
+        return code, [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_parallel_matches_serial(self) -> None:
+        """Worker processes produce the serial results in input order."""
+        source = _jsonl(self.records)
+        serial_code, serial = self._run(source, jobs=1)
+        parallel_code, parallel = self._run(source, jobs=2)
+        self.assertEqual(serial_code, 0)
+        self.assertEqual(parallel_code, 0)
+        self.assertEqual(parallel, serial)
+        self.assertEqual([r["index"] for r in parallel], list(range(len(self.records))))
+        self.assertEqual([r["id"] for r in parallel], [r["id"] for r in self.records])
+
+    def test_failures_set_exit_code(self) -> None:
+        """A failed record is reported in place and makes the batch fail."""
+        code, results = self._run(_jsonl([{"text": "ok"}, {"format": "txt"}]), jobs=1)
+        self.assertEqual(code, 1)
+        self.assertIn("output", results[0])
+        self.assertEqual(results[1]["index"], 1)
+        self.assertIn("error", results[1])
+
+    def test_cli_batch(self) -> None:
+        """--batch reads a file and --output receives the JSONL results."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = os.path.join(tmpdir, "in.jsonl")
+            target = os.path.join(tmpdir, "out.jsonl")
+            with open(source, "w", encoding="utf-8") as f:
+                f.write(_jsonl(self.records[:3]))
+
+            code = main(
+                ["--batch", source, "--jobs", "1", "--output", target], use_daemon=False
+            )
+            self.assertEqual(code, 0)
+            with open(target, encoding="utf-8") as f:
+                results = [json.loads(line) for line in f]
+            self.assertEqual([r["id"] for r in results], [0, 1, 2])
+
+            out = io.StringIO()
+            with redirect_stdout(out):
+                code = main(["--batch", source, "--jobs", "0"], use_daemon=False)
+            self.assertEqual(code, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
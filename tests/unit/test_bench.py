@@ -0,0 +1,118 @@
+"""
+Unit tests for the Figlet Forge benchmark suite.
+
+These tests verify benchmark collection, timing, JSON baselines and
+regression detection in compare mode, using tiny sample durations.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from figlet_forge.bench import (
+    Benchmark,
+    bundled_fonts,
+    collect_benchmarks,
+    compare_results,
+    load_baseline,
+    run_benchmark,
+    run_benchmarks,
+    save_baseline,
+)
+from figlet_forge.bench.__main__ import main as bench_main
+from figlet_forge.bench.runner import BenchResult
+
+
+class TestBenchRunner(unittest.TestCase):
+    """Test timing, baselines and comparisons."""
+
+    def setUp(self) -> None:
+        """Create a scratch directory for baseline files."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "baseline.json")
+
+    def tearDown(self) -> None:
+        """Remove the scratch directory."""
+        self.tmpdir.cleanup()
+
+    def test_run_benchmark(self) -> None:
+        """A benchmark yields positive per-operation timings."""
+        calls = []
+        bench = Benchmark("noop", "test", lambda: calls.append(1))
+        result = run_benchmark(bench, min_time=0.001, repeat=3)
+        self.assertEqual(result.repeat, 3)
+        self.assertGreater(result.median_ns, 0)
+        self.assertLessEqual(result.min_ns, result.median_ns)
+        self.assertGreaterEqual(len(calls), result.loops * 3)
+
+    def test_failing_benchmark_is_skipped(self) -> None:
+        """One broken benchmark does not abort the run."""
+        benches = [
+            Benchmark("broken", "test", lambda: 1 / 0),
+            Benchmark("ok", "test", lambda: None),
+        ]
+        with self.assertLogs("figlet_forge.bench.runner", level="WARNING"):
+            results = run_benchmarks(benches, min_time=0.001, repeat=1)
+        self.assertEqual([r.name for r in results], ["ok"])
+
+    def test_baseline_round_trip_and_compare(self) -> None:
+        """Saved baselines load back and flag slowdowns past the threshold."""
+        baseline_results = [
+            BenchResult("a", "g", 1, 1, 100.0, 90.0, {}),
+            BenchResult("b", "g", 1, 1, 100.0, 90.0, {}),
+        ]
+        save_baseline(baseline_results, self.path)
+        baseline = load_baseline(self.path)
+        self.assertIn("python", baseline["meta"])
+
+        current = [
+            BenchResult("a", "g", 1, 1, 105.0, 100.0, {}),
+            BenchResult("b", "g", 1, 1, 150.0, 140.0, {}),
+            BenchResult("c", "g", 1, 1, 10.0, 10.0, {}),
+        ]
+        comparisons = compare_results(baseline, current)
+        self.assertEqual([c.name for c in comparisons], ["a", "b"])
+        regressions = [c.name for c in comparisons if c.is_regression(0.10)]
+        self.assertEqual(regressions, ["b"])
+
+    def test_rejects_foreign_json(self) -> None:
+        """Files that are not baselines are refused."""
+        with open(self.path, "w") as f:
+            json.dump({"results": {}}, f)
+        with self.assertRaises(ValueError):
+            load_baseline(self.path)
+
+
+class TestBenchSuite(unittest.TestCase):
+    """Test the bundled benchmark definitions and CLI."""
+
+    def test_collection_covers_all_areas(self) -> None:
+        """The suite includes every benchmarked area and all bundled fonts."""
+        names = [b.name for b in collect_benchmarks()]
+        self.assertEqual(len(names), len(set(names)))
+        for font_name in bundled_fonts():
+            self.assertIn(f"font_load/cold/{font_name}", names)
+            self.assertIn(f"font_load/warm/{font_name}", names)
+        for prefix in ("render/", "color/", "export/html", "export/svg", "transform/"):
+            self.assertTrue(any(n.startswith(prefix) for n in names), prefix)
+
+    def test_cli_save_then_compare(self) -> None:
+        """The CLI writes a baseline and compares a later run against it."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "baseline.json")
+            common = ["--quick", "--filter", "^export/", "--min-time", "0.001", "--repeat", "1"]
+            self.assertEqual(bench_main(common + ["--save", path]), 0)
+            with open(path) as f:
+                self.assertEqual(
+                    sorted(json.load(f)["results"]), ["export/html", "export/svg"]
+                )
+            # A huge threshold can never report a regression
+            self.assertEqual(
+                bench_main(common + ["--compare", path, "--threshold", "1000"]), 0
+            )
+            self.assertEqual(bench_main(["--compare", os.path.join(tmpdir, "x")]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+Unit tests for the layered canvas compositor.
+
+These tests verify clipping, transparency, z-ordering, concatenation
+layouts and the plain, ANSI, HTML and SVG renderings of a Canvas.
+"""
+
+import unittest
+
+from figlet_forge import RESET_COLORS
+from figlet_forge.core.exceptions import InvalidColor
+from figlet_forge.core.figlet_string import FigletString
+from figlet_forge.figlet import Figlet
+from figlet_forge.render.canvas import Canvas
+
+
+class TestCanvasBlit(unittest.TestCase):
+    """Test drawing into a canvas."""
+
+    def test_empty_canvas(self) -> None:
+        """A new canvas is filled and keeps its size."""
+        canvas = Canvas(3, 2, fill=".")
+        self.assertEqual(canvas.to_rows(), ["...", "..."])
+        self.assertEqual(canvas.dimensions, (3, 2))
+        self.assertEqual(canvas.to_plain().dimensions, (3, 2))
+
+    def test_blit_clips(self) -> None:
+        """Art hanging over any edge is clipped."""
+        canvas = Canvas(4, 3, fill=".")
+        self.assertEqual(canvas.blit("ab\ncd", -1, -1), (2, 2))
+        canvas.blit("xyz\nuvw", 2, 2)
+        self.assertEqual(canvas.to_rows(), ["d...", "....", "..xy"])
+
+    def test_transparency(self) -> None:
+        """Spaces (and extra transparent characters) show lower cells."""
+        canvas = Canvas(3, 1, fill=".", transparent=" $")
+        canvas.blit("a $")
+        self.assertEqual(canvas.to_rows(), ["a.."])
+        canvas.blit("b $", opaque=True)
+        self.assertEqual(canvas.to_rows(), ["b $"])
+
+    def test_opaque_pads_ragged_lines(self) -> None:
+        """Opaque art covers its whole bounding box."""
+        canvas = Canvas(3, 2, fill=".")
+        canvas.blit("abc\nd", opaque=True)
+        self.assertEqual(canvas.to_rows(), ["abc", "d  "])
+
+    def test_z_order(self) -> None:
+        """Higher layers stay on top whatever the drawing order."""
+        canvas = Canvas(3, 1)
+        canvas.blit("TOP", z=2)
+        canvas.blit("low", z=1)
+        self.assertEqual(canvas.to_rows(), ["TOP"])
+        canvas.blit("new", z=2)
+        self.assertEqual(canvas.to_rows(), ["new"])
+
+    def test_z_order_with_transparency(self) -> None:
+        """Lower layers fill the holes of higher ones."""
+        canvas = Canvas(3, 1)
+        canvas.blit("a c", z=1)
+        canvas.blit("xyz", z=0)
+        self.assertEqual(canvas.to_rows(), ["ayc"])
+
+    def test_layer_view(self) -> None:
+        """Layers draw at their z-order with their color."""
+        canvas = Canvas(2, 1)
+        canvas.layer(5, color="RED").blit("ab")
+        canvas.blit("xy", z=1)
+        self.assertEqual(canvas.to_rows(), ["ab"])
+        self.assertEqual(canvas._colors[0], [(255, 0, 0)] * 2)
+
+    def test_clear(self) -> None:
+        """Clearing resets cells and depth."""
+        canvas = Canvas(2, 1)
+        canvas.blit("ab", z=9, color="RED")
+        canvas.clear()
+        canvas.blit("c")
+        self.assertEqual(canvas.to_rows(), ["c "])
+        self.assertEqual(canvas.to_ansi(), "c ")
+
+    def test_invalid_color(self) -> None:
+        """Unknown colors are rejected before drawing."""
+        with self.assertRaises(InvalidColor):
+            Canvas(1, 1).blit("a", color="not-a-color")
+
+
+class TestCanvasLayout(unittest.TestCase):
+    """Test hconcat() and vconcat()."""
+
+    def test_hconcat(self) -> None:
+        """Pieces are placed side by side and aligned vertically."""
+        canvas = Canvas(7, 3, fill=".")
+        size = canvas.hconcat(["ab\ncd\nef", "X"], gap=2, align="bottom")
+        self.assertEqual(size, (5, 3))
+        self.assertEqual(canvas.to_rows(), ["ab.....", "cd.....", "ef..X.."])
+
+    def test_vconcat(self) -> None:
+        """Pieces are stacked and aligned horizontally."""
+        canvas = Canvas(4, 4, fill=".")
+        size = canvas.vconcat(["abcd", "x"], y=1, gap=1, align="center")
+        self.assertEqual(size, (4, 3))
+        self.assertEqual(canvas.to_rows(), ["....", "abcd", "....", ".x.."])
+
+    def test_bad_alignment(self) -> None:
+        """Unknown alignments raise ValueError."""
+        with self.assertRaises(ValueError):
+            Canvas(2, 2).hconcat(["a"], align="left")
+
+    def test_banner_board(self) -> None:
+        """Rendered banners compose like their overlay equivalent."""
+        figlet = Figlet(font="small", width=200)
+        left, right = figlet.render_text("CPU"), figlet.render_text("OK")
+        canvas = Canvas(left.dimensions[0] + 1 + right.dimensions[0], 5)
+        canvas.hconcat([left, right])
+        expected = FigletString(left).ljust(left.dimensions[0] + 1)
+        expected = expected.overlay(right, left.dimensions[0] + 1, 0)
+        self.assertEqual(
+            [row.rstrip() for row in canvas.to_rows()],
+            [row.rstrip() for row in expected.rows],
+        )
+
+
+class TestCanvasFormats(unittest.TestCase):
+    """Test the rendered formats."""
+
+    def setUp(self) -> None:
+        """Create a canvas with one colored run."""
+        self.canvas = Canvas(4, 1)
+        self.canvas.blit("a<bc")
+        self.canvas.blit("<b", x=1, color="0;128;255")
+
+    def test_ansi_runs(self) -> None:
+        """Escape codes are only emitted where the color changes."""
+        self.assertEqual(
+            self.canvas.to_ansi(),
+            f"a\033[38;2;0;128;255m<b{RESET_COLORS}c",
+        )
+
+    def test_ansi_spaces_keep_color(self) -> None:
+        """Uncolored spaces between cells of one color do not reset it."""
+        canvas = Canvas(5, 1)
+        canvas.blit("a b c", color="RED")
+        self.assertEqual(canvas.to_ansi(), f"\033[38;2;255;0;0ma b c{RESET_COLORS}")
+
+    def test_html(self) -> None:
+        """Colored runs become escaped spans."""
+        output = self.canvas.render("html")
+        line = 'a<span style="color: #0080ff">&lt;b</span>c'
+        self.assertIn(f'<div class="figlet-line">{line}</div>', output)
+
+    def test_svg(self) -> None:
+        """Colored runs become tspans."""
+        output = self.canvas.render("svg")
+        self.assertTrue(output.startswith("<svg"))
+        self.assertIn('a<tspan fill="#0080ff">&lt;b</tspan>c', output)
+
+    def test_plain(self) -> None:
+        """Plain rendering drops colors."""
+        self.assertEqual(str(self.canvas), "a<bc")
+        self.assertIsInstance(self.canvas.render(), FigletString)
+        with self.assertRaises(ValueError):
+            self.canvas.render("png")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+"""
+Unit tests for the rectangular character grid.
+
+These tests verify the pure-Python grid against hand-written expectations,
+check that the NumPy grid (when NumPy is installed) gives identical
+results, and that FigletString transforms built on the grid are unchanged.
+"""
+
+import os
+import unittest
+from unittest import mock
+
+from figlet_forge.core import char_grid
+from figlet_forge.core.char_grid import (
+    GRID_BACKEND_ENV,
+    NUMPY_MIN_CELLS,
+    CharGrid,
+    scale_indices,
+    select_backend,
+)
+from figlet_forge.core.figlet_string import FigletString
+from figlet_forge.figlet import Figlet
+
+HAVE_NUMPY = char_grid.numpy_module() is not None
+
+ROWS = ["abc", "de", "fghi"]
+
+
+class TestCharGridPython(unittest.TestCase):
+    """Test the pure-Python grid backend."""
+
+    backend = "python"
+
+    def grid(self, rows=ROWS, **kwargs) -> CharGrid:
+        """Build a grid on the backend under test."""
+        return CharGrid.from_rows(rows, backend=self.backend, **kwargs)
+
+    def test_round_trip_pads_rows(self) -> None:
+        """Short rows are padded to the grid width."""
+        grid = self.grid()
+        self.assertEqual(grid.backend, self.backend)
+        self.assertEqual((grid.width, grid.height), (4, 3))
+        self.assertEqual(grid.to_rows(), ["abc ", "de  ", "fghi"])
+        self.assertEqual(self.grid(fill=".").to_rows(), ["abc.", "de..", "fghi"])
+
+    def test_transpose(self) -> None:
+        """Rows become columns."""
+        self.assertEqual(
+            self.grid().transpose().to_rows(), ["adf", "beg", "c h", "  i"]
+        )
+
+    def test_rotations(self) -> None:
+        """Rotations match their definitions and undo each other."""
+        grid = self.grid()
+        self.assertEqual(grid.rotate_cw().to_rows(), ["fda", "geb", "h c", "i  "])
+        self.assertEqual(grid.rotate_ccw().to_rows(), ["  i", "c h", "beg", "adf"])
+        self.assertEqual(grid.rotate_cw().rotate_ccw().to_rows(), grid.to_rows())
+        rotated = grid.rotate_cw()
+        self.assertEqual((rotated.width, rotated.height), (3, 4))
+
+    def test_flip_and_mirror(self) -> None:
+        """Row order and row contents reverse independently."""
+        self.assertEqual(self.grid().flip_rows().to_rows(), ["fghi", "de  ", "abc "])
+        self.assertEqual(self.grid().mirror().to_rows(), [" cba", "  ed", "ihgf"])
+
+    def test_crop(self) -> None:
+        """Crops are clipped to the grid."""
+        self.assertEqual(self.grid().crop(1, 1, 2, 5).to_rows(), ["e ", "gh"])
+        cropped = self.grid().crop(10, 0, 2, 2)
+        self.assertEqual((cropped.width, cropped.height), (0, 2))
+
+    def test_scale(self) -> None:
+        """Index maps pick source rows and columns."""
+        scaled = self.grid(["ab", "cd"]).scale([0, 0, 1], [1, 0, 0])
+        self.assertEqual(scaled.to_rows(), ["baa", "baa", "dcc"])
+        self.assertEqual((scaled.width, scaled.height), (3, 3))
+        self.assertEqual(self.grid(["ab"]).scale([0], [1]).to_rows(), ["b"])
+        self.assertEqual(self.grid(["ab"]).scale([0], []).to_rows(), [""])
+
+    def test_overlay(self) -> None:
+        """Every cell of the pasted grid replaces the cell below it."""
+        patch = CharGrid.from_rows(["X ", "YZ"], backend="python")
+        result = self.grid().overlay(patch, 1, 1)
+        self.assertEqual(result.to_rows(), ["abc ", "dX  ", "fYZi"])
+        with self.assertRaises(ValueError):
+            self.grid().overlay(patch, 3, 0)
+
+    def test_empty_grid(self) -> None:
+        """Grids without columns survive every transform."""
+        grid = self.grid(["", ""])
+        self.assertEqual(grid.to_rows(), ["", ""])
+        self.assertEqual(grid.rotate_cw().height, 0)
+        self.assertEqual(self.grid([]).to_rows(), [])
+
+    def test_wide_characters(self) -> None:
+        """Characters outside the BMP are single cells."""
+        grid = self.grid(["\U0001f600a", "b"])
+        self.assertEqual(grid.rotate_cw().to_rows(), ["b\U0001f600", " a"])
+
+
+@unittest.skipUnless(HAVE_NUMPY, "NumPy is not installed")
+class TestCharGridNumpy(TestCharGridPython):
+    """Run the same tests on the NumPy backend."""
+
+    backend = "numpy"
+
+    def test_matches_python_backend(self) -> None:
+        """Both backends produce identical rows for every transform."""
+        art = Figlet(font="slant", width=200).render_text("Grid (q) 42")
+        rows = list(art.rows)
+        operations = [
+            lambda g: g.transpose(),
+            lambda g: g.rotate_cw(),
+            lambda g: g.rotate_ccw(),
+            lambda g: g.flip_rows().mirror(),
+            lambda g: g.crop(3, 1, 20, 3),
+            lambda g: g.scale(scale_indices(g.height, 2), scale_indices(g.width, 1.5)),
+            lambda g: g.overlay(g.crop(0, 0, 5, 2), 7, 2),
+        ]
+        for index, operation in enumerate(operations):
+            with self.subTest(operation=index):
+                self.assertEqual(
+                    operation(CharGrid.from_rows(rows, backend="numpy")).to_rows(),
+                    operation(CharGrid.from_rows(rows, backend="python")).to_rows(),
+                )
+
+
+class TestBackendSelection(unittest.TestCase):
+    """Test select_backend() and scale_indices()."""
+
+    def test_small_grids_use_python(self) -> None:
+        """Auto selection keeps small grids in pure Python."""
+        with mock.patch.dict(os.environ, {GRID_BACKEND_ENV: ""}):
+            self.assertEqual(select_backend(NUMPY_MIN_CELLS - 1), "python")
+            expected = "numpy" if HAVE_NUMPY else "python"
+            self.assertEqual(select_backend(NUMPY_MIN_CELLS), expected)
+
+    def test_environment_override(self) -> None:
+        """The environment variable forces a backend."""
+        with mock.patch.dict(os.environ, {GRID_BACKEND_ENV: "python"}):
+            self.assertEqual(select_backend(10**6), "python")
+        with mock.patch.dict(os.environ, {GRID_BACKEND_ENV: "bogus"}):
+            with self.assertRaises(ValueError):
+                select_backend(1)
+
+    def test_missing_numpy_falls_back(self) -> None:
+        """Requesting NumPy without it installed uses pure Python."""
+        with mock.patch.object(char_grid, "_numpy", False):
+            self.assertEqual(select_backend(10**6, "numpy"), "python")
+
+    def test_scale_indices(self) -> None:
+        """Whole factors repeat indices and fractions append a prefix."""
+        self.assertEqual(scale_indices(3, 2), [0, 0, 1, 1, 2, 2])
+        self.assertEqual(scale_indices(4, 1.5), [0, 1, 2, 3, 0, 1])
+        self.assertEqual(scale_indices(0, 3), [])
+
+
+class TestFigletStringGeometry(unittest.TestCase):
+    """Test the FigletString transforms built on CharGrid."""
+
+    def setUp(self) -> None:
+        """Create ragged art."""
+        self.art = FigletString("ab\ncde\nf")
+
+    def test_rotations(self) -> None:
+        """Rotations pad ragged lines and keep their dimensions."""
+        rotated = self.art.rotate_90_clockwise()
+        self.assertEqual(str(rotated), "fca\n db\n e ")
+        self.assertEqual(rotated.dimensions, (3, 3))
+        self.assertEqual(str(self.art.rotate_90_counterclockwise()), " e \nbd \nacf")
+        self.assertEqual(str(FigletString("\n\n").rotate_90_clockwise()), "")
+
+    def test_scale_ragged(self) -> None:
+        """Ragged lines are scaled by their own length."""
+        self.assertEqual(
+            str(self.art.scale(1.5, 2)), "aba\naba\ncdecd\ncdecd\nff\nff"
+        )
+
+    def test_backends_agree(self) -> None:
+        """Large art renders the same on either backend."""
+        art = Figlet(width=10000).render_text("0123456789" * 12)
+        results = []
+        for backend in ("python", "numpy"):
+            with mock.patch.dict(os.environ, {GRID_BACKEND_ENV: backend}):
+                results.append(
+                    (
+                        str(art.rotate_90_clockwise()),
+                        str(art.rotate_90_counterclockwise()),
+                        str(art.scale(2.5, 2)),
+                    )
+                )
+        self.assertEqual(results[0], results[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,9 +13,12 @@ from figlet_forge.color.effects import (
     highlight_pattern,
     pulse_colorize,
     rainbow_colorize,
+    random_colorize,
 )
 from figlet_forge.color.figlet_color import (
+    ResolvedColor,
     parse_color,
+    resolve_color,
 )
 from figlet_forge.core.exceptions import InvalidColor
 
@@ -52,10 +55,54 @@ class TestColorParsing(unittest.TestCase):
         self.assertTrue(fg.startswith("\033[38;2;"))
         self.assertEqual(bg, "")
 
+    def test_parse_named_codes(self):
+        """Named colors map to single escape codes."""
+        self.assertEqual(parse_color("red:blue"), ("\033[31m", "\033[44m"))
+        self.assertEqual(
+            parse_color("BRIGHT_RED:LIGHT_BLUE"), ("\033[91m", "\033[104m")
+        )
+        self.assertIn(parse_color("RANDOM")[0], {f"\033[{n}m" for n in range(30, 98)})
+
+
+class TestColorResolver(unittest.TestCase):
+    """Test the cached color resolver."""
+
+    def test_resolve(self):
+        """Specs resolve to escape codes and a foreground RGB value."""
+        self.assertEqual(
+            resolve_color("RED:BLACK"),
+            ResolvedColor("\033[31m", "\033[40m", (255, 0, 0)),
+        )
+        self.assertEqual(resolve_color("1;2;3").rgb, (1, 2, 3))
+        self.assertEqual(resolve_color("BRIGHT_GREEN").rgb, (100, 255, 100))
+        self.assertEqual(resolve_color(""), ResolvedColor("", "", None))
+
+    def test_cached(self):
+        """Repeated specs are parsed once."""
+        resolve_color.cache_clear()
+        for _ in range(3):
+            parse_color("CYAN:RED")
+        info = resolve_color.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+
+    def test_invalid(self):
+        """Invalid specs raise every time."""
+        for _ in range(2):
+            with self.assertRaises(InvalidColor):
+                resolve_color("300;0;0")
+
 
 class TestColorEffects(unittest.TestCase):
     """Test color effect functions."""
 
+    def test_random_colorize(self):
+        """Every non-empty line gets one named color."""
+        result = random_colorize("ab\n\ncd")
+        first, blank, last = result.split("\n")
+        self.assertEqual(blank, "")
+        self.assertRegex(first, r"^\033\[\d+mab\033\[0m$")
+        self.assertRegex(last, r"^\033\[\d+mcd\033\[0m$")
+
     def test_rainbow_colorize(self):
         """Test rainbow color effect."""
         text = "ABC"
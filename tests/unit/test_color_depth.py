@@ -0,0 +1,206 @@
+"""
+Unit tests for color depth detection and depth-aware color emission.
+
+These tests verify terminal depth detection from the environment, the
+conversion of RGB colors to 256- and 16-color escapes, and that effects,
+compiled effects and the CLI emit escapes for the requested depth.
+"""
+
+import io
+import re
+import unittest
+from unittest.mock import patch
+
+from figlet_forge.cli.main import main
+from figlet_forge.color import get_coloring_functions, resolve_color
+from figlet_forge.color.depth import (
+    ANSI_16,
+    ANSI_256,
+    NO_COLOR,
+    TRUECOLOR,
+    depth_from_env,
+    depth_name,
+    parse_depth,
+    rgb_escape,
+    rgb_to_16,
+    rgb_to_256,
+)
+from figlet_forge.color.effects import (
+    color_style_apply,
+    gradient_colorize,
+    highlight_pattern,
+    pulse_colorize,
+    rainbow_colorize,
+)
+from figlet_forge.color.registry import EffectRegistry
+
+ART = " _  _\n| || |\n|_||_|"
+
+# Matches any SGR escape sequence
+ESCAPE = re.compile(r"\033\[[0-9;]*m")
+
+
+class TestDetection(unittest.TestCase):
+    """Test working out the depth from the environment."""
+
+    def test_environment(self) -> None:
+        """Variables are checked in order of precedence."""
+        cases = [
+            ({"NO_COLOR": "", "COLORTERM": "truecolor"}, NO_COLOR),
+            ({"FORCE_COLOR": "2", "TERM": "dumb"}, ANSI_256),
+            ({"FORCE_COLOR": "0"}, NO_COLOR),
+            ({"FORCE_COLOR": "true"}, ANSI_16),
+            ({"COLORTERM": "24bit", "TERM": "xterm"}, TRUECOLOR),
+            ({"TERM": "xterm-256color"}, ANSI_256),
+            ({"TERM": "dumb"}, NO_COLOR),
+            ({"TERM": "xterm"}, ANSI_16),
+        ]
+        for environ, expected in cases:
+            with self.subTest(environ=environ):
+                self.assertEqual(depth_from_env(environ), expected)
+
+    def test_not_a_terminal(self) -> None:
+        """Without TERM, color depends on having a terminal."""
+        self.assertEqual(depth_from_env({}, isatty=False), NO_COLOR)
+        self.assertEqual(depth_from_env({}, isatty=True), ANSI_16)
+
+    def test_names(self) -> None:
+        """Depth names round-trip and unknown names are rejected."""
+        for depth in (TRUECOLOR, ANSI_256, ANSI_16, NO_COLOR):
+            self.assertEqual(parse_depth(depth_name(depth)), depth)
+        self.assertEqual(parse_depth("24BIT"), TRUECOLOR)
+        with self.assertRaises(ValueError):
+            parse_depth("8")
+
+
+class TestConversion(unittest.TestCase):
+    """Test converting RGB colors to palette escapes."""
+
+    def test_rgb_to_256(self) -> None:
+        """Colors map to the cube or the gray ramp."""
+        self.assertEqual(rgb_to_256((255, 0, 0)), 196)
+        self.assertEqual(rgb_to_256((0, 0, 0)), 16)
+        self.assertEqual(rgb_to_256((238, 238, 238)), 255)
+        self.assertEqual(rgb_to_256((95, 135, 175)), 16 + 36 + 12 + 3)
+
+    def test_rgb_to_16(self) -> None:
+        """Colors map to the nearest basic color."""
+        self.assertEqual(rgb_to_16((200, 10, 10)), 1)
+        self.assertEqual(rgb_to_16((250, 250, 250)), 15)
+        self.assertEqual(rgb_to_16((0, 0, 0)), 0)
+
+    def test_escape_forms(self) -> None:
+        """Each depth writes its own escape form."""
+        rgb = (255, 0, 0)
+        self.assertEqual(rgb_escape(rgb), "\033[38;2;255;0;0m")
+        self.assertEqual(rgb_escape(rgb, ANSI_256, True), "\033[48;5;196m")
+        self.assertEqual(rgb_escape(rgb, ANSI_16), "\033[91m")
+        self.assertEqual(rgb_escape((0, 0, 0), ANSI_16, True), "\033[40m")
+        self.assertEqual(rgb_escape(rgb, NO_COLOR), "")
+
+    def test_resolve_color(self) -> None:
+        """RGB specs are converted and named colors kept."""
+        self.assertEqual(resolve_color("255;0;0", ANSI_256).fg, "\033[38;5;196m")
+        self.assertEqual(resolve_color("RED", ANSI_16).fg, "\033[31m")
+        self.assertEqual(resolve_color("RED:BLUE", NO_COLOR)[:2], ("", ""))
+
+
+class TestEffects(unittest.TestCase):
+    """Test effects emitting escapes for a depth."""
+
+    def _escapes(self, text: str) -> set:
+        """Distinct escapes other than the reset."""
+        return set(ESCAPE.findall(text)) - {"\033[0m"}
+
+    def test_palette_depths(self) -> None:
+        """Gradients and pulses only use escapes of the requested depth."""
+        forms = ((ANSI_256, r"\033\[38;5;\d+m"), (ANSI_16, r"\033\[[39]\dm"))
+        for depth, form in forms:
+            with self.subTest(depth=depth):
+                for result in (
+                    gradient_colorize(ART, "RED", "BLUE", depth=depth),
+                    pulse_colorize(ART, "0;200;100", depth=depth),
+                    color_style_apply(ART, "ice", depth=depth),
+                ):
+                    self.assertEqual(ESCAPE.sub("", result), ART)
+                    for escape in self._escapes(result):
+                        self.assertRegex(escape, form)
+
+    def test_equal_neighbours_merge(self) -> None:
+        """Neighbouring characters that quantize alike share one escape."""
+        result = gradient_colorize("abcdefgh", "RED", "240;0;0", depth=ANSI_16)
+        self.assertEqual(result, "\033[91mabcdefgh\033[0m")
+
+    def test_no_color(self) -> None:
+        """At NO_COLOR effects return the text unchanged."""
+        self.assertEqual(gradient_colorize(ART, "RED", "BLUE", depth=NO_COLOR), ART)
+        self.assertEqual(rainbow_colorize(ART, depth=NO_COLOR), ART)
+        self.assertEqual(color_style_apply(ART, "red_on_black", depth=NO_COLOR), ART)
+        self.assertEqual(highlight_pattern("a|b", r"\|", "RED", depth=NO_COLOR), "a|b")
+
+
+class TestCompiledDepth(unittest.TestCase):
+    """Test compiling effects for a depth."""
+
+    def setUp(self) -> None:
+        """Create an isolated registry."""
+        self.registry = EffectRegistry()
+
+    def test_cached_per_depth(self) -> None:
+        """Each depth compiles its own effect."""
+        truecolor = self.registry.compile("fire")
+        reduced = self.registry.compile("fire", ANSI_256)
+        self.assertIsNot(truecolor, reduced)
+        self.assertIs(self.registry.compile("fire", ANSI_256), reduced)
+        self.assertEqual(reduced(ART), color_style_apply(ART, "fire", depth=ANSI_256))
+        self.assertEqual(reduced.at_depth(TRUECOLOR).depth, TRUECOLOR)
+
+    def test_spec_forms(self) -> None:
+        """Built-in spec forms honour the depth."""
+        self.assertEqual(
+            self.registry.compile("255;0;0", ANSI_256)("x"), "\033[38;5;196mx\033[0m"
+        )
+        self.assertEqual(
+            self.registry.compile("red_to_blue", ANSI_16)(ART),
+            gradient_colorize(ART, "red", "blue", depth=ANSI_16),
+        )
+        self.assertEqual(self.registry.compile("pulse_RED", NO_COLOR)(ART), ART)
+
+    def test_registered_function(self) -> None:
+        """Plain functions are skipped only at NO_COLOR."""
+        self.registry.register("upper", str.upper)
+        self.assertEqual(self.registry.compile("upper", ANSI_16)("a"), "A")
+        self.assertEqual(self.registry.compile("upper", NO_COLOR)("a"), "a")
+
+    def test_get_coloring_functions(self) -> None:
+        """The module-level lookup takes a depth."""
+        effect = get_coloring_functions("ice", ANSI_16)
+        self.assertEqual(effect.depth, ANSI_16)
+
+
+class TestCLIDepth(unittest.TestCase):
+    """Test the --color-depth option."""
+
+    def _run(self, *args: str) -> str:
+        """Render "Hi" in red with extra arguments and return the output."""
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            self.assertEqual(main(["--color=255;0;0", *args, "Hi"], False), 0)
+        return stdout.getvalue()
+
+    def test_explicit_depths(self) -> None:
+        """The option selects the escape form."""
+        self.assertIn("\033[38;2;255;0;0m", self._run("--color-depth=truecolor"))
+        self.assertIn("\033[38;5;196m", self._run("--color-depth=256"))
+        self.assertIn("\033[91m", self._run("--color-depth=16"))
+        self.assertNotIn("\033[", self._run("--color-depth=none"))
+
+    def test_auto_uses_detection(self) -> None:
+        """The default asks detect_color_depth()."""
+        with patch(
+            "figlet_forge.color.depth.detect_color_depth", return_value=ANSI_256
+        ):
+            self.assertIn("\033[38;5;196m", self._run())
+
+
+if __name__ == "__main__":
+    unittest.main()
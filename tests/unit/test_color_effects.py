@@ -10,12 +10,16 @@ from unittest.mock import patch
 
 import pytest
 
+from figlet_forge.color import effects
 from figlet_forge.color.effects import (
+    _gradient_colors,
     _parse_color_to_rgb,
     color_style_apply,
     gradient_colorize,
+    gradient_palette,
     highlight_pattern,
     pulse_colorize,
+    pulse_palette,
     rainbow_colorize,
 )
 from figlet_forge.core.exceptions import InvalidColor
@@ -151,6 +155,47 @@ class TestColorEffects(unittest.TestCase):
             color_style_apply("ABC", "invalid_style")
 
 
+class TestPalettes(unittest.TestCase):
+    """Test the cached gradient and pulse palettes."""
+
+    def test_gradient_endpoints(self) -> None:
+        """Visible characters run from the start to the end color."""
+        result = gradient_colorize("a b\n  cd", "255;0;0", "0;0;255")
+        first, second = result.splitlines()
+        self.assertTrue(first.startswith("\033[38;2;255;0;0ma "))
+        self.assertIn("\033[38;2;0;0;255mb", first)
+        self.assertTrue(second.startswith("  \033[38;2;255;0;0mc"))
+
+    def test_gradient_palette_is_cached(self) -> None:
+        """Lines with the same number of visible characters share a palette."""
+        gradient_palette.cache_clear()
+        gradient_colorize("abc\nxyz\nq r s", "RED", "BLUE")
+        info = gradient_palette.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+
+    @unittest.skipUnless(effects.numpy_module() is not None, "NumPy is not installed")
+    def test_numpy_palette_matches_python(self) -> None:
+        """Both interpolation paths give the same colors."""
+        colors = ((3, 200, 17), (250, 1, 99))
+        _gradient_colors.cache_clear()
+        with patch.object(effects, "NUMPY_MIN_PALETTE", 1):
+            vectorized = _gradient_colors(*colors, 777)
+        _gradient_colors.cache_clear()
+        with patch.object(effects, "numpy_module", return_value=None):
+            plain = _gradient_colors(*colors, 777)
+        self.assertEqual(vectorized, plain)
+
+    def test_pulse_wave_repeats(self) -> None:
+        """The pulse palette covers one period of the wave."""
+        palette = pulse_palette((200, 100, 50), 2)
+        self.assertEqual(len(palette), 4)
+        self.assertEqual(palette[0], "\033[38;2;200;100;50m")
+        self.assertEqual(palette[2], "\033[38;2;100;50;25m")
+        result = pulse_colorize("abcde", "200;100;50", 2)
+        self.assertTrue(result.startswith(palette[0] + "a" + palette[1] + "b"))
+        self.assertIn(palette[0] + "e", result)
+
+
 @pytest.mark.parametrize(
     "input_text,color,expected_contains",
     [
@@ -0,0 +1,177 @@
+"""
+Unit tests for color fields over the whole banner.
+
+These tests verify the geometry of each kind of field, that the NumPy and
+per-cell backends agree, and that fields reach the effects, the predefined
+styles and the effect registry.
+"""
+
+import re
+import unittest
+from unittest.mock import patch
+
+from figlet_forge.color import fields
+from figlet_forge.color.depth import ANSI_256, NO_COLOR
+from figlet_forge.color.effects import color_style_apply
+from figlet_forge.color.fields import (
+    FIELD_KINDS,
+    color_field,
+    field_colorize,
+    plasma_colorize,
+    style_field,
+)
+from figlet_forge.color.figlet_color import InvalidColor
+from figlet_forge.color.registry import EffectRegistry, FieldEffect
+from figlet_forge.core.char_grid import numpy_module
+
+ART = " _  _\n| || |\n|_||_|"
+
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+
+# Matches any SGR escape sequence
+ESCAPE = re.compile(r"\033\[[0-9;]*m")
+
+
+class TestGeometry(unittest.TestCase):
+    """Test where each kind of field puts its colors."""
+
+    def test_horizontal_and_vertical(self) -> None:
+        """Linear fields run across the columns or down the rows."""
+        field = color_field("horizontal", 5, 3, ("RED", "BLUE"))
+        self.assertEqual(field.color_at(0, 2), RED)
+        self.assertEqual(field.color_at(4, 0), BLUE)
+        field = color_field("vertical", 5, 3, ("RED", "BLUE"))
+        self.assertEqual({field.color_at(x, 0) for x in range(5)}, {RED})
+        self.assertEqual(field.color_at(3, 2), BLUE)
+
+    def test_diagonal(self) -> None:
+        """Diagonals run from the top left to the bottom right corner."""
+        field = color_field("diagonal", 9, 4, ("RED", "BLUE"))
+        self.assertEqual(field.color_at(0, 0), RED)
+        self.assertEqual(field.color_at(8, 3), BLUE)
+        # One row down is two columns across, as cells are twice as tall
+        self.assertEqual(field.color_at(2, 0), field.color_at(0, 1))
+
+    def test_radial(self) -> None:
+        """Radial fields start at the center and end at the corners."""
+        field = color_field("radial", 9, 5, ("RED", "BLUE"))
+        self.assertEqual(field.color_at(4, 2), RED)
+        for x, y in ((0, 0), (8, 0), (0, 4), (8, 4)):
+            self.assertEqual(field.color_at(x, y), BLUE)
+
+    def test_stops(self) -> None:
+        """Middle stops are reached halfway."""
+        field = color_field("horizontal", 3, 1, ("RED", "0;255;0", "BLUE"))
+        self.assertEqual(field.palette, (RED, (0, 255, 0), BLUE))
+
+    def test_palette(self) -> None:
+        """The palette holds each color once."""
+        field = color_field("vertical", 40, 4, ("RED", "BLUE"))
+        self.assertEqual(len(field.palette), 4)
+        self.assertEqual(len(field.indices), 4)
+        self.assertEqual(len(field.indices[0]), 40)
+
+    def test_phase(self) -> None:
+        """Phases move the field and wrap around after one cycle."""
+        still = color_field("plasma", 20, 4)
+        moved = color_field("plasma", 20, 4, phase=0.25)
+        self.assertNotEqual(still, moved)
+        self.assertEqual(color_field("plasma", 20, 4, phase=1.25), moved)
+        gradient = color_field("horizontal", 20, 1, ("RED", "BLUE"), phase=0.5)
+        self.assertEqual(gradient.color_at(0, 0), BLUE)
+
+    def test_invalid(self) -> None:
+        """Unknown kinds and colors are rejected."""
+        with self.assertRaises(ValueError):
+            color_field("spiral", 3, 3)
+        with self.assertRaises(InvalidColor):
+            color_field("radial", 3, 3, ("RED",))
+        with self.assertRaises(InvalidColor):
+            color_field("radial", 3, 3, ("RED", "NOPE"))
+
+
+@unittest.skipIf(numpy_module() is None, "NumPy is not installed")
+class TestBackends(unittest.TestCase):
+    """Test that both backends compute the same fields."""
+
+    def test_backends_agree(self) -> None:
+        """NumPy and per-cell fields have the same palette and indices."""
+        colors = ("RED", "0;200;30", "BLUE")
+        for kind in FIELD_KINDS:
+            for phase in (0.0, 0.37):
+                with self.subTest(kind=kind, phase=phase):
+                    fields._field.cache_clear()
+                    with patch.object(fields, "NUMPY_MIN_FIELD", 1):
+                        vectorized = color_field(kind, 61, 9, colors, phase)
+                    fields._field.cache_clear()
+                    with patch.object(fields, "numpy_module", return_value=None):
+                        plain = color_field(kind, 61, 9, colors, phase)
+                    self.assertEqual(vectorized, plain)
+
+
+class TestEffects(unittest.TestCase):
+    """Test coloring text with fields."""
+
+    def test_visible_cells_only(self) -> None:
+        """Spaces stay uncolored and the text is unchanged."""
+        result = field_colorize(ART, "diagonal", ("RED", "BLUE"))
+        self.assertEqual(ESCAPE.sub("", result), ART)
+        self.assertTrue(result.startswith(" \033[38;2;"))
+
+    def test_matches_field(self) -> None:
+        """Cells take the color of their position in the field."""
+        art = style_field(ART, "radial", ("RED", "BLUE"))
+        field = color_field("radial", 6, 3, ("RED", "BLUE"))
+        self.assertEqual(art.style_at(2, 1).fg, field.color_at(2, 1))
+        self.assertIsNone(art.style_at(0, 0))
+
+    def test_depths(self) -> None:
+        """Fields honour the color depth."""
+        result = plasma_colorize(ART, depth=ANSI_256)
+        for escape in set(ESCAPE.findall(result)) - {"\033[0m"}:
+            self.assertRegex(escape, r"\033\[38;5;\d+m")
+        self.assertEqual(
+            field_colorize(ART, "radial", ("RED", "BLUE"), depth=NO_COLOR), ART
+        )
+        with self.assertRaises(InvalidColor):
+            field_colorize(ART, "radial", ("RED", "NOPE"), depth=NO_COLOR)
+
+    def test_styles(self) -> None:
+        """Predefined field styles are available by name."""
+        self.assertEqual(color_style_apply(ART, "plasma"), plasma_colorize(ART))
+        self.assertEqual(
+            color_style_apply(ART, "glow"),
+            field_colorize(ART, "radial", ("WHITE", "YELLOW", "RED")),
+        )
+
+
+class TestRegistry(unittest.TestCase):
+    """Test compiling field specs."""
+
+    def setUp(self) -> None:
+        """Create an isolated registry."""
+        self.registry = EffectRegistry()
+
+    def test_spec_form(self) -> None:
+        """Specs of the form <kind>_<color>_to_<color> compile to fields."""
+        effect = self.registry.compile("radial_yellow_to_red_to_blue")
+        self.assertIsInstance(effect, FieldEffect)
+        self.assertEqual(
+            effect(ART), field_colorize(ART, "radial", ("yellow", "red", "blue"))
+        )
+        self.assertEqual(effect.at_depth(NO_COLOR)(ART), ART)
+        self.assertIsNone(self.registry.get("radial_red_to_nope"))
+
+    def test_plain_gradients_unchanged(self) -> None:
+        """Specs that are not field kinds are still line gradients."""
+        self.assertNotIsInstance(self.registry.compile("red_to_blue"), FieldEffect)
+
+    def test_builtin_names(self) -> None:
+        """Field styles are registered."""
+        self.assertIsInstance(self.registry.compile("plasma"), FieldEffect)
+        self.assertIn("sunset", self.registry.names())
+
+
+if __name__ == "__main__":
+    unittest.main()
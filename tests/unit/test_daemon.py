@@ -0,0 +1,225 @@
+"""
+Unit tests for the Figlet Forge render daemon.
+
+These tests verify address handling, the in-process fallback and a full
+round trip through a daemon listening on a temporary Unix socket.
+"""
+
+import io
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from figlet_forge.cli import daemon
+from figlet_forge.cli.main import main
+from figlet_forge.metrics import REGISTRY
+
+
+class TestAddresses(unittest.TestCase):
+    """Test address parsing and resolution."""
+
+    def test_parse_address(self) -> None:
+        """Unix paths and TCP host:port pairs are recognised."""
+        self.assertEqual(daemon.parse_address("unix:/tmp/ff.sock"), "/tmp/ff.sock")
+        self.assertEqual(daemon.parse_address("/tmp/ff.sock"), "/tmp/ff.sock")
+        self.assertEqual(daemon.parse_address("tcp:localhost:7000"), ("localhost", 7000))
+        self.assertEqual(daemon.parse_address("127.0.0.1:7000"), ("127.0.0.1", 7000))
+        self.assertEqual(daemon.parse_address("tcp::7000"), ("127.0.0.1", 7000))
+        with self.assertRaises(ValueError):
+            daemon.parse_address("tcp:localhost:http")
+
+    def test_resolve_address(self) -> None:
+        """Forwarding is opt-in unless a daemon socket exists."""
+        with tempfile.TemporaryDirectory() as runtime_dir:
+            env = {"XDG_RUNTIME_DIR": runtime_dir}
+            with mock.patch.dict(os.environ, env, clear=False):
+                os.environ.pop(daemon.DAEMON_ENV, None)
+                self.assertIsNone(daemon.resolve_address())
+                self.assertEqual(
+                    daemon.resolve_address(force=True), daemon.default_address()
+                )
+                os.environ[daemon.DAEMON_ENV] = "off"
+                self.assertIsNone(daemon.resolve_address())
+                os.environ[daemon.DAEMON_ENV] = "tcp:127.0.0.1:7000"
+                self.assertEqual(daemon.resolve_address(), ("127.0.0.1", 7000))
+                self.assertEqual(daemon.resolve_address("unix:/x.sock"), "/x.sock")
+                del os.environ[daemon.DAEMON_ENV]
+
+    def test_forward_without_daemon(self) -> None:
+        """Forwarding to a missing daemon reports None so callers fall back."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            missing = os.path.join(tmpdir, "missing.sock")
+            self.assertIsNone(daemon.forward(["Hi"], missing))
+
+            out = io.StringIO()
+            with redirect_stdout(out):
+                code = main(["--client", "--daemon-address", missing, "-w", "80", "Hi"])
+            self.assertEqual(code, 0)
+            self.assertIn("_", out.getvalue())
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "requires Unix domain sockets")
+class TestDaemonRoundTrip(unittest.TestCase):
+    """Test a live daemon on a temporary socket."""
+
+    def setUp(self) -> None:
+        """Start a daemon in a background thread."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.env = mock.patch.dict(os.environ, {"XDG_RUNTIME_DIR": self.tmpdir.name})
+        self.env.start()
+        self.address = os.path.join(self.tmpdir.name, "ff.sock")
+        with mock.patch.object(daemon, "REQUEST_TIMEOUT", 0.2):
+            self.server = daemon.create_server(
+                self.address, lambda argv: main(argv, use_daemon=False)
+            )
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self) -> None:
+        """Stop the daemon and remove the socket."""
+        self.server.shutdown()
+        self.server.server_close()
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def _local(self, argv: list) -> str:
+        """Render in-process for comparison."""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            main(argv, use_daemon=False)
+        return out.getvalue()
+
+    def test_output_matches_in_process(self) -> None:
+        """The daemon streams back exactly what a local run prints."""
+        argv = ["--width", "80", "--font", "small", "Daemon"]
+        out = io.StringIO()
+        before = REGISTRY.get("daemon_requests")
+        self.assertEqual(daemon.forward(argv, self.address, stdout=out), 0)
+        self.assertEqual(out.getvalue(), self._local(argv))
+        self.assertEqual(REGISTRY.get("daemon_requests"), before + 1)
+
+    def test_stdin_and_stderr(self) -> None:
+        """Standard input is forwarded and errors arrive on stderr."""
+        out, err = io.StringIO(), io.StringIO()
+        code = daemon.forward(
+            ["--width", "80"], self.address, stdin="piped", stdout=out, stderr=err
+        )
+        self.assertEqual(code, 0)
+        self.assertEqual(out.getvalue(), self._local(["--width", "80", "piped"]))
+
+        code = daemon.forward(["--serve"], self.address, stdout=out, stderr=err)
+        self.assertEqual(code, 2)
+        self.assertIn("--serve", err.getvalue())
+
+    def test_cli_client_mode(self) -> None:
+        """main() forwards to the daemon named by --daemon-address."""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(["--client", "--daemon-address", self.address, "-w", "80", "Hi"])
+        self.assertEqual(code, 0)
+        self.assertEqual(out.getvalue(), self._local(["-w", "80", "Hi"]))
+
+    def test_private_files(self) -> None:
+        """The socket and the token file are closed to other users."""
+        self.assertEqual(os.stat(self.address).st_mode & 0o077, 0)
+        self.assertEqual(os.stat(daemon.token_path()).st_mode & 0o777, 0o600)
+
+    def test_token_required(self) -> None:
+        """Requests without the daemon's token are not run."""
+        out, err = io.StringIO(), io.StringIO()
+        before = REGISTRY.get("daemon_requests")
+        code = daemon.forward(
+            ["Hi"], self.address, stdout=out, stderr=err, token="guess"
+        )
+        self.assertEqual(code, 1)
+        self.assertEqual(out.getvalue(), "")
+        self.assertIn("token", err.getvalue())
+        self.assertEqual(REGISTRY.get("daemon_requests"), before)
+
+    def test_file_options_refused(self) -> None:
+        """Forwarded requests cannot write or read files by name."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = os.path.join(tmpdir, "out.txt")
+            for argv in (
+                ["-o", target, "Hi"],
+                [f"--output={target}", "Hi"],
+                ["--out", target, "Hi"],
+                ["-ro", target, "Hi"],
+                ["--batch", target],
+            ):
+                with self.subTest(argv=argv):
+                    err = io.StringIO()
+                    code = daemon.forward(
+                        argv, self.address, stdout=io.StringIO(), stderr=err
+                    )
+                    self.assertEqual(code, 2)
+                    self.assertIn("cannot be forwarded", err.getvalue())
+            self.assertFalse(os.path.exists(target))
+
+            # The CLI writes such files itself instead of forwarding
+            with redirect_stdout(io.StringIO()):
+                code = main(
+                    ["--client", "--daemon-address", self.address, "-o", target, "Hi"]
+                )
+            self.assertEqual(code, 0)
+            self.assertTrue(os.path.exists(target))
+
+    def test_silent_client_does_not_block(self) -> None:
+        """A client that never sends its request is dropped."""
+        silent = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        silent.connect(self.address)
+        try:
+            out = io.StringIO()
+            code = daemon.forward(["-w", "80", "Hi"], self.address, stdout=out)
+        finally:
+            silent.close()
+        self.assertEqual(code, 0)
+        self.assertIn("_", out.getvalue())
+
+    def test_refuses_second_daemon(self) -> None:
+        """A live socket is not replaced by a second daemon."""
+        with self.assertRaises(OSError):
+            daemon.create_server(self.address, lambda argv: 0)
+
+
+class TestToken(unittest.TestCase):
+    """Test the daemon token file."""
+
+    def setUp(self) -> None:
+        """Use a temporary runtime directory."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "ff.token")
+
+    def test_created_once(self) -> None:
+        """The token is created private and then reused."""
+        self.assertIsNone(daemon.read_token(self.path))
+        token = daemon.ensure_token(self.path)
+        self.assertEqual(len(token), 2 * daemon.TOKEN_BYTES)
+        self.assertEqual(daemon.ensure_token(self.path), token)
+        self.assertEqual(daemon.read_token(self.path), token)
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "requires POSIX permissions")
+    def test_readable_token_ignored(self) -> None:
+        """A token others can read is replaced."""
+        with open(self.path, "w") as f:
+            f.write("known")
+        os.chmod(self.path, 0o644)
+        self.assertIsNone(daemon.read_token(self.path))
+        self.assertNotEqual(daemon.ensure_token(self.path), "known")
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+
+    def test_no_token_renders_in_process(self) -> None:
+        """Without a token the client does not contact the daemon."""
+        with mock.patch.object(daemon, "token_path", return_value=self.path):
+            with mock.patch.object(daemon, "_connect") as connect:
+                self.assertIsNone(daemon.forward(["Hi"], "/nonexistent.sock"))
+        connect.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
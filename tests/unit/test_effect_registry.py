@@ -0,0 +1,125 @@
+"""
+Unit tests for the compiled color effect registry.
+
+These tests verify that specs compile to the same output as the effect
+functions, that compiled effects are reused, and that custom effects can
+be registered.
+"""
+
+import unittest
+
+from figlet_forge.color import get_coloring_functions
+from figlet_forge.color.effects import (
+    color_style_apply,
+    gradient_colorize,
+    pulse_colorize,
+)
+from figlet_forge.color.registry import (
+    Effect,
+    EffectRegistry,
+    GradientEffect,
+    SolidEffect,
+)
+from figlet_forge.core.exceptions import InvalidColor
+
+ART = " _  _\n| || |\n|_||_|"
+
+
+class TestCompile(unittest.TestCase):
+    """Test compiling color specs."""
+
+    def setUp(self) -> None:
+        """Create an isolated registry."""
+        self.registry = EffectRegistry()
+
+    def test_predefined_styles(self) -> None:
+        """Styles compile to the output of color_style_apply()."""
+        for name in ("fire", "red_on_black", "rainbow", "rgb"):
+            with self.subTest(name=name):
+                effect = self.registry.compile(name)
+                self.assertEqual(effect(ART), color_style_apply(ART, name))
+
+    def test_spec_forms(self) -> None:
+        """Gradient, pulse and plain color specs are understood."""
+        self.assertEqual(
+            self.registry.compile("red_to_blue")(ART),
+            gradient_colorize(ART, "RED", "BLUE"),
+        )
+        self.assertEqual(
+            self.registry.compile("pulse_CYAN")(ART), pulse_colorize(ART, "CYAN")
+        )
+        solid = self.registry.compile("RED:BLACK")
+        self.assertIsInstance(solid, SolidEffect)
+        code = "\033[31m\033[40m"
+        self.assertEqual(solid("a\n\nb"), f"{code}a\033[0m\n\n{code}b\033[0m")
+
+    def test_compiled_once(self) -> None:
+        """The same spec returns the same effect object."""
+        effect = self.registry.compile("fire")
+        self.assertIs(self.registry.compile("fire"), effect)
+        self.assertIsInstance(effect, GradientEffect)
+
+    def test_invalid(self) -> None:
+        """Invalid specs raise on compile and give None from get()."""
+        with self.assertRaises(InvalidColor):
+            self.registry.compile("red_to_nowhere")
+        self.assertIsNone(self.registry.get("not-a-color"))
+
+    def test_get_coloring_functions(self) -> None:
+        """The module-level lookup returns compiled effects."""
+        effect = get_coloring_functions("ice")
+        self.assertIsInstance(effect, Effect)
+        self.assertIs(get_coloring_functions("ice"), effect)
+
+
+class TestRegister(unittest.TestCase):
+    """Test registering custom effects."""
+
+    def setUp(self) -> None:
+        """Create an isolated registry."""
+        self.registry = EffectRegistry()
+
+    def test_register_function(self) -> None:
+        """Functions can be registered with a decorator."""
+
+        @self.registry.register("House")
+        def house(text: str) -> str:
+            return text.upper()
+
+        self.assertIn("house", self.registry.names())
+        self.assertEqual(self.registry.compile("HOUSE")("abc"), "ABC")
+
+    def test_register_effect_overrides(self) -> None:
+        """A registered effect replaces a built-in and clears compiled specs."""
+        before = self.registry.compile("fire")
+
+        class Marker(Effect):
+            name = "fire"
+
+            def apply(self, text: str) -> str:
+                return f"<{text}>"
+
+        self.registry.register("fire", Marker())
+        self.assertIsNot(self.registry.compile("fire"), before)
+        self.assertEqual(self.registry.compile("fire")("x"), "<x>")
+
+        self.registry.unregister("fire")
+        self.assertNotIn("fire", self.registry.names())
+        self.assertIsNone(self.registry.get("fire"))
+
+    def test_effect_needs_apply(self) -> None:
+        """An effect without apply() fails when it is created."""
+
+        class Incomplete(Effect):
+            name = "incomplete"
+
+        with self.assertRaises(TypeError):
+            Incomplete()  # type: ignore[abstract]
+
+    def test_empty_registry(self) -> None:
+        """Built-in styles are optional."""
+        self.assertEqual(EffectRegistry(builtins=False).names(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
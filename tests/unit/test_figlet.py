@@ -252,6 +252,39 @@ class TestFigletString(unittest.TestCase):
         self.assertEqual(width, 3)  # "ABC" is 3 characters wide
         self.assertEqual(height, 2)  # Two lines: "ABC" and "DEF"
 
+    def test_reverse_and_flip_translate(self) -> None:
+        """Directional characters are mirrored with the compiled tables."""
+        art = FigletString("(/<ab\n[q]")
+        self.assertEqual(art.reverse(), "ba>\\)\n[q]")
+        self.assertEqual(art.flip(), "]b[\n)/>aq")
+
+        class Custom(FigletString):
+            HORIZONTAL_MIRROR_MAP = {"a": "b"}
+
+        self.assertEqual(Custom("a(").reverse(), "(b")
+
+    def test_row_view(self) -> None:
+        """Rows and dimensions are cached and match splitlines()."""
+        text = FigletString("AB\nCDE\n")
+        self.assertEqual(text.rows, ("AB", "CDE"))
+        self.assertIs(text.rows, text.rows)
+        self.assertEqual(text.dimensions, (3, 2))
+
+        built = FigletString.from_rows(["AB", "CDE", ""])
+        self.assertEqual(built, "AB\nCDE\n")
+        self.assertEqual(built.rows, tuple(str.splitlines(built)))
+        self.assertEqual(built.dimensions, (3, 2))
+
+    def test_transforms_keep_row_view(self) -> None:
+        """Transforms build their result from rows without re-splitting it."""
+        centered = self.figlet_string.center(9)
+        self.assertEqual(centered.__dict__.get("_rows"), ("   ABC   ", "   DEF   "))
+        self.assertEqual(centered.dimensions, (9, 2))
+
+        bordered = self.figlet_string.border()
+        self.assertEqual(bordered.dimensions, (7, 4))
+        self.assertEqual(bordered.rows, tuple(str.splitlines(bordered)))
+
     def test_overlay(self) -> None:
         """Test overlay functionality."""
         base = FigletString("XXXXX\nXXXXX\nXXXXX")
@@ -317,5 +350,64 @@ def test_with_fixtures(figlet_factory, test_text: str) -> None:
     assert len(lines) > 0
 
 
+class TestRenderRuns(unittest.TestCase):
+    """Test Figlet.render_runs()."""
+
+    def setUp(self) -> None:
+        """Create a renderer in the slant font."""
+        self.figlet = Figlet(font="slant", width=200)
+
+    def test_single_run_matches_render_text(self) -> None:
+        """One run in the instance's font renders like render_text()."""
+        self.assertEqual(
+            str(self.figlet.render_runs([("Hi", None)])),
+            str(self.figlet.render_text("Hi")),
+        )
+
+    def test_single_run_is_justified_once(self) -> None:
+        """A single run is justified exactly like render_text()."""
+        for justify in ("left", "center", "right"):
+            with self.subTest(justify=justify):
+                figlet = Figlet(font="standard", justify=justify)
+                self.assertEqual(
+                    str(figlet.render_runs(["Hi"])), str(figlet.render_text("Hi"))
+                )
+
+    def test_runs_share_a_baseline(self) -> None:
+        """Runs in fonts of different heights sit on one baseline."""
+        slant = self.figlet.render_text("Ag")
+        mini = Figlet(font="mini", width=200).render_text("Ag")
+        result = self.figlet.render_runs(["Ag", ("Ag", "mini")], gap=1)
+
+        slant_base = self.figlet.font_instance.base_line
+        mini_base = Figlet(font="mini").font_instance.base_line
+        baseline_row = result.rows[slant_base - 1]
+        self.assertTrue(baseline_row.startswith(slant.rows[slant_base - 1]))
+        self.assertTrue(
+            baseline_row.rstrip().endswith(mini.rows[mini_base - 1].rstrip())
+        )
+        self.assertEqual(
+            result.dimensions, (slant.dimensions[0] + 1 + mini.dimensions[0], 6)
+        )
+
+    def test_fonts_are_reused(self) -> None:
+        """Each font, this instance's included, gets one cached renderer."""
+        self.figlet.render_runs([("1", "digital"), ("2", "digital"), ("3", None)])
+        self.figlet.render_runs([("4", "slant")])
+        self.assertEqual(list(self.figlet._run_figlets), ["digital", "slant"])
+
+    def test_right_to_left_reverses_runs(self) -> None:
+        """Right-to-left text places the first run last."""
+        figlet = Figlet(font="mini", width=200, direction="right-to-left")
+        result = figlet.render_runs(["A", "B"])
+        expected = Figlet(font="mini", width=200, direction="right-to-left")
+        self.assertEqual(str(result), str(expected.render_text("AB")))
+
+    def test_empty_runs(self) -> None:
+        """Empty input renders nothing."""
+        self.assertEqual(str(self.figlet.render_runs([])), "")
+        self.assertEqual(str(self.figlet.render_runs([("", "mini")])), "")
+
+
 if __name__ == "__main__":
     unittest.main()
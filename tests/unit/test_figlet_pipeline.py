@@ -0,0 +1,101 @@
+"""
+Unit tests for the fused FigletString transform pipeline.
+
+These tests verify that a pipeline produces exactly what the equivalent
+chain of FigletString transforms produces, and that steps are validated.
+"""
+
+import itertools
+import random
+import unittest
+
+from figlet_forge.core.figlet_pipeline import FigletPipeline
+from figlet_forge.core.figlet_string import FigletString
+from figlet_forge.figlet import Figlet
+
+# Steps as (method name, arguments)
+STEPS = [
+    ("reverse", ()),
+    ("flip", ()),
+    ("border", ("double",)),
+    ("shadow", ()),
+    ("border", ("ascii", 2)),
+]
+
+
+class TestFigletPipeline(unittest.TestCase):
+    """Test FigletString.pipeline()."""
+
+    def setUp(self) -> None:
+        """Render art containing mirrored and flipped characters."""
+        self.art = Figlet(font="slant", width=200).render_text("Hi (<[ q/b ]>)")
+
+    def test_matches_sequential_transforms(self) -> None:
+        """Every chain of up to three steps matches the eager transforms."""
+        for length in range(4):
+            for chain in itertools.product(STEPS, repeat=length):
+                pipeline, expected = self.art.pipeline(), self.art
+                for name, args in chain:
+                    pipeline = getattr(pipeline, name)(*args)
+                    expected = getattr(expected, name)(*args)
+                with self.subTest(chain=[name for name, _ in chain]):
+                    result = pipeline.apply()
+                    self.assertIsInstance(result, FigletString)
+                    self.assertEqual(result, expected)
+                    self.assertEqual(result.dimensions, expected.dimensions)
+                    self.assertEqual(result.rows, tuple(str.splitlines(expected)))
+
+    def test_random_chains(self) -> None:
+        """Random art and chains, blank edge rows included, match eagerly."""
+        rng = random.Random(35)
+        chars = " ab/\\()<>[]qd_|"
+        for _ in range(500):
+            rows = [
+                "".join(rng.choice(chars) for _ in range(rng.randrange(4)))
+                for _ in range(rng.randrange(5))
+            ]
+            art = FigletString("\n".join(rows))
+            chain = [rng.choice(STEPS) for _ in range(rng.randrange(6))]
+            pipeline, expected = art.pipeline(), art
+            for name, args in chain:
+                pipeline = getattr(pipeline, name)(*args)
+                expected = getattr(expected, name)(*args)
+            with self.subTest(art=str(art), chain=[name for name, _ in chain]):
+                result = pipeline.apply()
+                self.assertEqual(result, expected)
+                self.assertEqual(result.rows, expected.rows)
+                self.assertEqual(result.dimensions, expected.dimensions)
+
+    def test_leading_blank_row(self) -> None:
+        """A flipped leading blank row is dropped before a border, as eagerly."""
+        art = FigletString("\n]ab")
+        expected = art.flip().reverse().border()
+        result = art.pipeline().flip().reverse().border().apply()
+        self.assertEqual(result, expected)
+        self.assertEqual(len(result.rows), 3)
+
+    def test_colorize_runs_last(self) -> None:
+        """Color functions see the finished text and end the chain."""
+        pipeline = self.art.pipeline().flip().colorize(str.upper).colorize(repr)
+        self.assertEqual(pipeline.apply(), repr(str(self.art.flip()).upper()))
+        self.assertEqual(pipeline.steps, ("flip", "colorize", "colorize"))
+        with self.assertRaises(ValueError):
+            pipeline.reverse()
+
+    def test_pipeline_is_immutable(self) -> None:
+        """Each step returns a new pipeline; partial chains stay reusable."""
+        base = FigletString("12\n34").pipeline().reverse()
+        flipped = base.flip()
+        self.assertIsInstance(flipped, FigletPipeline)
+        self.assertEqual(base.apply(), "21\n43")
+        self.assertEqual(flipped.apply(), "43\n21")
+        self.assertEqual(FigletString("AB").pipeline().apply(), "AB")
+
+    def test_unknown_border_style(self) -> None:
+        """Unknown border styles are rejected when the step is added."""
+        with self.assertRaises(ValueError):
+            self.art.pipeline().border("wavy")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+"""
+Unit tests for render instrumentation in Figlet Forge.
+
+These tests verify per-phase timing, latency histograms and the
+sink registry used to observe the rendering pipeline.
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from figlet_forge.cli.main import main
+from figlet_forge.figlet import Figlet
+from figlet_forge.render import instrumentation
+from figlet_forge.render.instrumentation import (
+    NULL_TIMER,
+    RENDER_PHASES,
+    LatencyHistogram,
+    PhaseTimer,
+    RenderTiming,
+)
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Test the fixed-bucket latency histogram."""
+
+    def test_observe_and_summary(self) -> None:
+        """Observations update count, sum, max and quantiles."""
+        histogram = LatencyHistogram()
+        for value in (1_000, 2_000, 3_000, 1_000_000):
+            histogram.observe(value)
+
+        self.assertEqual(histogram.count, 4)
+        self.assertEqual(histogram.sum_ns, 1_006_000)
+        self.assertEqual(histogram.max_ns, 1_000_000)
+        self.assertLessEqual(histogram.quantile(0.5), 2_000)
+        self.assertEqual(histogram.quantile(0.99), 1_000_000)
+
+        summary = histogram.as_dict()
+        self.assertEqual(summary["count"], 4)
+        self.assertAlmostEqual(summary["max_ms"], 1.0)
+
+    def test_empty_quantile(self) -> None:
+        """An empty histogram reports zero latency."""
+        self.assertEqual(LatencyHistogram().quantile(0.99), 0)
+
+    def test_merge(self) -> None:
+        """Merging folds counts from another histogram."""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.observe(5_000)
+        second.observe(7_000)
+        first.merge(second)
+        self.assertEqual(first.count, 2)
+        self.assertEqual(first.max_ns, 7_000)
+
+        with self.assertRaises(ValueError):
+            first.merge(LatencyHistogram(bounds=(10,)))
+
+
+class TestPhaseTiming(unittest.TestCase):
+    """Test timers, sinks and engine integration."""
+
+    def tearDown(self) -> None:
+        """Leave instrumentation disabled for other tests."""
+        instrumentation.clear_sinks()
+        instrumentation.disable()
+
+    def test_null_timer_when_disabled(self) -> None:
+        """Disabled instrumentation hands out the shared no-op timer."""
+        instrumentation.disable()
+        self.assertIs(instrumentation.start_timer(), NULL_TIMER)
+        NULL_TIMER.mark("layout")
+        self.assertEqual(NULL_TIMER.phases, {})
+
+    def test_phase_timer_accumulates(self) -> None:
+        """Marking a phase twice accumulates its time."""
+        timer = PhaseTimer()
+        timer.mark("layout")
+        timer.mark("layout")
+        self.assertEqual(list(timer.phases), ["layout"])
+        self.assertGreaterEqual(timer.total_ns(), timer.phases["layout"])
+
+    def test_sink_receives_render_phases(self) -> None:
+        """A registered sink receives one timing per render."""
+        received = []
+        instrumentation.add_sink(received.append)
+
+        fig = Figlet(font="standard")
+        fig.render_text("Hi")
+
+        self.assertEqual(len(received), 1)
+        timing = received[0]
+        self.assertIsInstance(timing, RenderTiming)
+        self.assertEqual(timing.chars, 2)
+        self.assertEqual(timing.font, "standard")
+        for phase in ("preprocess", "glyph_lookup", "layout", "justify"):
+            self.assertIn(phase, timing.phases)
+            self.assertIn(phase, RENDER_PHASES)
+        self.assertGreaterEqual(timing.total_ns, sum(timing.phases.values()))
+
+        phase_metrics = fig._engine.get_phase_metrics()
+        self.assertEqual(phase_metrics["total"]["count"], 1)
+
+    def test_failing_sink_is_isolated(self) -> None:
+        """Sink errors never break rendering."""
+
+        def broken_sink(timing: RenderTiming) -> None:
+            raise RuntimeError("boom")
+
+        instrumentation.add_sink(broken_sink)
+        self.assertTrue(Figlet().render_text("ok").strip())
+
+    def test_timed_phase_joins_render(self) -> None:
+        """Work after a render is added to that render's record."""
+        received = []
+        instrumentation.add_sink(received.append)
+        histograms = {}
+
+        with instrumentation.render_scope():
+            Figlet(font="standard").render_text("Hi")
+            with instrumentation.timed_phase("transforms", histograms):
+                pass
+            self.assertEqual(received, [])
+
+        self.assertEqual(len(received), 1)
+        timing = received[0]
+        self.assertEqual(timing.chars, 2)
+        self.assertIn("transforms", timing.phases)
+        self.assertGreaterEqual(timing.total_ns, sum(timing.phases.values()))
+        self.assertEqual(histograms["transforms"].count, 1)
+
+    def test_timed_phase_alone_is_not_a_render(self) -> None:
+        """A phase with no render before it is never sent to sinks."""
+        received = []
+        instrumentation.add_sink(received.append)
+        histograms = {}
+
+        with instrumentation.timed_phase("transforms", histograms):
+            pass
+        with instrumentation.render_scope():
+            with instrumentation.timed_phase("transforms", histograms):
+                pass
+
+        self.assertEqual(received, [])
+        self.assertEqual(histograms["transforms"].count, 2)
+
+    def test_cli_reports_one_render(self) -> None:
+        """A CLI render with transforms is a single record."""
+        received = []
+        instrumentation.add_sink(received.append)
+
+        with redirect_stdout(io.StringIO()):
+            main(["-f", "small", "-r", "Hi"], use_daemon=False)
+
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0].font, "small")
+        self.assertIn("transforms", received[0].phases)
+
+    def test_rendering_time_counted_once(self) -> None:
+        """Cumulative rendering time matches the measured render."""
+        fig = Figlet(font="standard")
+        fig.render_text("Hello")
+        metrics = fig._engine.get_metrics()
+        self.assertEqual(metrics["renders"], 1)
+        self.assertGreater(metrics["rendering_time_ms"], 0.0)
+        # Phase histograms stay empty while instrumentation is off
+        self.assertEqual(fig._engine.get_phase_metrics(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Unit tests for the grid layout renderer.
+
+These tests verify column widths, horizontal and baseline alignment,
+rendering each distinct cell once and parallel rendering.
+"""
+
+import unittest
+from unittest import mock
+
+from figlet_forge import layout
+from figlet_forge.core.figlet_font import FigletFont
+from figlet_forge.core.figlet_string import FigletString
+from figlet_forge.figlet import Figlet
+from figlet_forge.layout import Cell, grid, render_cells
+
+
+class TestGrid(unittest.TestCase):
+    """Test grid()."""
+
+    def test_prerendered_cells(self) -> None:
+        """Columns are as wide as their widest cell, joined by the gutter."""
+        items = [FigletString("a"), FigletString("bbb"), FigletString("cc")]
+        result = grid(items, columns=2, gutter=1, valign="top")
+        self.assertEqual(result.rows, ("a  bbb", "cc    "))
+        self.assertEqual(result.dimensions, (6, 2))
+
+    def test_horizontal_alignment(self) -> None:
+        """Cells are padded inside their column."""
+        items = [FigletString("a"), FigletString("ccc")]
+        self.assertEqual(grid(items, columns=1, align="right").rows, ("  a", "ccc"))
+        self.assertEqual(grid(items, columns=1, align="center").rows, (" a ", "ccc"))
+
+    def test_vertical_alignment(self) -> None:
+        """Shorter cells are placed at the top, center or bottom."""
+        items = [FigletString("x\ny\nz"), FigletString("a")]
+        expected = {
+            "top": ("x a", "y  ", "z  "),
+            "center": ("x  ", "y a", "z  "),
+            "bottom": ("x  ", "y  ", "z a"),
+        }
+        for valign, rows in expected.items():
+            with self.subTest(valign=valign):
+                self.assertEqual(grid(items, gutter=1, valign=valign).rows, rows)
+
+    def test_baseline_alignment(self) -> None:
+        """Cells in fonts of different heights share a baseline row."""
+        result = grid([Cell("Ag", "small"), Cell("Ag", "mini")], gutter=1)
+        small = Figlet(font="small", width=200).render_text("Ag")
+        mini = Figlet(font="mini", width=200).render_text("Ag")
+        small_base = FigletFont.load_cached("small").base_line
+        mini_base = FigletFont.load_cached("mini").base_line
+        row = result.rows[small_base - 1]
+        self.assertTrue(row.startswith(small.rows[small_base - 1]))
+        self.assertTrue(row.rstrip().endswith(mini.rows[mini_base - 1].rstrip()))
+        self.assertEqual(result.dimensions[1], small.dimensions[1])
+
+    def test_row_gap_and_short_last_row(self) -> None:
+        """Grid rows are separated and a short last row keeps the full width."""
+        items = [FigletString("a"), FigletString("b"), FigletString("c")]
+        result = grid(items, columns=2, gutter=1, row_gap=1)
+        self.assertEqual(result.rows, ("a b", "   ", "c  "))
+
+    def test_empty_and_invalid(self) -> None:
+        """No items give empty art; bad arguments raise ValueError."""
+        self.assertEqual(str(grid([])), "")
+        for kwargs in ({"columns": 0}, {"align": "top"}, {"valign": "left"}):
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    grid(["a"], **kwargs)
+
+
+class TestRenderCells(unittest.TestCase):
+    """Test render_cells()."""
+
+    def test_distinct_cells_rendered_once(self) -> None:
+        """Repeated (text, font) pairs share one rendering."""
+        with mock.patch.object(
+            layout, "_render_spec", wraps=layout._render_spec
+        ) as render:
+            cells = render_cells(["OK", Cell("OK"), Cell("OK", "mini")])
+        self.assertEqual(render.call_count, 2)
+        self.assertIs(cells[0].art, cells[1].art)
+
+    def test_parallel_matches_serial(self) -> None:
+        """A worker pool renders the same cells."""
+        items = [Cell(str(i), "mini") for i in range(6)]
+        serial = grid(items, columns=3)
+        with mock.patch.object(layout, "MIN_PARALLEL_CELLS", 2):
+            parallel = grid(items, columns=3, jobs=2)
+        self.assertEqual(str(parallel), str(serial))
+
+
+if __name__ == "__main__":
+    unittest.main()
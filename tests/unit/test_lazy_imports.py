@@ -0,0 +1,138 @@
+"""
+Unit tests for lazy imports in Figlet Forge.
+
+These tests verify that importing the package and the CLI entry point
+does not load optional machinery, that lazily exported names still
+resolve, and that start-up stays within the import-time budget.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import figlet_forge
+from figlet_forge.bench.importtime import (
+    DEFAULT_IMPORT_BUDGET_MS,
+    measure_import,
+    parse_importtime,
+)
+
+SRC_DIR = os.path.dirname(os.path.dirname(figlet_forge.__file__))
+
+# Modules a plain render must not import
+OPTIONAL_MODULES = (
+    "figlet_forge.cli.sample",
+    "figlet_forge.cli.showcase",
+    "figlet_forge.color.effects",
+    "http.server",
+)
+
+
+def _modules_after(statement: str) -> set:
+    """Run a statement in a fresh interpreter and return sys.modules keys."""
+    code = f"import json, sys\n{statement}\nprint(json.dumps(sorted(sys.modules)))"
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    ).stdout
+    return set(json.loads(output.splitlines()[-1]))
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test what gets imported, and when."""
+
+    def test_package_import_is_minimal(self) -> None:
+        """Importing the package loads only version information."""
+        modules = _modules_after("import figlet_forge")
+        self.assertNotIn("figlet_forge.figlet", modules)
+        self.assertNotIn("figlet_forge.color", modules)
+        for name in OPTIONAL_MODULES:
+            self.assertNotIn(name, modules)
+
+    def test_plain_render_skips_optional_modules(self) -> None:
+        """A CLI render without color or showcase options stays lean."""
+        modules = _modules_after(
+            "from figlet_forge.cli import main\nmain(['--width', '80', 'Hi'])"
+        )
+        self.assertIn("figlet_forge.figlet", modules)
+        for name in OPTIONAL_MODULES:
+            self.assertNotIn(name, modules)
+
+    def test_cli_entry_defers_rendering(self) -> None:
+        """The CLI module can forward to a daemon without the render stack."""
+        modules = _modules_after("import figlet_forge.cli.main")
+        self.assertNotIn("figlet_forge.figlet", modules)
+        self.assertNotIn("figlet_forge.render.figlet_engine", modules)
+        self.assertNotIn("figlet_forge.core.figlet_font", modules)
+
+    def test_lazy_names_resolve(self) -> None:
+        """Public names are available on first access and listed by dir()."""
+        from figlet_forge.figlet import Figlet
+
+        self.assertIs(figlet_forge.Figlet, Figlet)
+        self.assertIn("Figlet", dir(figlet_forge))
+        self.assertIn("RenderEngine", dir(figlet_forge))
+        for name in figlet_forge.__all__:
+            self.assertTrue(hasattr(figlet_forge, name), name)
+        with self.assertRaises(AttributeError):
+            figlet_forge.NoSuchThing  # noqa: B018
+
+    def test_color_effects_resolve(self) -> None:
+        """Color effects remain importable from the color package."""
+        from figlet_forge.color import effects, rainbow_colorize
+
+        self.assertIs(rainbow_colorize, effects.rainbow_colorize)
+
+    def test_no_root_logging_configuration(self) -> None:
+        """Importing the package leaves the root logger untouched."""
+        code = (
+            "import logging, figlet_forge\n"
+            "print(len(logging.getLogger().handlers))"
+        )
+        env = dict(os.environ, PYTHONPATH=SRC_DIR)
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        ).stdout
+        self.assertEqual(output.strip(), "0")
+
+
+class TestImportTime(unittest.TestCase):
+    """Test the -X importtime benchmark."""
+
+    def test_parse_importtime(self) -> None:
+        """Nested and repeated entries keep the largest figures."""
+        output = "\n".join(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:       100 |        100 |     pkg.sub",
+                "import time:        20 |        120 |   pkg",
+                "import time:         5 |        125 | pkg.sub",
+                "unrelated line",
+            ]
+        )
+        timings = parse_importtime(output)
+        self.assertEqual(timings["pkg"], (20, 120))
+        self.assertEqual(timings["pkg.sub"], (100, 125))
+
+    def test_package_import_within_budget(self) -> None:
+        """Importing the package stays within the default budget."""
+        timing = measure_import("figlet_forge", runs=3)
+        self.assertGreater(timing.total_us, 0)
+        self.assertTrue(
+            timing.within(DEFAULT_IMPORT_BUDGET_MS),
+            f"import figlet_forge took {timing.total_ms:.1f} ms",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
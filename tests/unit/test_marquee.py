@@ -0,0 +1,157 @@
+"""
+Unit tests for scrolling marquees.
+
+These tests verify that frames are windows into the rendered strip, that
+wrapping and scrolling through behave at the edges, and that colored
+frames keep each cell's style without rendering or parsing colors again.
+"""
+
+import re
+import unittest
+from itertools import islice
+from unittest.mock import patch
+
+from figlet_forge import Figlet
+from figlet_forge.color.depth import ANSI_256, NO_COLOR, TRUECOLOR
+from figlet_forge.color.figlet_color import InvalidColor
+from figlet_forge.color.registry import compile_effect
+from figlet_forge.color.styled import Style, StyledArt
+from figlet_forge.render.marquee import DEFAULT_GAP, Marquee
+from figlet_forge.version import RESET_COLORS
+
+ART = " _  _\n| || |\n|_||_|"
+
+
+class TestPlainFrames(unittest.TestCase):
+    """Test the characters of each frame."""
+
+    def test_wrap(self) -> None:
+        """Frames slide along the text and come round after the gap."""
+        marquee = Marquee(ART, 4, gap=2)
+        self.assertEqual(len(marquee), 8)
+        self.assertEqual(marquee.frame(0).rows, (" _  ", "| ||", "|_||"))
+        self.assertEqual(marquee.frame(3).rows, (" _  ", "| | ", "|_| "))
+        # The end of the text, the gap and the start again
+        self.assertEqual(marquee.frame(5).rows, ("    ", "|  |", "|  |"))
+        self.assertEqual(marquee.frame(8), marquee.frame(0))
+
+    def test_viewport_wider_than_text(self) -> None:
+        """The text repeats as often as the viewport needs."""
+        marquee = Marquee("ab", 7, gap=1)
+        self.assertEqual(marquee.frame(0), "ab ab a")
+        self.assertEqual(marquee.frame(2), " ab ab ")
+
+    def test_scroll_through(self) -> None:
+        """Without wrapping the text enters on the right and leaves."""
+        marquee = Marquee(ART, 3, wrap=False)
+        frames = list(marquee)
+        self.assertEqual(len(frames), 6 + 3 + 1)
+        self.assertEqual(frames[0].rows, ("   ",) * 3)
+        self.assertEqual(frames[1].rows, ("   ", "  |", "  |"))
+        self.assertEqual(frames[-1].rows, ("   ",) * 3)
+        for frame in frames:
+            self.assertEqual(frame.dimensions, (3, 3))
+
+    def test_step_and_loops(self) -> None:
+        """Steps skip columns and loops repeat the pass."""
+        marquee = Marquee(ART, 4, gap=2, step=3)
+        self.assertEqual(len(marquee), 3)
+        frames = list(marquee.frames(loops=2))
+        self.assertEqual(frames[1], marquee.frame(3))
+        self.assertEqual(frames[3:], frames[:3])
+        self.assertEqual(len(list(islice(marquee.frames(loops=None), 50))), 50)
+
+    def test_invalid(self) -> None:
+        """Empty viewports, negative gaps and zero steps are rejected."""
+        for kwargs in ({"viewport_width": 0}, {"gap": -1}, {"step": 0}):
+            with self.subTest(**kwargs):
+                options = {"viewport_width": 4, **kwargs}
+                with self.assertRaises(ValueError):
+                    Marquee(ART, **options)
+
+
+class TestColoredFrames(unittest.TestCase):
+    """Test frames cut from styled art."""
+
+    def setUp(self) -> None:
+        """Style the middle of the art with one color per row."""
+        self.art = StyledArt(ART)
+        for row, rgb in enumerate(((255, 0, 0), (0, 255, 0), (0, 0, 255))):
+            self.art.set_styles(row, [Style(rgb)] * 4, start=1)
+
+    def test_cells_keep_styles(self) -> None:
+        """Every visible cell of a frame has its style in the art."""
+        marquee = Marquee(self.art, 5, gap=3)
+        width = self.art.dimensions[0] + 3
+        for offset in range(len(marquee)):
+            frame = StyledArt.from_ansi(marquee.frame(offset))
+            self.assertEqual(frame.plain(), Marquee(ART, 5, gap=3).frame(offset))
+            for y, row in enumerate(frame.rows):
+                for x, char in enumerate(row):
+                    if char != " ":
+                        expected = self.art.style_at((offset + x) % width, y)
+                        self.assertEqual(frame.style_at(x, y), expected)
+
+    def test_escapes_only_at_changes(self) -> None:
+        """Each row switches style once per run and ends reset."""
+        frame = Marquee(self.art, 6, gap=0).frame(1)
+        red = "\033[38;2;255;0;0m"
+        self.assertEqual(frame.rows[0], red + "_  _" + RESET_COLORS + "  ")
+        self.assertEqual(frame.dimensions, (6, 3))
+
+    def test_depth(self) -> None:
+        """Escapes are written at the marquee's depth."""
+        frame = Marquee(self.art, 6, depth=ANSI_256).frame(0)
+        self.assertIn("\033[38;5;196m", frame)
+        plain = Marquee(self.art, 6, depth=NO_COLOR).frame(0)
+        self.assertEqual(plain.rows[0], " _  _ ")
+
+
+class TestFigletMarquee(unittest.TestCase):
+    """Test Figlet.marquee()."""
+
+    def setUp(self) -> None:
+        """Create a renderer."""
+        self.figlet = Figlet(font="standard", justify="center")
+
+    def test_frames_slice_the_strip(self) -> None:
+        """Frames are windows into one unjustified render of the text."""
+        strip = Figlet(font="standard").render_text("Hi there")
+        width = strip.dimensions[0] + DEFAULT_GAP
+        frames = list(self.figlet.marquee("Hi\nthere", 30))
+        self.assertEqual(len(frames), width)
+        for offset, frame in enumerate(frames):
+            for row, line in zip(frame.rows, strip.rows):
+                padded = line.ljust(width) * 2
+                self.assertEqual(row, padded[offset : offset + 30])
+
+    def test_colored_frames_need_no_work(self) -> None:
+        """Producing a frame neither renders nor parses colors."""
+        frames = self.figlet.marquee("Hi", 12, color="red_to_blue", loops=None)
+        with patch.object(Figlet, "render_text", side_effect=AssertionError), patch(
+            "figlet_forge.color.styled._apply_sgr", side_effect=AssertionError
+        ), patch.object(Style, "escape", side_effect=AssertionError):
+            colored = list(islice(frames, 40))
+        self.assertIn("\033[38;2;", colored[0])
+
+    def test_matches_cli_colors(self) -> None:
+        """Frames use the escapes the effect writes at the same depth."""
+        for color, depth in (("red", None), ("rainbow", None), ("red_to_blue", 16)):
+            with self.subTest(color=color, depth=depth):
+                frame = next(self.figlet.marquee("Hi", 40, color=color, depth=depth))
+                effect = compile_effect(color, TRUECOLOR if depth is None else depth)
+                colored = effect(Figlet(font="standard").render_text("Hi"))
+                escapes = set(re.findall(r"\033\[[0-9;]*m", colored))
+                self.assertTrue(set(re.findall(r"\033\[[0-9;]*m", frame)) <= escapes)
+        frame = next(self.figlet.marquee("Hi", 12, color="red"))
+        self.assertIn("\033[31m", frame)
+        self.assertNotIn("\033[38;2;", frame)
+
+    def test_invalid_color(self) -> None:
+        """Invalid color specs fail before the first frame."""
+        with self.assertRaises(InvalidColor):
+            self.figlet.marquee("Hi", 12, color="NOT_A_COLOR")
+
+
+if __name__ == "__main__":
+    unittest.main()
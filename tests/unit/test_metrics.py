@@ -0,0 +1,168 @@
+"""
+Unit tests for the process-wide metrics registry in Figlet Forge.
+
+These tests verify counters, histograms, the Prometheus and JSON
+exporters, the HTTP handler and the shared font cache accounting.
+"""
+
+import json
+import unittest
+import urllib.request
+from functools import lru_cache
+
+from figlet_forge.color.figlet_color import _process_color_part, resolve_color
+from figlet_forge.core.figlet_font import FigletFont
+from figlet_forge.figlet import Figlet
+from figlet_forge.metrics import REGISTRY, MetricsRegistry, serve_metrics
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test a standalone registry."""
+
+    def setUp(self) -> None:
+        """Create a fresh registry with one metric of each kind."""
+        self.registry = MetricsRegistry()
+        self.registry.describe("renders", "counter", "Render calls")
+        self.registry.describe("render_latency", "histogram", "Render latency")
+
+    def test_counters_with_labels(self) -> None:
+        """Labelled series are tracked independently."""
+        self.registry.inc("cache_hits", cache="font")
+        self.registry.inc("cache_hits", 2, cache="font")
+        self.registry.inc("cache_hits", cache="color")
+        self.assertEqual(self.registry.get("cache_hits", cache="font"), 3)
+        self.assertEqual(self.registry.get("cache_hits", cache="color"), 1)
+        self.assertEqual(self.registry.get("cache_hits", cache="render"), 0)
+
+    def test_prometheus_exposition(self) -> None:
+        """Exports follow the Prometheus text format conventions."""
+        self.registry.inc("renders")
+        self.registry.inc("errors", kind='Bad"Kind')
+        self.registry.observe_ns("render_latency", 1_500_000)
+        text = self.registry.to_prometheus()
+
+        self.assertIn("# TYPE figlet_forge_renders_total counter", text)
+        self.assertIn("figlet_forge_renders_total 1\n", text)
+        self.assertIn('figlet_forge_errors_total{kind="Bad\\"Kind"} 1', text)
+        self.assertIn("# TYPE figlet_forge_render_latency_seconds histogram", text)
+        self.assertIn('figlet_forge_render_latency_seconds_bucket{le="+Inf"} 1', text)
+        self.assertIn("figlet_forge_render_latency_seconds_count 1", text)
+        self.assertTrue(text.endswith("\n"))
+
+    def test_exact_values(self) -> None:
+        """Counters, bucket bounds and sums are exported without rounding."""
+        self.registry.inc("renders", 1234567)
+        self.registry.inc("chars", 0.5)
+        self.registry.observe_ns("render_latency", 1_234_567_891)
+        text = self.registry.to_prometheus()
+
+        self.assertIn("figlet_forge_renders_total 1234567\n", text)
+        self.assertIn("figlet_forge_chars_total 0.5\n", text)
+        self.assertIn('_bucket{le="1.048576"} 0\n', text)
+        self.assertIn('_bucket{le="4.194304"} 1\n', text)
+        self.assertIn("figlet_forge_render_latency_seconds_sum 1.234567891\n", text)
+
+    def test_declared_metrics_export_zero(self) -> None:
+        """Described counters appear even before first use."""
+        self.assertIn("figlet_forge_renders_total 0", self.registry.to_prometheus())
+
+    def test_json_snapshot(self) -> None:
+        """The JSON snapshot round-trips through json.loads."""
+        self.registry.inc("renders", 3)
+        self.registry.observe_ns("render_latency", 2_000)
+        snapshot = json.loads(self.registry.to_json())
+        self.assertEqual(snapshot["counters"]["renders"][0]["value"], 3)
+        self.assertEqual(snapshot["histograms"]["render_latency"][0]["count"], 1)
+
+    def test_reset(self) -> None:
+        """Reset clears values but keeps declarations."""
+        self.registry.inc("renders")
+        self.registry.reset()
+        self.assertEqual(self.registry.get("renders"), 0)
+        self.assertIn("figlet_forge_renders_total 0", self.registry.to_prometheus())
+
+    def test_tracked_cache(self) -> None:
+        """lru_cache statistics are counted when the registry is read."""
+
+        @lru_cache(maxsize=None)
+        def square(value: int) -> int:
+            return value * value
+
+        square(1)
+        self.registry.track_cache("square", square.cache_info)
+        for value in (2, 2, 2):
+            square(value)
+        self.assertEqual(self.registry.get("cache_hits", cache="square"), 2)
+        self.assertEqual(self.registry.get("cache_misses", cache="square"), 1)
+
+        # Clearing the cache restarts its statistics, not the counters
+        square.cache_clear()
+        square(3)
+        self.assertEqual(self.registry.get("cache_misses", cache="square"), 2)
+        self.assertIn(
+            'figlet_forge_cache_hits_total{cache="square"} 2',
+            self.registry.to_prometheus(),
+        )
+
+    def test_unknown_kind(self) -> None:
+        """Only counters and histograms can be declared."""
+        with self.assertRaises(ValueError):
+            self.registry.describe("x", "gauge", "unsupported")
+
+
+class TestGlobalRegistry(unittest.TestCase):
+    """Test that rendering feeds the process-wide registry."""
+
+    def test_render_and_font_cache_metrics(self) -> None:
+        """Renders, characters and font cache lookups are counted."""
+        FigletFont.clear_cache()
+        REGISTRY.reset()
+
+        Figlet(font="small").render_text("abc")
+        Figlet(font="small").render_text("de")
+
+        self.assertEqual(REGISTRY.get("renders"), 2)
+        self.assertEqual(REGISTRY.get("chars_processed"), 5)
+        self.assertEqual(REGISTRY.get("cache_misses", cache="font"), 1)
+        self.assertEqual(REGISTRY.get("cache_hits", cache="font"), 1)
+        self.assertEqual(REGISTRY.get("font_loads"), 1)
+        self.assertEqual(REGISTRY.get_histogram("render_latency").count, 2)
+        self.assertIn("small", FigletFont.cached_fonts())
+
+    def test_color_cache_metrics(self) -> None:
+        """Color resolver lookups are counted as color cache lookups."""
+        resolve_color.cache_clear()
+        _process_color_part.cache_clear()
+        REGISTRY.reset()
+
+        for _ in range(3):
+            resolve_color("0;1;2:BLUE")
+
+        # One resolved spec and its two parts
+
+        self.assertEqual(REGISTRY.get("cache_misses", cache="color"), 3)
+        self.assertEqual(REGISTRY.get("cache_hits", cache="color"), 2)
+
+    def test_cached_font_is_shared(self) -> None:
+        """Figlet instances share one parsed font per name."""
+        first = Figlet(font="mini")
+        second = Figlet(font="mini")
+        self.assertIs(first.Font, second.Font)
+
+    def test_http_handler(self) -> None:
+        """The metrics server serves both export formats."""
+        server = serve_metrics(port=0)
+        try:
+            base = f"http://127.0.0.1:{server.server_address[1]}"
+            with urllib.request.urlopen(f"{base}/metrics") as response:
+                self.assertIn("text/plain", response.headers["Content-Type"])
+                self.assertIn(b"figlet_forge_renders_total", response.read())
+            with urllib.request.urlopen(f"{base}/metrics.json") as response:
+                self.assertIn("counters", json.loads(response.read()))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Unit tests for perceptual color quantization.
+
+These tests verify the CIELAB conversion, that the lookup tables pick the
+perceptually nearest palette color, and that cube cells are filled lazily.
+"""
+
+import random
+import unittest
+
+from figlet_forge.color import quantize
+from figlet_forge.color.quantize import (
+    ANSI_16_RGB,
+    ansi256_to_16,
+    ansi256_to_rgb,
+    color_distance,
+    rgb_to_16,
+    rgb_to_256,
+    rgb_to_lab,
+)
+
+
+class TestLab(unittest.TestCase):
+    """Test the CIELAB conversion."""
+
+    def test_reference_colors(self) -> None:
+        """Black, white and red convert to their known CIELAB values."""
+        self.assertEqual(rgb_to_lab((0, 0, 0)), (0.0, 0.0, 0.0))
+        lightness, a, b = rgb_to_lab((255, 255, 255))
+        self.assertAlmostEqual(lightness, 100.0, places=2)
+        self.assertAlmostEqual(a, 0.0, places=2)
+        self.assertAlmostEqual(b, 0.0, places=2)
+        lightness, a, b = rgb_to_lab((255, 0, 0))
+        self.assertAlmostEqual(lightness, 53.24, places=1)
+        self.assertAlmostEqual(a, 80.09, places=1)
+        self.assertAlmostEqual(b, 67.20, places=1)
+
+    def test_distance(self) -> None:
+        """Equal colors have no distance; the metric is symmetric."""
+        self.assertEqual(color_distance((10, 20, 30), (10, 20, 30)), 0)
+        self.assertEqual(
+            color_distance((255, 0, 0), (0, 0, 255)),
+            color_distance((0, 0, 255), (255, 0, 0)),
+        )
+
+
+class TestTables(unittest.TestCase):
+    """Test the lookup tables."""
+
+    def test_palette(self) -> None:
+        """Palette indices convert back to xterm's colors."""
+        self.assertEqual(ansi256_to_rgb(9), (255, 0, 0))
+        self.assertEqual(ansi256_to_rgb(16), (0, 0, 0))
+        self.assertEqual(ansi256_to_rgb(67), (95, 135, 175))
+        self.assertEqual(ansi256_to_rgb(255), (238, 238, 238))
+
+    def test_palette_colors_map_to_themselves(self) -> None:
+        """Colors of the cube, the ramp and the basic set are exact."""
+        for index in (16, 21, 46, 67, 196, 208, 231):
+            self.assertEqual(rgb_to_256(ansi256_to_rgb(index)), index)
+        for index, rgb in enumerate(ANSI_16_RGB):
+            self.assertEqual(rgb_to_16(rgb), index)
+            self.assertEqual(ansi256_to_16(index), index)
+
+    def test_nearest_is_perceptual(self) -> None:
+        """Table entries are the nearest candidate of their cell."""
+        rng = random.Random(7)
+        for _ in range(200):
+            rgb = tuple(rng.randrange(256) for _ in range(3))
+            cell_color = quantize._cell_color(quantize._cell(rgb))
+            best = min(
+                range(16, 256),
+                key=lambda i: color_distance(cell_color, ansi256_to_rgb(i)),
+            )
+            self.assertEqual(
+                color_distance(cell_color, ansi256_to_rgb(rgb_to_256(rgb))),
+                color_distance(cell_color, ansi256_to_rgb(best)),
+            )
+
+    def test_256_to_16(self) -> None:
+        """Dark cube and ramp colors map to black, bright ones to white."""
+        self.assertEqual(ansi256_to_16(16), 0)
+        self.assertEqual(ansi256_to_16(232), 0)
+        self.assertEqual(ansi256_to_16(231), 15)
+        self.assertEqual(ansi256_to_16(196), 9)
+
+    def test_cells_fill_lazily(self) -> None:
+        """Only converted colors are searched and stored."""
+        cell = quantize._cell((1, 2, 250))
+        quantize._rgb_to_256_cube[cell] = quantize._UNSET_256
+        index = rgb_to_256((1, 2, 250))
+        self.assertEqual(quantize._rgb_to_256_cube[cell], index)
+        self.assertEqual(rgb_to_256((3, 4, 252)), index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+"""
+Unit tests for the Figlet Forge HTTP render server.
+
+These tests drive the WSGI application through the standard library's
+wsgiref helpers and the ASGI application with a minimal event loop harness.
+"""
+
+import asyncio
+import json
+import unittest
+from typing import Any, Dict, List, Optional, Tuple
+from unittest import mock
+from wsgiref.util import setup_testing_defaults
+from wsgiref.validate import validator
+
+from figlet_forge.metrics import REGISTRY
+from figlet_forge.server import RenderService, create_app
+from figlet_forge.server import asgi
+
+
+def _call(
+    app: Any, query: str, method: str = "GET", path: str = "/render", **headers: str
+) -> Tuple[str, Dict[str, str], bytes]:
+    """Call a WSGI application and return (status, headers, body)."""
+    environ: Dict[str, Any] = {
+        "REQUEST_METHOD": method,
+        "SCRIPT_NAME": "",
+        "PATH_INFO": path,
+        "QUERY_STRING": query,
+    }
+    for name, value in headers.items():
+        environ["HTTP_" + name.upper()] = value
+    setup_testing_defaults(environ)
+
+    captured: Dict[str, Any] = {}
+
+    def start_response(
+        status: str, response_headers: List[Tuple[str, str]], exc_info: Any = None
+    ) -> Any:
+        captured["status"] = status
+        captured["headers"] = dict(response_headers)
+        return lambda data: None
+
+    result = validator(app)(environ, start_response)
+    try:
+        body = b"".join(result)
+    finally:
+        result.close()
+    return captured["status"], captured["headers"], body
+
+
+class TestWSGIApp(unittest.TestCase):
+    """Test the WSGI render endpoint."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create one service shared by the tests."""
+        cls.service = RenderService(max_text_length=50, max_output_bytes=2000)
+
+    def setUp(self) -> None:
+        """Start each test with an empty response cache."""
+        self.service.clear_cache()
+        self.app = create_app(self.service)
+
+    def test_render_text(self) -> None:
+        """Plain text renders with a strong ETag."""
+        status, headers, body = _call(self.app, "text=Hi&font=standard")
+        self.assertEqual(status, "200 OK")
+        self.assertTrue(headers["Content-Type"].startswith("text/plain"))
+        self.assertTrue(headers["ETag"].startswith('"'))
+        self.assertIn("_", body.decode("utf-8"))
+
+    def test_if_none_match_skips_rendering(self) -> None:
+        """A matching If-None-Match is answered with 304 without rendering."""
+        _, headers, _ = _call(self.app, "text=Hi")
+        etag = headers["ETag"]
+        with mock.patch.object(self.service, "render") as render:
+            status, headers304, body = _call(
+                self.app, "text=Hi", IF_NONE_MATCH=f'"other", {etag}'
+            )
+        render.assert_not_called()
+        self.assertEqual(status, "304 Not Modified")
+        self.assertEqual(headers304["ETag"], etag)
+        self.assertEqual(body, b"")
+
+    def test_if_none_match_wildcard(self) -> None:
+        """"*" matches a request that renders, but not one that fails."""
+        status, _, _ = _call(self.app, "text=Hi&color=bogus", IF_NONE_MATCH="*")
+        self.assertEqual(status, "400 Bad Request")
+        status, headers, body = _call(self.app, "text=Hi", IF_NONE_MATCH="*")
+        self.assertEqual(status, "304 Not Modified")
+        self.assertEqual(headers["ETag"], _call(self.app, "text=Hi")[1]["ETag"])
+        self.assertEqual(body, b"")
+
+    def test_cache_hit(self) -> None:
+        """Repeated requests are served from the response cache."""
+        hits = REGISTRY.get("cache_hits", cache="render")
+        first = _call(self.app, "text=Cache&format=json")
+        with mock.patch.object(self.service, "render") as render:
+            second = _call(self.app, "text=Cache&format=json")
+        render.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual(REGISTRY.get("cache_hits", cache="render"), hits + 1)
+
+    def test_formats(self) -> None:
+        """JSON, HTML and SVG outputs are produced with matching types."""
+        _, headers, body = _call(self.app, "text=Hi&format=json")
+        data = json.loads(body)
+        self.assertEqual(headers["Content-Type"], "application/json")
+        self.assertEqual(data["font"], "standard")
+        self.assertEqual(data["height"], len(data["output"].splitlines()))
+
+        _, headers, body = _call(self.app, "text=Hi&format=html&color=red")
+        self.assertTrue(headers["Content-Type"].startswith("text/html"))
+        self.assertIn(b"color: #ff0000", body)
+
+        _, headers, body = _call(self.app, "text=Hi&format=svg")
+        self.assertEqual(headers["Content-Type"], "image/svg+xml")
+        self.assertIn(b"<svg", body)
+
+    def test_colored_text(self) -> None:
+        """Text output carries ANSI color codes."""
+        _, _, body = _call(self.app, "text=Hi&color=red")
+        self.assertIn(b"\x1b[", body)
+
+    def test_random_color_is_not_cached(self) -> None:
+        """Non-deterministic colors get no ETag."""
+        status, headers, _ = _call(self.app, "text=Hi&color=rainbow")
+        self.assertEqual(status, "200 OK")
+        self.assertIn("ETag", headers)
+        params = self.service.parse_params("text=Hi&color=random")
+        self.assertFalse(params.cacheable)
+
+    def test_errors(self) -> None:
+        """Bad requests get the appropriate status codes."""
+        cases = [
+            ("text=", "400 Bad Request"),
+            ("text=Hi&font=../../etc/passwd", "400 Bad Request"),
+            ("text=Hi&format=pdf", "400 Bad Request"),
+            ("text=Hi&width=0", "400 Bad Request"),
+            ("text=Hi&color=not_a_color", "400 Bad Request"),
+            ("text=Hi&format=svg&color=rainbow", "400 Bad Request"),
+            ("text=Hi&format=html&color=not_a_color", "400 Bad Request"),
+            ("text=" + "x" * 51, "413 Payload Too Large"),
+            ("text=" + "W" * 50 + "&width=1000&format=svg", "413 Payload Too Large"),
+        ]
+        for query, expected in cases:
+            with self.subTest(query=query):
+                status, _, _ = _call(self.app, query)
+                self.assertEqual(status, expected)
+
+        self.assertEqual(_call(self.app, "", path="/other")[0], "404 Not Found")
+        status, headers, _ = _call(self.app, "text=Hi", method="POST")
+        self.assertEqual(status, "405 Method Not Allowed")
+        self.assertEqual(headers["Allow"], "GET, HEAD")
+
+    def test_head(self) -> None:
+        """HEAD returns headers without a body."""
+        status, headers, body = _call(self.app, "text=Hi", method="HEAD")
+        self.assertEqual(status, "200 OK")
+        self.assertGreater(int(headers["Content-Length"]), 0)
+        self.assertEqual(body, b"")
+
+
+class TestASGIApp(unittest.TestCase):
+    """Test the ASGI adapter."""
+
+    def _request(
+        self, app: Any, query: bytes, headers: Optional[List[Tuple[bytes, bytes]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Run one HTTP request through an ASGI app and collect messages."""
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/render",
+            "query_string": query,
+            "headers": headers or [],
+        }
+        messages: List[Dict[str, Any]] = []
+
+        async def receive() -> Dict[str, Any]:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: Dict[str, Any]) -> None:
+            messages.append(message)
+
+        asyncio.run(app(scope, receive, send))
+        return messages
+
+    def test_render_and_revalidate(self) -> None:
+        """The ASGI app renders and honours If-None-Match."""
+        app = asgi.create_app(RenderService())
+        start, body = self._request(app, b"text=Hi&format=txt")
+        self.assertEqual(start["status"], 200)
+        self.assertIn(b"_", body["body"])
+
+        etag = dict(start["headers"])[b"etag"]
+        start, body = self._request(app, b"text=Hi&format=txt", [(b"if-none-match", etag)])
+        self.assertEqual(start["status"], 304)
+        self.assertEqual(body["body"], b"")
+
+
+if __name__ == "__main__":
+    unittest.main()
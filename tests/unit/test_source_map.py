@@ -0,0 +1,114 @@
+"""
+Unit tests for source-to-glyph column mapping.
+
+These tests verify the column spans recorded by the builder for
+left-to-right, right-to-left and justified text, the lookups built on them
+and the highlight_source() effect.
+"""
+
+import unittest
+
+from figlet_forge import RESET_COLORS
+from figlet_forge.color import highlight_source
+from figlet_forge.core.figlet_string import FigletString
+from figlet_forge.figlet import Figlet
+
+
+class TestSourceSpans(unittest.TestCase):
+    """Test the spans recorded while rendering."""
+
+    def test_no_map_by_default(self) -> None:
+        """Rendering does not record spans unless asked to."""
+        art = Figlet().renderText("Hi")
+        self.assertIsNone(art.source_spans)
+        with self.assertRaises(ValueError):
+            art.column_span(0)
+
+    def test_spans_cover_the_art(self) -> None:
+        """Glyph spans are contiguous and cover every column."""
+        art = Figlet(source_map=True).renderText("Hi you")
+        spans = art.source_spans
+        self.assertEqual(art.source_text, "Hi you")
+        self.assertEqual(len(spans), 6)
+        self.assertEqual(spans[0][0], 0)
+        for previous, current in zip(spans, spans[1:]):
+            self.assertEqual(previous[1], current[0])
+        self.assertEqual(spans[-1][1], art.dimensions[0])
+
+    def test_span_matches_glyph(self) -> None:
+        """Each span holds exactly the glyph of its character."""
+        figlet = Figlet(source_map=True)
+        art = figlet.renderText("Hi")
+        start, end = art.column_span(1)
+        glyph = figlet.renderText("i")
+        self.assertEqual(
+            [row[start:end] for row in art.rows],
+            [row[: end - start] for row in glyph.rows],
+        )
+
+    def test_right_to_left(self) -> None:
+        """The first character is drawn at the right."""
+        art = Figlet(source_map=True, direction="right-to-left").renderText("Hi")
+        self.assertGreater(art.column_span(0)[0], art.column_span(1)[0])
+        self.assertEqual(art.column_span(0)[1], art.dimensions[0])
+
+    def test_center_justify(self) -> None:
+        """Spans follow the justification padding."""
+        left = Figlet(source_map=True, width=40).renderText("Hi")
+        center = Figlet(source_map=True, width=40, justify="center").renderText("Hi")
+        self.assertGreater(center.column_span(0)[0], 0)
+        for index in range(2):
+            left_start, left_end = left.column_span(index)
+            start, end = center.column_span(index)
+            self.assertEqual(
+                [row[start:end] for row in center.rows],
+                [row[left_start:left_end] for row in left.rows],
+            )
+
+    def test_source_index_at(self) -> None:
+        """Columns map back to the character drawn there."""
+        art = Figlet(source_map=True).renderText("Hi")
+        start, end = art.column_span(1)
+        self.assertEqual(art.source_index_at(start), 1)
+        self.assertEqual(art.source_index_at(end - 1), 1)
+        self.assertEqual(art.source_index_at(0), 0)
+        self.assertIsNone(art.source_index_at(art.dimensions[0]))
+        self.assertIsNone(art.source_index_at(-1))
+
+    def test_set_source_map_checks_length(self) -> None:
+        """One span is needed per source character."""
+        with self.assertRaises(ValueError):
+            FigletString("ab").set_source_map("ab", [(0, 1)])
+
+
+class TestHighlightSource(unittest.TestCase):
+    """Test highlight_source()."""
+
+    def setUp(self) -> None:
+        """Render art with a source map."""
+        self.art = Figlet(source_map=True).renderText("Hi you")
+        self.code = "\033[38;2;255;0;0m"
+
+    def test_highlights_matching_glyphs(self) -> None:
+        """Every row colors the columns of the matched characters."""
+        start, end = self.art.column_span(3)[0], self.art.column_span(5)[1]
+        result = highlight_source(self.art, "you", "255;0;0")
+        for row, plain in zip(result.splitlines(), self.art.rows):
+            highlighted = self.code + plain[start:end] + RESET_COLORS
+            self.assertEqual(row, plain[:start] + highlighted + plain[end:])
+
+    def test_case_insensitive(self) -> None:
+        """Matching can ignore case."""
+        self.assertEqual(highlight_source(self.art, "h", "255;0;0"), str(self.art))
+        self.assertIn(
+            self.code, highlight_source(self.art, "h", "255;0;0", case_sensitive=False)
+        )
+
+    def test_requires_source_map(self) -> None:
+        """Art without a source map is rejected."""
+        with self.assertRaises(ValueError):
+            highlight_source(Figlet().renderText("Hi"), "H", "255;0;0")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,225 @@
+"""
+Unit tests for the styled art grid.
+
+These tests verify that styles are interned into compact per-row arrays,
+that the ANSI, HTML and SVG emitters write one run per style change, and
+that the style effects produce the same colors as the string effects.
+"""
+
+import unittest
+
+from figlet_forge.color import (
+    Style,
+    StyledArt,
+    gradient_colorize,
+    pulse_colorize,
+    style_gradient,
+    style_pulse,
+    style_solid,
+)
+from figlet_forge.color.effects import rainbow_colorize, style_rainbow, style_shine
+from figlet_forge.color.depth import ANSI_16, ANSI_256, NO_COLOR, TRUECOLOR
+from figlet_forge.color.figlet_color import InvalidColor, parse_color
+
+ART = " _  _\n| || |\n|_||_|"
+RED = Style((255, 0, 0))
+BLUE = Style((0, 0, 255))
+
+
+class TestGrid(unittest.TestCase):
+    """Test the style table and cell arrays."""
+
+    def test_default_cells(self) -> None:
+        """New art has only the default style."""
+        art = StyledArt(ART)
+        self.assertEqual(art.dimensions, (6, 3))
+        self.assertEqual(art.styles, (None,))
+        self.assertEqual(list(art.cells(1)), [0] * 6)
+        self.assertEqual(art.to_ansi(), ART)
+
+    def test_intern(self) -> None:
+        """Equal styles share one table entry."""
+        art = StyledArt(ART)
+        self.assertEqual(art.intern(RED), 1)
+        self.assertEqual(art.intern(Style((255, 0, 0))), 1)
+        self.assertEqual(art.intern(Style()), 0)
+        self.assertEqual(art.cells(0).typecode, "H")
+
+    def test_set_styles(self) -> None:
+        """Styles past the end of a row are ignored."""
+        art = StyledArt("ab\nc")
+        art.set_styles(1, [RED, BLUE, RED])
+        art.set_styles(0, [BLUE], start=1)
+        self.assertEqual(art.style_at(0, 1), RED)
+        self.assertEqual(art.style_at(1, 0), BLUE)
+        self.assertIsNone(art.style_at(0, 0))
+        self.assertIsNone(art.style_at(5, 5))
+
+    def test_paint(self) -> None:
+        """Palette indices style the visible cells."""
+        art = StyledArt("a b\ncd").paint([RED, BLUE], [[0, 1, 1], [1, 0, 0]])
+        self.assertEqual(art.style_at(0, 0), RED)
+        self.assertIsNone(art.style_at(1, 0))
+        self.assertEqual(art.style_at(2, 0), BLUE)
+        self.assertEqual(art.style_at(1, 1), RED)
+        self.assertEqual(art.styles, (None, RED, BLUE))
+
+    def test_fill_and_plain(self) -> None:
+        """Fill skips whitespace and plain() drops all styles."""
+        art = StyledArt(ART).fill(RED)
+        self.assertIsNone(art.style_at(0, 0))
+        self.assertEqual(art.style_at(1, 0), RED)
+        self.assertEqual(str(art.plain()), ART)
+
+    def test_restyle(self) -> None:
+        """Restyling maps the table and shares cells when it can."""
+        art = style_gradient(ART, "RED", "BLUE")
+        inverted = art.restyle(lambda style: Style(None, style.fg))
+        self.assertIs(inverted.cells(2), art.cells(2))
+        self.assertEqual(inverted.style_at(0, 1), Style(None, (255, 0, 0)))
+        merged = art.restyle(lambda style: RED)
+        self.assertEqual(merged.styles, (None, RED))
+        self.assertEqual(merged.to_ansi(), StyledArt(ART).fill(RED).to_ansi())
+
+
+class TestEmitters(unittest.TestCase):
+    """Test writing styled art as ANSI, HTML and SVG."""
+
+    def test_runs(self) -> None:
+        """Uncolored spaces join the run before them."""
+        art = StyledArt("ab cd")
+        art.set_styles(0, [RED, RED, None, RED, BLUE])
+        self.assertEqual(art.runs(0), [(RED, "ab c"), (BLUE, "d")])
+
+    def test_background_runs(self) -> None:
+        """Spaces do not join a run with a background."""
+        art = style_solid("a b", "255;0;0:0;0;255")
+        self.assertEqual(art.runs(0), [(Style((255, 0, 0), (0, 0, 255)), "a b")])
+        art = StyledArt("a b")
+        art.set_styles(0, [Style(None, (0, 0, 255))])
+        self.assertEqual(len(art.runs(0)), 2)
+
+    def test_ansi_depths(self) -> None:
+        """Escapes follow the requested depth."""
+        art = StyledArt("ab").fill(RED)
+        self.assertEqual(art.to_ansi(), "\033[38;2;255;0;0mab\033[0m")
+        self.assertEqual(art.to_ansi(ANSI_256), "\033[38;5;196mab\033[0m")
+        self.assertEqual(art.to_ansi(NO_COLOR), "ab")
+
+    def test_html(self) -> None:
+        """Styled runs become spans and text is escaped."""
+        art = StyledArt("<a> b").fill(RED)
+        page = art.to_html()
+        self.assertIn('<span style="color: #ff0000">&lt;a&gt; b</span>', page)
+        self.assertIn('<div class="figlet-line">', page)
+
+    def test_svg(self) -> None:
+        """Foreground runs become tspans."""
+        svg = style_gradient("ab", "RED", "BLUE").to_svg()
+        self.assertIn('<tspan fill="#ff0000">a</tspan>', svg)
+        self.assertIn('<tspan fill="#0000ff">b</tspan>', svg)
+        self.assertTrue(svg.startswith("<svg"))
+
+
+class TestEffects(unittest.TestCase):
+    """Test the style effects and converting escaped text."""
+
+    def test_gradient_matches_string_effect(self) -> None:
+        """style_gradient() writes the colors of gradient_colorize()."""
+        self.assertEqual(
+            style_gradient(ART, "RED", "BLUE").to_ansi(),
+            gradient_colorize(ART, "RED", "BLUE"),
+        )
+        self.assertEqual(
+            style_gradient(ART, "RED", "BLUE").to_ansi(ANSI_256),
+            gradient_colorize(ART, "RED", "BLUE", depth=ANSI_256),
+        )
+
+    def test_pulse_matches_string_effect(self) -> None:
+        """style_pulse() writes the colors of pulse_colorize()."""
+        self.assertEqual(
+            style_pulse(ART, "0;200;100").to_ansi(), pulse_colorize(ART, "0;200;100")
+        )
+
+    def test_offsets(self) -> None:
+        """Offsets shift the pulse wave and the rainbow by whole steps."""
+        wave = style_pulse("abcd", "RED", intensity_levels=2)
+        shifted = style_pulse("abcd", "RED", intensity_levels=2, offset=1)
+        self.assertEqual(shifted.style_at(1, 0), wave.style_at(0, 0))
+        self.assertEqual(style_pulse("abcd", "RED", 2, offset=4).runs(0), wave.runs(0))
+        rainbow = style_rainbow(ART)
+        self.assertEqual(rainbow.style_at(1, 0), Style((255, 0, 0), None, 1))
+        self.assertEqual(
+            style_rainbow(ART, offset=1).style_at(1, 0), rainbow.style_at(4, 0)
+        )
+
+    def test_shine(self) -> None:
+        """The band is brightest at its position and fades to the base."""
+        art = style_shine("x" * 12, "0;0;0", "255;255;255", position=5, width=4)
+        self.assertEqual(art.style_at(5, 0), Style((255, 255, 255)))
+        self.assertEqual(art.style_at(4, 0), Style((127, 127, 127)))
+        self.assertEqual(art.style_at(0, 0), Style((0, 0, 0)))
+        self.assertEqual(art.style_at(7, 0), Style((0, 0, 0)))
+
+    def test_paint_in_place(self) -> None:
+        """Effects paint an existing StyledArt."""
+        art = StyledArt(ART)
+        self.assertIs(style_solid(art, "RED"), art)
+        self.assertEqual(art.style_at(1, 0), Style((255, 0, 0), None, 1))
+
+    def test_solid_named_colors(self) -> None:
+        """Named colors are written with the codes parse_color() uses."""
+        for spec in ("RED", "bright_red", "RED:BLUE", "BLACK:light_white"):
+            fg, bg = parse_color(spec)
+            for depth in (TRUECOLOR, ANSI_256, ANSI_16):
+                with self.subTest(spec=spec, depth=depth):
+                    colored = style_solid("ab", spec).to_ansi(depth)
+                    self.assertTrue(colored.startswith(fg + bg))
+        self.assertIn("\033[38;2;255;0;0m", style_solid("ab", "255;0;0").to_ansi())
+
+    def test_invalid_colors(self) -> None:
+        """Unknown colors are rejected."""
+        with self.assertRaises(InvalidColor):
+            style_gradient(ART, "RED", "NOPE")
+        with self.assertRaises(InvalidColor):
+            style_solid(ART, "NOPE")
+
+    def test_from_ansi_round_trip(self) -> None:
+        """Escaped output converts back to the same cells."""
+        colored = gradient_colorize(ART, "RED", "BLUE")
+        art = StyledArt.from_ansi(colored)
+        self.assertEqual(art.rows, tuple(ART.split("\n")))
+        self.assertEqual(art.to_ansi(), colored)
+
+    def test_from_ansi_palettes(self) -> None:
+        """256- and 16-color escapes keep their RGB values and palette index."""
+        art = StyledArt.from_ansi("\033[38;5;196ma\033[44mb\033[39mc\033[0md")
+        self.assertEqual(art.style_at(0, 0), Style((255, 0, 0), None, 196))
+        self.assertEqual(
+            art.style_at(1, 0), Style((255, 0, 0), (0, 0, 238), 196, 4)
+        )
+        self.assertEqual(art.style_at(2, 0), Style(None, (0, 0, 238), None, 4))
+        self.assertIsNone(art.style_at(3, 0))
+
+    def test_from_ansi_keeps_palette_codes(self) -> None:
+        """Palette colors are written back with their own codes."""
+        colored = "\033[31ma\033[0m \033[91;44mb\033[0m \033[38;5;208mc\033[0m"
+        art = StyledArt.from_ansi(colored)
+        self.assertEqual(
+            art.to_ansi(),
+            "\033[31ma \033[91m\033[44mb\033[0m \033[38;5;208mc\033[0m",
+        )
+        self.assertIn("\033[31m", art.to_ansi(ANSI_256))
+        self.assertIn("\033[38;5;208m", art.to_ansi(ANSI_256))
+        self.assertNotIn("38;5", art.to_ansi(ANSI_16))
+        self.assertIn("\033[31m", art.to_ansi(ANSI_16))
+        # HTML and SVG still use the RGB value
+        self.assertIn("color: #cd0000", art.to_html())
+
+    def test_rainbow_round_trip(self) -> None:
+        """Converting 16-color effect output does not make it larger."""
+        colored = rainbow_colorize(ART)
+        self.assertEqual(len(StyledArt.from_ansi(colored).to_ansi()), len(colored))
+
+if __name__ == "__main__":
+    unittest.main()